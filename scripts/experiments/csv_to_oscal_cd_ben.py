@@ -0,0 +1,142 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Script to benchmark how csv-to-oscal-cd scales with the rows of the csv, creating and updating a cd."""
+
+import configparser
+import csv
+import logging
+import pathlib
+import sys
+import tempfile
+import timeit
+from typing import List
+
+from trestle.tasks.base_task import TaskOutcome
+from trestle.tasks.csv_to_oscal_cd import CsvToOscalComponentDefinition
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler())
+
+HEADER = [
+    'Reference_Id',
+    'Rule_Id',
+    'Rule_Description',
+    'Check_Id',
+    'Check_Description',
+    'Profile_Source',
+    'Profile_Description',
+    'Component_Type',
+    'Control_Id_List',
+    'Component_Title',
+    'Component_Description',
+    'Parameter_Id',
+    'Parameter_Description',
+    'Parameter_Value_Default',
+    'Parameter_Value_Alternatives',
+    'Namespace',
+]
+PROFILE_SOURCE = 'https://example.com/profiles/NIST_SP-800-53_rev5_HIGH-baseline_profile.json'
+NAMESPACE = 'http://oscal-compass.github.io/compliance-trestle/schemas/oscal/cd'
+COMPONENTS = 5
+CONTROLS = 500
+
+
+def make_row(index: int, version: int) -> List[str]:
+    """Make the row of a rule, mapped to three controls and with a parameter for every third rule."""
+    controls = ' '.join(f'ac-{(index * 7 + ii) % CONTROLS + 1}_smt.a' for ii in range(3 - version % 2))
+    component = f'Service {index % COMPONENTS}'
+    parameter = [f'param_{index}', f'Parameter of rule {index}', str(10 + version), '10, 20, 30']
+    return [
+        str(1000000 + index),
+        f'rule_{index}',
+        f'Ensure setting {index} is configured, revision {version}',
+        f'check_{index}',
+        f'Check whether setting {index} is configured' if version == 0 else '',
+        PROFILE_SOURCE,
+        'NIST Special Publication 800-53 Revision 5 HIGH IMPACT BASELINE',
+        'Service',
+        controls,
+        component,
+        component,
+        *(parameter if index % 3 == 0 else ['', '', '', '']),
+        NAMESPACE,
+    ]
+
+
+def write_csv(path: pathlib.Path, rows: List[List[str]]) -> None:
+    """Write the csv with its header and column descriptions."""
+    with open(path, 'w', newline='', encoding='utf8') as f:
+        csv_writer = csv.writer(f, delimiter=',', quoting=csv.QUOTE_MINIMAL)
+        csv_writer.writerow(HEADER)
+        csv_writer.writerow(['column description'] * len(HEADER))
+        csv_writer.writerows(rows)
+
+
+def run_task(tmp_dir: pathlib.Path, csv_path: pathlib.Path, cd_path: pathlib.Path = None) -> float:
+    """Run the task and return the seconds taken."""
+    config = configparser.ConfigParser()
+    config.read_dict(
+        {
+            'task.csv-to-oscal-cd': {
+                'title': 'Component definition benchmark',
+                'version': 'V1.0',
+                'csv-file': str(csv_path),
+                'output-dir': str(tmp_dir / 'output'),
+                'quiet': 'true',
+            }
+        }
+    )
+    section = config['task.csv-to-oscal-cd']
+    if cd_path:
+        section['component-definition'] = str(cd_path)
+    tick = timeit.default_timer()
+    outcome = CsvToOscalComponentDefinition(section).execute()
+    seconds = timeit.default_timer() - tick
+    if outcome != TaskOutcome.SUCCESS:
+        raise RuntimeError(f'csv-to-oscal-cd failed for {csv_path}')
+    return seconds
+
+
+def run(sizes: List[int]) -> None:
+    """
+    Run the benchmark for csv files with each number of rows.
+
+    The cd created from the csv is then updated from a revision of it deleting, adding and modifying a tenth of the
+    rules each, with changed descriptions, parameter values and control mappings and cleared check descriptions.
+    """
+    for n_rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_dir = pathlib.Path(tmp)
+            csv_path = tmp_dir / 'rules.csv'
+            write_csv(csv_path, [make_row(index, 0) for index in range(n_rows)])
+            create_seconds = run_task(tmp_dir, csv_path)
+            cd_path = tmp_dir / 'component-definition.json'
+            (tmp_dir / 'output' / 'component-definition.json').rename(cd_path)
+            n_changes = max(1, n_rows // 10)
+            rows = [make_row(index, 1 if index < 2 * n_changes else 0) for index in range(n_changes, n_rows)]
+            rows += [make_row(index, 0) for index in range(n_rows, n_rows + n_changes)]
+            write_csv(csv_path, rows)
+            update_seconds = run_task(tmp_dir, csv_path, cd_path)
+            logger.info(
+                f'{n_rows} rows: create {create_seconds:.3f}s ({create_seconds * 1e6 / n_rows:.0f} us/row)'
+                f'  update {update_seconds:.3f}s ({update_seconds * 1e6 / n_rows:.0f} us/row)'
+            )
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] if len(sys.argv) > 1 else [100, 1000, 5000, 10000, 50000]
+    run(sizes)
@@ -0,0 +1,94 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Script to benchmark time and peak memory of json writing of a catalog, compared with orjson of the model dict."""
+
+import logging
+import pathlib
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from typing import Callable, Tuple
+
+import orjson
+
+from trestle.oscal.catalog import Catalog
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler())
+
+
+def legacy_write(catalog: Catalog, path: pathlib.Path) -> None:
+    """Write json the way trestle did before, by dumping the dict of the model with orjson."""
+    with path.open('wb') as write_file:
+        write_file.write(
+            orjson.dumps(catalog.oscal_dict(), default=catalog.__json_encoder__, option=orjson.OPT_INDENT_2)
+        )
+
+
+def time_it(label: str, count: int, func: Callable[[], None]) -> float:
+    """Time count calls of the function and log the result."""
+    tick = timeit.default_timer()
+    for _ in range(count):
+        func()
+    tock = timeit.default_timer()
+    logger.info(f'{label} for {count} iterations:  {tock - tick}')
+    return tock - tick
+
+
+def peak_memory(func: Callable[[], None]) -> float:
+    """Get the peak memory in MB allocated by one call of the function."""
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1 << 20)
+
+
+def measure(label: str, count: int, func: Callable[[], None]) -> Tuple[float, float]:
+    """Time the function and measure its peak memory."""
+    seconds = time_it(label, count, func)
+    peak = peak_memory(func)
+    logger.info(f'{label} peak memory: {peak:.1f} MB')
+    return seconds, peak
+
+
+def run(path: pathlib.Path, count: int) -> None:
+    """Run the benchmark."""
+    catalog = Catalog.oscal_read(path)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = pathlib.Path(tmp_dir) / 'legacy_catalog.json'
+        path = pathlib.Path(tmp_dir) / 'catalog.json'
+        logger.info('-----------------------------')
+        legacy_time, legacy_peak = measure('Legacy json write', count, lambda: legacy_write(catalog, legacy_path))
+        current_time, current_peak = measure('Json write', count, lambda: catalog.oscal_write(path))
+        logger.info(f'Speedup: {legacy_time / current_time:.2f}x  Peak memory ratio: {legacy_peak / current_peak:.2f}x')
+        if legacy_path.read_bytes() != path.read_bytes():
+            logger.warning('The files written by the two paths differ.')
+        logger.info('-----------------------------')
+        legacy_time, legacy_peak = measure(
+            'Legacy json serialize', count, lambda: orjson.dumps(catalog.oscal_dict(), default=catalog.__json_encoder__)
+        )
+        current_time, current_peak = measure('Json serialize', count, lambda: catalog.oscal_serialize_json_bytes())
+        logger.info(f'Speedup: {legacy_time / current_time:.2f}x  Peak memory ratio: {legacy_peak / current_peak:.2f}x')
+
+
+if __name__ == '__main__':
+    default_path = 'nist-content/nist.gov/SP800-53/rev5/json/NIST_SP-800-53_rev5_catalog.json'
+    path = pathlib.Path(sys.argv[1] if len(sys.argv) > 1 else default_path)
+    count = 5
+    run(path, count)
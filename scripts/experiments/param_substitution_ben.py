@@ -0,0 +1,144 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Script to benchmark substitution of parameters in control prose."""
+
+import logging
+import pathlib
+import re
+import sys
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+from trestle.common.list_utils import as_list
+from trestle.core.catalog.catalog_interface import CatalogInterface
+from trestle.core.control_interface import ControlInterface, ParameterRep, ParamReplacer
+from trestle.oscal import common
+from trestle.oscal.catalog import Catalog
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler())
+
+
+def legacy_replace_params(text: str, param_dict: Dict[str, common.Parameter], param_rep: ParameterRep) -> str:
+    """Replace moustaches the way trestle did before ParamReplacer: scan, replace one at a time, then rescan."""
+    orig_text = text
+    staches: List[str] = re.findall(r'{{.*?}}', text)
+    if not staches:
+        return text
+    for stache in staches:
+        param_id = stache[2:-2].replace('insert: param,', '').strip()
+        if param_dict.get(param_id) is not None:
+            param_str = ControlInterface.param_to_str(
+                param_dict[param_id], param_rep, False, False, None, None, None, param_dict
+            )
+            text = text.replace(stache, param_str, 1).strip()
+    if text != orig_text:
+        while True:
+            new_text = legacy_replace_params(text, param_dict, param_rep)
+            if new_text == text:
+                break
+            text = new_text
+    return text
+
+
+def legacy_replace_ids(text: str, param_dict: Dict[str, common.Parameter], param_rep: ParameterRep) -> str:
+    """Replace bare param ids the way trestle did before ParamReplacer: one regex substitution per param."""
+    for param in param_dict.values():
+        if param.id not in text:
+            continue
+        param_str = ControlInterface.param_to_str(param, param_rep, False, False, None, None, None, param_dict)
+        pattern = r'(^|[^a-zA-Z0-9_])' + param.id + r'($|[^a-zA-Z0-9_])'
+        text = re.sub(pattern, r'\1' + param_str + r'\2', text)
+    return text
+
+
+def time_it(label: str, count: int, func: Callable[[], List[str]]) -> Tuple[float, List[str]]:
+    """Time count calls of the function and log the result."""
+    tick = timeit.default_timer()
+    for _ in range(count):
+        result = func()
+    tock = timeit.default_timer()
+    logger.info(f'{label} for {count} iterations:  {tock - tick}')
+    return tock - tick, result
+
+
+def log_differences(legacy: List[str], current: List[str]) -> None:
+    """Log the number of prose strings with different results."""
+    differences = sum(1 for legacy_prose, prose in zip(legacy, current, strict=True) if legacy_prose != prose)
+    if differences:
+        logger.info(f'{differences} prose strings differ between legacy and current substitution.')
+
+
+def get_all_prose(part: common.Part, prose_list: List[str]) -> None:
+    """Gather the prose of the part and all its subparts."""
+    if part.prose:
+        prose_list.append(part.prose)
+    for sub_part in as_list(part.parts):
+        get_all_prose(sub_part, prose_list)
+
+
+def run(path: pathlib.Path, count: int) -> None:
+    """Run the benchmark."""
+    catalog = Catalog.oscal_read(path)
+    cat_interface = CatalogInterface(catalog)
+    param_dict = cat_interface._get_full_param_dict()
+    prose_list: List[str] = []
+    for control in cat_interface.get_all_controls_from_dict():
+        for part in as_list(control.parts):
+            get_all_prose(part, prose_list)
+    param_rep = ParameterRep.VALUE_OR_LABEL_OR_CHOICES
+    logger.info(f'{len(param_dict)} params and {len(prose_list)} prose strings in {path}')
+
+    logger.info('-----------------------------')
+    legacy_time, legacy = time_it(
+        'Legacy moustache substitution',
+        count,
+        lambda: [legacy_replace_params(prose, param_dict, param_rep) for prose in prose_list],
+    )
+
+    def replace_moustaches() -> List[str]:
+        replacer = ParamReplacer(param_dict, None, param_rep)
+        return [replacer.replace_moustaches(prose) for prose in prose_list]
+
+    current_time, current = time_it('ParamReplacer moustache substitution', count, replace_moustaches)
+    log_differences(legacy, current)
+    logger.info(f'Speedup: {legacy_time / current_time:.2f}x')
+
+    # references to params by bare id, as used when param ids appear in the prose itself
+    id_prose_list = [prose.replace('{{ insert: param, ', '').replace(' }}', '') for prose in prose_list]
+    logger.info('-----------------------------')
+    legacy_time, legacy = time_it(
+        'Legacy param id substitution',
+        count,
+        lambda: [legacy_replace_ids(prose, param_dict, param_rep) for prose in id_prose_list],
+    )
+
+    def replace_ids() -> List[str]:
+        replacer = ParamReplacer(param_dict, None, param_rep)
+        return [replacer.replace_ids(prose) for prose in id_prose_list]
+
+    current_time, current = time_it('ParamReplacer param id substitution', count, replace_ids)
+    # the legacy approach also substitutes ids found inside the text already substituted for other params
+    log_differences(legacy, current)
+    logger.info(f'Speedup: {legacy_time / current_time:.2f}x')
+
+
+if __name__ == '__main__':
+    default_path = 'nist-content/nist.gov/SP800-53/rev5/json/NIST_SP-800-53_rev5_catalog.json'
+    path = pathlib.Path(sys.argv[1] if len(sys.argv) > 1 else default_path)
+    count = 5
+    run(path, count)
@@ -0,0 +1,101 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Script to benchmark split and assembly of a catalog split per control, with and without reuse of stripped types."""
+
+import logging
+import pathlib
+import shutil
+import sys
+import tempfile
+import timeit
+from typing import Callable, List, Optional
+
+import trestle.core.base_model as base_model
+from trestle.common import const
+from trestle.common.model_utils import ModelUtils
+from trestle.core.base_model import OscalBaseModel
+from trestle.core.commands.split import SplitCmd
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler())
+
+create_stripped_model_type = OscalBaseModel.create_stripped_model_type.__func__  # type: ignore
+
+
+def create_stripped_model_type_uncached(
+    cls, stripped_fields: Optional[List[str]] = None, stripped_fields_aliases: Optional[List[str]] = None
+):
+    """Create the stripped type from scratch every time, as trestle did before stripped types were reused."""
+    base_model._stripped_model_types.clear()
+    return create_stripped_model_type(cls, stripped_fields, stripped_fields_aliases)
+
+
+def time_it(label: str, count: int, func: Callable[[], None]) -> float:
+    """Time count calls of the function and log the result."""
+    tick = timeit.default_timer()
+    for _ in range(count):
+        func()
+    tock = timeit.default_timer()
+    logger.info(f'{label} for {count} iterations:  {tock - tick}')
+    return tock - tick
+
+
+def run_split_and_assemble(catalog_path: pathlib.Path, count: int) -> List[float]:
+    """Time split of the catalog per control and its assembly in a temporary trestle workspace."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trestle_root = pathlib.Path(tmp_dir)
+        (trestle_root / const.TRESTLE_CONFIG_DIR).mkdir()
+        catalog_dir = trestle_root / 'catalogs' / 'my_catalog'
+
+        def split() -> None:
+            if catalog_dir.exists():
+                shutil.rmtree(catalog_dir)
+            catalog_dir.mkdir(parents=True)
+            shutil.copyfile(catalog_path, catalog_dir / 'catalog.json')
+            SplitCmd.perform_split(catalog_dir, 'catalog.json', 'catalog.groups.*.controls.*', trestle_root)
+
+        def assemble() -> None:
+            ModelUtils.load_distributed(catalog_dir / 'catalog.json', trestle_root)
+
+        split_time = time_it('Split per control', count, split)
+        n_files = sum(1 for path in catalog_dir.rglob('*') if path.is_file())
+        logger.info(f'Catalog split into {n_files} files')
+        assemble_time = time_it('Assemble', count, assemble)
+        return [split_time, assemble_time]
+
+
+def run(path: pathlib.Path, count: int) -> None:
+    """Run the benchmark."""
+    logger.info('-----------------------------')
+    logger.info('Creating stripped types every time they are requested')
+    OscalBaseModel.create_stripped_model_type = classmethod(create_stripped_model_type_uncached)
+    try:
+        uncached = run_split_and_assemble(path, count)
+    finally:
+        OscalBaseModel.create_stripped_model_type = classmethod(create_stripped_model_type)
+    logger.info('-----------------------------')
+    logger.info('Reusing stripped types')
+    cached = run_split_and_assemble(path, count)
+    logger.info('-----------------------------')
+    logger.info(f'Split speedup: {uncached[0] / cached[0]:.2f}x  Assemble speedup: {uncached[1] / cached[1]:.2f}x')
+
+
+if __name__ == '__main__':
+    default_path = 'nist-content/nist.gov/SP800-53/rev5/json/NIST_SP-800-53_rev5_catalog.json'
+    path = pathlib.Path(sys.argv[1] if len(sys.argv) > 1 else default_path).resolve()
+    count = 3
+    run(path, count)
@@ -0,0 +1,143 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Script to benchmark building tanium observations in chunks against forking the whole factory into each worker."""
+
+import importlib.util
+import json
+import logging
+import multiprocessing
+import pathlib
+import sys
+import tempfile
+import timeit
+from typing import Dict, List, Type
+
+from trestle.common import const
+from trestle.common.list_utils import join_key_to_list_dicts
+from trestle.oscal.assessment_results import Observation
+from trestle.transforms.implementations import tanium
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler())
+
+TIMESTAMP = '2021-02-24T19:31:13+00:00'
+STATES = ['pass', 'fail', 'notapplicable']
+
+
+class LegacyTaniumOscalFactory(tanium.TaniumOscalFactory):
+    """Factory mapping a bound method over the pool, so the whole factory is pickled to each worker."""
+
+    def _batch_observations(self, index: int) -> Dict[str, List[Observation]]:
+        batch_size = (len(self._rule_use_list) // self._batch_workers) + 1
+        rule_uses = self._rule_use_list[index * batch_size : (index + 1) * batch_size]
+        builder = tanium._ObservationBuilder(
+            self._ns,
+            self._component_refs,
+            {ip_address: inventory.uuid for ip_address, inventory in self._inventory_map.items()},
+            self._common_properties,
+            self._property_manager,
+        )
+        observation_partial_map: Dict[str, List[Observation]] = {}
+        for observation in builder.build(rule_uses).observations:
+            subject_uuid = observation.subjects[0].subject_uuid
+            observation_partial_map[subject_uuid] = observation_partial_map.get(subject_uuid, []) + [observation]
+        return observation_partial_map
+
+    def _derive_observations(self) -> None:
+        self._observation_map = {}
+        if self._batch_workers == 1:
+            self._observation_map = self._batch_observations(0)
+        else:
+            with multiprocessing.Pool(processes=self._batch_workers) as pool:
+                rval_list = pool.map(self._batch_observations, range(self._batch_workers))
+            for partial_observation_map in rval_list:
+                self._observation_map = join_key_to_list_dicts(self._observation_map, partial_observation_map)
+
+
+def make_results(n_hosts: int, n_rules: int) -> str:
+    """Make tanium results, one line per host with a finding for each rule."""
+    lines = []
+    for host in range(n_hosts):
+        findings = [
+            {
+                'Check ID': f'CIS Microsoft Windows Server 2019 Benchmark;1.{host % 3}.0;Level 1',
+                'Rule ID': f'xccdf_org.cisecurity.benchmarks_rule_{rule}',
+                'State': STATES[(host + rule) % len(STATES)],
+            }
+            for rule in range(n_rules)
+        ]
+        row = {
+            'Computer Name': f'host-{host}.lab.test',
+            'Tanium Client IP Address': f'10.0.{host // 256}.{host % 256}',
+            'IP Address': [f'10.0.{host // 256}.{host % 256}'],
+            'Comply - Compliance Findings': findings,
+            'Count': '1',
+        }
+        lines.append(json.dumps(row))
+    return '\n'.join(lines)
+
+
+def run_factory(
+    factory_class: Type[tanium.TaniumOscalFactory], blob: str, blocksize: int, cpus: int, count: int
+) -> float:
+    """Time count transforms of the blob to results with the factory, returning the seconds for each."""
+    tick = timeit.default_timer()
+    for _ in range(count):
+        rule_uses = tanium.RuleUseFactory(TIMESTAMP).make_list(blob)
+        factory = factory_class(TIMESTAMP, rule_uses, blocksize, cpus, cpus)
+        results = factory.results
+    seconds = (timeit.default_timer() - tick) / count
+    n_observations = sum(len(result.observations) for result in results)
+    workers = factory._batch_workers
+    logger.info(f'{factory_class.__name__} workers {workers}: {n_observations} observations in {seconds:.3f}s')
+    return seconds
+
+
+def run_script(blob: str) -> None:
+    """Time the tanium transform script on the results."""
+    script = pathlib.Path(__file__).resolve().parents[1] / 'tanium_transform_script.py'
+    spec = importlib.util.spec_from_file_location('tanium_transform_script', script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_f = pathlib.Path(tmp_dir) / 'tanium.json'
+        data_f.write_text(blob, encoding=const.FILE_ENCODING)
+        tick = timeit.default_timer()
+        json_str = module.transform(data_f)
+        seconds = timeit.default_timer() - tick
+    logger.info(f'tanium_transform_script: {len(json_str) / (1 << 20):.1f} MB of json in {seconds:.3f}s')
+
+
+def run(n_hosts: int, n_rules: int, cpus: int, count: int) -> None:
+    """Run the benchmark."""
+    blob = make_results(n_hosts, n_rules)
+    n_rule_uses = n_hosts * n_rules
+    blocksize = max(1, n_rule_uses // (cpus * 4))
+    logger.info(f'Tanium results of {n_rule_uses} rule uses, {len(blob) / (1 << 20):.1f} MB, blocksize {blocksize}')
+    for workers in sorted({1, cpus}):
+        legacy = run_factory(LegacyTaniumOscalFactory, blob, blocksize, workers, count)
+        current = run_factory(tanium.TaniumOscalFactory, blob, blocksize, workers, count)
+        logger.info(f'Speedup with cpus {workers}: {legacy / current:.2f}x')
+    run_script(blob)
+
+
+if __name__ == '__main__':
+    n_hosts = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    n_rules = int(sys.argv[2]) if len(sys.argv) > 2 else 250
+    cpus = int(sys.argv[3]) if len(sys.argv) > 3 else min(4, multiprocessing.cpu_count())
+    count = 3
+    run(n_hosts, n_rules, cpus, count)
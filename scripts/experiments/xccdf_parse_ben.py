@@ -0,0 +1,141 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Script to benchmark time and peak memory of parsing a large synthetic ARF result, streamed and as a whole tree."""
+
+import logging
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from defusedxml import ElementTree
+
+from trestle.transforms.xccdf_parser import XCCDF_12_TEST_RESULT, iter_rule_results
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler())
+
+RESULTS = ['pass', 'fail', 'notapplicable', 'notselected']
+
+
+def make_arf(n_rules: int, n_definitions: int) -> str:
+    """Make an ARF document with the definitions in its content and a TestResult with the rule results."""
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<arf:asset-report-collection xmlns:arf="http://scap.nist.gov/schema/asset-reporting-format/1.1"'
+        ' xmlns:xccdf="http://checklists.nist.gov/xccdf/1.2">',  # NOSONAR
+        '<arf:report-requests><arf:report-request id="collection1"><arf:content>',
+    ]
+    for ii in range(n_definitions):
+        lines.append(
+            f'<definition id="oval:def:{ii}" class="compliance" version="1">'
+            f'<metadata><title>Definition {ii}</title><description>Check number {ii} of the content</description>'
+            f'</metadata><criteria operator="AND"><criterion test_ref="oval:tst:{ii}"/></criteria></definition>'
+        )
+    lines.append('</arf:content></arf:report-request></arf:report-requests><arf:reports><arf:report id="xccdf1">')
+    lines.append(
+        '<xccdf:TestResult id="xccdf_org.open-scap_testresult_profile" start-time="2026-01-01T00:00:00"'
+        ' end-time="2026-01-01T01:00:00" version="0.1.60" test-system="cpe:/a:redhat:openscap:1.3.5">'
+    )
+    lines.append('<xccdf:benchmark href="#scap_org.open-scap_comp_ssg-ocp4-ds.xml" id="xccdf_org.ssgproject"/>')
+    lines.append('<xccdf:target>cluster-node-1</xccdf:target>')
+    lines.append(
+        '<xccdf:target-facts>'
+        '<xccdf:fact name="urn:xccdf:fact:scanner:name" type="string">OpenSCAP</xccdf:fact>'
+        '<xccdf:fact name="urn:xccdf:fact:scanner:version" type="string">1.3.5</xccdf:fact>'
+        '<xccdf:fact name="urn:xccdf:fact:asset:identifier:host_name" type="string">node-1</xccdf:fact>'
+        '</xccdf:target-facts>'
+    )
+    for ii in range(n_rules):
+        lines.append(
+            f'<xccdf:rule-result idref="xccdf_org.ssgproject.content_rule_{ii}" role="full"'
+            f' time="2026-01-01T00:{ii % 60:02d}:00" severity="medium" weight="1.000000">'
+            f'<xccdf:result>{RESULTS[ii % len(RESULTS)]}</xccdf:result>'
+            f'<xccdf:ident system="https://ncp.nist.gov/cce">CCE-{ii}</xccdf:ident>'
+            f'<xccdf:check system="http://oval.mitre.org/XMLSchema/oval-definitions-5">'
+            f'<xccdf:check-content-ref name="oval:def:{ii}" href="#oval0"/></xccdf:check></xccdf:rule-result>'
+        )
+    lines.append('<xccdf:score system="urn:xccdf:scoring:default" maximum="100.000000">50.0</xccdf:score>')
+    lines.append('</xccdf:TestResult></arf:report></arf:reports></arf:asset-report-collection>')
+    return '\n'.join(lines)
+
+
+def _first(root, tag: str):
+    for child in root:
+        if child.tag.rsplit('}').pop() == tag:
+            return child
+    return None
+
+
+def legacy_parse(xml: str) -> List[Dict[str, Optional[str]]]:
+    """Parse the rule results the way trestle did before, from the whole document tree."""
+    root = ElementTree.fromstring(xml, forbid_dtd=True)
+    version = root.get('version', '0')
+    root = root.find(f'.//{XCCDF_12_TEST_RESULT}')
+    benchmark = _first(root, 'benchmark')
+    facts = {fact.get('name'): fact.text for fact in _first(root, 'target-facts')}
+    rule_uses = []
+    for lev1 in root:
+        if lev1.tag.rsplit('}').pop() == 'rule-result':
+            rule_uses.append(
+                {
+                    'id_': root.get('id'),
+                    'target': _first(root, 'target').text,
+                    'benchmark_href': benchmark.get('href'),
+                    'host_name': facts.get('urn:xccdf:fact:asset:identifier:host_name'),
+                    'idref': lev1.get('idref'),
+                    'version': version,
+                    'result': _first(lev1, 'result').text,
+                }
+            )
+    return rule_uses
+
+
+def streamed_parse(xml: str) -> List[Dict[str, Optional[str]]]:
+    """Parse the rule results with the streaming parser."""
+    return list(iter_rule_results(xml, default_version='0'))
+
+
+def measure(label: str, count: int, func: Callable[[], List]) -> Tuple[float, float]:
+    """Time count calls of the function and measure the peak memory of one call, in MB."""
+    tick = timeit.default_timer()
+    for _ in range(count):
+        n_rules = len(func())
+    seconds = timeit.default_timer() - tick
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    peak = peak / (1 << 20)
+    logger.info(f'{label} of {n_rules} rule results for {count} iterations: {seconds:.3f}s peak memory: {peak:.1f} MB')
+    return seconds, peak
+
+
+def run(n_rules: int, n_definitions: int, count: int) -> None:
+    """Run the benchmark."""
+    xml = make_arf(n_rules, n_definitions)
+    logger.info(f'Synthetic ARF of {len(xml) / (1 << 20):.1f} MB')
+    legacy_time, legacy_peak = measure('Legacy parse', count, lambda: legacy_parse(xml))
+    current_time, current_peak = measure('Streamed parse', count, lambda: streamed_parse(xml))
+    logger.info(f'Speedup: {legacy_time / current_time:.2f}x  Peak memory ratio: {legacy_peak / current_peak:.2f}x')
+
+
+if __name__ == '__main__':
+    n_rules = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    n_definitions = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    count = 3
+    run(n_rules, n_definitions, count)
@@ -0,0 +1,85 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Script to benchmark yaml writing and reading of a catalog, compared with the ruamel.yaml json round trip."""
+
+import logging
+import pathlib
+import sys
+import tempfile
+import timeit
+from typing import Callable
+
+from ruamel.yaml import YAML
+
+import yaml
+
+from trestle.common import const
+from trestle.oscal.catalog import Catalog
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler())
+
+
+def legacy_write(catalog: Catalog, path: pathlib.Path) -> None:
+    """Write yaml the way trestle did before, by loading the json serialization as yaml and dumping it."""
+    with path.open('w', encoding=const.FILE_ENCODING) as write_file:
+        ruamel_yaml = YAML(typ='safe')
+        ruamel_yaml.dump(ruamel_yaml.load(catalog.oscal_serialize_json()), write_file)
+
+
+def legacy_read(path: pathlib.Path) -> Catalog:
+    """Read yaml the way trestle did before, with a new ruamel.yaml instance."""
+    ruamel_yaml = YAML(typ='safe')
+    with path.open('r', encoding=const.FILE_ENCODING) as fh:
+        obj = ruamel_yaml.load(fh)
+    return Catalog.parse_obj(obj['catalog'])
+
+
+def time_it(label: str, count: int, func: Callable[[], None]) -> float:
+    """Time count calls of the function and log the result."""
+    tick = timeit.default_timer()
+    for _ in range(count):
+        func()
+    tock = timeit.default_timer()
+    logger.info(f'{label} for {count} iterations:  {tock - tick}')
+    return tock - tick
+
+
+def run(path: pathlib.Path, count: int) -> None:
+    """Run the benchmark."""
+    catalog = Catalog.oscal_read(path)
+    logger.info(f'libyaml available: {yaml.__with_libyaml__}')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = pathlib.Path(tmp_dir) / 'legacy_catalog.yaml'
+        path = pathlib.Path(tmp_dir) / 'catalog.yaml'
+        logger.info('-----------------------------')
+        legacy_time = time_it('Legacy yaml write', count, lambda: legacy_write(catalog, legacy_path))
+        current_time = time_it('Yaml write', count, lambda: catalog.oscal_write(path))
+        logger.info(f'Speedup: {legacy_time / current_time:.2f}x')
+        logger.info('-----------------------------')
+        legacy_time = time_it('Legacy yaml read', count, lambda: legacy_read(legacy_path))
+        current_time = time_it('Yaml read', count, lambda: Catalog.oscal_read(path))
+        logger.info(f'Speedup: {legacy_time / current_time:.2f}x')
+        if Catalog.oscal_read(legacy_path) != Catalog.oscal_read(path):
+            logger.warning('The catalogs written by the two paths differ.')
+
+
+if __name__ == '__main__':
+    default_path = 'nist-content/nist.gov/SP800-53/rev5/json/NIST_SP-800-53_rev5_catalog.json'
+    path = pathlib.Path(sys.argv[1] if len(sys.argv) > 1 else default_path)
+    count = 5
+    run(path, count)
@@ -16,6 +16,7 @@
 
 import logging
 import pathlib
+import sys
 
 from trestle.common import const
 from trestle.transforms.transformer_singleton import transformer_factory
@@ -26,10 +27,17 @@ logger.addHandler(logging.StreamHandler())
 
 sample_data_f = pathlib.Path('small_sample_tanium.json')
 
-if __name__ == '__main__':
-    with sample_data_f.open('r', encoding=const.FILE_ENCODING) as f:
+
+def transform(data_f: pathlib.Path) -> str:
+    """Transform the tanium results in the file to OSCAL, serialized as json."""
+    with data_f.open('r', encoding=const.FILE_ENCODING) as f:
         stringed = f.read()
     tanium_tf = transformer_factory.get('tanium')
     output_oscal = tanium_tf.transform(stringed)
-    json_str = output_oscal.oscal_serialize_json()
+    return output_oscal.oscal_serialize_json()
+
+
+if __name__ == '__main__':
+    data_f = pathlib.Path(sys.argv[1]) if len(sys.argv) > 1 else sample_data_f
+    json_str = transform(data_f)
     logger.info(json_str)
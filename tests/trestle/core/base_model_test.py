@@ -19,7 +19,10 @@ import pathlib
 from datetime import datetime, timezone, tzinfo
 from uuid import uuid4
 
+import orjson
+
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from pydantic.v1 import ValidationError
 
@@ -244,6 +247,20 @@ def test_stripping_model_class() -> None:
         raise Exception('Test failure')
 
 
+def test_stripped_model_type_reused() -> None:
+    """Test the same stripped model type is returned for the same fields however they are given."""
+    stripped_type = oscatalog.Catalog.create_stripped_model_type(stripped_fields=['metadata', 'back_matter'])
+    assert oscatalog.Catalog.create_stripped_model_type(stripped_fields=['back_matter', 'metadata']) is stripped_type
+    assert (
+        oscatalog.Catalog.create_stripped_model_type(stripped_fields_aliases=['back-matter', 'metadata'])
+        is stripped_type
+    )
+    assert oscatalog.Catalog.create_stripped_model_type(stripped_fields=['metadata']) is not stripped_type
+    assert oscatalog.Group1.create_stripped_model_type(stripped_fields=['controls']) is not (
+        oscatalog.Group2.create_stripped_model_type(stripped_fields=['controls'])
+    )
+
+
 def test_stripped_model_type_failure() -> None:
     """Test for user failure conditions."""
     with pytest.raises(err.TrestleError):
@@ -393,6 +410,39 @@ def test_oscal_write(tmp_path: pathlib.Path) -> None:
         component2.oscal_write(tmp_path / 'target.borked')
 
 
+@pytest.mark.parametrize('pretty', [True, False])
+@pytest.mark.parametrize('wrapped', [True, False])
+def test_oscal_serialize_json_matches_dict(
+    sample_catalog_rich_controls: oscatalog.Catalog, pretty: bool, wrapped: bool
+) -> None:
+    """Test json serialized from the model directly is the same as orjson gives for the dict of the model."""
+    catalog = sample_catalog_rich_controls
+    odict = catalog.oscal_dict() if wrapped else catalog.dict(by_alias=True, exclude_none=True)
+    expected = orjson.dumps(odict, default=catalog.__json_encoder__, option=orjson.OPT_INDENT_2 if pretty else 0)
+    assert catalog.oscal_serialize_json_bytes(pretty=pretty, wrapped=wrapped) == expected
+
+    # nested root models, an empty list and strings with newlines in a list of plain values
+    props = [common.Property.construct(name='a', value='b', remarks=common.Remarks(__root__='c\nd'))]
+    part = common.Part(id='ac-1_smt', name='item', props=props, parts=[])
+    control = oscatalog.Control.construct(id='ac-1', title='title', parts=[part], params=None, class_=None)
+    control.__dict__['extra'] = {'a': ['e\nf', 2], 'b': {}, 'c': None}
+    expected = orjson.dumps(
+        {**control.dict(by_alias=True, exclude_none=True), 'extra': control.__dict__['extra']},
+        option=orjson.OPT_INDENT_2 if pretty else 0,
+    )
+    assert control.oscal_serialize_json_bytes(pretty=pretty, wrapped=False) == expected
+
+
+def test_oscal_write_json_in_chunks(
+    sample_catalog_rich_controls: oscatalog.Catalog, tmp_path: pathlib.Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test json written to file in small chunks is the same as the serialized model."""
+    monkeypatch.setattr(ospydantic._OscalJsonWriter, 'chunk_size', 100)
+    path = tmp_path / 'catalog.json'
+    sample_catalog_rich_controls.oscal_write(path)
+    assert path.read_bytes() == sample_catalog_rich_controls.oscal_serialize_json_bytes(pretty=True)
+
+
 def test_get_field_value_by_alias(sample_nist_component_def: component.ComponentDefinition) -> None:
     """Test get attribute by alias method."""
     assert (
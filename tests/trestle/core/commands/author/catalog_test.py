@@ -179,6 +179,65 @@ def test_catalog_generate_assemble(
     assert test_utils.catalog_interface_equivalent(interface_orig, assembled_cat, False)
 
 
+def test_catalog_generate_jobs(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test the catalog markdown written by several processes is the same as written serially."""
+    cat_name = 'my_cat'
+    md_name = 'my_md'
+    catalog_dir = tmp_trestle_dir / f'catalogs/{cat_name}'
+    catalog_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copy(test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME, catalog_dir / 'catalog.json')
+    test_args = f'trestle author catalog-generate -n {cat_name} -o {md_name}'.split()
+    monkeypatch.setattr(sys, 'argv', test_args)
+    assert Trestle().run() == 0
+    fc = test_utils.FileChecker(tmp_trestle_dir / md_name)
+
+    monkeypatch.setattr(sys, 'argv', test_args + ['-j', '4', '-fo'])
+    assert Trestle().run() == 0
+    assert fc.files_unchanged()
+
+
+def test_catalog_generate_unchanged(
+    tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    """Test catalog generate only writes the control markdown files whose content changes."""
+    cat_name = 'my_cat'
+    md_name = 'my_md'
+    catalog_dir = tmp_trestle_dir / f'catalogs/{cat_name}'
+    catalog_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copy(test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME, catalog_dir / 'catalog.json')
+    catalog_generate = f'trestle author catalog-generate -n {cat_name} -o {md_name}'
+    test_utils.execute_command_and_assert(catalog_generate, 0, monkeypatch)
+    md_files = sorted((tmp_trestle_dir / md_name).rglob('*.md'))
+    mtimes = {md_file: md_file.stat().st_mtime_ns for md_file in md_files}
+    ac_1 = tmp_trestle_dir / md_name / 'ac/ac-1.md'
+    ac_1.unlink()
+
+    capsys.readouterr()
+    test_utils.execute_command_and_assert(catalog_generate, 0, monkeypatch)
+    output, _ = capsys.readouterr()
+    assert f'Wrote 1 control markdown files in {tmp_trestle_dir / md_name}' in output
+    assert f'with {len(md_files) - 1} unchanged files left as is' in output
+    assert all(md_file.stat().st_mtime_ns == mtimes[md_file] for md_file in md_files if md_file != ac_1)
+
+
+def test_catalog_assemble_jobs(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test catalog assemble with the markdown read by several processes gives the same catalog as reading serially."""
+    cat_name = 'my_cat'
+    md_name = 'my_md'
+    catalog_dir = tmp_trestle_dir / f'catalogs/{cat_name}'
+    catalog_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copy(test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME, catalog_dir / 'catalog.json')
+    test_utils.execute_command_and_assert(f'trestle author catalog-generate -n {cat_name} -o {md_name}', 0, monkeypatch)
+
+    catalog_assemble = f'trestle author catalog-assemble -m {md_name} -sp'
+    test_utils.execute_command_and_assert(f'{catalog_assemble} -o serial_cat', 0, monkeypatch)
+    test_utils.execute_command_and_assert(f'{catalog_assemble} -o parallel_cat -j 4', 0, monkeypatch)
+    serial_cat, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'serial_cat', cat.Catalog)
+    parallel_cat, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'parallel_cat', cat.Catalog)
+    assert ModelUtils.models_are_equivalent(serial_cat, parallel_cat, True)
+    assert len(CatalogInterface(parallel_cat).get_control_ids()) == 75
+
+
 def test_catalog_assemble_version(sample_catalog_rich_controls: cat.Catalog, tmp_trestle_dir: pathlib.Path) -> None:
     """Test catalog assemble version."""
     cat_name = 'my_cat'
@@ -178,6 +178,36 @@ def test_e2e(
     rc = trestle.cli.Trestle().run()
     assert rc == validate_code
 
+    # validating in parallel gives the same outcome
+    monkeypatch.setattr(sys, 'argv', (command_string_validate_content + ' -j 2').split())
+    rc = trestle.cli.Trestle().run()
+    assert rc == validate_code
+
+
+def test_validate_jobs_reports_all_invalid(
+    testdata_dir: pathlib.Path, tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    """Test validation with jobs reports every invalid file with the time taken."""
+    md_format_dir = testdata_dir / 'author/0.0.1/test_1_md_format'
+    execute_command_and_assert('trestle author docs setup -tn test_task', 0, monkeypatch)
+    template_loc = tmp_trestle_dir / '.trestle' / 'author' / 'test_task' / START_TEMPLATE_VERSION / 'template.md'
+    shutil.copyfile(md_format_dir / 'template.md', template_loc)
+    task_dir = tmp_trestle_dir / 'test_task'
+    for name in ['bad_1.md', 'bad_2.md']:
+        shutil.copyfile(md_format_dir / 'bad_instance_missing_heading.md', task_dir / name)
+    shutil.copyfile(md_format_dir / 'correct_instance_extra_features.md', task_dir / 'good.md')
+    capsys.readouterr()
+
+    execute_command_and_assert('trestle author docs validate -tn test_task -j 2', 1, monkeypatch)
+    out, _ = capsys.readouterr()
+    assert 'Validated 3 files in' in out
+    assert 'with 2 invalid' in out
+    for name in ['bad_1.md', 'bad_2.md']:
+        assert f'  INVALID: test_task/{name}' in out
+    assert 'VALID: test_task/good.md (' in out
+
+    execute_command_and_assert('trestle author docs validate -tn test_task -j 0', 1, monkeypatch)
+
 
 def test_failure_bad_template_dir(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
     """Create and test a bad directory."""
@@ -282,6 +282,11 @@ def test_e2e(
     rc = trestle.cli.Trestle().run()
     assert rc == validate_code
 
+    # validating in parallel gives the same outcome
+    monkeypatch.setattr(sys, 'argv', (command_string_validate_content + ' -j 2').split())
+    rc = trestle.cli.Trestle().run()
+    assert rc == validate_code
+
 
 @pytest.mark.parametrize(
     'task_name, template_content, target_content, setup_code, template_code, validate_code, readme_validate',
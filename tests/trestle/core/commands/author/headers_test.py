@@ -212,6 +212,11 @@ def test_e2e(
     rc = Trestle().run()
     assert rc == validate_rc
 
+    # validating in parallel gives the same outcome
+    monkeypatch.setattr(sys, 'argv', (command_string_validate_content + ' -j 2').split())
+    rc = Trestle().run()
+    assert rc == validate_rc
+
 
 def test_abort_safely_on_missing_directory(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
     """Test that validation fails cleanly on a missing directory."""
@@ -23,6 +23,7 @@ from tests.test_utils import execute_command_and_assert, setup_for_ssp
 
 from trestle.core.commands.author.jinja import _number_captions
 from trestle.core.commands.author.ssp import SSPGenerate
+from trestle.core.jinja.environment import create_environment
 from trestle.core.markdown.docs_markdown_node import DocsMarkdownNode
 
 
@@ -156,6 +157,46 @@ def test_jinja_profile_docs(
                 assert node4.get_node_for_key('## Implementation Guidance')
 
 
+def test_jinja_profile_docs_jobs(
+    testdata_dir: pathlib.Path, tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test Jinja Profile docs rendered in parallel and with the bytecode cache match the serial output."""
+    input_template = 'profile_to_docs.md.jinja'
+
+    setup_ssp(testdata_dir, tmp_trestle_dir, monkeypatch)
+
+    command_import = f'trestle author jinja -i {input_template} -o controls -p comp_prof --docs-profile'
+    execute_command_and_assert(command_import, 0, monkeypatch)
+    serial = {
+        path.relative_to(tmp_trestle_dir / 'controls'): path.read_text()
+        for path in (tmp_trestle_dir / 'controls').rglob('*.md')
+    }
+    assert serial
+
+    for options in ['-j 2', '-bc', '-j 2 -bc']:
+        shutil.rmtree(tmp_trestle_dir / 'controls')
+        execute_command_and_assert(f'{command_import} {options}', 0, monkeypatch)
+        for rel_path, contents in serial.items():
+            assert (tmp_trestle_dir / 'controls' / rel_path).read_text() == contents
+    assert any((tmp_trestle_dir / '.trestle' / 'cache' / '__jinja__').iterdir())
+
+    execute_command_and_assert(f'{command_import} -j 0', 1, monkeypatch)
+
+
+def test_jinja_bytecode_cache_skips_rendered_templates(tmp_trestle_dir: pathlib.Path) -> None:
+    """Test only templates loaded from files are saved in the bytecode cache, not templates given by source."""
+    (tmp_trestle_dir / 'template.md.jinja').write_text('# {{ title }}\n')
+    jinja_env = create_environment(tmp_trestle_dir, tmp_trestle_dir)
+    cache_dir = tmp_trestle_dir / '.trestle' / 'cache' / '__jinja__'
+
+    jinja_env.trestle_rendered_templates['rendered'] = '# {{ title }} again\n'
+    assert jinja_env.get_template('rendered').render(title='A') == '# A again'
+    assert not any(cache_dir.iterdir())
+
+    assert jinja_env.get_template('template.md.jinja').render(title='A') == '# A'
+    assert len(list(cache_dir.iterdir())) == 1
+
+
 def test_jinja_profile_docs_no_part_prose(
     testdata_dir: pathlib.Path, tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch
 ) -> None:
@@ -837,15 +837,16 @@ def test_adding_removing_sections(tmp_trestle_dir: pathlib.Path, monkeypatch: Mo
     assert not tree.get_node_for_key('## Control this_should_appear_in_parts')
 
 
+@pytest.mark.parametrize('jobs', [1, 4])
 @pytest.mark.parametrize('bracket_format', [True, False])
 @pytest.mark.parametrize('show_values', [True, False])
 def test_profile_resolve(
-    tmp_trestle_dir: pathlib.Path, show_values: bool, bracket_format: bool, monkeypatch: MonkeyPatch
+    tmp_trestle_dir: pathlib.Path, show_values: bool, bracket_format: bool, jobs: int, monkeypatch: MonkeyPatch
 ) -> None:
     """Test profile resolve to create resolved profile catalog."""
     test_utils.setup_for_multi_profile(tmp_trestle_dir, False, False)
     cat_name = 'resolved_catalog'
-    command_profile_resolve = f'trestle author profile-resolve -n main_profile -o {cat_name}'
+    command_profile_resolve = f'trestle author profile-resolve -n main_profile -o {cat_name} -j {jobs}'
     if show_values:
         command_profile_resolve += ' -sv'
     if bracket_format:
@@ -15,6 +15,7 @@
 
 import argparse
 import pathlib
+import shutil
 from typing import Dict, List
 
 from _pytest.monkeypatch import MonkeyPatch
@@ -115,6 +116,27 @@ def test_ssp_generate(tmp_trestle_dir: pathlib.Path) -> None:
     assert fc.files_unchanged()
 
 
+def test_ssp_generate_jobs(tmp_trestle_dir: pathlib.Path) -> None:
+    """Test the ssp markdown written by several threads is the same as written serially."""
+    args, _ = setup_for_ssp(tmp_trestle_dir, prof_name, ssp_name)
+    ssp_cmd = SSPGenerate()
+    assert ssp_cmd._run(args) == 0
+    md_dir = tmp_trestle_dir / ssp_name
+    fc = FileChecker(md_dir)
+
+    args.jobs = 4
+    shutil.rmtree(md_dir)
+    assert ssp_cmd._run(args) == 0
+    assert fc.files_unchanged()
+
+    # regenerate over the existing markdown
+    assert ssp_cmd._run(args) == 0
+    assert fc.files_unchanged()
+
+    args.jobs = 0
+    assert ssp_cmd._run(args) == 1
+
+
 def test_ssp_generate_no_cds(tmp_trestle_dir: pathlib.Path) -> None:
     """Test the ssp generator with no comp defs."""
     args, _ = setup_for_ssp(tmp_trestle_dir, prof_name, ssp_name)
@@ -490,6 +512,71 @@ def test_ssp_assemble(tmp_trestle_dir: pathlib.Path) -> None:
     assert orig_ssp_path.stat().st_mtime > orig_file_creation
 
 
+def test_ssp_assemble_jobs(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test ssp assemble with the markdown read by several processes gives the same ssp as reading serially."""
+    gen_args, _ = setup_for_ssp(tmp_trestle_dir, prof_name, ssp_name)
+    assert SSPGenerate()._run(gen_args) == 0
+
+    ssp_assemble = f'trestle author ssp-assemble -m {ssp_name} -cd {gen_args.compdefs}'
+    test_utils.execute_command_and_assert(f'{ssp_assemble} -o serial_ssp', 0, monkeypatch)
+    test_utils.execute_command_and_assert(f'{ssp_assemble} -o parallel_ssp -j 4', 0, monkeypatch)
+    serial_ssp, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'serial_ssp', ossp.SystemSecurityPlan)
+    parallel_ssp, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'parallel_ssp', ossp.SystemSecurityPlan)
+    assert ModelUtils.models_are_equivalent(serial_ssp, parallel_ssp, True)
+
+
+def test_ssp_assemble_incremental(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test ssp assemble only reads the changed markdown and gives the same ssp as a full assemble."""
+    gen_args, _ = setup_for_ssp(tmp_trestle_dir, prof_name, ssp_name)
+    assert SSPGenerate()._run(gen_args) == 0
+
+    ssp_assemble = f'trestle author ssp-assemble -m {ssp_name} -cd {gen_args.compdefs}'
+    test_utils.execute_command_and_assert(f'{ssp_assemble} -o first_ssp', 0, monkeypatch)
+
+    prose_sys = 'My response for This System'
+    ac_1_path = tmp_trestle_dir / ssp_name / 'ac/ac-1.md'
+    assert test_utils.substitute_text_in_file(
+        ac_1_path, '<!-- Add implementation prose for the main This System component for control: ac-1 -->', prose_sys
+    )
+
+    read_files: List[pathlib.Path] = []
+    orig_read_control_info = ControlReader.read_control_info_from_md
+
+    def read_control_info(control_file: pathlib.Path, context: ControlContext):
+        read_files.append(control_file)
+        return orig_read_control_info(control_file, context)
+
+    monkeypatch.setattr(ControlReader, 'read_control_info_from_md', read_control_info)
+    test_utils.execute_command_and_assert(f'{ssp_assemble} -o incremental_ssp', 0, monkeypatch)
+    assert read_files == [ac_1_path]
+
+    read_files.clear()
+    test_utils.execute_command_and_assert(f'{ssp_assemble} -o full_ssp --full', 0, monkeypatch)
+    assert len(read_files) > 1
+
+    incremental_ssp, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'incremental_ssp', ossp.SystemSecurityPlan)
+    full_ssp, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'full_ssp', ossp.SystemSecurityPlan)
+    assert ModelUtils.models_are_equivalent(incremental_ssp, full_ssp, True)
+    imp_req = next(
+        imp_req
+        for imp_req in incremental_ssp.control_implementation.implemented_requirements
+        if imp_req.control_id == 'ac-1'
+    )
+    assert prose_sys in [by_comp.description for by_comp in imp_req.by_components]
+
+    # a cache naming types outside trestle is not used to construct them, and the files are read again
+    cache_paths = list((tmp_trestle_dir / const.TRESTLE_CACHE_DIR / const.ASSEMBLE_CACHE_DIR).glob('*.json'))
+    assert cache_paths
+    for cache_path in cache_paths:
+        text = cache_path.read_text(encoding=const.FILE_ENCODING)
+        cache_path.write_text(text.replace('"trestle.', '"os.'), encoding=const.FILE_ENCODING)
+    read_files.clear()
+    test_utils.execute_command_and_assert(f'{ssp_assemble} -o tampered_ssp', 0, monkeypatch)
+    assert len(read_files) > 1
+    tampered_ssp, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'tampered_ssp', ossp.SystemSecurityPlan)
+    assert ModelUtils.models_are_equivalent(tampered_ssp, full_ssp, True)
+
+
 def test_ssp_assemble_fedramp_profile(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
     """Tests ssp assemble with a fedramp profile."""
     gen_args = setup_for_ssp_fedramp(tmp_trestle_dir, ssp_name)
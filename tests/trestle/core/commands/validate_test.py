@@ -190,6 +190,87 @@ def test_role_refs_validator(
     assert pytest_wrapped_e.value.code == code
 
 
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_validate_all_report(
+    jobs: int, tmp_trestle_dir: pathlib.Path, testdata_dir: pathlib.Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test validation of all models continues past failures and reports every model."""
+    for name, source in [('good_cat', 'minimal_catalog.json'), ('bad_cat', 'minimal_catalog_bad_oscal_version.json')]:
+        (tmp_trestle_dir / test_utils.CATALOGS_DIR / name).mkdir(exist_ok=True, parents=True)
+        shutil.copyfile(
+            testdata_dir / 'json' / source, tmp_trestle_dir / test_utils.CATALOGS_DIR / name / 'catalog.json'
+        )
+    (tmp_trestle_dir / 'assessment-plans/my_ap').mkdir(exist_ok=True, parents=True)
+    ap_obj = generate_sample_model(ap.AssessmentPlan)
+    ap_obj.metadata.roles = [Role(id='id1', title='title1')]
+    ap_obj.metadata.responsible_parties = [ResponsibleParty(role_id='foo', party_uuids=[str(uuid4())])]
+    ap_obj.oscal_write(tmp_trestle_dir / 'assessment-plans/my_ap/assessment-plan.json')
+
+    testcmd = f'trestle validate -a -j {jobs} --report report.json'
+    monkeypatch.setattr(sys, 'argv', testcmd.split())
+    assert Trestle().run() == CmdReturnCodes.COMMAND_ERROR.value
+
+    report = json.loads((tmp_trestle_dir / 'report.json').read_text())
+    assert report['models'] == 3
+    assert report['failures'] == 2
+    assert not report['valid']
+    results = {pathlib.Path(result['model_path']).parent.name: result for result in report['results']}
+    assert results['good_cat']['valid']
+    assert results['bad_cat']['load_failed']
+    assert not results['my_ap']['valid']
+    assert not results['my_ap']['load_failed']
+    assert all(result['seconds'] >= 0 for result in report['results'])
+
+    # without the load failure the models that fail validation give a validation error
+    shutil.rmtree(tmp_trestle_dir / test_utils.CATALOGS_DIR / 'bad_cat')
+    assert Trestle().run() == CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
+
+    monkeypatch.setattr(sys, 'argv', ['trestle', 'validate', '-a', '-j', '0'])
+    assert Trestle().run() == CmdReturnCodes.INCORRECT_ARGS.value
+
+
+def test_validate_all_incremental(
+    tmp_trestle_dir: pathlib.Path, testdata_dir: pathlib.Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test incremental validation skips unchanged models and revalidates those referencing changed ones."""
+    for name in ['my_cat', 'other_cat']:
+        (tmp_trestle_dir / test_utils.CATALOGS_DIR / name).mkdir(exist_ok=True, parents=True)
+        shutil.copyfile(
+            testdata_dir / 'json/minimal_catalog.json',
+            tmp_trestle_dir / test_utils.CATALOGS_DIR / name / 'catalog.json',
+        )
+    profile = generate_sample_model(prof.Profile)
+    profile.imports = [prof.Import1(href='trestle://catalogs/my_cat/catalog.json', include_all={})]
+    ModelUtils.save_top_level_model(profile, tmp_trestle_dir, 'my_prof', FileContentType.JSON)
+    report_path = tmp_trestle_dir / 'report.json'
+
+    def validate_and_get_skipped():
+        monkeypatch.setattr(sys, 'argv', ['trestle', 'validate', '-a', '-i', '--report', 'report.json'])
+        assert Trestle().run() == 0
+        report = json.loads(report_path.read_text())
+        return {pathlib.Path(result['model_path']).parent.name for result in report['results'] if result['skipped']}
+
+    assert validate_and_get_skipped() == set()
+    assert (tmp_trestle_dir / const.TRESTLE_CONFIG_DIR / const.VALIDATION_MANIFEST_FILE).exists()
+    assert validate_and_get_skipped() == {'my_cat', 'other_cat', 'my_prof'}
+
+    # a change to the imported catalog causes the profile importing it to be validated again
+    cat_path = tmp_trestle_dir / test_utils.CATALOGS_DIR / 'my_cat/catalog.json'
+    catalog = Catalog.oscal_read(cat_path)
+    catalog.metadata.title = 'changed title'
+    catalog.oscal_write(cat_path)
+    assert validate_and_get_skipped() == {'other_cat'}
+    assert validate_and_get_skipped() == {'my_cat', 'other_cat', 'my_prof'}
+
+    # a change within a split model is detected
+    other_cat_dir = tmp_trestle_dir / test_utils.CATALOGS_DIR / 'other_cat'
+    assert SplitCmd.perform_split(other_cat_dir, 'catalog.json', 'catalog.metadata', tmp_trestle_dir) == 0
+    assert validate_and_get_skipped() == {'my_cat', 'my_prof'}
+    metadata_path = tmp_trestle_dir / test_utils.CATALOGS_DIR / 'other_cat/catalog/metadata.json'
+    metadata_path.write_text(metadata_path.read_text().replace(catalog.metadata.version, 'new version'))
+    assert validate_and_get_skipped() == {'my_cat', 'my_prof'}
+
+
 def test_oscal_version_validator(
     tmp_trestle_dir: pathlib.Path, sample_catalog_minimal: Catalog, monkeypatch: MonkeyPatch
 ) -> None:
@@ -18,22 +18,29 @@
 import copy
 import pathlib
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
+from uuid import uuid4
 
 import pytest
 
 from tests import test_utils
 
+from trestle.common import const
 from trestle.common.const import RESOLUTION_SOURCE
 from trestle.common.err import TrestleError
 from trestle.common.model_utils import ModelUtils
 from trestle.core import generators as gens
 from trestle.core.catalog.catalog_interface import CatalogInterface
-from trestle.core.control_interface import ControlInterface, ParameterRep
+from trestle.core.control_interface import ControlInterface, ParameterRep, ParamReplacer
 from trestle.core.models.file_content_type import FileContentType
 from trestle.core.profile_resolver import ProfileResolver
+from trestle.core.remote import cache
 from trestle.core.repository import Repository
+from trestle.core.resolver import _import
 from trestle.core.resolver.merge import Merge
+from trestle.core.resolver.prefetch import prefetch_imports
+from trestle.core.resolver.resolution_cache import ResolutionCache
 from trestle.oscal import OSCAL_VERSION
 from trestle.oscal import catalog as cat
 from trestle.oscal import common as com
@@ -250,6 +257,30 @@ def test_replace_params(param_id, param_text, prose, result) -> None:
     assert ControlInterface._replace_ids_with_text(prose, ParameterRep.VALUE_OR_STRING_NONE, param_dict) == result
 
 
+def test_param_replacer() -> None:
+    """Test the param replacer handles adjacent ids, nested moustaches and changed params."""
+    param_1 = com.Parameter1(id='ac-2_smt.1', values=['the cat'])
+    param_10 = com.Parameter1(id='ac-2_smt.10', values=['{{ insert: param, ac-2_smt.1 }} food'])
+    param_dict = {param_1.id: param_1, param_10.id: param_10}
+    replacer = ParamReplacer(param_dict, None, ParameterRep.VALUE_OR_STRING_NONE)
+    assert replacer.replace_ids('ac-2_smt.1 ac-2_smt.1.') == 'the cat the cat.'
+    assert replacer.replace_ids('ac-2_smt.1x ac-2_smt.10') == 'ac-2_smt.1x {{ insert: param, ac-2_smt.1 }} food'
+    assert replacer.replace_moustaches(' Feed {{ ac-2_smt.10 }} to {{ insert: param, foo }} ') == (
+        'Feed the cat food to {{ insert: param, foo }}'
+    )
+    assert replacer.replace_moustaches('{{ foo }}') == '{{ foo }}'
+
+    # the string of a param is reused until it is forgotten
+    param_1.values = ['the dog']
+    assert replacer.replace_moustaches('{{ ac-2_smt.1 }}') == 'the cat'
+    replacer.forget(param_1.id)
+    assert replacer.replace_moustaches('{{ ac-2_smt.1 }}') == 'the dog'
+
+    assert ParamReplacer({}, None, ParameterRep.VALUE_OR_STRING_NONE).replace_ids('ac-2_smt.1') == 'ac-2_smt.1'
+    leave_replacer = ParamReplacer(param_dict, None, ParameterRep.LEAVE_MOUSTACHE)
+    assert leave_replacer.replace_moustaches('{{ ac-2_smt.1 }}') == '{{ ac-2_smt.1 }}'
+
+
 def test_replace_params_assignment_mode(simplified_nist_catalog: cat.Catalog) -> None:
     """Test replacement of params in assignment mode."""
     cat_interface = CatalogInterface(simplified_nist_catalog)
@@ -515,6 +546,122 @@ def test_profile_resolver_diamond_dependency(tmp_trestle_dir: pathlib.Path) -> N
     assert cat_interface.get_count_of_controls_in_dict() > 0
 
 
+def test_profile_resolver_resolution_cache(tmp_trestle_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test profiles resolved against a shared resolution cache match uncached resolution."""
+    test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
+    _, prof_a_path = ModelUtils.load_model_for_class(tmp_trestle_dir, 'test_profile_a', prof.Profile)
+    _, prof_b_path = ModelUtils.load_model_for_class(tmp_trestle_dir, 'test_profile_b', prof.Profile)
+    uncached_a = ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path)
+    uncached_b = ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_b_path)
+
+    # profile a imports nist_cat and profile b, which imports nist_cat again and profile c
+    resolution_cache = ResolutionCache()
+    cached_a = ProfileResolver.get_resolved_profile_catalog(
+        tmp_trestle_dir, prof_a_path, resolution_cache=resolution_cache
+    )
+    assert ModelUtils.models_are_equivalent(cached_a, uncached_a, True)
+    assert resolution_cache.hits == 1
+    assert len(resolution_cache) == 5
+
+    fetch_count = 0
+    orig_get_fetcher = cache.FetcherFactory.get_fetcher
+
+    def get_fetcher_counted(*args, **kwargs):
+        nonlocal fetch_count
+        fetch_count += 1
+        return orig_get_fetcher(*args, **kwargs)
+
+    monkeypatch.setattr(cache.FetcherFactory, 'get_fetcher', get_fetcher_counted)
+    # only profile b itself is fetched since its imports are already cached
+    cached_b = ProfileResolver.get_resolved_profile_catalog(
+        tmp_trestle_dir, prof_b_path, resolution_cache=resolution_cache
+    )
+    assert ModelUtils.models_are_equivalent(cached_b, uncached_b, True)
+    assert fetch_count == 1
+    cached_b_again = ProfileResolver.get_resolved_profile_catalog(
+        tmp_trestle_dir, prof_b_path, resolution_cache=resolution_cache
+    )
+    assert fetch_count == 1
+    assert cached_b_again is not cached_b
+    assert ModelUtils.models_are_equivalent(cached_b_again, uncached_b, True)
+
+    # changes to a returned catalog do not leak into the cache
+    cached_b_again.metadata.title = 'changed'
+    cached_b_third = ProfileResolver.get_resolved_profile_catalog(
+        tmp_trestle_dir, prof_b_path, resolution_cache=resolution_cache
+    )
+    assert cached_b_third.metadata.title == uncached_b.metadata.title
+
+    resolution_cache.clear()
+    assert len(resolution_cache) == 0
+    assert resolution_cache.hits == 0
+
+
+def test_profile_resolver_jobs(tmp_trestle_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test concurrent resolution of sibling imports matches serial resolution."""
+    test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
+    _, prof_a_path = ModelUtils.load_model_for_class(tmp_trestle_dir, 'test_profile_a', prof.Profile)
+    serial_cat = ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path)
+    executor_workers = []
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def __init__(self, max_workers: int) -> None:
+            executor_workers.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(_import, 'ThreadPoolExecutor', CountingExecutor)
+    parallel_cat = ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path, jobs=4)
+    # profile a imports profile b, which has imports of its own that are resolved serially
+    assert executor_workers == [2]
+    assert ModelUtils.models_are_equivalent(serial_cat, parallel_cat, True)
+    assert serial_cat.metadata.links == parallel_cat.metadata.links
+    with pytest.raises(TrestleError, match='at least 1'):
+        ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path, jobs=0)
+
+
+def test_prefetch_imports(tmp_trestle_dir: pathlib.Path) -> None:
+    """Test prefetch of the import graph of a profile visits each model once and reports failures."""
+    test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
+    prof_a, prof_a_path = ModelUtils.load_model_for_class(tmp_trestle_dir, 'test_profile_a', prof.Profile)
+    snapshot_dir = tmp_trestle_dir / const.TRESTLE_CACHE_DIR / const.MODEL_CACHE_DIR
+    shutil.rmtree(snapshot_dir, ignore_errors=True)
+    # profile a imports nist_cat and profile b, which imports nist_cat again, profile c and profile d
+    report = prefetch_imports(tmp_trestle_dir, str(prof_a_path), 4)
+    assert (report.local, report.hits, report.misses, report.failures) == (5, 0, 0, {})
+    # each model is parsed once and its snapshot kept for resolution
+    assert len(list(snapshot_dir.iterdir())) == 5
+
+    # add an import via back matter and one that cannot be fetched
+    resource = com.Resource(uuid=str(uuid4()), rlinks=[])
+    resource.rlinks.append(com.Rlink(href='trestle://profiles/test_profile_c/profile.json'))
+    prof_a.back_matter = com.BackMatter(resources=[resource])
+    prof_a.imports.append(prof.Import1(href=f'#{resource.uuid}', include_all={}))
+    prof_a.imports.append(prof.Import1(href='https://127.0.0.1/no/such/catalog.json', include_all={}))
+    prof_a.oscal_write(prof_a_path)
+    report = prefetch_imports(tmp_trestle_dir, str(prof_a_path), 4)
+    assert report.local == 5
+    assert list(report.failures) == ['https://127.0.0.1/no/such/catalog.json']
+    with pytest.raises(TrestleError, match='at least 1'):
+        prefetch_imports(tmp_trestle_dir, str(prof_a_path), 0)
+
+
+def test_resolution_cache_eviction() -> None:
+    """Test the least recently used catalogs are evicted from the resolution cache."""
+    resolution_cache = ResolutionCache(max_entries=2)
+    catalogs = [gens.generate_sample_model(cat.Catalog) for _ in range(3)]
+    resolution_cache.put('a', catalogs[0])
+    resolution_cache.put('b', catalogs[1])
+    assert resolution_cache.get('a').uuid == catalogs[0].uuid
+    resolution_cache.put('c', catalogs[2])
+    assert 'a' in resolution_cache
+    assert 'b' not in resolution_cache
+    assert resolution_cache.get('b') is None
+    assert resolution_cache.misses == 1
+    assert len(resolution_cache) == 2
+    with pytest.raises(TrestleError):
+        ResolutionCache(0)
+
+
 def test_profile_resolver_no_params(tmp_trestle_dir: pathlib.Path) -> None:
     """Test profile resolver when missing param values."""
     prof_name = 'my_prof'
@@ -1576,3 +1576,18 @@ def test_row_property_builder(tmp_path):
         raise AssertionError('invalid class OK?')
     except Exception:
         assert prop
+
+
+def test_list_index() -> None:
+    """Test list index finds the first item for each key as the list grows, and after it is replaced."""
+    list_index = csv_to_oscal_cd._ListIndex(lambda item: item[0] if item[0] != 'skip' else None)
+    items = [('a', 1), ('skip', 2), ('a', 3)]
+    assert list_index.find(items, 'a') == ('a', 1)
+    assert list_index.find(items, 'skip') is None
+    assert list_index.find(items, 'b') is None
+    items.append(('b', 4))
+    assert list_index.find(items, 'b') == ('b', 4)
+    items = [('a', 5)]
+    assert list_index.find(items, 'a') == ('a', 5)
+    assert list_index.find(items, 'b') is None
+    assert list_index.find(None, 'a') is None
@@ -15,14 +15,19 @@
 """Tanium to OSCAL task tests."""
 
 import configparser
+import json
 import os
 import pathlib
+import re
+import shutil
+import tracemalloc
 
 from _pytest.monkeypatch import MonkeyPatch
 
 from tests.test_utils import TEST_DIR, set_cwd_unsafe
 
 import trestle.common.const as const
+import trestle.core.base_model as base_model
 import trestle.tasks.tanium_result_to_oscal_ar as tanium_result_to_oscal_ar
 import trestle.transforms.implementations.tanium as tanium
 from trestle.tasks.base_task import TaskOutcome
@@ -271,6 +276,66 @@ def test_tanium_execute_cpus(tmp_path, monkeypatch: MonkeyPatch):
     assert retval == TaskOutcome.SUCCESS
 
 
+@set_cwd_unsafe(root_dir)
+def test_tanium_execute_chunks(tmp_path, monkeypatch: MonkeyPatch):
+    """Test execute call with observations built in chunks by worker processes."""
+    monkeybusiness = MonkeyBusiness()
+    monkeypatch.setattr(tanium, '_uuid_component', monkeybusiness.uuid_component)
+    monkeypatch.setattr(tanium, '_uuid_inventory', monkeybusiness.uuid_inventory)
+    monkeypatch.setattr(tanium, '_uuid_observation', monkeybusiness.uuid_observation)
+    monkeypatch.setattr(tanium, '_uuid_result', monkeybusiness.uuid_result)
+    monkeypatch.setattr(tanium.os, 'cpu_count', lambda: 2)
+    tanium.TaniumTransformer.set_timestamp('2021-02-24T19:31:13+00:00')
+    config = setup_config(cf01)
+    section = config['task.tanium-result-to-oscal-ar']
+    section['output-dir'] = str(tmp_path)
+    section['blocksize'] = '100'
+    section['cpus-max'] = '2'
+    section['cpus-min'] = '2'
+    tgt = tanium_result_to_oscal_ar.TaniumResultToOscalAR(section)
+    retval = tgt.execute()
+    assert retval == TaskOutcome.SUCCESS
+    # observations are created in the workers, so only the uuids of the observations differ from serial
+    f_expected = pathlib.Path('tests/data/tasks/tanium/output/') / 'Tanium.oscal.json'
+    f_produced = tmp_path / 'Tanium.oscal.json'
+    expected = re.sub(r'"uuid": "[^"]*"', '', f_expected.read_text(encoding=const.FILE_ENCODING))
+    produced = re.sub(r'"uuid": "[^"]*"', '', f_produced.read_text(encoding=const.FILE_ENCODING))
+    assert produced == expected
+
+
+@set_cwd_unsafe(root_dir)
+def test_tanium_execute_streaming(tmp_path, monkeypatch: MonkeyPatch):
+    """Test execute call reading the input incrementally, as one json list and as one json object per line."""
+    config = setup_config(cf01)
+    section = config['task.tanium-result-to-oscal-ar']
+    ifile = pathlib.Path(section['input-dir']) / 'Tanium.comply-results-json'
+    rows = json.loads(ifile.read_text(encoding=const.FILE_ENCODING))
+    d_ndjson = tmp_path / 'ndjson'
+    d_ndjson.mkdir()
+    with open(d_ndjson / 'Tanium.comply-results-json', 'w', encoding=const.FILE_ENCODING) as fp:
+        for row in rows:
+            fp.write(json.dumps(row) + '\n')
+    f_expected = pathlib.Path('tests/data/tasks/tanium/output/') / 'Tanium.oscal.json'
+    for idir in [section['input-dir'], str(d_ndjson)]:
+        monkeybusiness = MonkeyBusiness()
+        monkeypatch.setattr(tanium, '_uuid_component', monkeybusiness.uuid_component)
+        monkeypatch.setattr(tanium, '_uuid_inventory', monkeybusiness.uuid_inventory)
+        monkeypatch.setattr(tanium, '_uuid_observation', monkeybusiness.uuid_observation)
+        monkeypatch.setattr(tanium, '_uuid_result', monkeybusiness.uuid_result)
+        tanium.TaniumTransformer.set_timestamp('2021-02-24T19:31:13+00:00')
+        d_produced = tmp_path / 'output'
+        section['input-dir'] = idir
+        section['output-dir'] = str(d_produced)
+        section['cpus-max'] = '1'
+        section['blocksize'] = '100'
+        section['streaming'] = 'true'
+        tgt = tanium_result_to_oscal_ar.TaniumResultToOscalAR(section)
+        retval = tgt.execute()
+        assert retval == TaskOutcome.SUCCESS
+        f_produced = d_produced / 'Tanium.oscal.json'
+        assert f_produced.read_text(encoding=const.FILE_ENCODING) == f_expected.read_text(encoding=const.FILE_ENCODING)
+
+
 @set_cwd_unsafe(root_dir)
 def test_tanium_execute_no_config(tmp_path):
     """Test execute no config call."""
@@ -325,6 +390,31 @@ def execute_no_overwrite_dir_part2(tmp_path, monkeypatch: MonkeyPatch):
     assert retval == TaskOutcome.FAILURE
 
 
+@set_cwd_unsafe(root_dir)
+def test_tanium_execute_no_overwrite_writes_nothing(tmp_path):
+    """Test no output is written if any output exists without overwrite, whether or not files are transformed in parallel."""
+    config = setup_config(cf01)
+    section = config['task.tanium-result-to-oscal-ar']
+    d_input = tmp_path / 'input'
+    d_input.mkdir()
+    ifile = pathlib.Path(section['input-dir']) / 'Tanium.comply-results-json'
+    for name in ['Tanium-1.comply-results-json', 'Tanium-2.comply-results-json']:
+        shutil.copy(ifile, d_input / name)
+    d_produced = tmp_path / 'output'
+    d_produced.mkdir()
+    (d_produced / 'Tanium-2.oscal.json').write_text('{}', encoding=const.FILE_ENCODING)
+    section['input-dir'] = str(d_input)
+    section['output-dir'] = str(d_produced)
+    section['output-overwrite'] = 'false'
+    section['cpus-max'] = '1'
+    for jobs in ['1', '2']:
+        section['jobs'] = jobs
+        tgt = tanium_result_to_oscal_ar.TaniumResultToOscalAR(section)
+        retval = tgt.execute()
+        assert retval == TaskOutcome.FAILURE
+        assert os.listdir(d_produced) == ['Tanium-2.oscal.json']
+
+
 @set_cwd_unsafe(root_dir)
 def test_tanium_execute_no_input_dir(tmp_path):
     """Test execute with no input dir call."""
@@ -383,3 +473,78 @@ def test_tanium_execute_override_timestamp(tmp_path, monkeypatch: MonkeyPatch):
     f_expected = pathlib.Path('tests/data/tasks/tanium/output/') / 'Tanium.oscal.2020.json'
     f_produced = tmp_path / 'Tanium.oscal.json'
     assert list(open(f_produced, encoding=const.FILE_ENCODING)) == list(open(f_expected, encoding=const.FILE_ENCODING))
+
+
+@set_cwd_unsafe(root_dir)
+def test_tanium_execute_jobs(tmp_path):
+    """Test execute call with input files transformed in parallel."""
+    config = setup_config(cf01)
+    section = config['task.tanium-result-to-oscal-ar']
+    d_input = tmp_path / 'input'
+    d_input.mkdir()
+    ifile = pathlib.Path(section['input-dir']) / 'Tanium.comply-results-json'
+    for name in ['Tanium-1.comply-results-json', 'Tanium-2.comply-results-json']:
+        shutil.copy(ifile, d_input / name)
+    d_produced = tmp_path / 'output'
+    section['input-dir'] = str(d_input)
+    section['output-dir'] = str(d_produced)
+    section['cpus-max'] = '1'
+    section['jobs'] = '2'
+    tgt = tanium_result_to_oscal_ar.TaniumResultToOscalAR(section)
+    retval = tgt.execute()
+    assert retval == TaskOutcome.SUCCESS
+    assert sorted(os.listdir(d_produced)) == ['Tanium-1.oscal.json', 'Tanium-2.oscal.json']
+    section['jobs'] = '0'
+    tgt = tanium_result_to_oscal_ar.TaniumResultToOscalAR(section)
+    retval = tgt.execute()
+    assert retval == TaskOutcome.FAILURE
+
+
+def make_tanium_input(path: pathlib.Path, n_rows: int, as_list: bool) -> None:
+    """Make tanium input of rows over a fixed set of hosts and rules, as one json list or one json object per line."""
+    rows = []
+    for index in range(n_rows):
+        host = index % 10
+        findings = [
+            {
+                'Check ID': 'CIS Microsoft Windows Server 2019 Benchmark;1.1.0;Level 1',
+                'Rule ID': f'xccdf_org.cisecurity.benchmarks_rule_{rule}',
+                'State': ['pass', 'fail'][(index + rule) % 2],
+            }
+            for rule in range(10)
+        ]
+        row = {
+            'Computer Name': f'host-{host}.lab.test',
+            'Tanium Client IP Address': f'10.0.0.{host}',
+            'IP Address': [f'10.0.0.{host}'],
+            'Comply - Compliance Findings': findings,
+            'Count': '1',
+        }
+        rows.append(json.dumps(row))
+    text = '[' + ','.join(rows) + ']' if as_list else '\n'.join(rows)
+    path.write_text(text, encoding=const.FILE_ENCODING)
+
+
+def test_tanium_transform_file_memory(tmp_path, monkeypatch: MonkeyPatch):
+    """Test transform file peak memory does not grow with the number of rows, for either input format."""
+    # flush the output in small chunks, so the output buffer is full for both sizes
+    monkeypatch.setattr(base_model._OscalJsonWriter, 'chunk_size', 1 << 14)
+    for as_list in [True, False]:
+        peaks = []
+        for n_rows in [50, 200]:
+            ifile = tmp_path / f'Tanium-{n_rows}.comply-results-json'
+            ofile = tmp_path / f'Tanium-{n_rows}.oscal.json'
+            make_tanium_input(ifile, n_rows, as_list)
+            transformer = tanium.TaniumTransformer()
+            transformer.set_modes({'blocksize': 100, 'cpus_max': 1, 'cpus_min': 1})
+            tracemalloc.start()
+            try:
+                transformer.transform_file(ifile, ofile)
+                peaks.append(tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+            results = json.loads(ofile.read_text(encoding=const.FILE_ENCODING))
+            observations = [observation for result in results['results'] for observation in result['observations']]
+            assert len(observations) == n_rows * 10
+        # the input and output grow fourfold, but only one batch of observations is held at a time
+        assert peaks[1] < 1.5 * peaks[0]
@@ -17,6 +17,7 @@
 import configparser
 import os
 import pathlib
+import shutil
 import uuid
 
 from _pytest.monkeypatch import MonkeyPatch
@@ -515,3 +516,48 @@ def test_xccdf_execute_input_oscap_arf_result(tmp_path, monkeypatch: MonkeyPatch
         f_produced = d_produced / fn
         result = text_files_equal(f_expected, f_produced)
         assert result
+
+
+@set_cwd_unsafe(root_dir)
+def test_xccdf_execute_jobs(tmp_path, monkeypatch: MonkeyPatch):
+    """Test execute call with input files transformed in parallel."""
+    monkeybusiness = MonkeyBusiness()
+    monkeypatch.setattr(uuid, 'uuid4', monkeybusiness.uuid_mock1)
+    xccdf.XccdfTransformer.set_timestamp('2021-02-24T19:31:13+00:00')
+    d_input = tmp_path / 'input'
+    d_input.mkdir()
+    d_produced = tmp_path / 'output'
+    d_expected = {}
+    for cf in [cf06, cf07]:
+        section = setup_config(cf)['task.xccdf-result-to-oscal-ar']
+        for ifile in pathlib.Path(section['input-dir']).iterdir():
+            shutil.copy(ifile, d_input)
+        for ofile in pathlib.Path(section['output-dir']).iterdir():
+            d_expected[ofile.name] = ofile
+    section['input-dir'] = str(d_input)
+    section['output-dir'] = str(d_produced)
+    section['jobs'] = '2'
+    tgt = xccdf_result_to_oscal_ar.XccdfResultToOscalAR(section)
+    retval = tgt.execute()
+    assert retval == TaskOutcome.SUCCESS
+    list_dir = os.listdir(d_produced)
+    assert sorted(list_dir) == sorted(d_expected)
+    for fn in list_dir:
+        assert text_files_equal(d_expected[fn], d_produced / fn)
+    section['output-overwrite'] = 'false'
+    tgt = xccdf_result_to_oscal_ar.XccdfResultToOscalAR(section)
+    retval = tgt.execute()
+    assert retval == TaskOutcome.FAILURE
+
+
+@set_cwd_unsafe(root_dir)
+def test_xccdf_execute_bad_jobs(tmp_path):
+    """Test execute call with invalid jobs."""
+    config = setup_config(cf01)
+    section = config['task.xccdf-result-to-oscal-ar']
+    section['output-dir'] = str(tmp_path)
+    section['jobs'] = '0'
+    tgt = xccdf_result_to_oscal_ar.XccdfResultToOscalAR(section)
+    retval = tgt.execute()
+    assert retval == TaskOutcome.FAILURE
+    assert len(os.listdir(str(tmp_path))) == 0
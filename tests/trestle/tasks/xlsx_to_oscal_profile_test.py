@@ -20,10 +20,13 @@ import pathlib
 import uuid
 from unittest.mock import Mock, patch
 
+from openpyxl import load_workbook
+
 from tests.test_utils import TEST_DIR, set_cwd_unsafe, text_files_similar
 
 import trestle.tasks.xlsx_to_oscal_profile as xlsx_to_oscal_profile
 from trestle.tasks.base_task import TaskOutcome
+from trestle.tasks.xlsx_helper import SheetValues
 
 uuid_mock1 = Mock(return_value=uuid.UUID('56666738-0f9a-4e38-9aac-c0fad00a5821'))
 get_trestle_version_mock1 = Mock(return_value='0.21.0')
@@ -458,3 +461,22 @@ def test_xlsx_execute_embedded_blank_in_rule_name_id(tmp_path):
     tgt = xlsx_to_oscal_profile.XlsxToOscalProfile(section)
     retval = tgt.execute()
     assert retval == TaskOutcome.SUCCESS
+
+
+def test_sheet_values_read_only() -> None:
+    """Test sheet values read from a work book loaded read-only match those of a fully loaded work book."""
+    spread_sheet = TEST_DIR / 'data/spread-sheet/good.xlsx'
+    sheet_name = 'example_best_practices_controls'
+    wb_read_only = load_workbook(spread_sheet, read_only=True)
+    read_only = SheetValues(wb_read_only[sheet_name])
+    wb_read_only.close()
+    full = SheetValues(load_workbook(spread_sheet)[sheet_name])
+    assert (read_only.max_row, read_only.max_column) == (full.max_row, full.max_column) == (11, 19)
+    for row in range(1, full.max_row + 2):
+        for col in range(1, full.max_column + 2):
+            assert read_only.value(row, col) == full.value(row, col)
+            assert read_only.merged_value(row, col) == full.merged_value(row, col)
+    # the heading is merged across columns D to J
+    assert read_only.value(1, 5) is None
+    assert read_only.merged_value(1, 5) == read_only.merged_value(1, 10) == 'NIST Mappings'
+    assert read_only.merged_value(1, 11) == 'ResourceTitle (oscal)'
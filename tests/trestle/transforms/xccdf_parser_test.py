@@ -0,0 +1,73 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming xccdf parser tests."""
+
+from defusedxml import DTDForbidden
+
+import pytest
+
+from trestle.transforms.xccdf_parser import iter_rule_results
+
+XCCDF_NS = 'http://checklists.nist.gov/xccdf/1.2'  # NOSONAR
+
+TEST_RESULT = f"""<TestResult xmlns="{XCCDF_NS}" id="test-result-1" version="1.0">
+<benchmark href="#scap_org.open-scap_comp_ssg-ocp4-ds.xml" id="benchmark-1"/>
+<target>target-1</target>
+<target-facts>
+<fact name="urn:xccdf:fact:scanner:name" type="string">OpenSCAP</fact>
+<fact name="urn:xccdf:fact:scanner:version" type="string">1.3.5</fact>
+<fact name="urn:xccdf:fact:asset:identifier:host_name" type="string">host-1</fact>
+</target-facts>
+<rule-result idref="rule-1" time="t1" severity="high" weight="1.0"><result>pass</result></rule-result>
+<rule-result idref="rule-2" time="t2" severity="low" weight="1.0"><ident>CCE-2</ident><result>fail</result></rule-result>
+</TestResult>"""
+
+
+def test_iter_rule_results() -> None:
+    """Test the rule results of a TestResult document and of one within an ARF document are the same."""
+    rule_results = list(iter_rule_results(f'<?xml version="1.0" encoding="UTF-8"?>{TEST_RESULT}'))
+    assert [rule_result['idref'] for rule_result in rule_results] == ['rule-1', 'rule-2']
+    assert [rule_result['result'] for rule_result in rule_results] == ['pass', 'fail']
+    assert rule_results[0] == {
+        'id_': 'test-result-1',
+        'target': 'target-1',
+        'target_type': 'scap_comp_ssg',
+        'host_name': 'host-1',
+        'benchmark_href': '#scap_org.open-scap_comp_ssg-ocp4-ds.xml',
+        'benchmark_id': 'benchmark-1',
+        'scanner_name': 'OpenSCAP',
+        'scanner_version': '1.3.5',
+        'idref': 'rule-1',
+        'version': '1.0',
+        'time': 't1',
+        'result': 'pass',
+        'severity': 'high',
+        'weight': '1.0',
+    }
+
+    arf = f'<?xml version="1.0"?><arf><content><rule-result idref="other"/></content><reports>{TEST_RESULT}'
+    arf += (
+        f'<TestResult xmlns="{XCCDF_NS}" id="test-result-2"><rule-result idref="ignored"/></TestResult></reports></arf>'
+    )
+    arf_results = list(iter_rule_results(arf.encode(), default_version='0'))
+    assert arf_results == [dict(rule_result, version='0') for rule_result in rule_results]
+
+
+def test_iter_rule_results_forbids_dtd() -> None:
+    """Test documents with a dtd are rejected."""
+    xml = f'<?xml version="1.0"?><!DOCTYPE TestResult [<!ENTITY x "y">]>{TEST_RESULT}'
+    with pytest.raises(DTDForbidden):
+        list(iter_rule_results(xml))
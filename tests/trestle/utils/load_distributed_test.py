@@ -23,7 +23,7 @@ import pytest
 from tests import test_utils
 
 from trestle.common.err import TrestleError
-from trestle.common.model_utils import ModelUtils
+from trestle.common.model_utils import LazyModelList, ModelUtils
 from trestle.oscal.catalog import Catalog
 from trestle.oscal.common import Role
 
@@ -114,3 +114,34 @@ def test_load_distributed(testdata_dir, tmp_trestle_dir):
         actual_model_type, actual_model_alias, actual_model_instance = ModelUtils.load_distributed(
             catalog_file, tmp_trestle_dir, Dict
         )
+
+
+def test_load_distributed_jobs_and_lazy(testdata_dir, tmp_trestle_dir):
+    """Test distributed load with a thread pool and with lazy loading of collections."""
+    test_utils.ensure_trestle_config_dir(tmp_trestle_dir)
+    catalogs_dir = tmp_trestle_dir / 'catalogs'
+    shutil.rmtree(catalogs_dir)
+    shutil.copytree(testdata_dir / 'split_merge/step4_split_groups_array/catalogs', catalogs_dir)
+    catalog_file = catalogs_dir / 'mycatalog/catalog.json'
+
+    _, _, expected_catalog = ModelUtils.load_distributed(catalog_file, tmp_trestle_dir)
+
+    model_type, model_alias, catalog = ModelUtils.load_distributed(catalog_file, tmp_trestle_dir, jobs=4)
+    assert model_type == Catalog
+    assert model_alias == 'catalog'
+    assert catalog == expected_catalog
+
+    _, _, lazy_catalog = ModelUtils.load_distributed(catalog_file, tmp_trestle_dir, lazy=True)
+    assert isinstance(lazy_catalog.groups, LazyModelList)
+    assert lazy_catalog.groups.n_loaded == 0
+    assert len(lazy_catalog.groups) == len(expected_catalog.groups)
+    lazy_group = lazy_catalog.groups[1]
+    assert lazy_catalog.groups.n_loaded == 1
+    assert lazy_group.title == expected_catalog.groups[1].title
+    # nested collections are lazy too
+    assert list(lazy_group.controls) == expected_catalog.groups[1].controls
+    assert lazy_catalog.metadata.title == expected_catalog.metadata.title
+    assert [group.id for group in lazy_catalog.groups] == [group.id for group in expected_catalog.groups]
+
+    with pytest.raises(TrestleError):
+        ModelUtils.load_distributed(catalog_file, tmp_trestle_dir, jobs=0)
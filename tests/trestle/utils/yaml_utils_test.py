@@ -0,0 +1,58 @@
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for yaml_utils module."""
+
+import io
+import pathlib
+
+from ruamel.yaml import YAML
+
+import yaml
+
+from trestle.common.yaml_utils import yaml_dump, yaml_load
+from trestle.oscal.catalog import Catalog
+
+
+def test_yaml_scalars_match_ruamel() -> None:
+    """Test plain scalars resolve as ruamel.yaml resolves them and strings survive a round trip."""
+    text = 'a: yes\nb: on\nc: 0755\nd: 1e3\ne: 0o17\nf: true\ng: ~\nh: .inf\ni: y\nj: 12\n'
+    assert yaml_load(text) == YAML(typ='safe').load(text)
+
+    data = {'a': 'yes', 'b': 'on', 'c': '0755', 'd': '1e3', 'e': '0o17', 'f': 'true', 'g': '~', 'h': 'é', 'i': 12}
+    stream = io.StringIO()
+    yaml_dump(data, stream)
+    assert yaml_load(stream.getvalue()) == data
+    assert YAML(typ='safe').load(stream.getvalue()) == data
+
+
+def test_oscal_yaml_round_trip(testdata_dir: pathlib.Path, tmp_path: pathlib.Path) -> None:
+    """Test a catalog written as yaml reads back the same with trestle and with ruamel.yaml."""
+    catalog = Catalog.oscal_read(testdata_dir / 'json/simplified_nist_catalog.json')
+    yaml_path = tmp_path / 'catalog.yaml'
+    catalog.oscal_write(yaml_path)
+    assert Catalog.oscal_read(yaml_path) == catalog
+    assert YAML(typ='safe').load(yaml_path.read_text()) == yaml.safe_load(catalog.oscal_serialize_json())
+
+
+def test_oscal_yaml_layout(testdata_dir: pathlib.Path, tmp_path: pathlib.Path) -> None:
+    """Test a model is written as yaml in the layout written by loading its json as yaml with ruamel.yaml."""
+    catalog = Catalog.oscal_read(testdata_dir / 'json/simplified_nist_catalog.json')
+    yaml_path = tmp_path / 'catalog.yaml'
+    catalog.oscal_write(yaml_path)
+    stream = io.StringIO()
+    ruamel_yaml = YAML(typ='safe')
+    ruamel_yaml.dump(ruamel_yaml.load(catalog.oscal_serialize_json()), stream)
+    assert yaml_path.read_text(encoding='utf8') == stream.getvalue()
+    # collections of scalars are in flow style
+    assert '- {name: label, value: ' in stream.getvalue()
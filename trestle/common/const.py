@@ -223,6 +223,14 @@ HOUR_SECONDS: int = 3600
 
 DAY_SECONDS: int = 24 * HOUR_SECONDS
 
+# section and option of the trestle config file giving the seconds before objects cached from remote hrefs are stale
+CACHE_CONFIG_SECTION = 'cache'
+
+CACHE_EXPIRATION_OPTION = 'expiration-seconds'
+
+# suffix of the file beside an object cached from https holding the validators of the response, for conditional requests
+HTTP_CACHE_METADATA_SUFFIX = '.http-cache.json'
+
 FILE_URI = 'file:///'
 
 SFTP_URI = 'sftp://'
@@ -248,6 +256,25 @@ CACHE_ABS_DIR = '__abs__'
 
 UNIX_CACHE_ROOT = '__root__'
 
+# directory within the trestle cache holding a parsed model snapshot per cached object
+MODEL_CACHE_DIR = '__models__'
+
+# key signing the model snapshots, kept in the cache directory of the user outside the workspace
+SNAPSHOT_KEY_DIR = 'compliance-trestle'
+
+SNAPSHOT_KEY_FILE = 'snapshot.key'
+
+SNAPSHOT_KEY_SIZE = 32
+
+# directory within the trestle cache holding the content parsed from control markdown during assembly
+ASSEMBLE_CACHE_DIR = '__assemble__'
+
+# directory within the trestle cache holding compiled jinja templates
+JINJA_CACHE_DIR = '__jinja__'
+
+# file within the trestle config dir recording the models that passed validation
+VALIDATION_MANIFEST_FILE = 'validation-manifest.json'
+
 TRESTLE_HREF_HEADING = 'trestle://'
 
 TRESTLE_HREF_REGEX = '^trestle://[^/]'
@@ -341,6 +368,10 @@ HELP_ALLOWED_SECTIONS = 'Short names of sections that are allowed to be in the a
 
 HELP_MARKDOWN_NAME = 'Name of the output generated profile markdown folder'
 
+HELP_JOBS = 'Number of parallel workers to use, default 1 for serial processing'
+
+HELP_FULL = 'Read all control markdown files rather than only those changed since the last assemble'
+
 HELP_COMPDEFS = 'Comma-separated list of component-definitions for the ssp.'
 
 HELP_INCLUDE_ALL_PARTS = (
@@ -15,14 +15,17 @@
 # limitations under the License.
 """Common utilities for the OSCAL models and directories."""
 
+import functools
 import importlib
 import logging
 import pathlib
 import re
 import uuid
+from collections.abc import Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union, get_args, get_origin
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union, get_args, get_origin
 import types
 
 from pydantic.v1 import BaseModel, create_model
@@ -109,12 +112,54 @@ def _resolve_collection_item_alias(parent_model_type: Type[Any], field_alias: st
         raise err.TrestleError(f'Error in json path {alias_path}: {e}') from e
 
 
+class LazyModelList(Sequence):
+    """
+    Read-only sequence of the members of a decomposed collection, each loaded from its files when first accessed.
+
+    This is what a lazy load_distributed puts in place of the list of members of a decomposed collection.
+    Models holding one are for reading only, since they are not validated and cannot be serialized.
+    Load the model without lazy if it needs to be written or validated.
+    """
+
+    def __init__(self, loaders: List[Callable[[], OscalBaseModel]]) -> None:
+        """Initialize with a function per member that loads it."""
+        self._loaders = loaders
+        self._models: List[Optional[OscalBaseModel]] = [None] * len(loaders)
+
+    def __len__(self) -> int:
+        """Get the number of members."""
+        return len(self._loaders)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[OscalBaseModel, List[OscalBaseModel]]:
+        """Get the member or members, loading them if needed."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        model = self._models[index]
+        if model is None:
+            model = self._loaders[index]()
+            self._models[index] = model
+        return model
+
+    @property
+    def n_loaded(self) -> int:
+        """Get the number of members loaded so far."""
+        return sum(1 for model in self._models if model is not None)
+
+    def __repr__(self) -> str:
+        """Represent the list without loading its members."""
+        return f'LazyModelList({self.n_loaded} of {len(self)} loaded)'
+
+
 class ModelUtils:
     """Utilities for the OSCAL models input and output."""
 
     @staticmethod
     def load_distributed(
-        abs_path: Path, abs_trestle_root: Path, collection_type: Optional[Type[Any]] = None
+        abs_path: Path,
+        abs_trestle_root: Path,
+        collection_type: Optional[Type[Any]] = None,
+        jobs: int = 1,
+        lazy: bool = False,
     ) -> Tuple[
         Type[OscalBaseModel], str, Optional[Union[OscalBaseModel, List[OscalBaseModel], Dict[str, OscalBaseModel]]]
     ]:
@@ -129,6 +174,8 @@ class ModelUtils:
             collection_type: The type of collection model, if it is a collection model.
                 typing.List is the only collection type handled or expected.
                 Defaults to None.
+            jobs: Number of threads used to read and parse the files of a decomposed model.
+            lazy: Load the members of decomposed collections only when they are accessed, as a LazyModelList.
 
         Returns:
             Return a tuple of Model Type (e.g. class 'trestle.oscal.catalog.Catalog'),
@@ -139,7 +186,26 @@ class ModelUtils:
         Note:
             This does not validate the model.  You must either validate the model separately or use the load_validate
             utilities.
+            A model loaded with lazy is for reading only, as described in LazyModelList.
         """
+        if jobs < 1:
+            raise TrestleError(f'Number of jobs must be at least 1, not {jobs}')
+        if jobs == 1:
+            return ModelUtils._load_distributed(abs_path, abs_trestle_root, collection_type, None, lazy)
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            return ModelUtils._load_distributed(abs_path, abs_trestle_root, collection_type, executor, lazy)
+
+    @staticmethod
+    def _load_distributed(
+        abs_path: Path,
+        abs_trestle_root: Path,
+        collection_type: Optional[Type[Any]],
+        executor: Optional[Executor],
+        lazy: bool,
+    ) -> Tuple[
+        Type[OscalBaseModel], str, Optional[Union[OscalBaseModel, List[OscalBaseModel], Dict[str, OscalBaseModel]]]
+    ]:
+        """Load the model as described in load_distributed, using the executor if given for the files it holds."""
         # if trying to load file that does not exist, load path instead
         if not abs_path.exists():
             abs_path = abs_path.with_name(abs_path.stem)
@@ -150,7 +216,7 @@ class ModelUtils:
         if collection_type:
             # If the path contains a list type model
             if collection_type is list:
-                return ModelUtils._load_list(abs_path, abs_trestle_root)
+                return ModelUtils._load_list(abs_path, abs_trestle_root, executor, lazy)
             # the only other collection type in OSCAL is dict, and it only applies to include_all,
             # which is too granular ever to be loaded by this routine
             else:
@@ -179,10 +245,16 @@ class ModelUtils:
         if decomposed_dir.exists():
             aliases_not_to_be_stripped = []
             instances_to_be_merged: List[OscalBaseModel] = []
+            local_paths = sorted(trestle.common.file_utils.iterdir_without_hidden_files(decomposed_dir))
+            file_loaders = iter(
+                ModelUtils._get_file_loaders(
+                    [path for path in local_paths if path.is_file()], abs_trestle_root, executor, lazy
+                )
+            )
 
-            for local_path in sorted(trestle.common.file_utils.iterdir_without_hidden_files(decomposed_dir)):
+            for local_path in local_paths:
                 if local_path.is_file():
-                    model_type, model_alias, model_instance = ModelUtils.load_distributed(local_path, abs_trestle_root)
+                    model_type, model_alias, model_instance = next(file_loaders)()
                     aliases_not_to_be_stripped.append(model_alias.split('.')[-1])
                     instances_to_be_merged.append(model_instance)
 
@@ -201,8 +273,8 @@ class ModelUtils:
                     if model_type.is_collection_container():
                         # This directory is a decomposed List or Dict
                         collection_type = model_type.get_collection_type()
-                        model_type, model_alias, model_instance = ModelUtils.load_distributed(
-                            local_path, abs_trestle_root, collection_type
+                        model_type, model_alias, model_instance = ModelUtils._load_distributed(
+                            local_path, abs_trestle_root, collection_type, executor, lazy
                         )
                         aliases_not_to_be_stripped.append(model_alias.split('.')[-1])
                         instances_to_be_merged.append(model_instance)
@@ -255,7 +327,11 @@ class ModelUtils:
                 # Resolve the Union to get an actual model type based on the data
                 actual_model_type = _get_model_type_from_union(root_type, field_hint)
 
-            merged_model_instance = actual_model_type(**primary_model_dict)
+            if any(isinstance(value, LazyModelList) for value in primary_model_dict.values()):
+                # a lazy collection cannot be validated without loading it, so construct the model unvalidated
+                merged_model_instance = actual_model_type.construct(**primary_model_dict)
+            else:
+                merged_model_instance = actual_model_type(**primary_model_dict)
             return merged_model_type, merged_model_alias, merged_model_instance
         return primary_model_type, primary_model_alias, primary_model_instance
 
@@ -376,7 +452,7 @@ class ModelUtils:
             malias = model_alias.split('.')[-1]
             class_name = alias_to_classname(malias, AliasMode.JSON)
             logger.debug(f'collection field type class name {class_name} and alias {malias}')
-            model_type = create_model(class_name, __base__=OscalBaseModel, __root__=(singular_model_type, ...))
+            model_type = ModelUtils._get_root_wrapper_type(class_name, singular_model_type)
             logger.debug(f'model_type created: {model_type}')
             return model_type, model_alias
 
@@ -450,12 +526,18 @@ class ModelUtils:
                 malias = model_alias.split('.')[-1]
                 class_name = alias_to_classname(malias, AliasMode.JSON)
                 logger.debug(f'Wrapping Union type {singular_model_type} in __root__ model')
-                model_type = create_model(class_name, __base__=OscalBaseModel, __root__=(singular_model_type, ...))
+                model_type = ModelUtils._get_root_wrapper_type(class_name, singular_model_type)
                 return model_type, model_alias
         else:
             singular_model_type = _get_model_type_from_union(singular_model_type)
         return singular_model_type, model_alias
 
+    @staticmethod
+    @functools.cache
+    def _get_root_wrapper_type(class_name: str, root_type: Any) -> Type[OscalBaseModel]:
+        """Get the model wrapping the type in __root__, created once per class name and type."""
+        return create_model(class_name, __base__=OscalBaseModel, __root__=(root_type, ...))
+
     @staticmethod
     def model_type_to_model_dir(model_type: str) -> str:
         """Get plural model directory from model type."""
@@ -667,21 +749,50 @@ class ModelUtils:
         return name[0] == '.' or name[0] == '_'
 
     @staticmethod
-    def _load_list(abs_path: Path, abs_trestle_root: Path) -> Tuple[Type[OscalBaseModel], str, List[OscalBaseModel]]:
+    def _load_list(
+        abs_path: Path, abs_trestle_root: Path, executor: Optional[Executor] = None, lazy: bool = False
+    ) -> Tuple[Type[OscalBaseModel], str, Union[List[OscalBaseModel], LazyModelList]]:
         """Given path to a directory of list(array) models, load the distributed models."""
-        aliases_not_to_be_stripped = []
-        instances_to_be_merged: List[OscalBaseModel] = []
         collection_model_type, collection_model_alias = ModelUtils.get_stripped_model_type(abs_path, abs_trestle_root)
-        for path in sorted(trestle.common.file_utils.iterdir_without_hidden_files(abs_path)):
-            # ASSUMPTION HERE: if it is a directory, there's a file that can not be decomposed further.
-            if path.is_dir():
-                continue
-            _, model_alias, model_instance = ModelUtils.load_distributed(path, abs_trestle_root)
+        # ASSUMPTION HERE: if it is a directory, there's a file that can not be decomposed further.
+        paths = [
+            path
+            for path in sorted(trestle.common.file_utils.iterdir_without_hidden_files(abs_path))
+            if not path.is_dir()
+        ]
+        if lazy:
+            loaders = [functools.partial(ModelUtils._load_member, path, abs_trestle_root, lazy) for path in paths]
+            return collection_model_type, collection_model_alias, LazyModelList(loaders)
+        file_loaders = ModelUtils._get_file_loaders(paths, abs_trestle_root, executor, lazy)
+        instances_to_be_merged: List[OscalBaseModel] = [loader()[2] for loader in file_loaders]
+        return collection_model_type, collection_model_alias, instances_to_be_merged
 
-            instances_to_be_merged.append(model_instance)
-            aliases_not_to_be_stripped.append(model_alias.split('.')[-1])
+    @staticmethod
+    def _load_member(abs_path: Path, abs_trestle_root: Path, lazy: bool) -> Optional[OscalBaseModel]:
+        """Load a member of a lazily loaded collection, without an executor since it may be shut down by now."""
+        return ModelUtils._load_distributed(abs_path, abs_trestle_root, None, None, lazy)[2]
 
-        return collection_model_type, collection_model_alias, instances_to_be_merged
+    @staticmethod
+    def _get_file_loaders(
+        paths: List[Path], abs_trestle_root: Path, executor: Optional[Executor], lazy: bool
+    ) -> List[Callable[[], Tuple[Type[OscalBaseModel], str, Any]]]:
+        """
+        Get a function per file that returns the loaded model for it, in the same order as the files.
+
+        Files that are not decomposed further are submitted to the executor, if there is one, so they are read and
+        parsed concurrently.  The others are loaded in the calling thread when their function is called, since they
+        may use the executor themselves.
+        """
+        loaders: List[Callable[[], Tuple[Type[OscalBaseModel], str, Any]]] = []
+        for path in paths:
+            if executor is not None and not path.with_name(path.stem).exists():
+                future = executor.submit(ModelUtils._load_distributed, path, abs_trestle_root, None, None, lazy)
+                loaders.append(future.result)
+            else:
+                loaders.append(
+                    functools.partial(ModelUtils._load_distributed, path, abs_trestle_root, None, executor, lazy)
+                )
+        return loaders
 
     @staticmethod
     def _parameter_to_dict_recurse(obj: Union[OscalBaseModel, str], partial: bool) -> Union[str, Dict[str, Any]]:
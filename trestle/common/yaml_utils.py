@@ -0,0 +1,84 @@
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Fast reading and writing of yaml holding plain data, such as oscal models.
+
+The loader is backed by libyaml when it is available, which is much faster than the pure python parser.  Plain
+scalars are resolved by the yaml 1.2 core schema, as ruamel.yaml does, so files written by either library read back
+the same.  Output is written by ruamel.yaml, whose line wrapping libyaml cannot reproduce, so files keep the layout
+trestle has always written them in.
+"""
+
+import re
+from typing import IO, Any, Union
+
+from ruamel.yaml import YAML
+
+import yaml
+
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+_YAML_TAG_PREFIX = 'tag:yaml.org,2002:'
+
+# implicit resolvers of the yaml 1.2 core schema, with the characters a matching plain scalar can start with
+_CORE_SCHEMA_RESOLVERS = [
+    ('bool', r'^(?:true|True|TRUE|false|False|FALSE)$', 'tTfF'),
+    ('int', r'^(?:[-+]?[0-9]+|0o[0-7]+|0x[0-9a-fA-F]+)$', '-+0123456789'),
+    (
+        'float',
+        r'^(?:[-+]?(?:\.[0-9]+|[0-9]+(?:\.[0-9]*)?)(?:[eE][-+]?[0-9]+)?|[-+]?\.(?:inf|Inf|INF)|\.(?:nan|NaN|NAN))$',
+        '-+0123456789.',
+    ),
+    ('null', r'^(?:~|null|Null|NULL|)$', ['~', 'n', 'N', '']),
+]
+
+
+class OscalYamlLoader(_SafeLoader):
+    """Safe yaml loader resolving plain scalars by the yaml 1.2 core schema, plus timestamps."""
+
+    def construct_yaml_int(self, node: yaml.ScalarNode) -> int:
+        """Construct an int, where a leading zero does not mean octal as it does in yaml 1.1."""
+        value = self.construct_scalar(node)
+        sign = -1 if value[0] == '-' else 1
+        value = value.lstrip('-+')
+        if value.startswith('0o'):
+            return sign * int(value[2:], 8)
+        if value.startswith('0x'):
+            return sign * int(value[2:], 16)
+        return sign * int(value)
+
+
+# replace the yaml 1.1 resolvers of the loader, keeping those for timestamps and merge keys
+OscalYamlLoader.yaml_implicit_resolvers = {
+    first: [
+        (tag, regexp)
+        for tag, regexp in resolvers
+        if tag in [f'{_YAML_TAG_PREFIX}timestamp', f'{_YAML_TAG_PREFIX}merge']
+    ]
+    for first, resolvers in _SafeLoader.yaml_implicit_resolvers.items()
+}
+for _name, _regexp, _first in _CORE_SCHEMA_RESOLVERS:
+    OscalYamlLoader.add_implicit_resolver(f'{_YAML_TAG_PREFIX}{_name}', re.compile(_regexp), list(_first))
+OscalYamlLoader.add_constructor(f'{_YAML_TAG_PREFIX}int', OscalYamlLoader.construct_yaml_int)
+
+
+def yaml_load(stream: Union[str, bytes, IO[Any]]) -> Any:
+    """Load the yaml document in the stream or string."""
+    return yaml.load(stream, Loader=OscalYamlLoader)  # noqa: S506 - the loader is derived from the safe loader
+
+
+def yaml_dump(data: Any, stream: IO[str]) -> None:
+    """Dump the plain data to the stream as ruamel.yaml always has, with collections of scalars in flow style."""
+    # a new instance per dump, since an instance is not safe to share between threads
+    YAML(typ='safe').dump(data, stream)
@@ -16,7 +16,7 @@
 """Validate based on all registered validators."""
 
 import pathlib
-from typing import Optional
+from typing import List, Optional
 
 import trestle.core.validator_factory as vfact
 from trestle.core.base_model import OscalBaseModel
@@ -32,6 +32,18 @@ class AllValidator(Validator):
         """Return information on which validation failed."""
         return self.last_failure_msg
 
+    def manifest_key(self) -> str:
+        """Return the keys of all registered validators, since a model must pass them all."""
+        return '+'.join(sorted(val.manifest_key() for val in vfact.validator_factory.get_all() if val != self))
+
+    def dependency_hrefs(self, model: OscalBaseModel) -> List[str]:
+        """Return the hrefs that any of the registered validators depend on."""
+        hrefs: List[str] = []
+        for val in vfact.validator_factory.get_all():
+            if val != self:
+                hrefs.extend(href for href in val.dependency_hrefs(model) if href not in hrefs)
+        return hrefs
+
     def model_is_valid(self, model: OscalBaseModel, quiet: bool, trestle_root: Optional[pathlib.Path] = None) -> bool:
         """
         Validate an oscal model against all available validators in the trestle library.
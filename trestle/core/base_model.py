@@ -29,7 +29,9 @@ I can write a comment in here and you can even edit on the same line.
 import datetime
 import logging
 import pathlib
-from typing import Any, Dict, List, Optional, Type, cast
+import threading
+from enum import Enum
+from typing import IO, Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Type, cast
 
 import orjson
 
@@ -37,17 +39,148 @@ from pydantic.v1 import Extra, Field, create_model
 from pydantic.v1.fields import ModelField
 from pydantic.v1.parse import load_file
 
-from ruamel.yaml import YAML
-
 import trestle.common.const as const
 import trestle.common.err as err
 from trestle.common.str_utils import AliasMode, classname_to_alias
 from trestle.common.type_utils import get_origin, is_collection_field_type
+from trestle.common.yaml_utils import yaml_dump, yaml_load
 from trestle.core.models.file_content_type import FileContentType
 from trestle.core.trestle_base_model import TrestleBaseModel
 
 logger = logging.getLogger(__name__)
 
+# stripped model types already created, keyed by the class they derive from and the fields stripped from it
+_stripped_model_types: Dict[Tuple[Type['OscalBaseModel'], FrozenSet[str]], Type['OscalBaseModel']] = {}
+_stripped_model_types_lock = threading.Lock()
+
+
+def _to_plain_data(obj: Any, encoder: Callable[[Any], Any]) -> Any:
+    """Convert the output of dict() to the plain types it is written as in json, using the encoder for the rest."""
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {key: _to_plain_data(value, encoder) for key, value in obj.items()}
+    if obj_type is list:
+        return [_to_plain_data(value, encoder) for value in obj]
+    if obj is None or obj_type in (str, int, float, bool):
+        return obj
+    if isinstance(obj, dict):
+        return {key: _to_plain_data(value, encoder) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [_to_plain_data(value, encoder) for value in obj]
+    if isinstance(obj, Enum):
+        return _to_plain_data(obj.value, encoder)
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        # as orjson formats them when writing json
+        return obj.isoformat()
+    for plain_type in (str, bool, int, float):
+        if isinstance(obj, plain_type):
+            return plain_type(obj)
+    return _to_plain_data(encoder(obj), encoder)
+
+
+class _OscalJsonWriter:
+    """
+    Writer of the json for a model, walking the model itself rather than a dict made from it.
+
+    The output is the same as orjson gives for model.dict(by_alias=True, exclude_none=True), but without building
+    that dict.  The json is written in chunks as it is produced when a stream is given, so at no point is a copy of
+    the whole content held in memory.  Values that are not models, dicts or lists are serialized by orjson.  A model
+    may also hold an iterator in place of a list, e.g. by copy(update=...), to have its items produced only as they
+    are written.
+    """
+
+    chunk_size = 1 << 20
+
+    def __init__(self, default: Callable[[Any], Any], pretty: bool, stream: Optional[IO[bytes]] = None) -> None:
+        """Initialize the writer with the encoder for values orjson does not handle."""
+        self._default = default
+        self._option = orjson.OPT_INDENT_2 if pretty else 0
+        self._pretty = pretty
+        self._stream = stream
+        self._buffer = bytearray()
+
+    def _write(self, piece: bytes) -> None:
+        self._buffer += piece
+        if self._stream is not None and len(self._buffer) > self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the pending output to the stream."""
+        if self._stream is not None:
+            self._stream.write(self._buffer)
+            self._buffer.clear()
+
+    def getvalue(self) -> bytes:
+        """Get all output when there is no stream."""
+        return bytes(self._buffer)
+
+    def write_root(self, model: 'OscalBaseModel', wrapper_key: Optional[str]) -> None:
+        """Write the model, wrapped in an object with the wrapper key if given."""
+        if wrapper_key is not None:
+            self._write_object([(wrapper_key, model)], 0)
+        else:
+            self._write_object(self._model_items(model), 0)
+
+    @staticmethod
+    def _model_items(model: TrestleBaseModel) -> List[Tuple[str, Any]]:
+        fields = model.__fields__
+        return [
+            (fields[name].alias if name in fields else name, value)
+            for name, value in model.__dict__.items()
+            if value is not None
+        ]
+
+    def _write_object(self, items: List[Tuple[str, Any]], level: int) -> None:
+        if not items:
+            self._write(b'{}')
+            return
+        if self._pretty:
+            indent = b'\n' + b'  ' * (level + 1)
+            separator = b': '
+        else:
+            indent = b''
+            separator = b':'
+        self._write(b'{')
+        for i, (key, value) in enumerate(items):
+            self._write((b',' if i else b'') + indent + orjson.dumps(key) + separator)
+            self._write_value(value, level + 1)
+        self._write((b'\n' + b'  ' * level if self._pretty else b'') + b'}')
+
+    def _write_list(self, items: Iterable[Any], level: int) -> None:
+        indent = b'\n' + b'  ' * (level + 1) if self._pretty else b''
+        self._write(b'[')
+        empty = True
+        for item in items:
+            self._write((b'' if empty else b',') + indent)
+            self._write_value(item, level + 1)
+            empty = False
+        if not empty:
+            self._write(b'\n' + b'  ' * level if self._pretty else b'')
+        self._write(b']')
+
+    def _write_value(self, value: Any, level: int) -> None:
+        if isinstance(value, TrestleBaseModel):
+            if '__root__' in value.__fields__:
+                self._write_value(value.__dict__['__root__'], level)
+            else:
+                self._write_object(self._model_items(value), level)
+        elif isinstance(value, dict):
+            # as with pydantic, exclusion of None applies to model fields but not to dict entries
+            self._write_object(list(value.items()), level)
+        elif isinstance(value, (list, tuple, set, frozenset)) and any(
+            isinstance(item, (TrestleBaseModel, dict, list, tuple, set, frozenset)) for item in value
+        ):
+            self._write_list(value, level)
+        elif isinstance(value, Iterator):
+            # a list produced lazily, e.g. one too large to hold in memory, written as its items are produced
+            self._write_list(value, level)
+        else:
+            dumped = orjson.dumps(value, default=self._default, option=self._option)
+            if self._pretty and level and (dumped[0] == 91 or dumped[0] == 123):
+                # indent the nested lines of a list of plain values to its level, as newlines are escaped in strings
+                dumped = dumped.replace(b'\n', b'\n' + b'  ' * level)
+            self._write(dumped)
+
 
 def robust_datetime_serialization(input_dt: datetime.datetime) -> str:
     """Return a nicely formatted string for in a format compatible with OSCAL specifications.
@@ -114,6 +247,7 @@ class OscalBaseModel(TrestleBaseModel):
 
         Returns:
             Pydantic data class thta can be used to instanciate a model.
+            The same class is returned for every request to strip the same fields from the same class.
 
         Raises:
             TrestleError: If user provided both stripped_fields and stripped_field_aliases or neither.
@@ -135,6 +269,17 @@ class OscalBaseModel(TrestleBaseModel):
             except KeyError as e:
                 raise err.TrestleError(f'Field {str(e)} does not exist in the model')
 
+        key = (cls, frozenset(excluded_fields))
+        with _stripped_model_types_lock:
+            new_model = _stripped_model_types.get(key)
+            if new_model is None:
+                new_model = cls._create_stripped_model_type(excluded_fields)
+                _stripped_model_types[key] = new_model
+        return new_model
+
+    @classmethod
+    def _create_stripped_model_type(cls, excluded_fields: List[str]) -> Type['OscalBaseModel']:
+        """Create the pydantic model derived from the current model without the excluded fields."""
         current_fields = cls.__fields__
         new_fields_for_model = {}
         # Build field list
@@ -206,6 +351,10 @@ class OscalBaseModel(TrestleBaseModel):
 
         return stripped_instance
 
+    def _oscal_wrapper_key(self) -> str:
+        """Get the key wrapping the model in oscal json and yaml."""
+        return classname_to_alias(self.__class__.__name__, AliasMode.JSON)
+
     def oscal_dict(self) -> Dict[str, Any]:
         """Return a dictionary including the root wrapping object key."""
         class_name = self.__class__.__name__
@@ -227,13 +376,9 @@ class OscalBaseModel(TrestleBaseModel):
         Returns:
             Oscal model serialized to a json object including packaging inside of a single top level key.
         """
-        if wrapped:
-            odict = self.oscal_dict()
-        else:
-            odict = self.dict(by_alias=True, exclude_none=True)
-        if pretty:
-            return orjson.dumps(odict, default=self.__json_encoder__, option=orjson.OPT_INDENT_2)
-        return orjson.dumps(odict, default=self.__json_encoder__)
+        writer = _OscalJsonWriter(self.__json_encoder__, pretty)
+        writer.write_root(self, self._oscal_wrapper_key() if wrapped else None)
+        return writer.getvalue()
 
     def oscal_serialize_json(self, pretty: bool = False, wrapped: bool = True) -> str:
         """
@@ -266,11 +411,12 @@ class OscalBaseModel(TrestleBaseModel):
 
         if content_type == FileContentType.YAML:
             with pathlib.Path(path).open('w', encoding=const.FILE_ENCODING) as write_file:
-                yaml = YAML(typ='safe')
-                yaml.dump(yaml.load(self.oscal_serialize_json()), write_file)
+                yaml_dump(_to_plain_data(self.oscal_dict(), self.__json_encoder__), write_file)
         elif content_type == FileContentType.JSON:
             with pathlib.Path(path).open('wb') as write_file:
-                write_file.write(self.oscal_serialize_json_bytes(pretty=True))
+                writer = _OscalJsonWriter(self.__json_encoder__, True, write_file)
+                writer.write_root(self, self._oscal_wrapper_key())
+                writer.flush()
 
     @classmethod
     def oscal_read(cls, path: pathlib.Path) -> Optional['OscalBaseModel']:
@@ -297,9 +443,8 @@ class OscalBaseModel(TrestleBaseModel):
         obj: Dict[str, Any] = {}
         try:
             if content_type == FileContentType.YAML:
-                yaml = YAML(typ='safe')
                 with path.open('r', encoding=const.FILE_ENCODING) as fh:
-                    obj = yaml.load(fh)
+                    obj = yaml_load(fh)
             elif content_type == FileContentType.JSON:
                 obj = load_file(path, json_loads=cls.__config__.json_loads)
         except Exception as e:
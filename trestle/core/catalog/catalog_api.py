@@ -15,6 +15,7 @@
 
 import logging
 import pathlib
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
 import trestle.core.generators as gens
@@ -24,6 +25,7 @@ from trestle.common.file_utils import prune_empty_dirs
 from trestle.core.catalog.catalog_interface import CatalogInterface
 from trestle.core.catalog.catalog_merger import CatalogMerger
 from trestle.core.catalog.catalog_reader import CatalogReader
+from trestle.core.catalog.control_read_cache import ControlReadCache
 from trestle.core.catalog.catalog_writer import CatalogWriter
 from trestle.core.control_context import ContextPurpose, ControlContext
 from trestle.oscal import profile as prof
@@ -58,37 +60,55 @@ class CatalogAPI:
             raise TrestleError('ControlContext cannot be empty.')
         self._context = context
 
-    def write_catalog_as_markdown(self, label_as_key: bool = False) -> None:
+    def write_catalog_as_markdown(self, label_as_key: bool = False, jobs: int = 1) -> None:
         """
         Write out the catalog controls from dict as markdown files to the specified directory.
 
         Args:
             label_as_key: Whether to use label_as_key for part_id to label map
+            jobs: Number of processes writing the control markdown files
 
         Returns:
             None
+
+        Notes:
+            Only the control files whose content changes are written, and the counts of files written and left
+            unchanged are logged.
         """
         # create the directory in which to write the control markdown files
         self._context.md_root.mkdir(exist_ok=True, parents=True)
 
         part_id_map = self._catalog_interface.get_statement_part_id_map(label_as_key=label_as_key)
 
+        tick = time.perf_counter()
         if self._context.purpose == ContextPurpose.PROFILE:
             found_alters, _, _ = self.read_additional_content_from_md(label_as_key=True)
-            self._writer.write_catalog_as_profile_markdown(self._context, part_id_map, found_alters)
+            written, unchanged = self._writer.write_catalog_as_profile_markdown(
+                self._context, part_id_map, found_alters, jobs
+            )
         elif self._context.purpose == ContextPurpose.COMPONENT:
-            self._writer.write_catalog_as_component_markdown(self._context, part_id_map)
+            written, unchanged = self._writer.write_catalog_as_component_markdown(self._context, part_id_map, jobs)
         elif self._context.purpose == ContextPurpose.SSP:
-            self._writer.write_catalog_as_ssp_markdown(self._context, part_id_map)
+            written, unchanged = self._writer.write_catalog_as_ssp_markdown(self._context, part_id_map, jobs)
         else:
-            self._writer.write_catalog_as_catalog(self._context, part_id_map)
+            written, unchanged = self._writer.write_catalog_as_catalog(self._context, part_id_map, jobs)
+        logger.info(
+            f'Wrote {written} control markdown files in {self._context.md_root} in {time.perf_counter() - tick:.3f}s'
+            f' with {unchanged} unchanged files left as is.'
+        )
 
         # prune any directories that have no markdown files
         prune_empty_dirs(self._context.md_root, '*.md')
 
-    def read_catalog_from_markdown(self, markdown_dir: pathlib.Path, is_set_parameters: bool) -> cat.Catalog:
-        """Read catalog from markdown."""
-        md_catalog = self._reader.read_catalog_from_markdown(markdown_dir, is_set_parameters)
+    def read_catalog_from_markdown(
+        self,
+        markdown_dir: pathlib.Path,
+        is_set_parameters: bool,
+        jobs: int = 1,
+        read_cache: Optional[ControlReadCache] = None,
+    ) -> cat.Catalog:
+        """Read catalog from markdown, with the control files read by jobs processes and unchanged ones cached."""
+        md_catalog = self._reader.read_catalog_from_markdown(markdown_dir, is_set_parameters, jobs, read_cache)
         md_catalog_interface = CatalogInterface(md_catalog)
         if md_catalog_interface.get_count_of_controls_in_catalog(True) == 0:
             raise TrestleError(f'No controls were loaded from markdown {markdown_dir}.  No catalog created.')
@@ -96,9 +116,9 @@ class CatalogAPI:
         return md_catalog
 
     def read_additional_content_from_md(
-        self, label_as_key: bool = False
+        self, label_as_key: bool = False, jobs: int = 1, read_cache: Optional[ControlReadCache] = None
     ) -> Tuple[List[prof.Alter], Dict[str, Any], Dict[str, str]]:
-        """Read additional content from markdown."""
+        """Read additional content from markdown, with the files read by jobs processes and unchanged ones cached."""
         if not self._context:
             raise TrestleError('Reading content from the markdown requires context to be initialized!')
         label_map = self._catalog_interface.get_statement_part_id_map(label_as_key=label_as_key)
@@ -109,6 +129,8 @@ class CatalogAPI:
             label_map,
             self._context.sections_dict,
             self._context.to_markdown,
+            jobs,
+            read_cache,
         )
 
     def merge_catalog(self, catalog: cat.Catalog, replace_params: bool) -> None:
@@ -37,7 +37,7 @@ from trestle.common.list_utils import (
 )  # noqa E501
 from trestle.common.model_utils import ModelUtils
 from trestle.core.control_context import ControlContext
-from trestle.core.control_interface import CompDict, ComponentImpInfo, ControlInterface
+from trestle.core.control_interface import CompDict, ComponentImpInfo, ControlInterface, ParamReplacer
 from trestle.oscal import common
 from trestle.oscal import component as comp
 from trestle.oscal import profile as prof
@@ -687,17 +687,13 @@ class CatalogInterface:
     ) -> None:
         """Go through all controls and change prose based on param values."""
         param_dict = self._get_full_param_dict()
+        # a single replacer generates the string for each param once for all controls
+        replacer = ParamReplacer(
+            param_dict, param_format, param_rep, show_value_warnings, value_assigned_prefix, value_not_assigned_prefix
+        )
         # insert param values into prose of all controls
         for control in self.get_all_controls_from_dict():
-            ControlInterface.replace_control_prose(
-                control,
-                param_dict,
-                param_format,
-                param_rep,
-                show_value_warnings,
-                value_assigned_prefix,
-                value_not_assigned_prefix,
-            )
+            ControlInterface.replace_control_prose(control, param_dict, replacer=replacer)
 
     @staticmethod
     def _get_display_name_and_ns(param: common.Parameter) -> Tuple[Optional[str], Optional[str]]:
@@ -13,9 +13,12 @@
 # limitations under the License.
 """Provide interface to read catalog from markdown back to OSCAL."""
 
+import functools
+import itertools
 import logging
 import pathlib
-from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import trestle.common.const as const
 import trestle.core.generators as gens
@@ -27,6 +30,7 @@ from trestle.common.common_types import TypeWithSetParams
 from trestle.common.err import TrestleError
 from trestle.common.list_utils import as_list, none_if_empty
 from trestle.core.catalog.catalog_interface import CatalogInterface
+from trestle.core.catalog.control_read_cache import ControlReadCache
 from trestle.core.control_context import ControlContext
 from trestle.core.control_interface import CompDict, ComponentImpInfo, ControlInterface
 from trestle.core.control_reader import ControlReader
@@ -36,6 +40,41 @@ from trestle.oscal import ssp as ossp
 logger = logging.getLogger(__name__)
 
 
+def _read_files(
+    read_file: Callable[[pathlib.Path], Any],
+    md_path: pathlib.Path,
+    files: List[pathlib.Path],
+    jobs: int,
+    read_cache: Optional[ControlReadCache] = None,
+) -> Iterable[Any]:
+    """
+    Read each file in the markdown directory with the function, in worker processes if more than one job is requested.
+
+    The results are given in the order of the files, so merging them gives the same result as reading serially.
+    The function must be picklable, such as a static method or a partial of one.
+    If a read cache is given only the files changed since the last read are parsed, and the rest come from the cache.
+    """
+    if jobs < 1:
+        raise TrestleError(f'Number of jobs for markdown reading must be at least 1, not {jobs}.')
+    if read_cache is not None:
+        return read_cache.read_files(
+            md_path, read_file, files, lambda changed: _read_files(read_file, md_path, changed, jobs)
+        )
+    if jobs == 1 or len(files) < 2:
+        return map(read_file, files)
+    jobs = min(jobs, len(files))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(read_file, files, chunksize=max(1, len(files) // (jobs * 4))))
+
+
+def _get_control_files(md_path: pathlib.Path) -> Dict[str, List[pathlib.Path]]:
+    """Get the control markdown files in each group directory, by group id."""
+    return {
+        group_id: list(group_dir.glob('*.md'))
+        for group_id, group_dir in CatalogInterface._get_group_ids_and_dirs(md_path).items()
+    }
+
+
 class CatalogReader:
     """
     Catalog reader.
@@ -55,58 +94,76 @@ class CatalogReader:
         label_map: Dict[str, Dict[str, str]],
         sections_dict: Dict[str, str],
         write_mode: bool,
+        jobs: int = 1,
+        read_cache: Optional[ControlReadCache] = None,
     ) -> Tuple[List[prof.Alter], Dict[str, Any], Dict[str, str]]:
         """Read all markdown controls and return list of alters plus control param dict and param sort map."""
         alters_map: Dict[str, prof.Alter] = {}
         final_param_dict: Dict[str, Any] = {}
         param_sort_map: Dict[str, str] = {}
-        for group_path in CatalogInterface._get_group_ids_and_dirs(md_path).values():
-            for control_file in group_path.glob('*.md'):
-                sort_id, control_alters, control_param_dict = ControlReader.read_editable_content(
-                    control_file, required_sections_list, label_map, sections_dict, write_mode
-                )
-                alters_map[sort_id] = control_alters
-                for param_id, param_dict in control_param_dict.items():
-                    # if profile_values are present, overwrite values with them
-                    if const.PROFILE_VALUES in param_dict:
+        control_files = [file for files in _get_control_files(md_path).values() for file in files]
+        read_file = functools.partial(
+            ControlReader.read_editable_content,
+            required_sections_list=required_sections_list,
+            part_label_to_id_map=label_map,
+            cli_section_dict=sections_dict,
+            write_mode=write_mode,
+        )
+        for sort_id, control_alters, control_param_dict in _read_files(
+            read_file, md_path, control_files, jobs, read_cache
+        ):
+            alters_map[sort_id] = control_alters
+            for param_id, param_dict in control_param_dict.items():
+                # if profile_values are present, overwrite values with them
+                if const.PROFILE_VALUES in param_dict:
+                    if param_dict[const.PROFILE_VALUES] != [] and param_dict[const.PROFILE_VALUES] is not None:
+                        if not write_mode and const.REPLACE_ME_PLACEHOLDER in param_dict[const.PROFILE_VALUES]:
+                            param_dict[const.PROFILE_VALUES].remove(const.REPLACE_ME_PLACEHOLDER)
                         if param_dict[const.PROFILE_VALUES] != [] and param_dict[const.PROFILE_VALUES] is not None:
-                            if not write_mode and const.REPLACE_ME_PLACEHOLDER in param_dict[const.PROFILE_VALUES]:
-                                param_dict[const.PROFILE_VALUES].remove(const.REPLACE_ME_PLACEHOLDER)
-                            if param_dict[const.PROFILE_VALUES] != [] and param_dict[const.PROFILE_VALUES] is not None:
-                                param_dict[const.VALUES] = param_dict[const.PROFILE_VALUES]
-                        if not write_mode:
-                            param_dict.pop(const.PROFILE_VALUES)
-                    # verifies if at control profile edition the param value origin was modified
-                    # through the profile-param-value-origin tag
-                    if const.PROFILE_PARAM_VALUE_ORIGIN in param_dict:
-                        if param_dict[const.PROFILE_PARAM_VALUE_ORIGIN] != const.REPLACE_ME_PLACEHOLDER:
-                            param_dict[const.PARAM_VALUE_ORIGIN] = param_dict[const.PROFILE_PARAM_VALUE_ORIGIN]
-                            param_dict.pop(const.PROFILE_PARAM_VALUE_ORIGIN)
-                        else:
-                            # removes replace me placeholder and profile-param-value-origin as it was not modified
-                            param_dict.pop(const.PROFILE_PARAM_VALUE_ORIGIN)
-                            # validates param-value-origin is in dict to remove it
-                            # because a value wasn´t provided and it shouldn´t be inheriting value from parent
-                            if const.PARAM_VALUE_ORIGIN in param_dict:
-                                param_dict.pop(const.PARAM_VALUE_ORIGIN)
-                    final_param_dict[param_id] = param_dict
-                    param_sort_map[param_id] = sort_id
+                            param_dict[const.VALUES] = param_dict[const.PROFILE_VALUES]
+                    if not write_mode:
+                        param_dict.pop(const.PROFILE_VALUES)
+                # verifies if at control profile edition the param value origin was modified
+                # through the profile-param-value-origin tag
+                if const.PROFILE_PARAM_VALUE_ORIGIN in param_dict:
+                    if param_dict[const.PROFILE_PARAM_VALUE_ORIGIN] != const.REPLACE_ME_PLACEHOLDER:
+                        param_dict[const.PARAM_VALUE_ORIGIN] = param_dict[const.PROFILE_PARAM_VALUE_ORIGIN]
+                        param_dict.pop(const.PROFILE_PARAM_VALUE_ORIGIN)
+                    else:
+                        # removes replace me placeholder and profile-param-value-origin as it was not modified
+                        param_dict.pop(const.PROFILE_PARAM_VALUE_ORIGIN)
+                        # validates param-value-origin is in dict to remove it
+                        # because a value wasn´t provided and it shouldn´t be inheriting value from parent
+                        if const.PARAM_VALUE_ORIGIN in param_dict:
+                            param_dict.pop(const.PARAM_VALUE_ORIGIN)
+                final_param_dict[param_id] = param_dict
+                param_sort_map[param_id] = sort_id
         new_alters: List[prof.Alter] = []
         # fill the alters according to the control sorting order
         for key in sorted(alters_map.keys()):
             new_alters.extend(alters_map[key])
         return new_alters, final_param_dict, param_sort_map
 
-    def read_catalog_from_markdown(self, md_path: pathlib.Path, set_parameters_flag: bool) -> cat.Catalog:
+    def read_catalog_from_markdown(
+        self,
+        md_path: pathlib.Path,
+        set_parameters_flag: bool,
+        jobs: int = 1,
+        read_cache: Optional[ControlReadCache] = None,
+    ) -> cat.Catalog:
         """
-        Read the groups and catalog controls from the given directory.
+        Read the groups and catalog controls from the given directory, with the files read by jobs processes.
 
         This will overwrite the existing groups and controls in the catalog.
+        If a read cache is given, only the control files changed since the last read are parsed.
         """
-        id_map = CatalogInterface._get_group_ids_and_dirs(md_path)
+        files_map = _get_control_files(md_path)
+        control_files = [file for files in files_map.values() for file in files]
+        read_file = functools.partial(ControlReader.read_control, set_parameters_flag=set_parameters_flag)
+        results = iter(_read_files(read_file, md_path, control_files, jobs, read_cache))
         groups: List[cat.Group1 | cat.Group2] = []
         # read each group dir
-        for group_id, group_dir in id_map.items():
+        for group_id, group_files in files_map.items():
             control_list_raw = []
             group_title = ''
             # Need to get group title from at least one control in this directory
@@ -114,8 +171,7 @@ class CatalogReader:
             # Set group title to the first one found and warn if different non-empty title appears
             # Controls with empty group titles are tolerated but at least one title must be present or warning given
             # The special group with no name that has the catalog as parent is just a list and has no title
-            for control_path in group_dir.glob('*.md'):
-                control, control_group_title = ControlReader.read_control(control_path, set_parameters_flag)
+            for control, control_group_title in itertools.islice(results, len(group_files)):
                 if control_group_title:
                     if group_title:
                         if control_group_title != group_title:
@@ -145,12 +201,16 @@ class CatalogReader:
         return self._catalog_interface._catalog
 
     @staticmethod
-    def read_catalog_imp_reqs(md_path: pathlib.Path, context: ControlContext) -> List[comp.ImplementedRequirement]:
+    def read_catalog_imp_reqs(
+        md_path: pathlib.Path, context: ControlContext, jobs: int = 1, read_cache: Optional[ControlReadCache] = None
+    ) -> List[comp.ImplementedRequirement]:
         """Read the full set of control implemented requirements from markdown.
 
         Args:
             md_path: Path to the markdown control files, with directories for each group
             context: Context for the operation
+            jobs: Number of processes reading the control markdown files
+            read_cache: Optional cache of the content read from unchanged control files
 
         Returns:
             List of implemented requirements gathered from each control
@@ -161,10 +221,10 @@ class CatalogReader:
             This is only used during component assemble and only for updating one component
         """
         imp_req_map: Dict[str, comp.ImplementedRequirement] = {}
-        for group_path in CatalogInterface._get_group_ids_and_dirs(md_path).values():
-            for control_file in group_path.glob('*.md'):
-                sort_id, imp_req = ControlReader.read_implemented_requirement(control_file, context)
-                imp_req_map[sort_id] = imp_req
+        control_files = [file for files in _get_control_files(md_path).values() for file in files]
+        read_file = functools.partial(ControlReader.read_implemented_requirement, context=context)
+        for sort_id, imp_req in _read_files(read_file, md_path, control_files, jobs, read_cache):
+            imp_req_map[sort_id] = imp_req
         return [imp_req_map[key] for key in sorted(imp_req_map.keys())]
 
     @staticmethod
@@ -394,6 +454,8 @@ class CatalogReader:
         comp_dict: Dict[str, generic.GenericComponent],
         part_id_map_by_label: Dict[str, Dict[str, str]],
         context: ControlContext,
+        jobs: int = 1,
+        read_cache: Optional[ControlReadCache] = None,
     ) -> None:
         """
         Read md content into the ssp.
@@ -404,6 +466,8 @@ class CatalogReader:
             comp_dict: map of component name to component
             part_id_map_by_label: map label to part_id of control
             context: control context for the procedure
+            jobs: number of processes reading the control markdown files
+            read_cache: optional cache of the content read from unchanged control files
 
         Notes:
             The ssp should already contain info from the comp defs and this fills in selected content from md.
@@ -415,28 +479,28 @@ class CatalogReader:
             ssp has components but may not have all needed imp reqs and bycomps
             know controlid and comp name in comp_dict
         """
-        for group_path in CatalogInterface._get_group_ids_and_dirs(md_path).values():
-            for control_file in group_path.glob('*.md'):
-                skip = False
-                for file in control_file.parents:
-                    if file.name == const.INHERITANCE_VIEW_DIR:
-                        skip = True
-                        break
-                if skip:
-                    continue
-
-                control_id = control_file.stem
-
-                md_header, control_comp_dict = CatalogReader._read_comp_info_from_md(control_file, context)
-
-                for comp_name, comp_info_dict in control_comp_dict.items():
-                    if comp_name not in comp_dict:
-                        err_msg = f'Control {control_id} references component {comp_name} not defined in a component-definition.'  # noqa E501
-                        # give added guidance if no comp defs were specified at command line
-                        if not context.comp_def_name_list:
-                            err_msg += '  Please specify the names of any component-definitions needed for assembly.'
-                        raise TrestleError(err_msg)
-                    CatalogReader._update_ssp_with_comp_info(
-                        ssp, control_id, comp_dict[comp_name], comp_info_dict, part_id_map_by_label
+        control_files = [
+            control_file
+            for files in _get_control_files(md_path).values()
+            for control_file in files
+            if const.INHERITANCE_VIEW_DIR not in [file.name for file in control_file.parents]
+        ]
+        read_file = functools.partial(CatalogReader._read_comp_info_from_md, context=context)
+        for control_file, (md_header, control_comp_dict) in zip(
+            control_files, _read_files(read_file, md_path, control_files, jobs, read_cache), strict=True
+        ):
+            control_id = control_file.stem
+
+            for comp_name, comp_info_dict in control_comp_dict.items():
+                if comp_name not in comp_dict:
+                    err_msg = (
+                        f'Control {control_id} references component {comp_name} not defined in a component-definition.'  # noqa E501
                     )
-                CatalogReader._update_ssp_with_md_header(ssp, control_id, comp_dict, part_id_map_by_label, md_header)
+                    # give added guidance if no comp defs were specified at command line
+                    if not context.comp_def_name_list:
+                        err_msg += '  Please specify the names of any component-definitions needed for assembly.'
+                    raise TrestleError(err_msg)
+                CatalogReader._update_ssp_with_comp_info(
+                    ssp, control_id, comp_dict[comp_name], comp_info_dict, part_id_map_by_label
+                )
+            CatalogReader._update_ssp_with_md_header(ssp, control_id, comp_dict, part_id_map_by_label, md_header)
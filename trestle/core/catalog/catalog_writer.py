@@ -15,10 +15,14 @@
 
 import copy
 import logging
-from typing import Any, Dict, List
+import pathlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 import trestle.common.const as const
 import trestle.oscal.catalog as cat
+from trestle.common.err import TrestleError
 from trestle.common.list_utils import as_list, deep_get, none_if_empty
 from trestle.common.model_utils import ModelUtils
 from trestle.core.catalog.catalog_interface import CatalogInterface
@@ -33,6 +37,81 @@ from trestle.oscal import profile as prof
 logger = logging.getLogger(__name__)
 
 
+def _write_controls(tasks: List[Tuple[Any, ...]]) -> List[Optional[bool]]:
+    """Write the markdown for a chunk of controls, in a worker process, giving whether each file was written."""
+    return [ControlWriter().write_control_for_editing(*args) for args in tasks]
+
+
+class _ControlWritePool:
+    """
+    Pool writing control markdown files, in worker processes if more than one job is requested.
+
+    Writes are sent to the workers in chunks, each pickled with the contexts and controls it needs, so the catalog
+    interface itself stays in the parent.  Directories are created by the caller before the write is requested so
+    workers never race on them.  On exit all writes are finished and the first failure, in order of request, is raised.
+    The number of files written and of files left unchanged since their content was already the same are counted.
+    """
+
+    chunk_size = 16
+
+    def __init__(self, jobs: int) -> None:
+        """Initialize the pool for the number of jobs."""
+        if jobs < 1:
+            raise TrestleError(f'Number of jobs for markdown generation must be at least 1, not {jobs}.')
+        self._executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+        self._futures: List[Future] = []
+        self._tasks: List[Tuple[Any, ...]] = []
+        self.written = 0
+        self.unchanged = 0
+
+    def __enter__(self) -> '_ControlWritePool':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._executor is not None:
+            if exc_type is None:
+                self._submit()
+            self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+            if exc_type is None:
+                for future in self._futures:
+                    for result in future.result():
+                        self._count(result)
+
+    def _count(self, result: Optional[bool]) -> None:
+        if result:
+            self.written += 1
+        elif result is not None:
+            self.unchanged += 1
+
+    def _submit(self) -> None:
+        if self._tasks:
+            self._futures.append(self._executor.submit(_write_controls, self._tasks))
+            self._tasks = []
+
+    def write(
+        self,
+        context: ControlContext,
+        control: cat.Control,
+        dest_path: pathlib.Path,
+        group_title: str,
+        part_id_map: Dict[str, Dict[str, str]],
+        found_control_alters: List[prof.Alter],
+    ) -> None:
+        """Write the control markdown now, or queue it for a worker."""
+        args = (context, control, dest_path, group_title, part_id_map, found_control_alters)
+        if self._executor is None:
+            self._count(ControlWriter().write_control_for_editing(*args))
+            return
+        self._tasks.append(args)
+        if len(self._tasks) >= self.chunk_size:
+            self._submit()
+
+
 class CatalogWriter:
     """
     Catalog writer.
@@ -46,40 +125,52 @@ class CatalogWriter:
         self._catalog_interface = catalog_interface
 
     def write_catalog_as_profile_markdown(
-        self, context: ControlContext, part_id_map: Dict[str, Dict[str, str]], md_alters: List[prof.Alter]
-    ) -> None:
-        """Write out the catalog as profile markdown."""
+        self,
+        context: ControlContext,
+        part_id_map: Dict[str, Dict[str, str]],
+        md_alters: List[prof.Alter],
+        jobs: int = 1,
+    ) -> Tuple[int, int]:
+        """
+        Write out the catalog as profile markdown, with the controls written by jobs processes.
+
+        Returns the number of control files written and the number left unchanged.
+        """
         # Get the list of params for this profile from its set_params
         # this is just from the set_params
         profile_set_param_dict = CatalogInterface._get_full_profile_param_dict(context.profile)
 
         # write out the controls
-        for control in self._catalog_interface.get_all_controls_from_catalog(True):
-            # here we do special handling of how set-parameters merge with the yaml header
-            new_context = ControlContext.clone(context)
-            new_context.merged_header = {}
+        with _ControlWritePool(jobs) as pool:
+            for control in self._catalog_interface.get_all_controls_from_catalog(True):
+                # here we do special handling of how set-parameters merge with the yaml header
+                new_context = ControlContext.clone(context)
+                new_context.merged_header = {}
 
-            new_context = self._add_inherited_props_to_header(new_context, control.id)
+                new_context = self._add_inherited_props_to_header(new_context, control.id)
 
-            # get all params and vals for this control from the resolved profile catalog with block adds in effect
-            control_param_dict = ControlInterface.get_control_param_dict(control, False)
-            set_param_dict = self._construct_set_parameters_dict(profile_set_param_dict, control_param_dict, context)
+                # get all params and vals for this control from the resolved profile catalog with block adds in effect
+                control_param_dict = ControlInterface.get_control_param_dict(control, False)
+                set_param_dict = self._construct_set_parameters_dict(
+                    profile_set_param_dict, control_param_dict, context
+                )
 
-            if set_param_dict:
-                self._add_set_params_from_cli_yaml_header_to_header(new_context, set_param_dict, control_param_dict)
+                if set_param_dict:
+                    self._add_set_params_from_cli_yaml_header_to_header(new_context, set_param_dict, control_param_dict)
 
-            elif const.SET_PARAMS_TAG in new_context.merged_header:
-                # need to cull any params that are not in control
-                pop_list: List[str] = []
-                for key in new_context.merged_header[const.SET_PARAMS_TAG].keys():
-                    if key not in control_param_dict:
-                        pop_list.append(key)
-                for pop in pop_list:
-                    new_context.merged_header[const.SET_PARAMS_TAG].pop(pop)
+                elif const.SET_PARAMS_TAG in new_context.merged_header:
+                    # need to cull any params that are not in control
+                    pop_list: List[str] = []
+                    for key in new_context.merged_header[const.SET_PARAMS_TAG].keys():
+                        if key not in control_param_dict:
+                            pop_list.append(key)
+                    for pop in pop_list:
+                        new_context.merged_header[const.SET_PARAMS_TAG].pop(pop)
 
-            found_control_alters = [alter for alter in md_alters if alter.control_id == control.id]
+                found_control_alters = [alter for alter in md_alters if alter.control_id == control.id]
 
-            self._write_control_into_dir(new_context, control, part_id_map, found_control_alters)
+                self._write_control_into_dir(pool, new_context, control, part_id_map, found_control_alters)
+        return pool.written, pool.unchanged
 
     def _add_inherited_props_to_header(self, context: ControlContext, control_id: str) -> ControlContext:
         """Add inherited props to the merged header under inherited tag."""
@@ -239,9 +330,13 @@ class CatalogWriter:
                     rule_name = deep_get(rules_dict, [rule_id, 'name'], 'unknown_rule_name')
                     param[const.HEADER_RULE_ID] = rule_name
 
-    def write_catalog_as_ssp_markdown(self, context: ControlContext, part_id_map: Dict[str, Dict[str, str]]) -> None:
+    def write_catalog_as_ssp_markdown(
+        self, context: ControlContext, part_id_map: Dict[str, Dict[str, str]], jobs: int = 1
+    ) -> Tuple[int, int]:
         """
-        Write out the catalog as component markdown.
+        Write out the catalog as component markdown, with the controls written by jobs processes.
+
+        Returns the number of control files written and the number left unchanged.
 
         Already have resolved profile catalog, but with no setparams from compdefs
         Load all control level rules and param values based on compdefs and profile values
@@ -280,47 +375,52 @@ class CatalogWriter:
         # get param_dict of set_params in profile
         profile_set_param_dict = CatalogInterface._get_full_profile_param_dict(context.profile)
         catalog_merger = CatalogMerger(self._catalog_interface)
-        for control in self._catalog_interface.get_all_controls_from_dict():
-            control_id = control.id
-            context.comp_dict = self._catalog_interface._control_comp_dicts.get(control_id, {})
-            control_file_path = self._catalog_interface.get_control_file_path(context.md_root, control_id)
-            control_file_path.parent.mkdir(exist_ok=True, parents=True)
-            # the catalog interface is from the resolved profile catalog
-            control = self._catalog_interface.get_control(control_id)
-            _, group_title, _ = self._catalog_interface.get_group_info_by_control(control_id)
-            control_param_dict = ControlInterface.get_control_param_dict(control, False)
-            set_param_dict = self._construct_set_parameters_dict(profile_set_param_dict, control_param_dict, context)
-            new_context = ControlContext.clone(context)
-
-            if set_param_dict:
-                self._add_set_params_from_cli_yaml_header_to_header(new_context, set_param_dict, control_param_dict)
-
-            elif const.SET_PARAMS_TAG in new_context.merged_header:
-                # need to cull any params that are not in control
-                pop_list: List[str] = []
-                for key in new_context.merged_header[const.SET_PARAMS_TAG].keys():
-                    if key not in control_param_dict:
-                        pop_list.append(key)
-                for pop in pop_list:
-                    new_context.merged_header[const.SET_PARAMS_TAG].pop(pop)
-
-            # merge the md_header and md_comp_dict with info in cat_interface for this control in new_context
-            catalog_merger._merge_header_and_comp_dict(control, control_file_path, new_context)
-
-            if const.COMP_DEF_RULES_PARAM_VALS_TAG in new_context.merged_header:
-                for _, param_list in new_context.merged_header[const.COMP_DEF_RULES_PARAM_VALS_TAG].items():
-                    for param_dict in param_list:
-                        param_dict.pop(const.HEADER_RULE_ID, None)
-
-            control_writer = ControlWriter()
-            control_writer.write_control_for_editing(
-                new_context, control, control_file_path.parent, group_title, part_id_map, []
-            )
+        with _ControlWritePool(jobs) as pool:
+            for control in self._catalog_interface.get_all_controls_from_dict():
+                control_id = control.id
+                context.comp_dict = self._catalog_interface._control_comp_dicts.get(control_id, {})
+                control_file_path = self._catalog_interface.get_control_file_path(context.md_root, control_id)
+                control_file_path.parent.mkdir(exist_ok=True, parents=True)
+                # the catalog interface is from the resolved profile catalog
+                control = self._catalog_interface.get_control(control_id)
+                _, group_title, _ = self._catalog_interface.get_group_info_by_control(control_id)
+                control_param_dict = ControlInterface.get_control_param_dict(control, False)
+                set_param_dict = self._construct_set_parameters_dict(
+                    profile_set_param_dict, control_param_dict, context
+                )
+                new_context = ControlContext.clone(context)
+
+                if set_param_dict:
+                    self._add_set_params_from_cli_yaml_header_to_header(new_context, set_param_dict, control_param_dict)
+
+                elif const.SET_PARAMS_TAG in new_context.merged_header:
+                    # need to cull any params that are not in control
+                    pop_list: List[str] = []
+                    for key in new_context.merged_header[const.SET_PARAMS_TAG].keys():
+                        if key not in control_param_dict:
+                            pop_list.append(key)
+                    for pop in pop_list:
+                        new_context.merged_header[const.SET_PARAMS_TAG].pop(pop)
+
+                # merge the md_header and md_comp_dict with info in cat_interface for this control in new_context
+                catalog_merger._merge_header_and_comp_dict(control, control_file_path, new_context)
+
+                if const.COMP_DEF_RULES_PARAM_VALS_TAG in new_context.merged_header:
+                    for _, param_list in new_context.merged_header[const.COMP_DEF_RULES_PARAM_VALS_TAG].items():
+                        for param_dict in param_list:
+                            param_dict.pop(const.HEADER_RULE_ID, None)
+
+                pool.write(new_context, control, control_file_path.parent, group_title, part_id_map, [])
+        return pool.written, pool.unchanged
 
     def write_catalog_as_component_markdown(
-        self, context: ControlContext, part_id_map: Dict[str, Dict[str, str]]
-    ) -> None:
-        """Write out the catalog as component markdown."""
+        self, context: ControlContext, part_id_map: Dict[str, Dict[str, str]], jobs: int = 1
+    ) -> Tuple[int, int]:
+        """
+        Write out the catalog as component markdown, with the controls written by jobs processes.
+
+        Returns the number of control files written and the number left unchanged.
+        """
         context.rules_dict = {}
         context.rules_params_dict = {}
 
@@ -375,76 +475,87 @@ class CatalogWriter:
 
         catalog_merger = CatalogMerger(self._catalog_interface)
 
-        for control in self._catalog_interface.get_all_controls_from_catalog(True):
-            if control.id in control_ids_in_comp_imp:
-                context.comp_dict = self._catalog_interface.get_comp_info(control.id)
-                new_context = ControlContext.clone(context)
-                # get the resolved catalog values for the control params
-                control_param_dict = ControlInterface.get_control_param_dict(control, False)
-                # update them with values in the ci
-                for set_param in as_list(new_context.control_implementation.set_parameters):
-                    _update_values(set_param, control_param_dict)
-                # update them with values in the imp_req
-                for imp_req in as_list(new_context.control_implementation.implemented_requirements):
-                    if imp_req.control_id == control.id:
-                        for set_param in as_list(imp_req.set_parameters):
-                            _update_values(set_param, control_param_dict)
-
-                # insert the param values into the header
-                if control_param_dict:
-                    new_context.merged_header[const.PARAM_VALUES_TAG] = {}
-                    for key, param in control_param_dict.items():
-                        new_context.merged_header[const.PARAM_VALUES_TAG][key] = none_if_empty(
-                            ControlInterface._param_values_as_str_list(param)
-                        )
-                # merge the md_header and md_comp_dict with info in cat_interface for this control
-                control_file_path = self._catalog_interface.get_control_file_path(context.md_root, control.id)
-                catalog_merger._merge_header_and_comp_dict(control, control_file_path, new_context)
-
-                self._write_control_into_dir(new_context, control, part_id_map, [])
+        with _ControlWritePool(jobs) as pool:
+            for control in self._catalog_interface.get_all_controls_from_catalog(True):
+                if control.id in control_ids_in_comp_imp:
+                    context.comp_dict = self._catalog_interface.get_comp_info(control.id)
+                    new_context = ControlContext.clone(context)
+                    # get the resolved catalog values for the control params
+                    control_param_dict = ControlInterface.get_control_param_dict(control, False)
+                    # update them with values in the ci
+                    for set_param in as_list(new_context.control_implementation.set_parameters):
+                        _update_values(set_param, control_param_dict)
+                    # update them with values in the imp_req
+                    for imp_req in as_list(new_context.control_implementation.implemented_requirements):
+                        if imp_req.control_id == control.id:
+                            for set_param in as_list(imp_req.set_parameters):
+                                _update_values(set_param, control_param_dict)
+
+                    # insert the param values into the header
+                    if control_param_dict:
+                        new_context.merged_header[const.PARAM_VALUES_TAG] = {}
+                        for key, param in control_param_dict.items():
+                            new_context.merged_header[const.PARAM_VALUES_TAG][key] = none_if_empty(
+                                ControlInterface._param_values_as_str_list(param)
+                            )
+                    # merge the md_header and md_comp_dict with info in cat_interface for this control
+                    control_file_path = self._catalog_interface.get_control_file_path(context.md_root, control.id)
+                    catalog_merger._merge_header_and_comp_dict(control, control_file_path, new_context)
+
+                    self._write_control_into_dir(pool, new_context, control, part_id_map, [])
+        return pool.written, pool.unchanged
+
+    def write_catalog_as_catalog(
+        self, context: ControlContext, part_id_map: Dict[str, Dict[str, str]], jobs: int = 1
+    ) -> Tuple[int, int]:
+        """
+        Write the catalog as a simple catalog, with the controls written by jobs processes.
 
-    def write_catalog_as_catalog(self, context: ControlContext, part_id_map: Dict[str, Dict[str, str]]) -> None:
-        """Write the catalog as a simple catalog."""
+        Returns the number of control files written and the number left unchanged.
+        """
         # write out the controls
-        for control in self._catalog_interface.get_all_controls_from_catalog(True):
-            # here we do special handling of how set-parameters merge with the yaml header
-            new_context = ControlContext.clone(context)
+        with _ControlWritePool(jobs) as pool:
+            for control in self._catalog_interface.get_all_controls_from_catalog(True):
+                # here we do special handling of how set-parameters merge with the yaml header
+                new_context = ControlContext.clone(context)
 
-            control_param_dict = ControlInterface.get_control_param_dict(control, False)
-            set_param_dict: Dict[str, str] = {}
-            for param_id, param_dict in control_param_dict.items():
-                tmp_dict = ModelUtils.parameter_to_dict(param_dict, True)
-                values = tmp_dict.get('values', None)
-                new_dict = {'values': values}
-                set_param_dict[param_id] = new_dict
-            if set_param_dict:
-                if const.SET_PARAMS_TAG not in new_context.cli_yaml_header:
-                    new_context.cli_yaml_header[const.SET_PARAMS_TAG] = {}
-                if new_context.overwrite_header_values:
-                    # update the control params with new values
-                    for key, value in new_context.cli_yaml_header[const.SET_PARAMS_TAG].items():
-                        if key in control_param_dict:
-                            set_param_dict[key] = value
-                else:
-                    # update the control params with any values in yaml header not set in control
-                    # need to maintain order in the set_param_dict
-                    for key, value in new_context.cli_yaml_header[const.SET_PARAMS_TAG].items():
-                        if key in control_param_dict and key not in set_param_dict:
-                            set_param_dict[key] = value
-                new_context.cli_yaml_header[const.SET_PARAMS_TAG] = set_param_dict
-            elif const.SET_PARAMS_TAG in new_context.cli_yaml_header:
-                # need to cull any params that are not in control
-                pop_list: List[str] = []
-                for key in new_context.cli_yaml_header[const.SET_PARAMS_TAG].keys():
-                    if key not in control_param_dict:
-                        pop_list.append(key)
-                for pop in pop_list:
-                    new_context.cli_yaml_header[const.SET_PARAMS_TAG].pop(pop)
-
-            self._write_control_into_dir(new_context, control, part_id_map, [])
+                control_param_dict = ControlInterface.get_control_param_dict(control, False)
+                set_param_dict: Dict[str, str] = {}
+                for param_id, param_dict in control_param_dict.items():
+                    tmp_dict = ModelUtils.parameter_to_dict(param_dict, True)
+                    values = tmp_dict.get('values', None)
+                    new_dict = {'values': values}
+                    set_param_dict[param_id] = new_dict
+                if set_param_dict:
+                    if const.SET_PARAMS_TAG not in new_context.cli_yaml_header:
+                        new_context.cli_yaml_header[const.SET_PARAMS_TAG] = {}
+                    if new_context.overwrite_header_values:
+                        # update the control params with new values
+                        for key, value in new_context.cli_yaml_header[const.SET_PARAMS_TAG].items():
+                            if key in control_param_dict:
+                                set_param_dict[key] = value
+                    else:
+                        # update the control params with any values in yaml header not set in control
+                        # need to maintain order in the set_param_dict
+                        for key, value in new_context.cli_yaml_header[const.SET_PARAMS_TAG].items():
+                            if key in control_param_dict and key not in set_param_dict:
+                                set_param_dict[key] = value
+                    new_context.cli_yaml_header[const.SET_PARAMS_TAG] = set_param_dict
+                elif const.SET_PARAMS_TAG in new_context.cli_yaml_header:
+                    # need to cull any params that are not in control
+                    pop_list: List[str] = []
+                    for key in new_context.cli_yaml_header[const.SET_PARAMS_TAG].keys():
+                        if key not in control_param_dict:
+                            pop_list.append(key)
+                    for pop in pop_list:
+                        new_context.cli_yaml_header[const.SET_PARAMS_TAG].pop(pop)
+
+                self._write_control_into_dir(pool, new_context, control, part_id_map, [])
+        return pool.written, pool.unchanged
 
     def _write_control_into_dir(
         self,
+        pool: _ControlWritePool,
         context: ControlContext,
         control: cat.Control,
         part_id_map: Dict[str, Dict[str, str]],
@@ -459,5 +570,4 @@ class CatalogWriter:
             if not group_dir.exists():
                 group_dir.mkdir(parents=True, exist_ok=True)
 
-        writer = ControlWriter()
-        writer.write_control_for_editing(context, control, group_dir, group_title, part_id_map, found_control_alters)
+        pool.write(context, control, group_dir, group_title, part_id_map, found_control_alters)
@@ -0,0 +1,288 @@
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of the content parsed from control markdown files, used to only re-read the files changed between assembles."""
+
+import dataclasses
+import datetime
+import functools
+import hashlib
+import importlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pydantic.v1 import BaseModel
+
+from trestle import __version__
+from trestle.common import const
+from trestle.core.control_context import ControlContext
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+
+# fingerprint of a file as its mtime in ns, size and sha256 of the content, followed by its encoded parse result
+CacheEntry = Tuple[int, int, str, Any]
+
+# keys marking the encoded form of values json cannot hold directly
+_TUPLE_KEY = '__tuple__'
+_DICT_KEY = '__dict__'
+_MODEL_KEY = '__model__'
+_DATACLASS_KEY = '__dataclass__'
+_ENUM_KEY = '__enum__'
+
+
+def _type_name(obj_type: type) -> str:
+    return f'{obj_type.__module__}:{obj_type.__qualname__}'
+
+
+def _encode(obj: Any) -> Any:
+    """Encode a parse result as plain json data, with the trestle type of each model, dataclass and enum in it."""
+    if obj is None or isinstance(obj, (str, bool, int, float)) and not isinstance(obj, Enum):
+        return obj
+    if isinstance(obj, list):
+        return [_encode(item) for item in obj]
+    if isinstance(obj, tuple):
+        return {_TUPLE_KEY: [_encode(item) for item in obj]}
+    if isinstance(obj, dict):
+        if not all(isinstance(key, str) for key in obj):
+            raise TypeError('Dict keys must be strings')
+        return {_DICT_KEY: {key: _encode(value) for key, value in obj.items()}}
+    if isinstance(obj, BaseModel):
+        return {_MODEL_KEY: _type_name(type(obj)), 'data': json.loads(obj.json(by_alias=True))}
+    if dataclasses.is_dataclass(obj):
+        fields = {field.name: _encode(getattr(obj, field.name)) for field in dataclasses.fields(obj)}
+        return {_DATACLASS_KEY: _type_name(type(obj)), 'fields': fields}
+    if isinstance(obj, Enum):
+        return {_ENUM_KEY: _type_name(type(obj)), 'value': _encode(obj.value)}
+    raise TypeError(f'Object of type {type(obj).__name__} cannot be cached')
+
+
+def _get_trestle_type(name: str) -> type:
+    """Get a type defined in a trestle module by its name, refusing any other."""
+    module_name, _, qualname = name.partition(':')
+    if module_name != 'trestle' and not module_name.startswith('trestle.'):
+        raise ValueError(f'Type {name} is not defined by trestle')
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualname.split('.'):
+        obj = getattr(obj, attr)
+    if not isinstance(obj, type):
+        raise ValueError(f'{name} is not a type')
+    return obj
+
+
+def _decode(data: Any) -> Any:
+    """Decode a parse result encoded by _encode, only constructing trestle models, dataclasses and enums."""
+    if isinstance(data, list):
+        return [_decode(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if _TUPLE_KEY in data:
+        return tuple(_decode(item) for item in data[_TUPLE_KEY])
+    if _DICT_KEY in data:
+        return {key: _decode(value) for key, value in data[_DICT_KEY].items()}
+    if _MODEL_KEY in data:
+        model_type = _get_trestle_type(data[_MODEL_KEY])
+        if not issubclass(model_type, BaseModel):
+            raise ValueError(f'{data[_MODEL_KEY]} is not a model')
+        return model_type.parse_obj(data['data'])
+    if _DATACLASS_KEY in data:
+        dataclass_type = _get_trestle_type(data[_DATACLASS_KEY])
+        if not dataclasses.is_dataclass(dataclass_type):
+            raise ValueError(f'{data[_DATACLASS_KEY]} is not a dataclass')
+        return dataclass_type(**{key: _decode(value) for key, value in data['fields'].items()})
+    if _ENUM_KEY in data:
+        enum_type = _get_trestle_type(data[_ENUM_KEY])
+        if not issubclass(enum_type, Enum):
+            raise ValueError(f'{data[_ENUM_KEY]} is not an enum')
+        return enum_type(_decode(data['value']))
+    raise ValueError('Unknown encoded value')
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert the objects that may be held in the reader arguments to json serializable form."""
+    if isinstance(obj, ControlContext):
+        # the control markdown readers only depend on these fields, and the rest may hold large models
+        return {
+            'purpose': obj.purpose,
+            'comp_name': obj.comp_name,
+            'component': obj.component.title if obj.component else None,
+        }
+    if isinstance(obj, BaseModel):
+        return obj.dict(by_alias=True, exclude_none=True)
+    if dataclasses.is_dataclass(obj):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    if isinstance(obj, (pathlib.Path, datetime.datetime, datetime.date)):
+        return str(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} has no fingerprint')
+
+
+def _get_reader_fingerprint(read_file: Callable[[pathlib.Path], Any]) -> Tuple[str, Optional[str]]:
+    """
+    Get the name of the function reading each file and a hash of the arguments it is given besides the file.
+
+    The hash is None if the arguments cannot be fingerprinted, in which case no previous results are reused.
+    """
+    func = read_file.func if isinstance(read_file, functools.partial) else read_file
+    name = f'{func.__module__}.{func.__qualname__}'
+    args = (read_file.args, read_file.keywords) if isinstance(read_file, functools.partial) else ((), {})
+    try:
+        text = json.dumps(args, default=_json_default, sort_keys=True)
+    except (TypeError, ValueError) as e:
+        logger.debug(f'Unable to fingerprint the arguments of {name}: {e}')
+        return name, None
+    return name, hashlib.sha256(text.encode()).hexdigest()
+
+
+class ControlReadCache:
+    """
+    Fingerprints and parse results of the control markdown files read during assembly.
+
+    The cache for each markdown directory is kept in the trestle cache of the workspace, holding the mtime, size
+    and hash of each control file read together with what was parsed from it.  The cache is json, and only the
+    models, dataclasses and enums of trestle are constructed from it, so a cache committed with the workspace cannot
+    run code.  A later read of the same directory
+    by the same reader and arguments only parses the files whose fingerprint changed, and takes the others from
+    the cache, so the result is the same as parsing them all.  With full set the cache is not used but is refreshed.
+    """
+
+    def __init__(self, trestle_root: pathlib.Path, full: bool = False) -> None:
+        """Initialize the cache for the trestle root."""
+        self._trestle_root = trestle_root.resolve()
+        self._cache_dir = self._trestle_root / const.TRESTLE_CACHE_DIR / const.ASSEMBLE_CACHE_DIR
+        self._full = full
+
+    def _get_cache_path(self, md_path: pathlib.Path) -> pathlib.Path:
+        """Get the path of the cache file for the markdown directory."""
+        md_path = md_path.resolve()
+        try:
+            key = md_path.relative_to(self._trestle_root).as_posix()
+        except ValueError:
+            key = md_path.as_posix()
+        return self._cache_dir / f'{hashlib.sha256(key.encode()).hexdigest()}.json'
+
+    def _load(self, cache_path: pathlib.Path) -> Dict[str, Any]:
+        """Load the cached readers for a markdown directory, or an empty dict if missing or unusable."""
+        if self._full or not cache_path.exists():
+            return {}
+        try:
+            data = json.loads(cache_path.read_text(encoding=const.FILE_ENCODING))
+            if data.get('version') != CACHE_VERSION or data.get('trestle_version') != __version__:
+                return {}
+            return dict(data['readers'])
+        except Exception as e:
+            logger.debug(f'Ignoring unreadable markdown read cache {cache_path}: {e}')
+            return {}
+
+    def _save(self, cache_path: pathlib.Path, readers: Dict[str, Any]) -> None:
+        """Save the cached readers for a markdown directory, atomically replacing any existing cache."""
+        data = {'version': CACHE_VERSION, 'trestle_version': __version__, 'readers': readers}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', encoding=const.FILE_ENCODING, dir=cache_path.parent, delete=False
+            ) as f:
+                json.dump(data, f)
+            os.replace(f.name, cache_path)
+        except Exception as e:
+            logger.debug(f'Unable to save markdown read cache {cache_path}: {e}')
+
+    @staticmethod
+    def _reuse_entry(path: pathlib.Path, stat: os.stat_result, entry: Optional[CacheEntry]) -> Optional[CacheEntry]:
+        """Get the entry, updated to the current mtime, if the file content matches its fingerprint."""
+        if not isinstance(entry, list) or len(entry) != 4:
+            return None
+        mtime_ns, size, digest, result = entry
+        if stat.st_size != size:
+            return None
+        if stat.st_mtime_ns == mtime_ns:
+            return mtime_ns, size, digest, result
+        # the file was touched but may still have the same content
+        if hashlib.sha256(path.read_bytes()).hexdigest() != digest:
+            return None
+        return stat.st_mtime_ns, size, digest, result
+
+    def read_files(
+        self,
+        md_path: pathlib.Path,
+        read_file: Callable[[pathlib.Path], Any],
+        files: List[pathlib.Path],
+        read_changed: Callable[[List[pathlib.Path]], Iterable[Any]],
+    ) -> List[Any]:
+        """
+        Get the result of reading each file in the markdown directory, parsing only those changed since last read.
+
+        Args:
+            md_path: the markdown directory containing the files
+            read_file: the function reading each file, used to identify the cached results
+            files: the control markdown files to read
+            read_changed: function giving the result of reading each file in a list with read_file
+
+        Returns:
+            The result for each file in the order of the files, each a new object not shared with the cache
+        """
+        cache_path = self._get_cache_path(md_path)
+        readers = self._load(cache_path)
+        reader_name, args_hash = _get_reader_fingerprint(read_file)
+        cached = readers.get(reader_name)
+        old_entries = cached.get('files') if isinstance(cached, dict) and cached.get('args') == args_hash else None
+        if not isinstance(old_entries, dict):
+            old_entries = {}
+
+        keys = [file.relative_to(md_path).as_posix() for file in files]
+        # fingerprint before parsing so a file modified during the read is parsed again next time
+        stats = [file.stat() for file in files]
+        entries = [
+            self._reuse_entry(file, stat, old_entries.get(key))
+            for file, stat, key in zip(files, stats, keys, strict=True)
+        ]
+        changed = [file for file, entry in zip(files, entries, strict=True) if entry is None]
+        digests = {file: hashlib.sha256(file.read_bytes()).hexdigest() for file in changed}
+        logger.debug(f'Reading {len(changed)} of {len(files)} control files in {md_path} changed since last read')
+        changed_results = iter(read_changed(changed))
+        results: List[Any] = []
+        new_entries: Dict[str, CacheEntry] = {}
+        for file, stat, key, entry in zip(files, stats, keys, entries, strict=True):
+            if entry is not None:
+                try:
+                    results.append(_decode(entry[3]))
+                    new_entries[key] = entry
+                    continue
+                except Exception as e:
+                    logger.debug(f'Reading {file} again since its cached result is unusable: {e}')
+                    result = read_file(file)
+                    digest = hashlib.sha256(file.read_bytes()).hexdigest()
+            else:
+                result = next(changed_results)
+                digest = digests[file]
+            results.append(result)
+            if args_hash is not None:
+                try:
+                    # encode now since the caller may modify the result
+                    new_entries[key] = stat.st_mtime_ns, stat.st_size, digest, _encode(result)
+                except TypeError as e:
+                    logger.debug(f'Not caching the results of {reader_name} in {md_path}: {e}')
+                    args_hash = None
+        if args_hash is not None:
+            readers[reader_name] = {'args': args_hash, 'files': new_entries}
+            self._save(cache_path, readers)
+        return results
@@ -29,6 +29,7 @@ from trestle.common.err import TrestleError, TrestleNotFoundError, handle_generi
 from trestle.common.load_validate import load_validate_model_name, load_validate_model_path
 from trestle.common.model_utils import ModelUtils
 from trestle.core.catalog.catalog_api import CatalogAPI
+from trestle.core.catalog.control_read_cache import ControlReadCache
 from trestle.core.commands.author.common import AuthorCommonCommand
 from trestle.core.commands.common.cmd_utils import clear_folder
 from trestle.core.commands.common.return_codes import CmdReturnCodes
@@ -61,6 +62,7 @@ class CatalogGenerate(AuthorCommonCommand):
             action='store_true',
             default=False,
         )
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -90,7 +92,12 @@ class CatalogGenerate(AuthorCommonCommand):
             markdown_path = trestle_root / args.output
 
             return self.generate_markdown(
-                trestle_root, catalog_path, markdown_path, yaml_header, args.overwrite_header_values
+                trestle_root,
+                catalog_path,
+                markdown_path,
+                yaml_header,
+                args.overwrite_header_values,
+                getattr(args, 'jobs', 1),
             )
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Error occurred when generating markdown for catalog')
@@ -102,8 +109,9 @@ class CatalogGenerate(AuthorCommonCommand):
         markdown_path: pathlib.Path,
         yaml_header: Dict[str, Any],
         overwrite_header_values: bool,
+        jobs: int = 1,
     ) -> int:
-        """Generate markdown for the controls in the catalog."""
+        """Generate markdown for the controls in the catalog, written by jobs processes."""
         try:
             catalog = load_validate_model_path(trestle_root, catalog_path)
             context = ControlContext.generate(
@@ -116,7 +124,7 @@ class CatalogGenerate(AuthorCommonCommand):
                 set_parameters_flag=True,
             )
             catalog_api = CatalogAPI(catalog=catalog, context=context)
-            catalog_api.write_catalog_as_markdown()
+            catalog_api.write_catalog_as_markdown(jobs=jobs)
 
         except TrestleNotFoundError as e:
             raise TrestleError(f'Catalog {catalog_path} not found for load: {e}')
@@ -144,6 +152,8 @@ class CatalogAssemble(AuthorCommonCommand):
         self.add_argument('-sp', '--set-parameters', action='store_true', help=const.HELP_SET_PARAMS)
         self.add_argument('-r', '--regenerate', action='store_true', help=const.HELP_REGENERATE)
         self.add_argument('-vn', '--version', help=const.HELP_VERSION, required=False, type=str)
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
+        self.add_argument('--full', action='store_true', help=const.HELP_FULL)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -157,6 +167,8 @@ class CatalogAssemble(AuthorCommonCommand):
                 set_parameters_flag=args.set_parameters,
                 regenerate=args.regenerate,
                 version=args.version,
+                jobs=getattr(args, 'jobs', 1),
+                incremental=not getattr(args, 'full', False),
             )
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Error occurred while assembling catalog')
@@ -170,6 +182,8 @@ class CatalogAssemble(AuthorCommonCommand):
         set_parameters_flag: bool,
         regenerate: bool,
         version: Optional[str],
+        jobs: int = 1,
+        incremental: bool = False,
     ) -> int:
         """
         Assemble the markdown directory into a json catalog model file.
@@ -182,6 +196,8 @@ class CatalogAssemble(AuthorCommonCommand):
             set_parameters_flag: set the parameters and props in the control to the values in the markdown yaml header
             regenerate: whether to regenerate the uuid's in the catalog
             version: version for the assembled catalog
+            jobs: number of processes reading the control markdown files
+            incremental: only parse the control markdown files changed since the last incremental assemble
 
         Returns:
             0 on success, 1 otherwise
@@ -198,7 +214,8 @@ class CatalogAssemble(AuthorCommonCommand):
         # assemble the markdown controls into fresh md_catalog
         catalog_api_from_md = CatalogAPI(catalog=None)
         try:
-            md_catalog = catalog_api_from_md.read_catalog_from_markdown(md_dir, set_parameters_flag)
+            read_cache = ControlReadCache(trestle_root) if incremental else None
+            md_catalog = catalog_api_from_md.read_catalog_from_markdown(md_dir, set_parameters_flag, jobs, read_cache)
         except Exception as e:
             raise TrestleError(f'Error reading catalog from markdown {md_dir}: {e}')
 
@@ -77,3 +77,10 @@ EXCLUDE_HELP = (
     '[DEPRECATED: use --ignore instead] The name of a folder, relative to the root of the trestle project,'
     + 'e.g. architecture or architecture/infrastructure.'
 )
+
+JOBS_SHORT = '-j'
+JOBS_LONG = '--jobs'
+JOBS_HELP = (
+    'Validate with this number of parallel workers, reporting every invalid file with the time taken'
+    + ' rather than stopping at the first one.'
+)
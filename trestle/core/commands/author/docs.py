@@ -26,6 +26,7 @@ import trestle.core.commands.author.consts as author_const
 from trestle.common import const, file_utils
 from trestle.common.err import TrestleError, handle_generic_command_exception
 from trestle.core.commands.author.common import AuthorCommonCommand
+from trestle.core.commands.author.instance_validation import InstanceValidation
 from trestle.core.commands.author.versioning.template_versioning import TemplateVersioning
 from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.core.markdown.markdown_api import MarkdownAPI
@@ -90,6 +91,9 @@ class Docs(AuthorCommonCommand):
             help=author_const.TEMPLATE_TYPE_VALIDATE_HELP,
             action='store_true',
         )
+        self.add_argument(
+            author_const.JOBS_SHORT, author_const.JOBS_LONG, help=author_const.JOBS_HELP, type=int, default=None
+        )
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -115,6 +119,7 @@ class Docs(AuthorCommonCommand):
                     args.template_version,
                     args.ignore,
                     args.validate_template_type,
+                    getattr(args, 'jobs', None),
                 )
 
             return status
@@ -205,12 +210,16 @@ class Docs(AuthorCommonCommand):
         template_version: Optional[str] = None,
         ignore: Optional[str] = None,
         validate_by_type_field: bool = False,
+        validation: Optional[InstanceValidation] = None,
     ) -> int:
         """
         Validate md files in a directory with option to recurse.
 
         Template version will be fetched from the instance header.
+        If the validation is deferred the files are only queued on it, to be validated when it is run.
         """
+        if validation is None:
+            validation = InstanceValidation(self.trestle_root)
         # status is a linux returncode
         status = 0
         for item_path in md_dir.iterdir():
@@ -258,6 +267,8 @@ class Docs(AuthorCommonCommand):
                                     ' template type field'
                                 )
                                 status = 1
+                                if validation.deferred:
+                                    continue
                                 return status
                             template_name = template_name + '.md'
                             template_file = versione_template_dir / template_name
@@ -267,13 +278,13 @@ class Docs(AuthorCommonCommand):
                         raise TrestleError(
                             f'Required template file: {self.rel_dir(template_file)} does not exist. Exiting.'
                         )
-                    md_api.load_validator_with_template(
-                        template_file, validate_header, not validate_only_header, governed_heading
+                    valid = validation.validate_markdown(
+                        item_path, template_file, validate_header, not validate_only_header, governed_heading
                     )
-                    if not md_api.validate_instance(item_path):
+                    if valid is False:
                         logger.info(f'INVALID: {self.rel_dir(item_path)}')
                         status = 1
-                    else:
+                    elif valid:
                         logger.info(f'VALID: {self.rel_dir(item_path)}')
                 elif recurse:
                     if ignore:
@@ -291,6 +302,7 @@ class Docs(AuthorCommonCommand):
                         template_version,
                         ignore,
                         validate_by_type_field,
+                        validation,
                     )
                     if rc != 0:
                         status = rc
@@ -307,6 +319,7 @@ class Docs(AuthorCommonCommand):
         template_version: str,
         ignore: str,
         validate_by_type_field: bool,
+        jobs: Optional[int] = None,
     ) -> int:
         """
         Validate task.
@@ -317,6 +330,7 @@ class Docs(AuthorCommonCommand):
             validate_only_header: Whether to validate just the yaml header.
             recurse: Whether to allow validated files to be in a directory tree.
             readme_validate: Whether to validate readme files, otherwise they will be ignored.
+            jobs: If given, validate all files with this number of processes and report every invalid one.
 
         Returns:
             Return code to be used for the command.
@@ -324,7 +338,8 @@ class Docs(AuthorCommonCommand):
         if not self.task_path.is_dir():
             raise TrestleError(f'Task directory {self.rel_dir(self.task_path)} does not exist. Exiting validate.')
 
-        return self._validate_dir(
+        validation = InstanceValidation(self.trestle_root, jobs)
+        status = self._validate_dir(
             governed_heading,
             self.task_path,
             validate_header,
@@ -334,4 +349,8 @@ class Docs(AuthorCommonCommand):
             template_version,
             ignore,
             validate_by_type_field,
+            validation,
         )
+        if not validation.run():
+            status = 1
+        return status
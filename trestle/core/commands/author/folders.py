@@ -20,13 +20,14 @@ import logging
 import pathlib
 import re
 import shutil
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import trestle.core.commands.author.consts as author_const
 import trestle.core.draw_io as draw_io
 from trestle.common import const, file_utils
 from trestle.common.err import TrestleError, TrestleIncorrectArgsError, handle_generic_command_exception
 from trestle.core.commands.author.common import AuthorCommonCommand
+from trestle.core.commands.author.instance_validation import InstanceValidation
 from trestle.core.commands.author.versioning.template_versioning import TemplateVersioning
 from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.core.markdown.markdown_api import MarkdownAPI
@@ -88,6 +89,9 @@ class Folders(AuthorCommonCommand):
             help=author_const.TEMPLATE_TYPE_VALIDATE_HELP,
             action='store_true',
         )
+        self.add_argument(
+            author_const.JOBS_SHORT, author_const.JOBS_LONG, help=author_const.JOBS_HELP, type=int, default=None
+        )
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -112,6 +116,7 @@ class Folders(AuthorCommonCommand):
                     args.template_version,
                     args.ignore,
                     args.validate_template_type,
+                    getattr(args, 'jobs', None),
                 )
             else:
                 raise TrestleIncorrectArgsError(f'Unsupported mode: {args.mode} for folders command.')
@@ -195,6 +200,7 @@ class Folders(AuthorCommonCommand):
         template_version: str,
         ignore: str,
         validate_by_type_field: bool,
+        validation: InstanceValidation,
     ) -> bool:
         """
         Validate instances against templates.
@@ -202,6 +208,8 @@ class Folders(AuthorCommonCommand):
         Validation will succeed if:
             1. All template files from the specified version are present in the task
             2. All of the instances are valid
+
+        If the validation is deferred the instances are only queued on it, to be validated when it is run.
         """
         all_versioned_templates: Dict[str, Any] = {}
         instance_version = template_version
@@ -290,16 +298,15 @@ class Folders(AuthorCommonCommand):
 
                 if instance_file_name in all_versioned_templates[instance_version] or template_type_is_valid:
                     # validate
-                    md_api.load_validator_with_template(
-                        template_file, validate_header, not validate_only_header, governed_heading
+                    status = validation.validate_markdown(
+                        instance_file, template_file, validate_header, not validate_only_header, governed_heading
                     )
-                    status = md_api.validate_instance(instance_file)
-                    if not status:
+                    if status is False:
                         logger.warning(
                             f'INVALID: Markdown file {instance_file} failed validation against' + f' {template_file}'
                         )
                         return False
-                    else:
+                    elif status:
                         logger.info(f'VALID: {instance_file}')
                     # mark template as present
                     if template_type_is_valid:
@@ -337,14 +344,13 @@ class Folders(AuthorCommonCommand):
 
                 if instance_file_name in all_versioned_templates[instance_version]:
                     # validate
-                    drawio_validator = draw_io.DrawIOMetadataValidator(template_file)
-                    status = drawio_validator.validate(instance_file)
-                    if not status:
+                    status = validation.validate_drawio(instance_file, template_file)
+                    if status is False:
                         logger.warning(
                             f'INVALID: Drawio file {instance_file} failed validation against' + f' {template_file}'
                         )
                         return False
-                    else:
+                    elif status:
                         logger.info(f'VALID: {instance_file}')
                     # mark template as present
                     all_versioned_templates[instance_version][instance_file_name] = True
@@ -403,11 +409,18 @@ class Folders(AuthorCommonCommand):
         template_version: str,
         ignore: str,
         validate_by_type_field: bool,
+        jobs: Optional[int] = None,
     ) -> int:
-        """Validate task."""
+        """
+        Validate task.
+
+        If jobs is given all files are validated with that number of processes and every invalid one is reported.
+        """
         if not self.task_path.is_dir():
             raise TrestleError(f'Task directory {self.task_path} does not exist. Exiting validate.')
 
+        validation = InstanceValidation(self.trestle_root, jobs)
+        failed_dirs: List[pathlib.Path] = []
         for task_instance in self.task_path.iterdir():
             if task_instance.is_dir():
                 if file_utils.is_symlink(task_instance):
@@ -421,15 +434,24 @@ class Folders(AuthorCommonCommand):
                     template_version,
                     ignore,
                     validate_by_type_field,
+                    validation,
                 )
                 if not result:
-                    raise TrestleError(
-                        'Governed-folder validation failed for task'
-                        + f'{self.task_name} on directory {self.rel_dir(task_instance)}'
-                    )
+                    if not validation.deferred:
+                        raise TrestleError(
+                            'Governed-folder validation failed for task'
+                            + f'{self.task_name} on directory {self.rel_dir(task_instance)}'
+                        )
+                    failed_dirs.append(task_instance)
             else:
                 logger.info(
                     f'Unexpected file {self.rel_dir(task_instance)} identified in {self.task_name}'
                     + ' directory, ignoring.'
                 )
+        if not validation.run() or failed_dirs:
+            failed = ', '.join(self.rel_dir(failed_dir) for failed_dir in failed_dirs)
+            raise TrestleError(
+                f'Governed-folder validation failed for task {self.task_name}'
+                + (f' on directories {failed}' if failed else '')
+            )
         return CmdReturnCodes.SUCCESS.value
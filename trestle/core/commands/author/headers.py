@@ -19,12 +19,13 @@ import argparse
 import logging
 import pathlib
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import trestle.core.commands.author.consts as author_const
 from trestle.common import const, file_utils
 from trestle.common.err import TrestleError, handle_generic_command_exception
 from trestle.core.commands.author.common import AuthorCommonCommand
+from trestle.core.commands.author.instance_validation import InstanceValidation
 from trestle.core.commands.author.versioning.template_versioning import TemplateVersioning
 from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.core.draw_io import DrawIO, DrawIOMetadataValidator
@@ -84,6 +85,9 @@ class Headers(AuthorCommonCommand):
             nargs='*',
             default=None,
         )
+        self.add_argument(
+            author_const.JOBS_SHORT, author_const.JOBS_LONG, help=author_const.JOBS_HELP, type=int, default=None
+        )
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -112,7 +116,12 @@ class Headers(AuthorCommonCommand):
                     exclusions = args.exclude
                 # mode is validate
                 status = self.validate(
-                    args.recurse, args.readme_validate, exclusions, args.template_version, args.ignore
+                    args.recurse,
+                    args.readme_validate,
+                    exclusions,
+                    args.template_version,
+                    args.ignore,
+                    getattr(args, 'jobs', None),
                 )
             return status
 
@@ -178,8 +187,9 @@ class Headers(AuthorCommonCommand):
         relative_exclusions: List[pathlib.Path],
         template_version: str,
         ignore: str,
+        validation: InstanceValidation,
     ) -> bool:
-        """Validate a directory within the trestle workspace."""
+        """Validate a directory within the trestle workspace, or queue its files if the validation is deferred."""
         all_versioned_templates: Dict[str, Any] = {}
         instance_version = template_version
         instance_file_names: List[pathlib.Path] = []
@@ -236,12 +246,13 @@ class Headers(AuthorCommonCommand):
                     self._update_templates(all_versioned_templates, templates, instance_version)
 
                 # validate
-                md_api.load_validator_with_template(all_versioned_templates[instance_version]['md'], True, False)
-                status = md_api.validate_instance(instance_file)
-                if not status:
+                status = validation.validate_markdown(
+                    instance_file, all_versioned_templates[instance_version]['md'], True, False
+                )
+                if status is False:
                     logger.info(f'INVALID: {self.rel_dir(instance_file)}')
                     return False
-                else:
+                elif status:
                     logger.info(f'VALID: {self.rel_dir(instance_file)}')
 
             elif instance_file.suffix == const.DRAWIO_FILE_EXT:
@@ -270,12 +281,11 @@ class Headers(AuthorCommonCommand):
                     self._update_templates(all_versioned_templates, templates, instance_version)
 
                 # validate
-                drawio_validator = DrawIOMetadataValidator(all_versioned_templates[instance_version]['drawio'])
-                status = drawio_validator.validate(instance_file)
-                if not status:
+                status = validation.validate_drawio(instance_file, all_versioned_templates[instance_version]['drawio'])
+                if status is False:
                     logger.info(f'INVALID: {self.rel_dir(instance_file)}')
                     return False
-                else:
+                elif status:
                     logger.info(f'VALID: {self.rel_dir(instance_file)}')
 
             else:
@@ -301,8 +311,14 @@ class Headers(AuthorCommonCommand):
         relative_excludes: List[pathlib.Path],
         template_version: str,
         ignore: str,
+        jobs: Optional[int] = None,
     ) -> int:
-        """Run validation based on available templates."""
+        """
+        Run validation based on available templates.
+
+        If jobs is given all files are validated with that number of processes and every invalid one is reported.
+        """
+        validation = InstanceValidation(self.trestle_root, jobs)
         paths = []
         if self.task_name:
             if not self.task_path.is_dir():
@@ -326,11 +342,15 @@ class Headers(AuthorCommonCommand):
 
         for path in paths:
             try:
-                valid = self._validate_dir(path, recurse, readme_validate, relative_excludes, template_version, ignore)
+                valid = self._validate_dir(
+                    path, recurse, readme_validate, relative_excludes, template_version, ignore, validation
+                )
                 if not valid:
                     logger.info(f'validation failed on {path}')
                     return CmdReturnCodes.DOCUMENTS_VALIDATION_ERROR.value
             except Exception as e:
                 raise TrestleError(f'Error during header validation on {path} {e}')
 
+        if not validation.run():
+            return CmdReturnCodes.DOCUMENTS_VALIDATION_ERROR.value
         return CmdReturnCodes.SUCCESS.value
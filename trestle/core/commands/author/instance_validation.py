@@ -0,0 +1,167 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Validation of governed instance files against their templates for the author commands."""
+
+import functools
+import hashlib
+import logging
+import pathlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+
+from trestle.common import const
+from trestle.common.err import TrestleError
+from trestle.core.draw_io import DrawIOMetadataValidator
+from trestle.core.markdown.markdown_api import MarkdownAPI
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class InstanceValidationResult:
+    """Outcome of validating a single instance file against its template."""
+
+    instance_path: pathlib.Path
+    template_path: pathlib.Path
+    valid: bool
+    seconds: float
+    message: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _InstanceValidationTask:
+    """Instance file to validate against a template, with the markdown validation options."""
+
+    instance_path: pathlib.Path
+    template_path: pathlib.Path
+    validate_header: bool = True
+    validate_body: bool = False
+    governed_heading: Optional[str] = None
+
+
+@functools.lru_cache(maxsize=128)
+def _load_drawio_validator(template_path: pathlib.Path, digest: str) -> DrawIOMetadataValidator:
+    """Load the validator for a drawio template, cached by the digest of the template content."""
+    return DrawIOMetadataValidator(template_path)
+
+
+def _validate_instance_file(task: _InstanceValidationTask) -> bool:
+    """Validate the instance against its template, raising on errors reading either of them."""
+    if task.template_path.suffix == const.DRAWIO_FILE_EXT:
+        digest = hashlib.sha256(task.template_path.read_bytes()).hexdigest()
+        return _load_drawio_validator(task.template_path, digest).validate(task.instance_path)
+    md_api = MarkdownAPI()
+    md_api.load_validator_with_template(
+        task.template_path, task.validate_header, task.validate_body, task.governed_heading
+    )
+    return md_api.validate_instance(task.instance_path)
+
+
+def _validate_instance(task: _InstanceValidationTask) -> InstanceValidationResult:
+    """Validate one instance, capturing the outcome rather than raising so all instances can be reported."""
+    tick = time.perf_counter()
+    try:
+        valid = _validate_instance_file(task)
+    except Exception as e:
+        return InstanceValidationResult(
+            task.instance_path, task.template_path, False, time.perf_counter() - tick, str(e)
+        )
+    return InstanceValidationResult(task.instance_path, task.template_path, valid, time.perf_counter() - tick)
+
+
+class InstanceValidation:
+    """
+    Validation of the instance files of an author command against their templates.
+
+    Without jobs each instance is validated as soon as it is requested, so the command can stop at the first invalid
+    one.  With jobs the instances are queued instead and validated by that number of processes when run is called,
+    which reports every invalid instance along with the time taken for each and in total.
+    """
+
+    def __init__(self, trestle_root: pathlib.Path, jobs: Optional[int] = None) -> None:
+        """Initialize the validation, deferred to run if the number of jobs is given."""
+        if jobs is not None and jobs < 1:
+            raise TrestleError(f'Number of jobs for validation must be at least 1, not {jobs}.')
+        self._trestle_root = trestle_root
+        self._jobs = jobs
+        self._tasks: List[_InstanceValidationTask] = []
+
+    @property
+    def deferred(self) -> bool:
+        """Whether validation is deferred until run, so invalid instances do not stop the command."""
+        return self._jobs is not None
+
+    def _request(self, task: _InstanceValidationTask) -> Optional[bool]:
+        if self.deferred:
+            self._tasks.append(task)
+            return None
+        return _validate_instance_file(task)
+
+    def validate_markdown(
+        self,
+        instance_path: pathlib.Path,
+        template_path: pathlib.Path,
+        validate_header: bool,
+        validate_body: bool,
+        governed_heading: Optional[str] = None,
+    ) -> Optional[bool]:
+        """Validate a markdown instance against its template, or return None if deferred until run."""
+        return self._request(
+            _InstanceValidationTask(instance_path, template_path, validate_header, validate_body, governed_heading)
+        )
+
+    def validate_drawio(self, instance_path: pathlib.Path, template_path: pathlib.Path) -> Optional[bool]:
+        """Validate the metadata of a drawio instance against its template, or return None if deferred until run."""
+        return self._request(_InstanceValidationTask(instance_path, template_path))
+
+    def _rel_path(self, path: pathlib.Path) -> str:
+        try:
+            return str(path.relative_to(self._trestle_root))
+        except ValueError:
+            return str(path)
+
+    def run(self) -> bool:
+        """Validate the deferred instances, report the outcome for each and return whether all are valid."""
+        if not self._tasks:
+            return True
+        tasks, self._tasks = self._tasks, []
+        n_tasks = len(tasks)
+        tick = time.perf_counter()
+        if self._jobs == 1 or n_tasks < 2:
+            results = [_validate_instance(task) for task in tasks]
+        else:
+            jobs = min(self._jobs, n_tasks)
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(_validate_instance, tasks, chunksize=max(1, n_tasks // (jobs * 4))))
+        total_seconds = time.perf_counter() - tick
+
+        for result in results:
+            instance = self._rel_path(result.instance_path)
+            if result.valid:
+                logger.info(f'VALID: {instance} ({result.seconds:.3f}s)')
+            else:
+                logger.info(
+                    f'INVALID: {instance} failed validation against {self._rel_path(result.template_path)}'
+                    f' ({result.seconds:.3f}s)'
+                )
+        failures = [result for result in results if not result.valid]
+        logger.info(f'Validated {n_tasks} files in {total_seconds:.3f}s with {len(failures)} invalid.')
+        for failure in failures:
+            message = f': {failure.message}' if failure.message else ''
+            logger.info(f'  INVALID: {self._rel_path(failure.instance_path)}{message}')
+        return not failures
@@ -16,19 +16,20 @@
 """Trestle Commands."""
 
 import argparse
+import hashlib
 import logging
 import operator
 import pathlib
 import re
-import uuid
-from typing import Any, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
-from jinja2 import ChoiceLoader, DictLoader, Environment, FileSystemLoader, Template
+from jinja2 import Environment, Template
 
 from ruamel.yaml import YAML
 
 from trestle.common import const, log
-from trestle.common.err import TrestleIncorrectArgsError, handle_generic_command_exception
+from trestle.common.err import TrestleError, TrestleIncorrectArgsError, handle_generic_command_exception
 from trestle.common.load_validate import load_validate_model_name
 from trestle.common.model_utils import ModelUtils
 from trestle.core.catalog.catalog_interface import CatalogInterface
@@ -36,7 +37,7 @@ from trestle.core.commands.command_docs import CommandPlusDocs
 from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.core.control_interface import ControlInterface, ParameterRep
 from trestle.core.docs_control_writer import DocsControlWriter
-from trestle.core.jinja.ext import extensions
+from trestle.core.jinja.environment import create_environment
 from trestle.core.profile_resolver import ProfileResolver
 from trestle.core.ssp_io import SSPMarkdownWriter
 from trestle.oscal.profile import Profile
@@ -106,6 +107,14 @@ class JinjaCmd(CommandPlusDocs):
             action='store_true',
             required=False,
         )
+        self.add_argument(
+            '-bc',
+            '--bytecode-cache',
+            help='Cache the compiled templates in the trestle workspace to speed up later runs',
+            action='store_true',
+            required=False,
+        )
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> None:
         try:
@@ -143,6 +152,8 @@ class JinjaCmd(CommandPlusDocs):
                     parameters_formatting=args.bracket_format,
                     value_assigned_prefix=args.value_assigned_prefix,
                     value_not_assigned_prefix=args.value_not_assigned_prefix,
+                    bytecode_cache=getattr(args, 'bytecode_cache', False),
+                    jobs=getattr(args, 'jobs', 1),
                 )
 
             return JinjaCmd.jinja_ify(
@@ -156,6 +167,7 @@ class JinjaCmd(CommandPlusDocs):
                 parameters_formatting=args.bracket_format,
                 value_assigned_prefix=args.value_assigned_prefix,
                 value_not_assigned_prefix=args.value_not_assigned_prefix,
+                bytecode_cache=getattr(args, 'bytecode_cache', False),
             )
 
         except Exception as e:  # pragma: no cover
@@ -188,12 +200,11 @@ class JinjaCmd(CommandPlusDocs):
         parameters_formatting: Optional[str] = None,
         value_assigned_prefix: Optional[str] = None,
         value_not_assigned_prefix: Optional[str] = None,
+        bytecode_cache: bool = False,
     ) -> int:
         """Run jinja over an input file with additional booleans."""
         template_folder = pathlib.Path.cwd()
-        jinja_env = Environment(
-            loader=FileSystemLoader(template_folder), extensions=extensions(), trim_blocks=True, autoescape=True
-        )
+        jinja_env = create_environment(template_folder, trestle_root if bytecode_cache else None)
         template = jinja_env.get_template(str(r_input_file))
         # create boolean dict
         if operator.xor(bool(ssp), bool(profile)):
@@ -226,7 +237,7 @@ class JinjaCmd(CommandPlusDocs):
             lut['control_writer'] = DocsControlWriter()
             lut['ssp_md_writer'] = ssp_writer
 
-        output = JinjaCmd.render_template(template, lut, template_folder)
+        output = JinjaCmd.render_template(template, lut, template_folder, jinja_env)
 
         output_file = trestle_root / r_output_file
         if number_captions:
@@ -246,8 +257,12 @@ class JinjaCmd(CommandPlusDocs):
         parameters_formatting: Optional[str] = None,
         value_assigned_prefix: Optional[str] = None,
         value_not_assigned_prefix: Optional[str] = None,
+        bytecode_cache: bool = False,
+        jobs: int = 1,
     ) -> int:
-        """Output profile as multiple markdown files using Jinja."""
+        """Output profile as multiple markdown files using Jinja, with the controls rendered by jobs processes."""
+        if jobs < 1:
+            raise TrestleError(f'Number of jobs for jinja rendering must be at least 1, not {jobs}.')
         template_folder = pathlib.Path.cwd()
 
         # Output to multiple markdown files
@@ -265,8 +280,12 @@ class JinjaCmd(CommandPlusDocs):
             value_not_assigned_prefix,
         )
         catalog_interface = CatalogInterface(resolved_catalog)
+        lut['catalog_interface'] = catalog_interface
+        lut['control_interface'] = ControlInterface()
+        lut['profile'] = profile
 
         # Generate a single markdown page for each control per each group
+        tasks: List[Tuple[str, str, pathlib.Path]] = []
         for group in catalog_interface.get_all_groups_from_catalog():
             for control in catalog_interface.get_sorted_controls_in_group(group.id):
                 _, group_title, _ = catalog_interface.get_group_info_by_control(control.id)
@@ -277,28 +296,36 @@ class JinjaCmd(CommandPlusDocs):
                     if not group_dir.exists():
                         group_dir.mkdir(parents=True, exist_ok=True)
 
-                control_writer = DocsControlWriter()
-
-                jinja_env = Environment(
-                    loader=FileSystemLoader(template_folder), extensions=extensions(), trim_blocks=True, autoescape=True
-                )
-                template = jinja_env.get_template(str(r_input_file))
-                lut['catalog_interface'] = catalog_interface
-                lut['control_interface'] = ControlInterface()
-                lut['control_writer'] = control_writer
-                lut['control'] = control
-                lut['profile'] = profile
-                lut['group_title'] = group_title
-                output = JinjaCmd.render_template(template, lut, template_folder)
-
                 output_file = trestle_root / group_dir / pathlib.Path(control.id + const.MARKDOWN_FILE_EXT)
-                output_file.open('w', encoding=const.FILE_ENCODING).write(output)
+                tasks.append((control.id, group_title, output_file))
+
+        renderer_args = (template_folder, r_input_file, lut, trestle_root if bytecode_cache else None)
+        if jobs == 1 or len(tasks) < 2:
+            _ControlRenderer(*renderer_args).render_controls(tasks)
+        else:
+            jobs = min(jobs, len(tasks))
+            chunk_size = max(1, len(tasks) // (jobs * 4))
+            chunks = [tasks[ii : ii + chunk_size] for ii in range(0, len(tasks), chunk_size)]
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_control_renderer, initargs=renderer_args
+            ) as executor:
+                list(executor.map(_render_controls, chunks))
 
         return CmdReturnCodes.SUCCESS.value
 
     @staticmethod
-    def render_template(template: Template, lut: Dict[str, Any], template_folder: pathlib.Path) -> str:
-        """Render template."""
+    def render_template(
+        template: Template, lut: Dict[str, Any], template_folder: pathlib.Path, jinja_env: Optional[Environment] = None
+    ) -> str:
+        """
+        Render template.
+
+        The environment should be the one made by create_environment for the template, so it is shared by all renders
+        in a run.  If it is not given a new one is created for the template folder.
+        """
+        if jinja_env is None:
+            jinja_env = create_environment(template_folder)
+        rendered_templates: Dict[str, str] = jinja_env.trestle_rendered_templates
         new_output = template.render(**lut)
         output = ''
         # This recursion allows nesting within expressions (e.g. an expression can contain jinja templates).
@@ -306,20 +333,59 @@ class JinjaCmd(CommandPlusDocs):
         while new_output != output and error_countdown > 0:
             error_countdown = error_countdown - 1
             output = new_output
-            random_name = uuid.uuid4()  # Should be random and not used.
-            dict_loader = DictLoader({str(random_name): new_output})
-            jinja_env = Environment(
-                loader=ChoiceLoader([dict_loader, FileSystemLoader(template_folder)]),
-                extensions=extensions(),
-                autoescape=True,
-                trim_blocks=True,
-            )
-            template = jinja_env.get_template(str(random_name))
+            # name the output by its content so the environment can reuse its compiled form
+            name = hashlib.sha256(new_output.encode(const.FILE_ENCODING)).hexdigest()
+            rendered_templates[name] = new_output
+            try:
+                template = jinja_env.get_template(name)
+            finally:
+                rendered_templates.pop(name)
             new_output = template.render(**lut)
 
         return output
 
 
+class _ControlRenderer:
+    """Render the template for each control of a profile, with the jinja environment and template loaded once."""
+
+    def __init__(
+        self,
+        template_folder: pathlib.Path,
+        r_input_file: pathlib.Path,
+        lut: Dict[str, Any],
+        bytecode_cache_root: Optional[pathlib.Path],
+    ) -> None:
+        """Initialize the renderer with the lookup table shared by all controls."""
+        self._template_folder = template_folder
+        self._jinja_env = create_environment(template_folder, bytecode_cache_root)
+        self._template = self._jinja_env.get_template(str(r_input_file))
+        self._lut = lut
+
+    def render_controls(self, tasks: List[Tuple[str, str, pathlib.Path]]) -> None:
+        """Render and write the output file for each control id and group title."""
+        catalog_interface: CatalogInterface = self._lut['catalog_interface']
+        for control_id, group_title, output_file in tasks:
+            self._lut['control_writer'] = DocsControlWriter()
+            self._lut['control'] = catalog_interface.get_control(control_id)
+            self._lut['group_title'] = group_title
+            output = JinjaCmd.render_template(self._template, self._lut, self._template_folder, self._jinja_env)
+            output_file.open('w', encoding=const.FILE_ENCODING).write(output)
+
+
+_control_renderer: Optional[_ControlRenderer] = None
+
+
+def _init_control_renderer(*args: Any) -> None:
+    """Create the control renderer of a worker process."""
+    global _control_renderer
+    _control_renderer = _ControlRenderer(*args)
+
+
+def _render_controls(tasks: List[Tuple[str, str, pathlib.Path]]) -> None:
+    """Render a chunk of controls in a worker process."""
+    _control_renderer.render_controls(tasks)
+
+
 def _number_captions(md_body: str) -> str:
     """Incrementally number tables and image captions."""
     images = {}
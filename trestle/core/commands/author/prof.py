@@ -43,6 +43,7 @@ from trestle.common.list_utils import (
 from trestle.common.load_validate import load_validate_model_name
 from trestle.common.model_utils import ModelUtils
 from trestle.core.catalog.catalog_api import CatalogAPI
+from trestle.core.catalog.control_read_cache import ControlReadCache
 from trestle.core.commands.author.common import AuthorCommonCommand
 from trestle.core.commands.common.cmd_utils import clear_folder
 from trestle.core.commands.common.return_codes import CmdReturnCodes
@@ -78,6 +79,7 @@ class ProfileGenerate(AuthorCommonCommand):
         )
         self.add_argument('-s', '--sections', help=const.HELP_SECTIONS, required=False, type=str)
         self.add_argument('-rs', '--required-sections', help=const.HELP_REQUIRED_SECTIONS, required=False, type=str)
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -117,6 +119,7 @@ class ProfileGenerate(AuthorCommonCommand):
                 args.overwrite_header_values,
                 sections_dict,
                 comma_sep_to_list(args.required_sections),
+                getattr(args, 'jobs', 1),
             )
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Generation of the profile markdown failed')
@@ -130,6 +133,7 @@ class ProfileGenerate(AuthorCommonCommand):
         overwrite_header_values: bool,
         sections_dict: Optional[Dict[str, str]],
         required_sections: Optional[List[str]],
+        jobs: int = 1,
     ) -> int:
         """Generate markdown for the controls in the profile.
 
@@ -141,6 +145,7 @@ class ProfileGenerate(AuthorCommonCommand):
             overwrite_header_values: Overwrite values in the markdown header but allow new items to be added
             sections_dict: Optional dict mapping section short names to long
             required_sections: Optional list of sections that get prompted for prose if not in the profile
+            jobs: Number of processes writing the control markdown files
 
         Returns:
             0 on success, 1 on error
@@ -165,7 +170,7 @@ class ProfileGenerate(AuthorCommonCommand):
             context.required_sections = required_sections
             context.inherited_props = inherited_props
             catalog_api = CatalogAPI(catalog=catalog, context=context)
-            catalog_api.write_catalog_as_markdown()
+            catalog_api.write_catalog_as_markdown(jobs=jobs)
 
         except TrestleNotFoundError as e:
             raise TrestleError(f'Profile {profile_path} not found, error {e}')
@@ -195,6 +200,8 @@ class ProfileAssemble(AuthorCommonCommand):
         self.add_argument('-s', '--sections', help=const.HELP_SECTIONS, required=False, type=str)
         self.add_argument('-rs', '--required-sections', help=const.HELP_REQUIRED_SECTIONS, required=False, type=str)
         self.add_argument('-as', '--allowed-sections', help=const.HELP_ALLOWED_SECTIONS, required=False, type=str)
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
+        self.add_argument('--full', action='store_true', help=const.HELP_FULL)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -211,6 +218,8 @@ class ProfileAssemble(AuthorCommonCommand):
                 sections_dict=comma_colon_sep_to_dict(args.sections),
                 required_sections=comma_sep_to_list(args.required_sections),
                 allowed_sections=args.allowed_sections,
+                jobs=getattr(args, 'jobs', 1),
+                incremental=not getattr(args, 'full', False),
             )
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Assembly of markdown to profile failed')
@@ -315,6 +324,8 @@ class ProfileAssemble(AuthorCommonCommand):
         sections_dict: Dict[str, str],
         required_sections: List[str],
         allowed_sections: Optional[List[str]],
+        jobs: int = 1,
+        incremental: bool = False,
     ) -> int:
         """
         Assemble the markdown directory into a json profile model file.
@@ -330,6 +341,8 @@ class ProfileAssemble(AuthorCommonCommand):
             sections_dict: Optional map of short name to long name for sections
             required_sections: List of required sections in assembled profile, as comma-separated short names
             allowed_sections: Optional list of section short names that are allowed, as comma-separated short names
+            jobs: Number of processes reading the control markdown files
+            incremental: Only parse the control markdown files changed since the last incremental assemble
 
         Returns:
             0 on success, 1 otherwise
@@ -370,7 +383,9 @@ class ProfileAssemble(AuthorCommonCommand):
         # then overwrite the Adds in the existing profile with the new ones
         # keep track if any changes were made
         catalog_api = CatalogAPI(catalog=catalog, context=context)
-        found_alters, param_dict, param_map = catalog_api.read_additional_content_from_md(label_as_key=True)
+        found_alters, param_dict, param_map = catalog_api.read_additional_content_from_md(
+            label_as_key=True, jobs=jobs, read_cache=ControlReadCache(trestle_root) if incremental else None
+        )
 
         if allowed_sections is not None:
             for bad_part in [
@@ -470,6 +485,7 @@ class ProfileResolve(AuthorCommonCommand):
             type=str,
             default='',
         )
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -494,6 +510,7 @@ class ProfileResolve(AuthorCommonCommand):
                 value_not_assigned_prefix,
                 show_labels,
                 label_prefix,
+                args.jobs,
             )
 
         except Exception as e:  # pragma: no cover
@@ -510,6 +527,7 @@ class ProfileResolve(AuthorCommonCommand):
         value_not_assigned_prefix: Optional[str],
         show_labels: bool,
         label_prefix: Optional[str],
+        jobs: int = 1,
     ) -> int:
         """Create resolved profile catalog from given profile.
 
@@ -523,6 +541,7 @@ class ProfileResolve(AuthorCommonCommand):
             value_not_assigned_prefix: Prefix placed in front of param string if a value was *not* assigned
             show_labels: Show labels for parameters and not values
             label_prefix: Prefix placed in front of param label
+            jobs: Number of threads used to resolve sibling profile imports concurrently
 
         Returns:
             0 on success and raises exception on error
@@ -555,6 +574,7 @@ class ProfileResolve(AuthorCommonCommand):
             False,
             value_assigned_prefix,
             value_not_assigned_prefix,
+            jobs=jobs,
         )
         ModelUtils.save_top_level_model(catalog, trestle_root, catalog_name, FileContentType.JSON)
 
@@ -34,6 +34,7 @@ from trestle.common.list_utils import as_list, comma_sep_to_list, delete_list_fr
 from trestle.common.load_validate import load_validate_model_name
 from trestle.common.model_utils import ModelUtils
 from trestle.core.catalog.catalog_api import CatalogAPI
+from trestle.core.catalog.control_read_cache import ControlReadCache
 from trestle.core.catalog.catalog_interface import CatalogInterface
 from trestle.core.catalog.catalog_reader import CatalogReader
 from trestle.core.commands.author.common import AuthorCommonCommand
@@ -89,6 +90,7 @@ class SSPGenerate(AuthorCommonCommand):
             action='store_true',
             default=False,
         )
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -120,6 +122,7 @@ class SSPGenerate(AuthorCommonCommand):
                 args.overwrite_header_values,
                 args.force_overwrite,
                 args.include_all_parts,
+                getattr(args, 'jobs', 1),
             )
 
         except Exception as e:  # pragma: no cover
@@ -136,9 +139,10 @@ class SSPGenerate(AuthorCommonCommand):
         overwrite_header_values: bool,
         force_overwrite: bool,
         include_all_parts: bool,
+        jobs: int = 1,
     ) -> int:
         """
-        Generate the ssp markdown from the profile and compdefs.
+        Generate the ssp markdown from the profile and compdefs, with jobs workers resolving and writing the controls.
 
         Notes:
         Get RPC from profile.
@@ -191,6 +195,7 @@ class SSPGenerate(AuthorCommonCommand):
             params_format='[.]',
             param_rep=ParameterRep.ASSIGNMENT_FORM,
             show_value_warnings=True,
+            jobs=jobs,
         )
 
         catalog_api = CatalogAPI(catalog=resolved_catalog, context=context)
@@ -200,7 +205,7 @@ class SSPGenerate(AuthorCommonCommand):
 
         context.cli_yaml_header[const.TRESTLE_GLOBAL_TAG][const.PROFILE] = profile_header
 
-        catalog_api.write_catalog_as_markdown()
+        catalog_api.write_catalog_as_markdown(jobs=jobs)
 
         # Generate inheritance view after controls view completes
         if leveraged_ssp_name_or_href:
@@ -259,6 +264,8 @@ class SSPAssemble(AuthorCommonCommand):
         self.add_argument('-o', '--output', help=output_help_str, required=True, type=str)
         self.add_argument('-r', '--regenerate', action='store_true', help=const.HELP_REGENERATE)
         self.add_argument('-vn', '--version', help=const.HELP_VERSION, required=False, type=str)
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
+        self.add_argument('--full', action='store_true', help=const.HELP_FULL)
 
     @staticmethod
     def _get_ssp_component(ssp: ossp.SystemSecurityPlan, gen_comp: generic.GenericComponent) -> ossp.SystemComponent:
@@ -551,6 +558,7 @@ class SSPAssemble(AuthorCommonCommand):
             )
 
             context = ControlContext.generate(ContextPurpose.SSP, True, trestle_root, md_path)
+            read_cache = None if getattr(args, 'full', False) else ControlReadCache(trestle_root)
             context.comp_def_name_list = comma_sep_to_list(args.compdefs)
             part_id_map_by_id = catalog_interface.get_statement_part_id_map(False)
             catalog_interface.generate_control_rule_info(part_id_map_by_id, context)
@@ -598,7 +606,9 @@ class SSPAssemble(AuthorCommonCommand):
                     delete_list_from_list(ssp.system_implementation.components, index_list)
 
                 self._merge_comp_defs(ssp, comp_dict, context, catalog_interface)
-                CatalogReader.read_ssp_md_content(md_path, ssp, comp_dict, part_id_map_by_label, context)
+                CatalogReader.read_ssp_md_content(
+                    md_path, ssp, comp_dict, part_id_map_by_label, context, getattr(args, 'jobs', 1), read_cache
+                )
 
                 new_file_content_type = FileContentType.path_to_content_type(orig_ssp_path)
 
@@ -611,7 +621,9 @@ class SSPAssemble(AuthorCommonCommand):
                 ssp.control_implementation.description = const.SSP_SYSTEM_CONTROL_IMPLEMENTATION_TEXT
                 ssp.system_implementation.components = []
                 self._merge_comp_defs(ssp, comp_dict, context, catalog_interface)
-                CatalogReader.read_ssp_md_content(md_path, ssp, comp_dict, part_id_map_by_label, context)
+                CatalogReader.read_ssp_md_content(
+                    md_path, ssp, comp_dict, part_id_map_by_label, context, getattr(args, 'jobs', 1), read_cache
+                )
 
                 import_profile: ossp.ImportProfile = gens.generate_sample_model(ossp.ImportProfile)
                 import_profile.href = const.REPLACE_ME
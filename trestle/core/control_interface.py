@@ -873,20 +873,10 @@ class ControlInterface:
         Need to check all values in dict for a match
         Reject matches where the string has an adjacent alphanumeric char: param_1 and param_10 or aparam_1
         """
-        for param in param_dict.values():
-            param_id = param.id
-            if param_id is None:  # Check if None
-                continue
-            if param_id not in prose:  # Now mypy knows param_id is str
-                continue
-            # create the replacement text for the param_id
-            param_str = ControlInterface.param_to_str(
-                param, param_rep, False, False, params_format, value_assigned_prefix, value_not_assigned_prefix
-            )
-            # non-capturing groups are odd in re.sub so capture all 3 groups and replace the middle one
-            pattern = r'(^|[^a-zA-Z0-9_])' + param_id + r'($|[^a-zA-Z0-9_])'
-            prose = re.sub(pattern, r'\1' + param_str + r'\2', prose)  # type: ignore[operator]
-        return prose
+        replacer = ParamReplacer(
+            param_dict, params_format, param_rep, False, value_assigned_prefix, value_not_assigned_prefix
+        )
+        return replacer.replace_ids(prose)
 
     @staticmethod
     def _replace_params(
@@ -903,140 +893,31 @@ class ControlInterface:
 
         A single line of prose may contain multiple moustaches.
         """
-        # first check if there are any moustache patterns in the text
-        if param_rep == ParameterRep.LEAVE_MOUSTACHE:
-            return text
-        orig_text = text
-        staches: List[str] = re.findall(r'{{.*?}}', text)
-        if not staches:
-            return text
-        # now have list of all staches including braces, e.g. ['{{foo}}', '{{bar}}']
-        # clean the staches so they just have the param ids
-        param_ids = []
-        for stache in staches:
-            # remove braces so these are just param_ids but may have extra chars
-            stache_contents = stache[2:(-2)]
-            param_id = stache_contents.replace('insert: param,', '').strip()
-            param_ids.append(param_id)
-
-        # now replace original stache text with param values
-        for i, _ in enumerate(staches):
-            # A moustache may refer to a param_id not listed in the control's params
-            if param_ids[i] not in param_dict:
-                if show_value_warnings:
-                    logger.warning(f'Control prose references param {param_ids[i]} not set in the control: {staches}')
-            elif param_dict[param_ids[i]] is not None:
-                param = param_dict[param_ids[i]]
-                param_str = ControlInterface.param_to_str(
-                    param,
-                    param_rep,
-                    False,
-                    False,
-                    params_format,
-                    value_assigned_prefix,
-                    value_not_assigned_prefix,
-                    param_dict,
-                )
-                text = text.replace(staches[i], param_str, 1).strip()
-                # Parameter = Union[Parameter1, Parameter2] - check for values field before accessing
-                param_has_no_values = not (hasattr(param, 'values') and param.values)
-                if show_value_warnings and param_rep != ParameterRep.LABEL_OR_CHOICES and param_has_no_values:
-                    # verifies the current parameter is not an aggregated parameter to throw a warning
-                    if const.AGGREGATES not in [prop.name for prop in as_list(param.props)]:
-                        logger.warning(f'Parameter {param_id} has no values and was referenced by prose.')
-            elif show_value_warnings:
-                logger.warning(f'Control prose references param {param_ids[i]} with no specified value.')
-        # there may be staches remaining that we can't replace if not in param_dict
-        if text != orig_text:
-            while True:
-                new_text = ControlInterface._replace_params(
-                    text,
-                    param_dict,
-                    params_format,
-                    param_rep,
-                    show_value_warnings,
-                    value_assigned_prefix,
-                    value_not_assigned_prefix,
-                )
-                if new_text == text:
-                    break
-                text = new_text
-        return text
+        replacer = ParamReplacer(
+            param_dict, params_format, param_rep, show_value_warnings, value_assigned_prefix, value_not_assigned_prefix
+        )
+        return replacer.replace_moustaches(text)
 
     @staticmethod
-    def _replace_part_prose(
-        control: cat.Control,
-        part: common.Part,
-        param_dict: Dict[str, common.Parameter],
-        params_format: Optional[str] = None,
-        param_rep: ParameterRep = ParameterRep.VALUE_OR_LABEL_OR_CHOICES,
-        show_value_warnings: bool = False,
-        value_assigned_prefix: Optional[str] = None,
-        value_not_assigned_prefix: Optional[str] = None,
-    ) -> None:
+    def _replace_part_prose(control: cat.Control, part: common.Part, replacer: ParamReplacer) -> None:
         """Replace the part prose according to set_param."""
         if part.prose is not None:
-            fixed_prose = ControlInterface._replace_params(
-                part.prose,
-                param_dict,
-                params_format,
-                param_rep,
-                show_value_warnings,
-                value_assigned_prefix,
-                value_not_assigned_prefix,
-            )
             # change the prose in the control itself
-            part.prose = fixed_prose
+            part.prose = replacer.replace_moustaches(part.prose)
         for prt in as_list(part.parts):
-            ControlInterface._replace_part_prose(
-                control,
-                prt,
-                param_dict,
-                params_format,
-                param_rep,
-                show_value_warnings,
-                value_assigned_prefix,
-                value_not_assigned_prefix,
-            )
+            ControlInterface._replace_part_prose(control, prt, replacer)
         for sub_control in as_list(control.controls):
             for prt in as_list(sub_control.parts):
-                ControlInterface._replace_part_prose(
-                    sub_control,
-                    prt,
-                    param_dict,
-                    params_format,
-                    param_rep,
-                    show_value_warnings,
-                    value_assigned_prefix,
-                    value_not_assigned_prefix,
-                )
+                ControlInterface._replace_part_prose(sub_control, prt, replacer)
 
     @staticmethod
-    def _replace_param_choices(
-        param: common.Parameter,
-        param_dict: Dict[str, common.Parameter],
-        params_format: Optional[str],
-        param_rep: ParameterRep,
-        show_value_warnings: bool,
-        value_assigned_prefix: Optional[str] = None,
-        value_not_assigned_prefix: Optional[str] = None,
-    ) -> None:
+    def _replace_param_choices(param: common.Parameter, replacer: ParamReplacer) -> None:
         """Set values for all choices param that refer to params with values."""
         # Parameter = Union[Parameter1, Parameter2] - check for select field before accessing
         if hasattr(param, 'select') and param.select:
-            new_choices: List[str] = []
-            for choice in as_list(param.select.choice):
-                new_choice = ControlInterface._replace_params(
-                    choice,
-                    param_dict,
-                    params_format,
-                    param_rep,
-                    show_value_warnings,
-                    value_assigned_prefix,
-                    value_not_assigned_prefix,
-                )
-                new_choices.append(new_choice)
-            param.select.choice = new_choices
+            param.select.choice = [replacer.replace_moustaches(choice) for choice in as_list(param.select.choice)]
+            # the string for this param depends on its choices so it must be regenerated
+            replacer.forget(param.id)
 
     @staticmethod
     def replace_control_prose(
@@ -1047,13 +928,14 @@ class ControlInterface:
         show_value_warnings: bool = False,
         value_assigned_prefix: Optional[str] = None,
         value_not_assigned_prefix: Optional[str] = None,
+        replacer: Optional[ParamReplacer] = None,
     ) -> None:
-        """Replace the control prose according to set_param."""
-        # first replace all choices that reference parameters
-        # note that in ASSIGNMENT_FORM each choice with a parameter will end up as [Assignment: value]
-        for param in as_list(control.params):
-            ControlInterface._replace_param_choices(
-                param,
+        """Replace the control prose according to set_param.
+
+        A replacer created for the same param_dict and options may be passed in to share it across many controls.
+        """
+        if replacer is None:
+            replacer = ParamReplacer(
                 param_dict,
                 params_format,
                 param_rep,
@@ -1061,30 +943,16 @@ class ControlInterface:
                 value_assigned_prefix,
                 value_not_assigned_prefix,
             )
+        # first replace all choices that reference parameters
+        # note that in ASSIGNMENT_FORM each choice with a parameter will end up as [Assignment: value]
+        for param in as_list(control.params):
+            ControlInterface._replace_param_choices(param, replacer)
         for part in as_list(control.parts):
             if part.prose is not None:
-                fixed_prose = ControlInterface._replace_params(
-                    part.prose,
-                    param_dict,
-                    params_format,
-                    param_rep,
-                    show_value_warnings,
-                    value_assigned_prefix,
-                    value_not_assigned_prefix,
-                )
                 # change the prose in the control itself
-                part.prose = fixed_prose
+                part.prose = replacer.replace_moustaches(part.prose)
             for prt in as_list(part.parts):
-                ControlInterface._replace_part_prose(
-                    control,
-                    prt,
-                    param_dict,
-                    params_format,
-                    param_rep,
-                    show_value_warnings,
-                    value_assigned_prefix,
-                    value_not_assigned_prefix,
-                )
+                ControlInterface._replace_part_prose(control, prt, replacer)
 
     @staticmethod
     def bad_header(header: str) -> bool:
@@ -1277,3 +1145,137 @@ class ControlInterface:
         logger.warning(
             f'Unable to add imp req for component {component.title} control {new_imp_req.control_id} and source: {profile_title}'  # noqa E501
         )
+
+
+class ParamReplacer:
+    """
+    Replace references to parameters in prose with their string representation.
+
+    Moustaches are found with a single precompiled pattern and all of them are replaced in one pass over the text.
+    Bare param ids are matched with one pattern built from a trie of all the ids in the param_dict.
+    The string for each parameter is generated once and reused for every reference to it, so the replacer should be
+    shared across all the prose that uses the same param_dict and options.
+    """
+
+    _moustache_regex = re.compile(r'{{.*?}}')
+
+    # characters that may not be adjacent to a bare param id
+    _id_char_class = '[a-zA-Z0-9_]'
+
+    def __init__(
+        self,
+        param_dict: Dict[str, common.Parameter],
+        params_format: Optional[str] = None,
+        param_rep: ParameterRep = ParameterRep.VALUE_OR_LABEL_OR_CHOICES,
+        show_value_warnings: bool = False,
+        value_assigned_prefix: Optional[str] = None,
+        value_not_assigned_prefix: Optional[str] = None,
+    ) -> None:
+        """Initialize the replacer with the params available for replacement and how to represent them."""
+        self._param_dict = param_dict
+        self._params_format = params_format
+        self._param_rep = param_rep
+        self._show_value_warnings = show_value_warnings
+        self._value_assigned_prefix = value_assigned_prefix
+        self._value_not_assigned_prefix = value_not_assigned_prefix
+        self._param_strs: Dict[str, str] = {}
+        self._id_regex: Optional[re.Pattern] = None
+        self._params_by_id: Dict[str, common.Parameter] = {}
+        self._replaced = False
+
+    def forget(self, param_id: Optional[str]) -> None:
+        """Discard the stored string for a param whose contents have changed."""
+        self._param_strs.pop(param_id, None)
+
+    def _get_param_str(self, param: common.Parameter) -> str:
+        param_str = self._param_strs.get(param.id)
+        if param_str is None:
+            param_str = ControlInterface.param_to_str(
+                param,
+                self._param_rep,
+                False,
+                False,
+                self._params_format,
+                self._value_assigned_prefix,
+                self._value_not_assigned_prefix,
+                self._param_dict,
+            )
+            self._param_strs[param.id] = param_str
+        return param_str
+
+    def _replace_moustache(self, match: re.Match) -> str:
+        stache = match.group(0)
+        param_id = stache[2:-2].replace('insert: param,', '').strip()
+        # A moustache may refer to a param_id not listed in the control's params
+        if param_id not in self._param_dict:
+            if self._show_value_warnings:
+                logger.warning(f'Control prose references param {param_id} not set in the control: {stache}')
+            return stache
+        param = self._param_dict[param_id]
+        if param is None:
+            if self._show_value_warnings:
+                logger.warning(f'Control prose references param {param_id} with no specified value.')
+            return stache
+        self._replaced = True
+        if self._show_value_warnings and self._param_rep != ParameterRep.LABEL_OR_CHOICES:
+            # Parameter = Union[Parameter1, Parameter2] - check for values field before accessing
+            param_has_no_values = not (hasattr(param, 'values') and param.values)
+            # verifies the current parameter is not an aggregated parameter to throw a warning
+            if param_has_no_values and const.AGGREGATES not in [prop.name for prop in as_list(param.props)]:
+                logger.warning(f'Parameter {param_id} has no values and was referenced by prose.')
+        return self._get_param_str(param)
+
+    def replace_moustaches(self, text: str) -> str:
+        """
+        Replace params found in moustaches with their string representation.
+
+        The text is stripped if any moustache was replaced.  If the replacement text itself contains moustaches
+        they are replaced in turn until no further change occurs.
+        """
+        if self._param_rep == ParameterRep.LEAVE_MOUSTACHE or '{{' not in text:
+            return text
+        while True:
+            self._replaced = False
+            new_text = self._moustache_regex.sub(self._replace_moustache, text)
+            if not self._replaced:
+                return text
+            new_text = new_text.strip()
+            if new_text == text or '{{' not in new_text:
+                return new_text
+            text = new_text
+
+    @staticmethod
+    def _trie_pattern(words: List[str]) -> str:
+        """Build a regex alternation from a trie of the words, preferring the longest match."""
+        trie: Dict[str, Any] = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def node_pattern(node: Dict[str, Any]) -> str:
+            alternatives = [re.escape(char) + node_pattern(child) for char, child in sorted(node.items()) if char]
+            if not alternatives:
+                return ''
+            pattern = alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+            return f'(?:{pattern})?' if '' in node else pattern
+
+        return node_pattern(trie)
+
+    def _get_id_regex(self) -> re.Pattern:
+        if self._id_regex is None:
+            self._params_by_id = {
+                param.id: param for param in self._param_dict.values() if param is not None and param.id
+            }
+            ids_pattern = ParamReplacer._trie_pattern(list(self._params_by_id.keys()))
+            id_char = ParamReplacer._id_char_class
+            self._id_regex = re.compile(f'(?<!{id_char})(?:{ids_pattern})(?!{id_char})')
+        return self._id_regex
+
+    def replace_ids(self, text: str) -> str:
+        """Replace each bare param id in the text that is not adjacent to other id characters."""
+        id_regex = self._get_id_regex()
+        if not self._params_by_id:
+            return text
+        return id_regex.sub(lambda match: self._get_param_str(self._params_by_id[match.group(0)]), text)
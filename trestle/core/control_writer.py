@@ -488,7 +488,7 @@ class ControlWriter:
         group_title: str,
         part_id_map: Dict[str, str],
         found_alters: List[prof.Alter],
-    ) -> None:
+    ) -> Optional[bool]:
         """
         Write out the control in markdown format into the specified directory.
 
@@ -501,7 +501,7 @@ class ControlWriter:
             found_alters: List of alters read from the markdown file - if it exists
 
         Returns:
-            None
+            True if the file was written, False if it already had the same content, None if the control is withdrawn
 
         Notes:
             The filename is constructed from the control's id and created in the dest_path.
@@ -510,10 +510,11 @@ class ControlWriter:
             but in all cases new items from the provided header will be added to the markdown header.
             If the markdown file already exists, its current header and prose are read.
             Controls are checked if they are marked withdrawn, and if so they are not written out.
+            The file is only written if its content changes, so unchanged files keep their modification time.
         """
         if ControlInterface.is_withdrawn(control):
             logger.debug(f'Not writing out control {control.id} since it is marked Withdrawn.')
-            return
+            return None
 
         control_file = dest_path / (control.id + const.MARKDOWN_FILE_EXT)
         # read the existing markdown header and content if it exists
@@ -589,4 +590,4 @@ class ControlWriter:
         if context.required_sections:
             self._prompt_required_sections(context.required_sections, added_sections)
 
-        self._md_file.write_out()
+        return self._md_file.write_out()
@@ -15,6 +15,8 @@
 # limitations under the License.
 """Trestle core.jinja base class."""
 
+from typing import Any, Callable, Dict, Optional, Tuple
+
 from jinja2 import lexer, nodes
 from jinja2.environment import Environment
 from jinja2.ext import Extension
@@ -28,6 +30,24 @@ class TrestleJinjaExtension(Extension):
     def __init__(self, environment: Environment) -> None:
         """Ensure enviroment is set and carried into class vars."""
         super().__init__(environment)
+        self._source_cache: Dict[Tuple[Any, ...], Tuple[str, Optional[Callable[[], bool]]]] = {}
+
+    def get_transformed_source(self, name: str, key: Tuple[Any, ...], transform: Callable[[str], str]) -> str:
+        """
+        Get the source of the named file from the environment loader, as transformed by the function.
+
+        The result is memoized by name and key for as long as the loader reports the file is unchanged, since the
+        same markdown may be included by the template rendered for each of many controls.
+        """
+        cached = self._source_cache.get((name, *key))
+        if cached is not None:
+            content, uptodate = cached
+            if uptodate is not None and uptodate():
+                return content
+        source, _, uptodate = self.environment.loader.get_source(self.environment, name)
+        content = transform(source)
+        self._source_cache[(name, *key)] = content, uptodate
+        return content
 
     @staticmethod
     def parse_expression(parser):
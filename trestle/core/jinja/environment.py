@@ -0,0 +1,108 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Trestle core.jinja environment creation, with an optional bytecode cache persisted in the trestle workspace."""
+
+import datetime
+import hashlib
+import pathlib
+import re
+from typing import Any, Dict, Optional, Set
+
+from jinja2 import ChoiceLoader, DictLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateNotFound
+from jinja2.bccache import Bucket
+
+from trestle.common import const
+from trestle.core.jinja.ext import extensions
+
+# the trestle tags that insert the content of another file, or the date, into a template when it is compiled
+_INCLUDE_TAG_REGEX = re.compile(r'{%-?\s*(?:mdsection_include|md_clean_include)\s+["\']([^"\']+)["\']')
+_DATESTAMP_TAG_REGEX = re.compile(r'{%-?\s*md_datestamp\b')
+
+
+class TrestleBytecodeCache(FileSystemBytecodeCache):
+    """
+    Bytecode cache for jinja templates persisted in the trestle cache of the workspace.
+
+    The trestle include tags insert the content of markdown files into a template when it is compiled, and the
+    datestamp tag inserts the date, so the checksum of a template covers the files it includes and the date if it uses
+    them.  Templates using jinja extensions from plugins that insert other content at compile time should not be
+    cached.  Templates given by source rather than loaded from a file, such as rendered output, are never cached since
+    they are rarely compiled again.
+    """
+
+    def __init__(self, directory: pathlib.Path) -> None:
+        """Initialize the cache in the directory."""
+        directory.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(directory))
+
+    @staticmethod
+    def _update_checksum(environment: Environment, source: str, hasher: Any, seen: Set[str]) -> None:
+        hasher.update(source.encode(const.FILE_ENCODING))
+        if _DATESTAMP_TAG_REGEX.search(source):
+            hasher.update(datetime.date.today().isoformat().encode())
+        for name in _INCLUDE_TAG_REGEX.findall(source):
+            if name in seen:
+                continue
+            seen.add(name)
+            try:
+                included, _, _ = environment.loader.get_source(environment, name)
+            except TemplateNotFound:
+                # compiling will fail anyway, so nothing is cached
+                continue
+            TrestleBytecodeCache._update_checksum(environment, included, hasher, seen)
+
+    def get_bucket(self, environment: Environment, name: str, filename: Optional[str], source: str) -> Bucket:
+        """Get the bucket for the template, with a checksum covering its source and any content it includes."""
+        if filename is None:
+            # an empty bucket with no key, which set_bucket does not save
+            return Bucket(environment, '', '')
+        hasher = hashlib.sha1(usedforsecurity=False)
+        TrestleBytecodeCache._update_checksum(environment, source, hasher, set())
+        bucket = Bucket(environment, self.get_cache_key(name, filename), hasher.hexdigest())
+        self.load_bytecode(bucket)
+        return bucket
+
+    def set_bucket(self, bucket: Bucket) -> None:
+        """Save the compiled template in the bucket, unless it was not loaded from a file."""
+        if bucket.key:
+            super().set_bucket(bucket)
+
+
+def create_environment(template_folder: pathlib.Path, trestle_root: Optional[pathlib.Path] = None) -> Environment:
+    """
+    Create the jinja environment with the trestle extensions for templates in the folder.
+
+    Args:
+        template_folder: the folder containing the templates and the markdown they include
+        trestle_root: if given, compiled templates are cached in the trestle cache of this workspace between runs
+
+    Returns:
+        The environment, to be created once and used for all templates rendered in a run.
+
+    Notes:
+        Templates can also be given by source, by adding them to the trestle_rendered_templates dict of the
+        environment under a name before getting them, which is how rendered output is rendered again.
+    """
+    rendered_templates: Dict[str, str] = {}
+    loader = ChoiceLoader([DictLoader(rendered_templates), FileSystemLoader(template_folder)])
+    bytecode_cache = None
+    if trestle_root is not None:
+        bytecode_cache = TrestleBytecodeCache(trestle_root / const.TRESTLE_CACHE_DIR / const.JINJA_CACHE_DIR)
+    jinja_env = Environment(
+        loader=loader, extensions=extensions(), trim_blocks=True, autoescape=True, bytecode_cache=bytecode_cache
+    )
+    jinja_env.extend(trestle_rendered_templates=rendered_templates)
+    return jinja_env
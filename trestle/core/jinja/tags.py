@@ -78,26 +78,32 @@ class MDSectionInclude(TrestleJinjaExtension):
                 if parser.stream.look().type == lexer.TOKEN_ASSIGN:
                     kwargs = {}
                 continue
-        # Use the established environment to source the file
-        md_content, _, _ = self.environment.loader.get_source(self.environment, markdown_source.value)
-        fm = frontmatter.loads(md_content)
-        if not fm.metadata == {}:
-            logger.warning('Non zero metadata on MD section include - ignoring')
-        full_md = docs_markdown_node.DocsMarkdownNode.build_tree_from_markdown(fm.content.split('\n'))
-        md_section = full_md.get_node_for_key(section_title.value, strict_matching=True)
-        # adjust
         if kwargs is not None:
             expected_heading_level = kwargs.get('heading_level')
-        if expected_heading_level is not None:
-            level = md_section.get_node_header_lvl()
-            delta = int(expected_heading_level) - level
-            if not delta == 0:
-                md_section.change_header_level_by(delta)
-        if not md_section:
-            raise err.TrestleError(
-                f'Unable to retrieve section "{section_title.value}"" from {markdown_source.value} jinja template.'
-            )
-        local_parser = Parser(self.environment, md_section.content.raw_text)
+
+        def get_section(md_content: str) -> str:
+            fm = frontmatter.loads(md_content)
+            if not fm.metadata == {}:
+                logger.warning('Non zero metadata on MD section include - ignoring')
+            full_md = docs_markdown_node.DocsMarkdownNode.build_tree_from_markdown(fm.content.split('\n'))
+            md_section = full_md.get_node_for_key(section_title.value, strict_matching=True)
+            # adjust
+            if expected_heading_level is not None:
+                level = md_section.get_node_header_lvl()
+                delta = int(expected_heading_level) - level
+                if not delta == 0:
+                    md_section.change_header_level_by(delta)
+            if not md_section:
+                raise err.TrestleError(
+                    f'Unable to retrieve section "{section_title.value}"" from {markdown_source.value} jinja template.'
+                )
+            return md_section.content.raw_text
+
+        # Use the established environment to source the file
+        section_text = self.get_transformed_source(
+            markdown_source.value, (section_title.value, expected_heading_level), get_section
+        )
+        local_parser = Parser(self.environment, section_text)
         top_level_output = local_parser.parse()
 
         return top_level_output.body
@@ -136,14 +142,18 @@ class MDCleanInclude(TrestleJinjaExtension):
                 if parser.stream.look().type == lexer.TOKEN_ASSIGN:
                     kwargs = {}
                 continue
-        md_content, _, _ = self.environment.loader.get_source(self.environment, markdown_source.value)
-        fm = frontmatter.loads(md_content)
-        content = fm.content
-        content += '\n\n'
         if kwargs is not None:
             expected_heading_level = kwargs.get('heading_level')
-        if expected_heading_level is not None:
-            content = adjust_heading_level(content, expected_heading_level)
+
+        def get_content(md_content: str) -> str:
+            fm = frontmatter.loads(md_content)
+            content = fm.content
+            content += '\n\n'
+            if expected_heading_level is not None:
+                content = adjust_heading_level(content, expected_heading_level)
+            return content
+
+        content = self.get_transformed_source(markdown_source.value, (expected_heading_level,), get_content)
 
         local_parser = Parser(self.environment, content)
         top_level_output = local_parser.parse()
@@ -29,6 +29,10 @@ logger = logging.getLogger(__name__)
 class LinksValidator(Validator):
     """Validator to confirm all uuids in links and prose match resources in backmatter."""
 
+    def dependency_hrefs(self, model: TopLevelOscalModel) -> List[str]:
+        """Return no hrefs since the links and back-matter resources are both within the model."""
+        return []
+
     def model_is_valid(
         self, model: TopLevelOscalModel, quiet: bool, trestle_root: Optional[pathlib.Path] = None
     ) -> bool:
@@ -15,6 +15,8 @@
 # limitations under the License.
 """A markdown API."""
 
+import functools
+import hashlib
 import logging
 import pathlib
 from typing import Dict, Optional
@@ -45,28 +47,19 @@ class MarkdownAPI:
         governed_section: Optional[str] = None,
         validate_template: bool = False,
     ) -> None:
-        """Load and initialize markdown validator."""
+        """
+        Load and initialize markdown validator.
+
+        The validator parsed from a template is cached for the template content and flags, so it is parsed once when
+        validating many instances against the same template.
+        """
         try:
             self.processor.governed_header = governed_section
-            if validate_template:
-                template_header, template_tree = self.processor.process_markdown(
-                    md_template_path, validate_yaml_header, validate_md_body or governed_section is not None
-                )
-            else:
-                template_header, template_tree = self.processor.process_markdown(md_template_path)
-
-            if not template_header and validate_yaml_header:
-                raise TrestleError(f'Expected yaml header for markdown template where none exists {md_template_path}')
-
-            self.validator = MarkdownValidator(
-                md_template_path,
-                template_header,
-                template_tree,
-                validate_yaml_header,
-                validate_md_body,
-                governed_section,
+            digest = hashlib.sha256(md_template_path.read_bytes()).hexdigest()
+            self.validator = _load_validator(
+                md_template_path, digest, validate_yaml_header, validate_md_body, governed_section, validate_template
             )
-        except TrestleError as e:
+        except OSError as e:
             raise TrestleError(f'Error while loading markdown template {md_template_path}: {e}.')
 
     def validate_instance(self, md_instance_path: pathlib.Path) -> bool:
@@ -87,3 +80,33 @@ class MarkdownAPI:
                 md_file.write(md_body)
         except OSError as e:
             raise TrestleError(f'Error while writing markdown file: {e}')
+
+
+@functools.lru_cache(maxsize=128)
+def _load_validator(
+    md_template_path: pathlib.Path,
+    digest: str,
+    validate_yaml_header: bool,
+    validate_md_body: bool,
+    governed_section: Optional[str],
+    validate_template: bool,
+) -> MarkdownValidator:
+    """Parse the template into a validator, cached by the digest of the template content and the flags."""
+    try:
+        processor = MarkdownProcessor()
+        processor.governed_header = governed_section
+        if validate_template:
+            template_header, template_tree = processor.process_markdown(
+                md_template_path, validate_yaml_header, validate_md_body or governed_section is not None
+            )
+        else:
+            template_header, template_tree = processor.process_markdown(md_template_path)
+
+        if not template_header and validate_yaml_header:
+            raise TrestleError(f'Expected yaml header for markdown template where none exists {md_template_path}')
+
+        return MarkdownValidator(
+            md_template_path, template_header, template_tree, validate_yaml_header, validate_md_body, governed_section
+        )
+    except TrestleError as e:
+        raise TrestleError(f'Error while loading markdown template {md_template_path}: {e}.')
@@ -13,14 +13,15 @@
 # limitations under the License.
 """Create formatted markdown files with optional yaml header."""
 
+import io
 import logging
+import os
 import pathlib
 from typing import Any, Dict, List, Optional
 
 from ruamel.yaml import YAML
 
 import trestle.common.const as const
-from trestle.common import file_utils
 from trestle.common.err import TrestleError
 from trestle.common.list_utils import as_dict
 from trestle.core.markdown.markdown_api import MarkdownAPI
@@ -138,31 +139,52 @@ class MDWriter:
         while len(self._lines) > 0 and self._lines[0] == '':
             self._lines = self._lines[1:]
 
-    def write_out(self) -> None:
-        """Write out the markdown file."""
+    def get_content(self) -> str:
+        """Get the full content of the file as it will be written, including the yaml header and its comments."""
         self._check_header()
+        out = io.StringIO()
+        # Make sure yaml header is written first
+        if self._yaml_header:
+            out.write('---\n')
+            yaml = YAML()
+            yaml.indent(mapping=2, sequence=4, offset=2)
+            yaml.dump(self._yaml_header, out)
+            out.write('---\n\n')
+
+        out.write('\n'.join(self._lines))
+        # if last line has text it will need an extra \n at end
+        if self._lines and self._lines[-1]:
+            out.write('\n')
+        content = out.getvalue()
+        # insert helpful comments into the header after the first line containing each tag
+        for tag, comment in as_dict(self._header_comments_dict).items():
+            tag_pos = content.find(tag) if tag in as_dict(self._yaml_header) else -1
+            if tag_pos >= 0:
+                line_end = content.find('\n', tag_pos)
+                insert_pos = len(content) if line_end < 0 else line_end + 1
+                content = content[:insert_pos] + comment + content[insert_pos:]
+        return content
+
+    def write_out(self) -> bool:
+        """
+        Write out the markdown file, unless the file already has the same content.
+
+        Returns:
+            True if the file was written, False if it was left as is since its content would not change.
+        """
+        content = self.get_content()
         try:
+            # the file is written in text mode, so compare with the content as it would be on disk
+            disk_content = content.replace('\n', os.linesep).encode(const.FILE_ENCODING)
+            if self._file_path.exists() and self._file_path.read_bytes() == disk_content:
+                return False
             self._file_path.parent.mkdir(exist_ok=True, parents=True)
             with open(self._file_path, 'w', encoding=const.FILE_ENCODING) as f:
-                # Make sure yaml header is written first
-                if self._yaml_header:
-                    f.write('---\n')
-                    yaml = YAML()
-                    yaml.indent(mapping=2, sequence=4, offset=2)
-                    yaml.dump(self._yaml_header, f)
-                    f.write('---\n\n')
-
-                f.write('\n'.join(self._lines))
-                # if last line has text it will need an extra \n at end
-                if self._lines and self._lines[-1]:
-                    f.write('\n')
-            # insert helpful comments into the header happens after header is written out
-            for tag, comment in as_dict(self._header_comments_dict).items():
-                if tag in as_dict(self._yaml_header):
-                    file_utils.insert_text_in_file(self._file_path, tag, comment)
+                f.write(content)
         except OSError as e:
             logger.debug(f'md_writer error attempting to write out md file {self._file_path} {e}')
             raise TrestleError(f'Error attempting to write out md file {self._file_path} {e}')
+        return True
 
     def get_lines(self) -> List[str]:
         """Return the current lines in the file."""
@@ -25,6 +25,8 @@ from trestle.common.list_utils import as_list, pop_item_from_list
 from trestle.core.catalog.catalog_interface import CatalogInterface
 from trestle.core.control_interface import ParameterRep
 from trestle.core.resolver._import import Import
+from trestle.core.resolver.prefetch import prefetch_imports
+from trestle.core.resolver.resolution_cache import ResolutionCache
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +77,8 @@ class ProfileResolver:
         show_value_warnings: bool = False,
         value_assigned_prefix: Optional[str] = None,
         value_not_assigned_prefix: Optional[str] = None,
+        resolution_cache: Optional[ResolutionCache] = None,
+        jobs: int = 1,
     ) -> Tuple[cat.Catalog, Optional[Dict[str, Any]]]:
         """
         Create the resolved profile catalog given a profile path along with inherited props.
@@ -89,11 +93,17 @@ class ProfileResolver:
             show_value_warnings: warn if prose references a value that has not been set
             value_assigned_prefix: Prefix placed in front of param string if a value was assigned
             value_not_assigned_prefix: Prefix placed in front of param string if a value was *not* assigned
+            resolution_cache: optional cache of imported catalogs to share across resolutions of several profiles
+            jobs: number of threads used to resolve the imports of the first profile with several imports concurrently,
+                and to prefetch all the models it imports beforehand if more than one
 
         Returns:
             The resolved profile catalog and a control dict of inherited props
         """
         logger.debug(f'get resolved profile catalog and inherited props for {profile_path} via generated Import.')
+        if jobs > 1:
+            report = prefetch_imports(trestle_root, str(profile_path), jobs)
+            logger.info(f'Prefetched imports of {profile_path}: {report}')
         import_ = prof.Import1(href=str(profile_path), include_all={})
         # The final Import has change_prose=True to force parameter substitution in the prose only at the last stage.
         import_filter = Import(
@@ -109,6 +119,8 @@ class ProfileResolver:
             show_value_warnings,
             value_assigned_prefix,
             value_not_assigned_prefix,
+            resolution_cache=resolution_cache,
+            jobs=jobs,
         )
         logger.debug('launch pipeline')
         resolved_profile_catalog = next(import_filter.process())
@@ -126,6 +138,8 @@ class ProfileResolver:
         show_value_warnings: bool = False,
         value_assigned_prefix: Optional[str] = None,
         value_not_assigned_prefix: Optional[str] = None,
+        resolution_cache: Optional[ResolutionCache] = None,
+        jobs: int = 1,
     ) -> cat.Catalog:
         """
         Create the resolved profile catalog given a profile path.
@@ -140,6 +154,9 @@ class ProfileResolver:
             show_value_warnings: warn if prose references a value that has not been set
             value_assigned_prefix: Prefix placed in front of param string if a value was assigned
             value_not_assigned_prefix: Prefix placed in front of param string if a value was *not* assigned
+            resolution_cache: optional cache of imported catalogs to share across resolutions of several profiles
+            jobs: number of threads used to resolve the imports of the first profile with several imports concurrently,
+                and to prefetch all the models it imports beforehand if more than one
 
         Returns:
             The resolved profile catalog
@@ -155,5 +172,7 @@ class ProfileResolver:
             show_value_warnings,
             value_assigned_prefix,
             value_not_assigned_prefix,
+            resolution_cache,
+            jobs,
         )
         return resolved_profile_catalog
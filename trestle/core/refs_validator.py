@@ -16,7 +16,7 @@
 """Validate by confirming all refs have corresponding id."""
 
 import pathlib
-from typing import Optional
+from typing import List, Optional
 
 from trestle.common.common_types import TopLevelOscalModel
 from trestle.common.list_utils import as_list
@@ -26,6 +26,10 @@ from trestle.core.validator import Validator
 class RefsValidator(Validator):
     """Validator to confirm all references in responsible parties are found in roles."""
 
+    def dependency_hrefs(self, model: TopLevelOscalModel) -> List[str]:
+        """Return no hrefs since the roles and responsible parties are both in the model metadata."""
+        return []
+
     def model_is_valid(
         self, model: TopLevelOscalModel, quiet: bool, trestle_root: Optional[pathlib.Path] = None
     ) -> bool:
@@ -19,13 +19,23 @@ Trestle cache operations library.
 Allows for using URI's to reference external directories and then expand.
 """
 
+import atexit
+import configparser
 import datetime
 import getpass
+import functools
+import hashlib
+import hmac
+import json
 import logging
 import os
 import pathlib
+import pickle  # noqa: S403 - only used for snapshots signed by trestle itself
 import platform
 import re
+import secrets
+import tempfile
+import threading
 from abc import ABC, abstractmethod
 from enum import Enum
 from io import StringIO
@@ -34,9 +44,12 @@ from urllib import parse
 
 import paramiko
 
+import pydantic
+
 import requests
 from requests.auth import HTTPBasicAuth
 
+from trestle import __version__
 from trestle.common import const, file_utils
 from trestle.common.err import TrestleError
 from trestle.core import parser
@@ -45,6 +58,33 @@ from trestle.core.base_model import OscalBaseModel
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _get_snapshot_key() -> Optional[bytes]:
+    """Get the secret key of this user signing model snapshots, creating it if needed, or None if unavailable.
+
+    The key is kept in the cache directory of the user rather than the workspace, so it is never committed.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or str(pathlib.Path.home() / '.cache')
+    key_path = pathlib.Path(cache_home) / const.SNAPSHOT_KEY_DIR / const.SNAPSHOT_KEY_FILE
+    try:
+        key_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            key = key_path.read_bytes()
+        else:
+            key = secrets.token_bytes(const.SNAPSHOT_KEY_SIZE)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(key)
+    except OSError as e:
+        logger.debug(f'Model snapshots disabled, unable to get the snapshot key {key_path}: {e}')
+        return None
+    if len(key) != const.SNAPSHOT_KEY_SIZE:
+        logger.debug(f'Model snapshots disabled, invalid snapshot key {key_path}')
+        return None
+    return key
+
+
 class FetcherBase(ABC):
     """FetcherBase - base class for caching and fetching remote oscal objects."""
 
@@ -62,7 +102,26 @@ class FetcherBase(ABC):
         self._trestle_cache_path: pathlib.Path = self._trestle_root / const.TRESTLE_CACHE_DIR
         # ensure trestle cache directory exists.
         self._trestle_cache_path.mkdir(exist_ok=True)
-        self._expiration_seconds = const.DAY_SECONDS
+        self._expiration_seconds = self._get_expiration_seconds()
+
+    def _get_expiration_seconds(self) -> int:
+        """Get the seconds before a cached object is stale, from the cache section of the workspace config if set."""
+        config_path = self._trestle_root / const.TRESTLE_CONFIG_DIR / const.TRESTLE_CONFIG_FILE
+        config = configparser.ConfigParser(interpolation=configparser.ExtendedInterpolation())
+        try:
+            config.read(config_path, encoding=const.FILE_ENCODING)
+        except configparser.Error as e:
+            logger.debug(f'Using default cache expiration, unable to read {config_path}: {e}')
+            return const.DAY_SECONDS
+        try:
+            expiration_seconds = config.getint(
+                const.CACHE_CONFIG_SECTION, const.CACHE_EXPIRATION_OPTION, fallback=const.DAY_SECONDS
+            )
+        except ValueError as e:
+            raise TrestleError(f'Invalid {const.CACHE_EXPIRATION_OPTION} in {config_path}: {e}')
+        if expiration_seconds < 0:
+            raise TrestleError(f'Invalid {const.CACHE_EXPIRATION_OPTION} in {config_path}: must not be negative')
+        return expiration_seconds
 
     @staticmethod
     def _time_since_modification(file_path: pathlib.Path) -> datetime.timedelta:
@@ -71,10 +130,17 @@ class FetcherBase(ABC):
         return datetime.datetime.now(datetime.timezone.utc) - last_modification
 
     @abstractmethod
-    def _do_fetch(self) -> None:
-        """Fetch the object from a remote source."""
+    def _do_fetch(self) -> bool:
+        """Fetch the object from a remote source, returning whether its content was downloaded."""
         pass
 
+    @staticmethod
+    def _write_cache_file(path: pathlib.Path, text: str) -> None:
+        """Write the text to the file in the cache atomically, so concurrent fetches never leave it partly written."""
+        with tempfile.NamedTemporaryFile('w', encoding=const.FILE_ENCODING, dir=path.parent, delete=False) as f:
+            f.write(text)
+        os.replace(f.name, path)
+
     def _in_cache(self) -> bool:
         """Return whether object is present in the cache or not."""
         return self._cached_object_path.exists()
@@ -87,24 +153,43 @@ class FetcherBase(ABC):
             seconds=self._expiration_seconds
         )
 
-    def _update_cache(self, force_update: bool = False) -> bool:
-        """Update the cache by fetching the target remote object, if stale or forced.
+    def _refresh_cache(self, force_update: bool = False) -> Optional[bool]:
+        """Fetch the target remote object if stale or forced.
 
         Args:
             force_update: force the fetch regardless of staleness.
 
         Returns:
-            True if update occurred
+            None if no fetch occurred, otherwise whether the content was downloaded rather than found unchanged
         """
         if self._is_stale() or force_update:
             try:
-                self._do_fetch()
-                return True
+                return self._do_fetch()
             except Exception as e:
                 raise TrestleError(
                     f'Cache update failure for {self._uri}.  Please confirm the file is json and not html: {e}.'
                 ) from e  # noqa E501
-        return False
+        return None
+
+    def _update_cache(self, force_update: bool = False) -> bool:
+        """Update the cache by fetching the target remote object, if stale or forced.
+
+        Args:
+            force_update: force the fetch regardless of staleness.
+
+        Returns:
+            True if update occurred
+        """
+        return self._refresh_cache(force_update) is not None
+
+    def prefetch(self) -> Optional[int]:
+        """Fetch the object into the cache if stale, returning the size downloaded in bytes, or None if not downloaded.
+
+        Nothing is downloaded if the cached object is still fresh, or is stale but found unchanged at the source.
+        """
+        if not self._refresh_cache():
+            return None
+        return self._cached_object_path.stat().st_size
 
     def get_raw(self, force_update: bool = False) -> Dict[str, Any]:
         """Retrieve the raw dictionary representing the underlying object."""
@@ -134,14 +219,97 @@ class FetcherBase(ABC):
             logger.debug(f'get_oscal failed, error loading cache file for {self._uri} as {model_type}')
             raise TrestleError(f'get_oscal failure for {self._uri}: {e}.') from e
 
+    def _get_model_snapshot_path(self) -> pathlib.Path:
+        """Get the path of the parsed model snapshot of the cached object.
+
+        There is one snapshot per cached object, replaced whenever the content of the object changes.
+        """
+        source_hash = hashlib.sha256(str(self._cached_object_path).encode()).hexdigest()
+        return self._trestle_cache_path / const.MODEL_CACHE_DIR / f'{source_hash}.snapshot'
+
+    def _get_content_digest(self) -> Optional[bytes]:
+        """Get the hash of the content of the cached object together with the trestle and pydantic versions.
+
+        Any change to the source or to the model classes results in a new digest, invalidating the snapshot.
+        """
+        try:
+            content = self._cached_object_path.read_bytes()
+        except OSError:
+            return None
+        digest = hashlib.sha256(f'{__version__}:{pydantic.VERSION}:'.encode())
+        digest.update(content)
+        return digest.digest()
+
+    def _load_model_snapshot(
+        self, snapshot_path: pathlib.Path, content_digest: bytes
+    ) -> Optional[Tuple[OscalBaseModel, str]]:
+        """Load the previously parsed model and its root key from the snapshot, if present and still current.
+
+        The snapshot is only unpickled if it was written by this user, i.e. it is signed with the snapshot key
+        kept outside the workspace, so snapshots committed to a repository or copied from elsewhere are ignored.
+        """
+        key = _get_snapshot_key()
+        if key is None or not snapshot_path.exists():
+            return None
+        try:
+            snapshot = snapshot_path.read_bytes()
+        except OSError as e:
+            logger.debug(f'Ignoring unreadable model snapshot {snapshot_path} for {self._uri}: {e}')
+            return None
+        mac_size = hashlib.sha256().digest_size
+        signature, payload = snapshot[:mac_size], snapshot[mac_size:]
+        if not hmac.compare_digest(signature, hmac.new(key, payload, hashlib.sha256).digest()):
+            logger.debug(f'Ignoring model snapshot {snapshot_path} for {self._uri} not written by this user')
+            return None
+        if payload[: len(content_digest)] != content_digest:
+            return None
+        try:
+            model, root_key = pickle.loads(payload[len(content_digest) :])  # noqa: S301 - signed by this user
+        except Exception as e:
+            logger.debug(f'Ignoring unreadable model snapshot {snapshot_path} for {self._uri}: {e}')
+            return None
+        logger.debug(f'Loaded parsed model snapshot for {self._uri}')
+        return model, root_key
+
+    def _save_model_snapshot(
+        self, snapshot_path: pathlib.Path, content_digest: bytes, model: OscalBaseModel, root_key: str
+    ) -> None:
+        """Save the signed parsed model and its root key as the snapshot, atomically replacing the previous one."""
+        key = _get_snapshot_key()
+        if key is None:
+            return
+        try:
+            payload = content_digest + pickle.dumps((model, root_key), protocol=pickle.HIGHEST_PROTOCOL)
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('wb', dir=snapshot_path.parent, delete=False) as f:
+                f.write(hmac.new(key, payload, hashlib.sha256).digest())
+                f.write(payload)
+            os.replace(f.name, snapshot_path)
+        except Exception as e:
+            logger.debug(f'Unable to save model snapshot {snapshot_path} for {self._uri}: {e}')
+
     def get_oscal(self, force_update: bool = False) -> Tuple[OscalBaseModel, str]:
-        """Retrieve the cached file and model name without knowing its model type."""
-        model_dict = self.get_raw(force_update)
+        """Retrieve the cached file and model name without knowing its model type.
+
+        Parsed models are kept as snapshots in the trestle cache along with the content hash of the file,
+        so repeated reads of unchanged content skip the parsing and validation of the model.
+        """
+        self._update_cache(force_update)
+        snapshot_path = self._get_model_snapshot_path()
+        content_digest = self._get_content_digest()
+        if content_digest is not None:
+            snapshot = self._load_model_snapshot(snapshot_path, content_digest)
+            if snapshot is not None:
+                return snapshot
+        model_dict = self.get_raw()
         root_key = parser.root_key(model_dict)
         model_name = parser.to_full_model_name(root_key)
         if model_name is None:
             raise TrestleError(f'Failed cache read of non top level model with root_key {root_key}')
-        return parser.parse_dict(model_dict[root_key], model_name), root_key
+        model = parser.parse_dict(model_dict[root_key], model_name)
+        if content_digest is not None:
+            self._save_model_snapshot(snapshot_path, content_digest, model, root_key)
+        return model, root_key
 
 
 class LocalFetcher(FetcherBase):
@@ -202,13 +370,21 @@ class LocalFetcher(FetcherBase):
         # Local file is always stale.
         return True
 
-    def _do_fetch(self) -> None:
+    def _do_fetch(self) -> bool:
         """No need to fetch since using actual file path."""
-        pass
+        return False
 
 
 class HTTPSFetcher(FetcherBase):
-    """Fetcher for https content."""
+    """Fetcher for https content.
+
+    All fetchers in a process share one session, so connections to each server are kept alive and reused. The
+    ETag and Last-Modified of each response are kept beside the cached object, so once it is stale it is fetched
+    with a conditional request and only downloaded again if it has changed.
+    """
+
+    _session: Optional[requests.Session] = None
+    _session_pid: Optional[int] = None
 
     # Use request: https://requests.readthedocs.io/en/master/
     def __init__(self, trestle_root: pathlib.Path, uri: str) -> None:
@@ -264,8 +440,47 @@ class HTTPSFetcher(FetcherBase):
         https_cached_dir = https_cached_dir / path_parent
         https_cached_dir.mkdir(parents=True, exist_ok=True)
         self._cached_object_path = https_cached_dir / pathlib.Path(pathlib.Path(u.path).name)
+        self._metadata_path = self._cached_object_path.with_name(
+            self._cached_object_path.name + const.HTTP_CACHE_METADATA_SUFFIX
+        )
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Get the session shared by the fetchers of this process, creating it in a new process."""
+        if cls._session is None or cls._session_pid != os.getpid():
+            cls._session = requests.Session()
+            cls._session_pid = os.getpid()
+        return cls._session
+
+    def _get_conditional_headers(self) -> Dict[str, str]:
+        """Get the headers to fetch the url only if changed since the cached object, if it and its metadata exist."""
+        if not self._in_cache() or not self._metadata_path.exists():
+            return {}
+        try:
+            metadata = json.loads(self._metadata_path.read_text(encoding=const.FILE_ENCODING))
+        except Exception as e:
+            logger.debug(f'Ignoring unreadable cache metadata {self._metadata_path} for {self._uri}: {e}')
+            return {}
+        if not isinstance(metadata, dict) or metadata.get('url') != self._url:
+            return {}
+        headers = {}
+        if metadata.get('etag'):
+            headers['If-None-Match'] = metadata['etag']
+        if metadata.get('last-modified'):
+            headers['If-Modified-Since'] = metadata['last-modified']
+        return headers
+
+    def _save_metadata(self, response: requests.Response) -> None:
+        """Save the validators of the response beside the cached object, or remove stale ones if it has none."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            self._metadata_path.unlink(missing_ok=True)
+            return
+        metadata = {'url': self._url, 'etag': etag, 'last-modified': last_modified}
+        FetcherBase._write_cache_file(self._metadata_path, json.dumps(metadata))
 
-    def _do_fetch(self) -> None:
+    def _do_fetch(self) -> bool:
         auth = None
         verify = None
         # This order reflects requests library behavior: REQUESTS_CA_BUNDLE comes first.
@@ -281,24 +496,39 @@ class HTTPSFetcher(FetcherBase):
         if self._username is not None and self._password is not None:
             auth = HTTPBasicAuth(self._username, self._password)
 
+        headers = self._get_conditional_headers()
         try:
-            response = requests.get(self._url, auth=auth, verify=verify, timeout=30)
+            response = self._get_session().get(self._url, auth=auth, verify=verify, headers=headers, timeout=30)
         except Exception as e:
             raise TrestleError(f'Cache update failure to connect via HTTPS: {self._url} ({e})')
 
+        if response.status_code == 304 and headers:
+            # unchanged since cached, so it is only marked as fresh again
+            logger.debug(f'Cached object for {self._uri} not modified')
+            self._cached_object_path.touch()
+            return False
         if response.status_code == 200:
             try:
                 result = response.text
             except Exception as err:
                 raise TrestleError(f'Cache update failure reading response via HTTPS: {self._url} ({err})')
             else:
-                self._cached_object_path.write_text(result, encoding=const.FILE_ENCODING)
-        else:
-            raise TrestleError(f'GET returned code {response.status_code}: {self._uri}')
+                FetcherBase._write_cache_file(self._cached_object_path, result)
+                self._save_metadata(response)
+                return True
+        raise TrestleError(f'GET returned code {response.status_code}: {self._uri}')
 
 
 class SFTPFetcher(FetcherBase):
-    """Fetcher for SFTP content."""
+    """Fetcher for SFTP content.
+
+    The connections opened by the fetchers of a process are kept in a pool by host, port and user, so all the files
+    fetched from a host are fetched over one SSH session. The connections are closed when the process exits.
+    """
+
+    _connections: Dict[Tuple[str, int, str], Tuple[paramiko.SSHClient, paramiko.SFTPClient]] = {}
+    _connections_pid: Optional[int] = None
+    _connections_lock = threading.Lock()
 
     def __init__(self, trestle_root: pathlib.Path, uri: str) -> None:
         """Initialize SFTP fetcher. Update the expected cache path as per caching specs.
@@ -332,13 +562,108 @@ class SFTPFetcher(FetcherBase):
         sftp_cached_dir.mkdir(parents=True, exist_ok=True)
         self._cached_object_path = sftp_cached_dir / pathlib.Path(pathlib.Path(u.path).name)
 
-    def _do_fetch(self) -> None:
+    @classmethod
+    def close_connections(cls) -> None:
+        """Close the pooled connections of this process."""
+        with cls._connections_lock:
+            connections = cls._connections if cls._connections_pid == os.getpid() else {}
+            cls._connections = {}
+            for client, sftp_client in connections.values():
+                try:
+                    sftp_client.close()
+                    client.close()
+                except Exception as e:
+                    logger.debug(f'Error closing sftp connection: {e}')
+
+    @classmethod
+    def _get_pooled_sftp_client(cls, key: Tuple[str, int, str]) -> Optional[paramiko.SFTPClient]:
+        """Get the sftp client of the pooled connection for the key if it is still open, discarding it otherwise."""
+        if cls._connections_pid != os.getpid():
+            # connections of the parent of a forked process cannot be shared with it
+            cls._connections = {}
+            cls._connections_pid = os.getpid()
+        if key not in cls._connections:
+            return None
+        client, sftp_client = cls._connections[key]
+        transport = client.get_transport()
+        if transport is not None and transport.is_active():
+            return sftp_client
+        del cls._connections[key]
+        client.close()
+        return None
+
+    def _do_fetch(self) -> bool:
         """Fetch remote object and update the cache if appropriate and possible to do so.
 
         Authentication relies on the user's private key being either active via ssh-agent or
         supplied via environment variable SSH_KEY. In the latter case, it must not require a passphrase prompt.
         """
         u = parse.urlparse(self._uri)
+        username = getpass.getuser() if not u.username else u.username
+        port = 22 if not u.port else u.port
+        key = (u.hostname, port, username)
+        sftp_client, pooled = self._get_sftp_client(key, u)
+
+        localpath = self._cached_object_path
+        # get into a temporary file replacing the cached object once complete, so it is never left partly written
+        fd, tmp_name = tempfile.mkstemp(dir=localpath.parent)
+        os.close(fd)
+        try:
+            try:
+                sftp_client.get(remotepath=u.path[1:], localpath=tmp_name)
+            except Exception as e:
+                SFTPFetcher._discard_connection(key, sftp_client)
+                if not pooled:
+                    raise TrestleError(f'Error getting remote resource {self._uri} into cache {localpath}: {e}')
+                # the pooled connection may have been dropped by the server, so retry once on a new one
+                logger.debug(f'Retrying get of {self._uri} on a new connection after error: {e}')
+                sftp_client, _ = self._get_sftp_client(key, u)
+                try:
+                    sftp_client.get(remotepath=u.path[1:], localpath=tmp_name)
+                except Exception as e:
+                    SFTPFetcher._discard_connection(key, sftp_client)
+                    raise TrestleError(f'Error getting remote resource {self._uri} into cache {localpath}: {e}')
+            os.replace(tmp_name, localpath)
+        finally:
+            pathlib.Path(tmp_name).unlink(missing_ok=True)
+        return True
+
+    def _get_sftp_client(self, key: Tuple[str, int, str], u: parse.ParseResult) -> Tuple[paramiko.SFTPClient, bool]:
+        """Get the sftp client of the pooled connection for the key, connecting if needed, and whether it was pooled.
+
+        New connections are made outside the lock so connecting to one host does not hold up fetches from others.
+        If another thread pooled a connection for the key meanwhile, it is used instead and the new one is closed.
+        """
+        with SFTPFetcher._connections_lock:
+            sftp_client = SFTPFetcher._get_pooled_sftp_client(key)
+        if sftp_client is not None:
+            return sftp_client, True
+        connection = self._connect(u, key[2], key[1])
+        with SFTPFetcher._connections_lock:
+            pooled_connection = SFTPFetcher._connections.setdefault(key, connection)
+        if pooled_connection is not connection:
+            connection[1].close()
+            connection[0].close()
+        return pooled_connection[1], False
+
+    @classmethod
+    def _discard_connection(cls, key: Tuple[str, int, str], sftp_client: paramiko.SFTPClient) -> None:
+        """Remove the connection of the sftp client from the pool if still pooled, and close it."""
+        with cls._connections_lock:
+            connection = cls._connections.get(key)
+            if connection is not None and connection[1] is sftp_client:
+                del cls._connections[key]
+        if connection is not None and connection[1] is sftp_client:
+            try:
+                sftp_client.close()
+                connection[0].close()
+            except Exception as e:
+                logger.debug(f'Error closing sftp connection: {e}')
+
+    def _connect(
+        self, u: parse.ParseResult, username: str, port: int
+    ) -> Tuple[paramiko.SSHClient, paramiko.SFTPClient]:
+        """Open a new connection to the host and an sftp session on it."""
         client = paramiko.SSHClient()
         # Must pick up host keys from the default known_hosts on this environment:
         try:
@@ -353,15 +678,9 @@ class SFTPFetcher(FetcherBase):
             pkey = None
             look_for_keys = True
 
-        username = getpass.getuser() if not u.username else u.username
         try:
             client.connect(
-                u.hostname,
-                username=username,
-                password=u.password,
-                pkey=pkey,
-                look_for_keys=look_for_keys,
-                port=22 if not u.port else u.port,
+                u.hostname, username=username, password=u.password, pkey=pkey, look_for_keys=look_for_keys, port=port
             )
         except Exception as e:
             raise TrestleError(f'Cache update failure to connect via SSH: {u.hostname}: {e}.')
@@ -369,13 +688,12 @@ class SFTPFetcher(FetcherBase):
         try:
             sftp_client = client.open_sftp()
         except Exception as e:
+            client.close()
             raise TrestleError(f'Cache update failure to open sftp for {u.hostname}: {e}.')
+        return client, sftp_client
 
-        localpath = self._cached_object_path
-        try:
-            sftp_client.get(remotepath=u.path[1:], localpath=(localpath.__str__()))
-        except Exception as e:
-            raise TrestleError(f'Error getting remote resource {self._uri} into cache {localpath}: {e}')
+
+atexit.register(SFTPFetcher.close_connections)
 
 
 # For passing variables:
@@ -16,7 +16,8 @@
 import logging
 import os
 import pathlib
-from typing import Iterator, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List, Optional, Tuple, Union
 
 import trestle.common.const as const
 import trestle.oscal.catalog as cat
@@ -28,10 +29,37 @@ from trestle.core.remote import cache
 from trestle.core.resolver.merge import Merge
 from trestle.core.resolver.modify import Modify
 from trestle.core.resolver.prune import Prune
+from trestle.core.resolver.resolution_cache import ResolutionCache
 from trestle.oscal.common import Resource
 
 logger = logging.getLogger(__name__)
 
+# suffixes of the rlink hrefs of a back matter resource that can be imported
+IMPORT_RLINK_SUFFIXES = ('.json', '.yaml', '.yml')
+
+
+def get_import_uri(href: str, parent_url_root: Optional[str]) -> Tuple[str, Optional[str]]:
+    """
+    Get the uri of an import href and the parent url root for any relative imports of the model it refers to.
+
+    Args:
+        href: the href of the import, other than a reference to a back matter resource
+        parent_url_root: the parent url root of the importing profile, if it was fetched from a remote source
+
+    Returns:
+        The uri, relative to the parent url root if the href is a relative path, and the parent url root for the
+        imports of the model if it is remote
+    """
+    uri_type = cache.FetcherFactory.get_uri_type(href)
+    # if this looks like a relative path to remote source, append parent path
+    if uri_type == cache.FetcherFactory.UriType.LOCAL_FILE and parent_url_root:
+        href = parent_url_root + '/' + href
+    # if href is now a remote path, capture its parent path for possible use with child imports that are relative
+    if cache.FetcherFactory.uri_type_is_not_local(uri_type):
+        parent_url_root = os.path.dirname(href)
+        logger.debug('parent url root path %s', parent_url_root)
+    return href, parent_url_root
+
 
 class Import(Pipeline.Filter):
     """Import filter class."""
@@ -51,6 +79,8 @@ class Import(Pipeline.Filter):
         value_assigned_prefix: Optional[str] = None,
         value_not_assigned_prefix: Optional[str] = None,
         parent_url_root: Optional[str] = None,
+        resolution_cache: Optional[ResolutionCache] = None,
+        jobs: int = 1,
     ) -> None:
         """Initialize and store trestle root for cache access."""
         self._trestle_root = trestle_root
@@ -66,6 +96,11 @@ class Import(Pipeline.Filter):
         self.value_assigned_prefix = value_assigned_prefix
         self.value_not_assigned_prefix = value_not_assigned_prefix
         self._parent_url_root = parent_url_root
+        self._resolution_cache = resolution_cache
+        self._jobs = jobs
+
+        if jobs < 1:
+            raise TrestleError(f'Number of jobs for profile import must be at least 1, not {jobs}.')
 
         if not self._import.href or not self._import.href.strip():
             raise TrestleError('Attempt to import via an empty href.')
@@ -77,9 +112,7 @@ class Import(Pipeline.Filter):
             try:
                 resource = [r for r in self._resources if r.uuid == self._import.href[1:]][0]
                 self._import.href = [
-                    rlink.href
-                    for rlink in resource.rlinks
-                    if rlink.href.endswith('.json') or rlink.href.endswith('.yaml') or rlink.href.endswith('.yml')
+                    rlink.href for rlink in resource.rlinks if rlink.href.endswith(IMPORT_RLINK_SUFFIXES)
                 ][0]
 
             except Exception as e:
@@ -88,18 +121,41 @@ class Import(Pipeline.Filter):
                     f'Back matter resource resolution needed for profile import failed with error: {str(e)}'
                 )
 
-        uri_type = cache.FetcherFactory.get_uri_type(self._import.href)
-        # if this looks like a relative path to remote source, append parent path
-        if uri_type == cache.FetcherFactory.UriType.LOCAL_FILE and self._parent_url_root:
-            self._import.href = self._parent_url_root + '/' + self._import.href
-        # if href is now a remote path, capture its parent path for possible use with child imports that are relative
-        if cache.FetcherFactory.uri_type_is_not_local(uri_type):
-            self._parent_url_root = os.path.dirname(self._import.href)
-            logger.debug('parent url root path %s', self._parent_url_root)
+        self._import.href, self._parent_url_root = get_import_uri(self._import.href, self._parent_url_root)
         logger.debug('import href is %s', self._import.href)
 
+    def _get_cache_key(self) -> Tuple[Any, ...]:
+        """Get the resolution cache key for this import from its href and the options affecting its resolution."""
+        href = self._import.href
+        if cache.FetcherFactory.get_uri_type(href) == cache.FetcherFactory.UriType.LOCAL_FILE:
+            href = str(pathlib.Path(href).resolve())
+        return (
+            href,
+            str(self._trestle_root.resolve()),
+            self._change_prose,
+            self._block_adds,
+            self._block_params,
+            self._params_format,
+            self._param_rep,
+            self.show_value_warnings,
+            self.value_assigned_prefix,
+            self.value_not_assigned_prefix,
+        )
+
     def process(self, _=None) -> Iterator[cat.Catalog]:  # type: ignore
         """Load href for catalog or profile and yield each import as catalog imported by its distinct pipeline."""
+        if self._resolution_cache is None:
+            yield self._resolve()
+            return
+        key = self._get_cache_key()
+        catalog = self._resolution_cache.get(key)
+        if catalog is None:
+            catalog = self._resolve()
+            self._resolution_cache.put(key, catalog)
+        yield catalog
+
+    def _resolve(self) -> cat.Catalog:
+        """Load href for catalog or profile and return it as a catalog, resolving any imports of a profile."""
         logger.debug(f'import entering process with href {self._import.href}')
         fetcher = cache.FetcherFactory.get_fetcher(self._trestle_root, self._import.href)
 
@@ -108,45 +164,66 @@ class Import(Pipeline.Filter):
 
         if model_type == const.MODEL_TYPE_CATALOG:
             logger.debug(f'DIRECT YIELD in import of catalog {model.metadata.title}')
-            yield model  # type: ignore
-        else:
-            if model_type != const.MODEL_TYPE_PROFILE:
-                raise TrestleError(f'Improper model type {model_type} as profile import.')
-
-            profile: prof.Profile = model
-            # profile uuid's must be unique or they may trigger circular reference warning
-            if profile.uuid in self._uuid_chain:
-                raise TrestleError(f'Profile {profile.metadata.title} is referenced in circular manner.')
-            self._uuid_chain.append(profile.uuid)
-            resources = profile.back_matter.resources if profile.back_matter and profile.back_matter.resources else None
-
-            pipelines: List[Pipeline] = []
-            logger.debug(
-                f'import pipelines for sub_imports of profile {self._import.href} with title {model.metadata.title}'
-            )
-            for sub_import in profile.imports:
-                import_filter = Import(
-                    self._trestle_root,
-                    sub_import,
-                    self._uuid_chain[:],  # Pass a copy to allow valid diamond dependencies
-                    resources=resources,
-                    parent_url_root=self._parent_url_root,
-                )
-                prune_filter = Prune(sub_import, profile)
-                pipeline = Pipeline([import_filter, prune_filter])
-                pipelines.append(pipeline)
-                logger.debug(f'sub_import add pipeline for sub href {sub_import.href} of main href {self._import.href}')
-            merge_filter = Merge(profile)
-            modify_filter = Modify(
-                profile,
-                self._change_prose,
-                self._block_adds,
-                self._block_params,
-                self._params_format,
-                self._param_rep,
-                self.show_value_warnings,
-                self.value_assigned_prefix,
-                self.value_not_assigned_prefix,
+            return model  # type: ignore
+        if model_type != const.MODEL_TYPE_PROFILE:
+            raise TrestleError(f'Improper model type {model_type} as profile import.')
+
+        profile: prof.Profile = model
+        # profile uuid's must be unique or they may trigger circular reference warning
+        if profile.uuid in self._uuid_chain:
+            raise TrestleError(f'Profile {profile.metadata.title} is referenced in circular manner.')
+        self._uuid_chain.append(profile.uuid)
+        resources = profile.back_matter.resources if profile.back_matter and profile.back_matter.resources else None
+
+        # only the first profile with several imports resolves them concurrently, and its imports resolve their own
+        # imports serially in their threads, so no more than jobs threads are used however deep the import graph
+        concurrent = self._jobs > 1 and len(profile.imports) > 1
+        pipelines: List[Pipeline] = []
+        logger.debug(
+            f'import pipelines for sub_imports of profile {self._import.href} with title {model.metadata.title}'
+        )
+        for sub_import in profile.imports:
+            import_filter = Import(
+                self._trestle_root,
+                sub_import,
+                self._uuid_chain[:],  # Pass a copy to allow valid diamond dependencies
+                resources=resources,
+                parent_url_root=self._parent_url_root,
+                resolution_cache=self._resolution_cache,
+                jobs=1 if concurrent else self._jobs,
             )
-            final_pipeline = Pipeline([merge_filter, modify_filter])
-            yield next(final_pipeline.process(pipelines))
+            prune_filter = Prune(sub_import, profile)
+            pipeline = Pipeline([import_filter, prune_filter])
+            pipelines.append(pipeline)
+            logger.debug(f'sub_import add pipeline for sub href {sub_import.href} of main href {self._import.href}')
+        if concurrent:
+            # fetch and prune the sibling imports concurrently, then merge them in their original order
+            with ThreadPoolExecutor(max_workers=min(self._jobs, len(pipelines))) as executor:
+                catalogs = list(executor.map(lambda pipeline: next(pipeline.process(None)), pipelines))
+            pipelines = [Pipeline([ResolvedImport(catalog)]) for catalog in catalogs]
+        merge_filter = Merge(profile)
+        modify_filter = Modify(
+            profile,
+            self._change_prose,
+            self._block_adds,
+            self._block_params,
+            self._params_format,
+            self._param_rep,
+            self.show_value_warnings,
+            self.value_assigned_prefix,
+            self.value_not_assigned_prefix,
+        )
+        final_pipeline = Pipeline([merge_filter, modify_filter])
+        return next(final_pipeline.process(pipelines))
+
+
+class ResolvedImport(Pipeline.Filter):
+    """Filter yielding a catalog already produced by an import pipeline."""
+
+    def __init__(self, catalog: cat.Catalog) -> None:
+        """Store the catalog produced by the import."""
+        self._catalog = catalog
+
+    def process(self, _=None) -> Iterator[cat.Catalog]:  # type: ignore
+        """Yield the stored catalog."""
+        yield self._catalog
@@ -0,0 +1,141 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Concurrent prefetch of the models imported by a profile into the trestle cache."""
+
+import logging
+import pathlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import trestle.oscal.profile as prof
+from trestle.common import const
+from trestle.common.err import TrestleError
+from trestle.core.remote import cache
+from trestle.core.resolver._import import IMPORT_RLINK_SUFFIXES, get_import_uri
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrefetchReport:
+    """Outcome of prefetching the import graph of a profile."""
+
+    hits: int = 0
+    misses: int = 0
+    local: int = 0
+    bytes_fetched: int = 0
+    seconds: float = 0.0
+    failures: Dict[str, str] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        """Summarize the report on one line."""
+        return (
+            f'{self.misses} fetched ({self.bytes_fetched} bytes), {self.hits} already cached, {self.local} local'
+            f' and {len(self.failures)} failed in {self.seconds:.3f}s'
+        )
+
+
+@dataclass
+class _PrefetchResult:
+    """Outcome of prefetching one import, with the imports of the model if it is a profile."""
+
+    href: str
+    remote: bool
+    bytes_fetched: Optional[int] = None
+    imports: List[Tuple[str, Optional[str]]] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def _get_import_hrefs(profile: prof.Profile, parent_url_root: Optional[str]) -> List[Tuple[str, Optional[str]]]:
+    """Get the uri and parent url root of each import of the profile, as profile resolution will import it."""
+    resources = profile.back_matter.resources if profile.back_matter and profile.back_matter.resources else []
+    rlinks = {resource.uuid: [rlink.href for rlink in resource.rlinks or []] for resource in resources}
+    imports = []
+    for import_ in profile.imports:
+        href = import_.href.strip()
+        if href.startswith('#'):
+            # leave references to unknown resources for resolution to report
+            href = next((rlink for rlink in rlinks.get(href[1:], []) if rlink.endswith(IMPORT_RLINK_SUFFIXES)), '')
+        if href:
+            imports.append(get_import_uri(href, parent_url_root))
+    return imports
+
+
+def _prefetch(trestle_root: pathlib.Path, href: str, parent_url_root: Optional[str]) -> _PrefetchResult:
+    """
+    Fetch the import into the cache if stale and find the imports of the model if it is a profile.
+
+    The model is parsed with get_oscal, so its snapshot is saved for resolution to load rather than parse it again.
+    """
+    result = _PrefetchResult(href, cache.FetcherFactory.uri_type_is_not_local(cache.FetcherFactory.get_uri_type(href)))
+    try:
+        fetcher = cache.FetcherFactory.get_fetcher(trestle_root, href)
+        result.bytes_fetched = fetcher.prefetch()
+        model, model_type = fetcher.get_oscal()
+    except Exception as e:
+        result.error = str(e)
+        return result
+    if model_type == const.MODEL_TYPE_PROFILE:
+        result.imports = _get_import_hrefs(model, parent_url_root)
+    return result
+
+
+def prefetch_imports(trestle_root: pathlib.Path, profile_href: str, jobs: int) -> PrefetchReport:
+    """
+    Fetch the models imported by the profile, and by any profiles it imports, into the trestle cache.
+
+    Args:
+        trestle_root: root directory of the trestle workspace
+        profile_href: string path or uri of the profile
+        jobs: number of threads fetching the imports concurrently
+
+    Returns:
+        The report of the models fetched, and found fresh in the cache, with any that could not be fetched
+
+    Notes:
+        The imports are fetched a level of the import graph at a time, so all imports of the profiles at one level
+        are fetched concurrently.  Each model is fetched once however often it is imported.  Failures are only
+        reported, leaving resolution to raise the error if the import is needed.
+    """
+    if jobs < 1:
+        raise TrestleError(f'Number of jobs for prefetch must be at least 1, not {jobs}.')
+    report = PrefetchReport()
+    tick = time.perf_counter()
+    level = [get_import_uri(profile_href, None)]
+    seen = {href for href, _ in level}
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while level:
+            results = list(executor.map(lambda item: _prefetch(trestle_root, *item), level))
+            level = []
+            for result in results:
+                if result.error is not None:
+                    logger.debug(f'Prefetch of {result.href} failed: {result.error}')
+                    report.failures[result.href] = result.error
+                elif not result.remote:
+                    report.local += 1
+                elif result.bytes_fetched is None:
+                    report.hits += 1
+                else:
+                    report.misses += 1
+                    report.bytes_fetched += result.bytes_fetched
+                for href, parent_url_root in result.imports:
+                    if href not in seen:
+                        seen.add(href)
+                        level.append((href, parent_url_root))
+    report.seconds = time.perf_counter() - tick
+    return report
@@ -0,0 +1,86 @@
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""In-process cache of catalogs produced by profile imports."""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import trestle.oscal.catalog as cat
+from trestle.common.err import TrestleError
+
+logger = logging.getLogger(__name__)
+
+
+class ResolutionCache:
+    """
+    Bounded cache of imported catalogs shared across profile resolutions.
+
+    Entries are keyed by the import href and the resolution options in effect for it, and hold the catalog
+    produced by that import before it is pruned by the importing profile.  The same entry therefore serves every
+    profile that imports the source, regardless of the controls it selects.
+
+    Catalogs are copied on the way in and on the way out, so callers are free to modify what they receive.
+    The least recently used entries are evicted once max_entries is exceeded.
+
+    The cache assumes the sources do not change during its lifetime.  Call clear() if they might.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        """Initialize the cache with the maximum number of catalogs to retain."""
+        if max_entries < 1:
+            raise TrestleError(f'Resolution cache must hold at least one entry, not {max_entries}.')
+        self._max_entries = max_entries
+        self._catalogs: OrderedDict[Hashable, cat.Catalog] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[cat.Catalog]:
+        """Get a copy of the catalog cached for the key, or None if not present."""
+        with self._lock:
+            catalog = self._catalogs.get(key)
+            if catalog is None:
+                self.misses += 1
+                return None
+            self._catalogs.move_to_end(key)
+            self.hits += 1
+        logger.debug(f'resolution cache hit for {key[0] if isinstance(key, tuple) else key}')
+        return catalog.copy(deep=True)
+
+    def put(self, key: Hashable, catalog: cat.Catalog) -> None:
+        """Store a copy of the catalog for the key, evicting the least recently used entries if needed."""
+        catalog_copy = catalog.copy(deep=True)
+        with self._lock:
+            self._catalogs[key] = catalog_copy
+            self._catalogs.move_to_end(key)
+            while len(self._catalogs) > self._max_entries:
+                evicted_key, _ = self._catalogs.popitem(last=False)
+                logger.debug(f'resolution cache evicted {evicted_key}')
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._catalogs.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached catalogs."""
+        return len(self._catalogs)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if the key has a cached catalog."""
+        return key in self._catalogs
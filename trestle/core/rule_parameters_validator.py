@@ -17,7 +17,7 @@
 
 import logging
 import pathlib
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from trestle.common.common_types import TopLevelOscalModel
 from trestle.common.common_types import TypeWithSetParams
@@ -80,6 +80,12 @@ class RuleParametersValidator(Validator):
                 values = set_param.values if hasattr(set_param, 'values') else None
                 deep_set(self._rule_param_values_dict, [set_param.param_id, comp_uuid, control_id], values)
 
+    def dependency_hrefs(self, model: TopLevelOscalModel) -> List[str]:
+        """Return the href of the profile imported by an ssp, since its resolved catalog identifies the rule params."""
+        if isinstance(model, SystemSecurityPlan) and model.import_profile.href:
+            return [model.import_profile.href]
+        return []
+
     def model_is_valid(
         self, model: TopLevelOscalModel, quiet: bool, trestle_root: Optional[pathlib.Path] = None
     ) -> bool:
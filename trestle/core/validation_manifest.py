@@ -0,0 +1,181 @@
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Manifest of models that passed validation, used to skip revalidation of unchanged models."""
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+from typing import Any, Dict, List, Optional, Set
+
+from trestle import __version__
+from trestle.common import const
+from trestle.common.err import TrestleError
+from trestle.common.list_utils import as_list
+from trestle.core.base_model import OscalBaseModel
+from trestle.core.remote.cache import FetcherFactory
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+class ValidationManifest:
+    """
+    Record of the models that passed validation and the content they passed with.
+
+    Each entry holds a hash of the model file together with its decomposed directory tree if it is split,
+    the validator and trestle version that passed it, and the hashes of the local documents it references.
+    A model is current if none of those have changed, including the documents referenced by its references.
+    Documents referenced by remote href cannot be hashed without fetching them, so they are not tracked.
+    """
+
+    def __init__(self, trestle_root: pathlib.Path, validator_key: str) -> None:
+        """Load the manifest for the trestle root, starting empty if it is missing or unreadable."""
+        self._trestle_root = trestle_root.resolve()
+        self._validator_key = validator_key
+        self._path = self._trestle_root / const.TRESTLE_CONFIG_DIR / const.VALIDATION_MANIFEST_FILE
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._hashes: Dict[str, Optional[str]] = {}
+        try:
+            data = json.loads(self._path.read_text(encoding=const.FILE_ENCODING))
+            if data.get('version') == MANIFEST_VERSION:
+                self._entries = data['models']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f'Ignoring unreadable validation manifest {self._path}: {e}')
+
+    @staticmethod
+    def find_dependency_hrefs(model: OscalBaseModel) -> List[str]:
+        """Find the hrefs of the documents imported or linked by the model."""
+        hrefs: List[str] = []
+        for attr in ['import_profile', 'import_ssp', 'import_ap']:
+            import_ = getattr(model, attr, None)
+            if import_ is not None:
+                hrefs.append(import_.href)
+        for attr in ['imports', 'import_component_definitions']:
+            hrefs.extend(import_.href for import_ in as_list(getattr(model, attr, None)))
+        for component in as_list(getattr(model, 'components', None)):
+            hrefs.extend(imp.source for imp in as_list(getattr(component, 'control_implementations', None)))
+        for mapping in as_list(getattr(model, 'mappings', None)):
+            hrefs.extend([mapping.source_resource.href, mapping.target_resource.href])
+        back_matter = getattr(model, 'back_matter', None)
+        if back_matter is not None:
+            for resource in as_list(back_matter.resources):
+                hrefs.extend(rlink.href for rlink in as_list(resource.rlinks))
+        return hrefs
+
+    def _href_to_path(self, href: str) -> Optional[pathlib.Path]:
+        """Convert the href to a local path, or None if it is remote or not a file."""
+        try:
+            uri_type = FetcherFactory.get_uri_type(href)
+        except TrestleError:
+            return None
+        if uri_type == FetcherFactory.UriType.TRESTLE:
+            return (self._trestle_root / href[len(const.TRESTLE_HREF_HEADING) :]).resolve()
+        if uri_type == FetcherFactory.UriType.LOCAL_FILE:
+            href = href[len(const.FILE_URI) - 1 :] if href.startswith(const.FILE_URI) else href
+            try:
+                return pathlib.Path(href).resolve()
+            except Exception:
+                return None
+        return None
+
+    def _get_key(self, path: pathlib.Path) -> str:
+        """Get the key for the path, relative to the trestle root if it is within it."""
+        path = path.resolve()
+        try:
+            return path.relative_to(self._trestle_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _get_hash(self, key: str) -> Optional[str]:
+        """Get the hash of the file and its decomposed directory tree, or None if the file does not exist."""
+        if key in self._hashes:
+            return self._hashes[key]
+        path = pathlib.Path(key) if pathlib.Path(key).is_absolute() else self._trestle_root / key
+        digest: Optional[str] = None
+        if path.is_file():
+            hasher = hashlib.sha256()
+            files = [path]
+            split_dir = path.with_suffix('')
+            if split_dir.is_dir():
+                files.extend(sorted(p for p in split_dir.rglob('*') if p.is_file()))
+            for file_path in files:
+                hasher.update(file_path.relative_to(path.parent).as_posix().encode())
+                hasher.update(b'\0')
+                hasher.update(file_path.read_bytes())
+                hasher.update(b'\0')
+            digest = hasher.hexdigest()
+        self._hashes[key] = digest
+        return digest
+
+    def _is_current(self, key: str, seen: Set[str]) -> bool:
+        """Check the entry for the key and, recursively, those of the documents it references."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        if entry.get('validator') != self._validator_key or entry.get('trestle_version') != __version__:
+            return False
+        if entry.get('hash') != self._get_hash(key):
+            return False
+        seen.add(key)
+        for dep_key, dep_hash in entry.get('dependencies', {}).items():
+            if dep_hash != self._get_hash(dep_key):
+                return False
+            # references of a document not in the manifest are not known, so only its own content is checked
+            if dep_key in self._entries and dep_key not in seen and not self._is_current(dep_key, seen):
+                return False
+        return True
+
+    def is_current(self, model_path: pathlib.Path) -> bool:
+        """Check if the model passed validation and neither it nor anything it references has changed since."""
+        return self._is_current(self._get_key(model_path), set())
+
+    def record(self, model_path: pathlib.Path, dependency_hrefs: List[str]) -> None:
+        """Record that the model passed validation with its current content and that of its references."""
+        dependencies: Dict[str, Optional[str]] = {}
+        for href in dependency_hrefs:
+            dep_path = self._href_to_path(href)
+            if dep_path is not None:
+                dep_key = self._get_key(dep_path)
+                dependencies[dep_key] = self._get_hash(dep_key)
+        key = self._get_key(model_path)
+        self._entries[key] = {
+            'hash': self._get_hash(key),
+            'validator': self._validator_key,
+            'trestle_version': __version__,
+            'dependencies': dependencies,
+        }
+
+    def forget(self, model_path: pathlib.Path) -> None:
+        """Remove the model from the manifest so it will be validated next time."""
+        self._entries.pop(self._get_key(model_path), None)
+
+    def save(self) -> None:
+        """Write the manifest, dropping entries for models that no longer exist."""
+        models = {key: entry for key, entry in self._entries.items() if self._get_hash(key) is not None}
+        data = {'version': MANIFEST_VERSION, 'models': models}
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding=const.FILE_ENCODING) as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_name, self._path)
+        except Exception:
+            pathlib.Path(tmp_name).unlink(missing_ok=True)
+            raise
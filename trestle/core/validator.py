@@ -15,21 +15,68 @@
 """Base class for all validators."""
 
 import argparse
+import json
 import logging
 import pathlib
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 import trestle.common.file_utils
+from trestle.common import const
 from trestle.common.common_types import TopLevelOscalModel
 from trestle.common.err import TrestleError
 from trestle.common.model_utils import ModelUtils
 from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.core.models.file_content_type import FileContentType
+from trestle.core.validation_manifest import ValidationManifest
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ModelValidationResult:
+    """Outcome of loading and validating a single model."""
+
+    model_path: pathlib.Path
+    valid: bool
+    seconds: float
+    message: Optional[str] = None
+    load_failed: bool = False
+    skipped: bool = False
+    dependency_hrefs: List[str] = field(default_factory=list)
+
+    def to_dict(self, trestle_root: pathlib.Path) -> Dict[str, Any]:
+        """Convert to a dict for the json report, with the model path relative to the trestle root."""
+        model_path = self.model_path.relative_to(trestle_root) if self.model_path.is_absolute() else self.model_path
+        return {
+            'model_path': model_path.as_posix(),
+            'valid': self.valid,
+            'load_failed': self.load_failed,
+            'skipped': self.skipped,
+            'message': self.message,
+            'seconds': round(self.seconds, 6),
+        }
+
+
+def _validate_model_file(
+    validator: 'Validator', model_path: pathlib.Path, trestle_root: pathlib.Path, quiet: bool
+) -> ModelValidationResult:
+    """Load and validate one model, capturing the outcome rather than raising so all models can be reported."""
+    tick = time.perf_counter()
+    try:
+        _, _, model = ModelUtils.load_distributed(model_path, trestle_root)
+    except Exception as e:
+        return ModelValidationResult(model_path, False, time.perf_counter() - tick, f'File load error {e}', True)
+    valid = validator.model_is_valid(model, quiet, trestle_root)  # type: ignore
+    dependency_hrefs = validator.dependency_hrefs(model) if valid else []
+    return ModelValidationResult(
+        model_path, valid, time.perf_counter() - tick, validator.error_msg(), dependency_hrefs=dependency_hrefs
+    )
+
+
 class Validator(ABC):
     """Validator base class."""
 
@@ -53,6 +100,19 @@ class Validator(ABC):
             Whether or not the model passed this validation test.
         """
 
+    def manifest_key(self) -> str:
+        """Key identifying this validator in the validation manifest."""
+        return self.__class__.__name__
+
+    def dependency_hrefs(self, model: TopLevelOscalModel) -> List[str]:
+        """
+        Get the hrefs of other documents whose content can change the outcome of this validator for the model.
+
+        By default this is everything the model imports or links to, so that a change to any of them causes
+        the model to be validated again by an incremental validation.
+        """
+        return ValidationManifest.find_dependency_hrefs(model)
+
     def validate(self, args: argparse.Namespace) -> int:
         """Perform the validation according to user options."""
         trestle_root = args.trestle_root  # trestle root is set via command line in args. Default is cwd.
@@ -86,18 +146,7 @@ class Validator(ABC):
 
         # validate all
         if args.all:
-            model_tups = ModelUtils.get_all_models(trestle_root)
-            for mt in model_tups:
-                model_dir = trestle_root / ModelUtils.model_type_to_model_dir(mt[0]) / mt[1]
-                extension_type = trestle.common.file_utils.get_contextual_file_type(model_dir)
-                model_path = model_dir / f'{mt[0]}{FileContentType.to_file_extension(extension_type)}'
-                _, _, model = ModelUtils.load_distributed(model_path, trestle_root)
-                if not self.model_is_valid(model, args.quiet, trestle_root):  # type: ignore
-                    logger.info(f'INVALID: Model {model_path} did not pass the {self.error_msg()}')
-                    return CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
-                if not args.quiet:
-                    logger.info(f'VALID: Model {model_path} passed the {self.error_msg()}')
-            return CmdReturnCodes.SUCCESS.value
+            return self._validate_all(args, trestle_root)
 
         # validate file
         if args.file:
@@ -109,3 +158,101 @@ class Validator(ABC):
             if not args.quiet:
                 logger.info(f'VALID: Model {file_path} passed the {self.error_msg()}')
         return CmdReturnCodes.SUCCESS.value
+
+    def _validate_all(self, args: argparse.Namespace, trestle_root: pathlib.Path) -> int:
+        """
+        Validate all models in the trestle root and report the outcome for every one of them.
+
+        With more than one job the models are loaded and validated concurrently in a pool of processes.
+        A failure does not stop the validation of the remaining models, and the failures are summarized at the end.
+        If incremental, models that passed before and have not changed since, along with everything they
+        reference, are skipped.
+        """
+        jobs = getattr(args, 'jobs', 1)
+        if jobs < 1:
+            logger.warning(f'Number of jobs must be at least 1, not {jobs}')
+            return CmdReturnCodes.INCORRECT_ARGS.value
+        model_paths: List[pathlib.Path] = []
+        for model_type, model_name in ModelUtils.get_all_models(trestle_root):
+            model_dir = trestle_root / ModelUtils.model_type_to_model_dir(model_type) / model_name
+            extension_type = trestle.common.file_utils.get_contextual_file_type(model_dir)
+            model_paths.append(model_dir / f'{model_type}{FileContentType.to_file_extension(extension_type)}')
+
+        manifest = (
+            ValidationManifest(trestle_root, self.manifest_key()) if getattr(args, 'incremental', False) else None
+        )
+        skipped: Dict[pathlib.Path, ModelValidationResult] = {}
+        if manifest:
+            for path in model_paths:
+                if manifest.is_current(path):
+                    skipped[path] = ModelValidationResult(path, True, 0.0, skipped=True)
+        to_validate = [path for path in model_paths if path not in skipped]
+
+        tick = time.perf_counter()
+        n_models = len(to_validate)
+        if jobs == 1 or n_models < 2:
+            validated = [_validate_model_file(self, path, trestle_root, args.quiet) for path in to_validate]
+        else:
+            with ProcessPoolExecutor(max_workers=min(jobs, n_models)) as executor:
+                validated = list(
+                    executor.map(
+                        _validate_model_file,
+                        [self] * n_models,
+                        to_validate,
+                        [trestle_root] * n_models,
+                        [args.quiet] * n_models,
+                    )
+                )
+        total_seconds = time.perf_counter() - tick
+        results_by_path = {result.model_path: result for result in validated}
+        results_by_path.update(skipped)
+        results = [results_by_path[path] for path in model_paths]
+
+        for result in results:
+            if result.load_failed:
+                logger.warning(f'{result.message} ({result.seconds:.3f}s)')
+            elif not result.valid:
+                logger.info(
+                    f'INVALID: Model {result.model_path} did not pass the {result.message} ({result.seconds:.3f}s)'
+                )
+            elif args.quiet:
+                continue
+            elif result.skipped:
+                logger.info(f'UNCHANGED: Model {result.model_path} passed validation previously')
+            else:
+                logger.info(f'VALID: Model {result.model_path} passed the {result.message} ({result.seconds:.3f}s)')
+        failures = [result for result in results if not result.valid]
+        if failures or not args.quiet:
+            logger.info(
+                f'Validated {n_models} models in {total_seconds:.3f}s with {len(failures)} failures'
+                f' and {len(skipped)} unchanged models skipped.'
+            )
+        for failure in failures:
+            logger.info(f'  FAILED: {failure.model_path}: {failure.message}')
+
+        if manifest:
+            for result in validated:
+                if result.valid:
+                    manifest.record(result.model_path, result.dependency_hrefs)
+                else:
+                    manifest.forget(result.model_path)
+            manifest.save()
+
+        report_path = getattr(args, 'report', None)
+        if report_path:
+            report = {
+                'valid': not failures,
+                'models': len(results),
+                'failures': len(failures),
+                'skipped': len(skipped),
+                'jobs': jobs,
+                'seconds': round(total_seconds, 6),
+                'results': [result.to_dict(trestle_root) for result in results],
+            }
+            (trestle_root / report_path).write_text(json.dumps(report, indent=2), encoding=const.FILE_ENCODING)
+
+        if any(result.load_failed for result in failures):
+            return CmdReturnCodes.COMMAND_ERROR.value
+        if failures:
+            return CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
+        return CmdReturnCodes.SUCCESS.value
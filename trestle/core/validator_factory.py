@@ -49,3 +49,8 @@ def init_arguments(cmd: Command) -> None:
     cmd.add_argument('-n', '--name', help='Name of single model to validate (with --type specified).', required=False)
     quiet_help = 'Do not report messages unless validation fails.'
     cmd.add_argument('-q', '--quiet', action='store_true', help=quiet_help, required=False)
+    cmd.add_argument('-j', '--jobs', help=f'{const.HELP_JOBS} (with --all).', type=int, default=1, required=False)
+    report_help = 'Path of a json report to write with the outcome and timing of each model (with --all).'
+    cmd.add_argument('--report', help=report_help, type=str, required=False)
+    incremental_help = 'Skip models that passed before and are unchanged along with what they reference (with --all).'
+    cmd.add_argument('-i', '--incremental', action='store_true', help=incremental_help, required=False)
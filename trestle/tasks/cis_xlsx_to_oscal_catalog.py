@@ -39,6 +39,7 @@ from trestle.oscal.common import Property
 from trestle.oscal.common import Resource
 from trestle.tasks.base_task import TaskBase
 from trestle.tasks.base_task import TaskOutcome
+from trestle.tasks.xlsx_helper import SheetValues
 
 logger = logging.getLogger(__name__)
 
@@ -51,16 +52,19 @@ class XlsxHelper:
     def __init__(self, file: str) -> None:
         """Initialize."""
         self._spread_sheet = file
-        self._wb = load_workbook(self._spread_sheet)
-        sheet_candidates = ['Combined Profiles', 'Combined']
-        self._sheet_name = None
-        for sheet_candidate in sheet_candidates:
-            if sheet_candidate in self._wb.sheetnames:
-                self._sheet_name = sheet_candidate
-                break
-        if not self._sheet_name:
-            raise RuntimeError(f'{file} missing one of {sheet_candidates} sheet')
-        self._work_sheet = self._wb[self._sheet_name]
+        wb = load_workbook(self._spread_sheet, read_only=True)
+        try:
+            sheet_candidates = ['Combined Profiles', 'Combined']
+            self._sheet_name = None
+            for sheet_candidate in sheet_candidates:
+                if sheet_candidate in wb.sheetnames:
+                    self._sheet_name = sheet_candidate
+                    break
+            if not self._sheet_name:
+                raise RuntimeError(f'{file} missing one of {sheet_candidates} sheet')
+            self._work_sheet = SheetValues(wb[self._sheet_name])
+        finally:
+            wb.close()
         self._mapper()
         self._key_to_col_map = {'statement': 'description'}
 
@@ -82,9 +86,9 @@ class XlsxHelper:
         cols = self._work_sheet.max_column + 1
         row = 1
         for col in range(row, cols):
-            cell = self._work_sheet.cell(row, col)
-            if cell.value:
-                name = self._normalize(cell.value)
+            value = self._work_sheet.value(row, col)
+            if value:
+                name = self._normalize(value)
                 self._col_name_to_number[name] = col
 
     def row_generator(self) -> Iterator[int]:
@@ -99,8 +103,7 @@ class XlsxHelper:
         nname = self._normalize(name)
         cname = self._translate(nname)
         col = self._col_name_to_number[cname]
-        cell = self._work_sheet.cell(row, col)
-        return cell.value
+        return self._work_sheet.value(row, col)
 
 
 class CatalogHelper:
@@ -18,6 +18,7 @@ import csv
 import datetime
 import logging
 import pathlib
+import shutil
 import tempfile
 import traceback
 from configparser import SectionProxy
@@ -31,6 +32,7 @@ from trestle.common.str_utils import as_bool
 from trestle.tasks.base_task import TaskBase
 from trestle.tasks.base_task import TaskOutcome
 from trestle.tasks.csv_to_oscal_cd import CsvToOscalComponentDefinition
+from trestle.tasks.xlsx_helper import SheetValues
 
 logger = logging.getLogger(__name__)
 
@@ -234,7 +236,8 @@ class SheetHelper:
         """Initialize."""
         self.wb = wb
         self.sn = sn
-        self.ws = self.wb[self.sn]
+        # sheets of work books loaded read-only are read once into values, other sheets are written
+        self.ws = SheetValues(self.wb[self.sn]) if self.wb.read_only else self.wb[self.sn]
 
     def get_sn(self) -> int:
         """Get sheet name."""
@@ -253,6 +256,8 @@ class SheetHelper:
 
     def get_cell_value(self, row: int, col: int) -> str:
         """Get cell value for given row and column name."""
+        if self.wb.read_only:
+            return self.ws.value(row, col)
         cell = self.ws.cell(row, col)
         return cell.value
 
@@ -314,13 +319,17 @@ class CombineHelper:
         benchmark_file = config['benchmark-file']
         self.ipath = pathlib.Path(benchmark_file)
         self.opath = pathlib.Path(tmpdir) / self.ipath.name
-        self.wb = load_workbook(self.ipath)
+        self.wb = load_workbook(self.ipath, read_only=True)
+        self.wb_combined = None
         self.ws_map = {}
         self.combined_map = {}
 
     def run(self) -> None:
         """Run."""
-        self._add_sheet_combined_profiles()
+        try:
+            self._add_sheet_combined_profiles()
+        finally:
+            self.wb.close()
         self._save()
 
     def _gather_sheets(self) -> None:
@@ -349,7 +358,7 @@ class CombineHelper:
         rec_count_sheets = 0
         # populate combined map
         for sn in self.ws_map.keys():
-            sheet_helper = SheetHelper(self.wb, sn)
+            sheet_helper = self.ws_map[sn]
             # process all rows from individual sheet
             rec_count_sheets += self._process_sheet(sheet_helper, src_col_section_no, src_col_recommendation_no)
         return rec_count_sheets
@@ -466,10 +475,11 @@ class CombineHelper:
         self._validate_columns_count()
         # key columns mappings
         rec_count_sheets = self._populate_combined_map()
-        # add combined sheet
+        # add combined sheet, as the only sheet of a new work book
         sn = self.sheetname_output
-        self.wb.create_sheet(sn)
-        combined_helper = SheetHelper(self.wb, sn)
+        self.wb_combined = Workbook()
+        self.wb_combined.active.title = sn
+        combined_helper = SheetHelper(self.wb_combined, sn)
         self.ws_map[sn] = combined_helper
         # populate combined sheet
         rec_count_merged = self._populate_combined_sheet(combined_helper)
@@ -508,7 +518,10 @@ class CombineHelper:
 
     def _save(self) -> None:
         """Save."""
-        self.wb.save(self.opath)
+        if self.wb_combined is None:
+            shutil.copyfile(self.ipath, self.opath)
+        else:
+            self.wb_combined.save(self.opath)
         logger.debug(f'{self.opath} saved')
 
 
@@ -655,9 +668,12 @@ class XlsxToCsvHelper:
         self.xpath = pathlib.Path(tmpdir) / self.ipath.name
         path = pathlib.Path(tmpdir) / self.xpath.name
         self.opath = path.with_suffix('.csv')
-        self.wb = load_workbook(self.xpath)
-        # worksheet
-        self.ws = self.wb[SheetHelper.get_sheetname()]
+        wb = load_workbook(self.xpath, read_only=True)
+        try:
+            # worksheet
+            self.ws = SheetValues(wb[SheetHelper.get_sheetname()])
+        finally:
+            wb.close()
         self._create_maps()
         # excluded columns
         default_columns_exclude = [f'"{head_recommendation_no}"', '"Profile"', '"Description"']
@@ -688,11 +704,11 @@ class XlsxToCsvHelper:
         row = 1
         cols = self.ws.max_column + 1
         for col in range(row, cols):
-            cell = self.ws.cell(row, col)
-            if cell.value:
-                key = self._name_to_key(cell.value)
+            value = self.ws.value(row, col)
+            if value:
+                key = self._name_to_key(value)
                 self._map_col_key_to_number[key] = col
-                self._map_name_to_col_key[cell.value] = key
+                self._map_name_to_col_key[value] = key
 
     def _name_to_key(self, name: str) -> str:
         """Name to key."""
@@ -725,8 +741,7 @@ class XlsxToCsvHelper:
         """Get cell value for given row and column name."""
         key = self._name_to_key(name)
         col = self._map_col_key_to_number[key]
-        cell = self.ws.cell(row, col)
-        return self._sanitize(cell.value)
+        return self._sanitize(self.ws.value(row, col))
 
     def is_same_rule(self, row_a: int, row_b: str) -> str:
         """Is same rule."""
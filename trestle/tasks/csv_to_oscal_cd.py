@@ -25,7 +25,7 @@ import sys
 import traceback
 import uuid
 from math import log10
-from typing import Generator, Iterator, List, Optional, Union
+from typing import Any, Callable, Generator, Iterator, List, Optional, Set, Tuple, Union
 
 from trestle.common.list_utils import as_list
 from trestle.core.catalog.catalog_interface import CatalogInterface
@@ -394,6 +394,7 @@ class CsvToOscalComponentDefinition(TaskBase):
 
     def _calculate_set_params(self, mod_rules: List) -> tuple:
         """Calculate set parameters add, delete, modify."""
+        mod_rules = set(mod_rules)
         cd_set_params = self._cd_mgr.get_set_params_keys()
         csv_set_params = self._csv_mgr.get_set_params_keys()
         del_set_params = []
@@ -422,6 +423,7 @@ class CsvToOscalComponentDefinition(TaskBase):
 
     def _calculate_control_mappings(self, mod_rules: List) -> tuple:
         """Calculate control mappings add, delete, modify."""
+        mod_rules = set(mod_rules)
         cd_controls = self._cd_mgr.get_control_keys()
         csv_controls = self._csv_mgr.get_control_keys()
         del_control_mappings = []
@@ -458,27 +460,37 @@ class CsvToOscalComponentDefinition(TaskBase):
 
     def rules_del(self, del_rules: List[str]) -> None:
         """Delete rules."""
+        # rules are deleted from each component in one pass
+        rule_ids_by_component = {}
         for tokens in del_rules:
             component_title = tokens[0]
             component_type = tokens[1]
             rule_id = tokens[2]
+            rule_ids_by_component.setdefault((component_title, component_type), []).append(rule_id)
+        for (component_title, component_type), rule_ids in rule_ids_by_component.items():
             description = ''
             # component
             component = self._cd_mgr.get_component(component_title, component_type, description)
             # props
-            component.props = self._delete_rule_props(component, rule_id)
+            component.props = self._delete_rule_props(component, rule_ids)
 
-    def _delete_rule_props(self, component: DefinedComponent, rule_id: str) -> List[Property]:
+    def _delete_rule_props(self, component: DefinedComponent, rule_ids: List[str]) -> List[Property]:
         """Delete rule props."""
         props = []
-        rule_set = _RuleSetHelper.get_rule_set(component.props, rule_id)
+        parameter_ids = set()
+        implemented_rule_ids = set()
+        rule_sets = {self._cd_mgr.find_rule_set(component, rule_id) for rule_id in rule_ids}
         for prop in component.props:
-            if prop.remarks != rule_set:
+            if prop.remarks not in rule_sets:
                 props.append(prop)
             elif prop.name in self._csv_mgr.get_parameter_id_column_names():
-                self._delete_rule_set_parameter(component, prop.value)
+                parameter_ids.add(prop.value)
             elif prop.name == RULE_ID:
-                self._delete_rule_implemented_requirement(component, prop.value)
+                implemented_rule_ids.add(prop.value)
+        if parameter_ids:
+            self._delete_rule_set_parameters(component, parameter_ids)
+        if implemented_rule_ids:
+            self._delete_rule_implemented_requirements(component, implemented_rule_ids)
         return props
 
     def _control_implementation_generator(
@@ -503,21 +515,18 @@ class CsvToOscalComponentDefinition(TaskBase):
             for implemented_requirement in implemented_requirements:
                 yield implemented_requirement
 
-    def _delete_rule_set_parameter(self, component: DefinedComponent, parameter_id: str) -> None:
-        """Delete rule set-parameter."""
+    def _delete_rule_set_parameters(self, component: DefinedComponent, parameter_ids: Set[str]) -> None:
+        """Delete rule set-parameters."""
         control_implementations = component.control_implementations
         for control_implementation in self._control_implementation_generator(control_implementations):
             if control_implementation.set_parameters:
-                set_parameters = control_implementation.set_parameters
-                control_implementation.set_parameters = []
-                for set_parameter in set_parameters:
-                    if set_parameter.param_id != parameter_id:
-                        _OscalHelper.add_set_parameter(control_implementation.set_parameters, set_parameter)
-                if not len(control_implementation.set_parameters):
-                    control_implementation.set_parameters = None
+                set_parameters = _OscalHelper.remove_set_parameters(
+                    control_implementation.set_parameters, parameter_ids
+                )
+                control_implementation.set_parameters = set_parameters if set_parameters else None
 
-    def _delete_rule_implemented_requirement(self, component: DefinedComponent, rule_id: str) -> None:
-        """Delete rule implemented_requirement."""
+    def _delete_rule_implemented_requirements(self, component: DefinedComponent, rule_ids: Set[str]) -> None:
+        """Delete rule implemented_requirements."""
         control_implementations = component.control_implementations
         component.control_implementations = []
         for control_implementation in self._control_implementation_generator(control_implementations):
@@ -525,20 +534,20 @@ class CsvToOscalComponentDefinition(TaskBase):
                 implemented_requirements = control_implementation.implemented_requirements
                 control_implementation.implemented_requirements = []
                 for implemented_requirement in implemented_requirements:
-                    self._delete_ir_props(implemented_requirement, rule_id)
-                    self._delete_ir_statements(implemented_requirement, rule_id)
+                    self._delete_ir_props(implemented_requirement, rule_ids)
+                    self._delete_ir_statements(implemented_requirement, rule_ids)
                     if len(as_list(implemented_requirement.props)) or len(as_list(implemented_requirement.statements)):
                         control_implementation.implemented_requirements.append(implemented_requirement)
             if len(as_list(control_implementation.implemented_requirements)):
                 component.control_implementations.append(control_implementation)
 
-    def _delete_ir_statements(self, implemented_requirement: ImplementedRequirement, rule_id: str) -> None:
+    def _delete_ir_statements(self, implemented_requirement: ImplementedRequirement, rule_ids: Set[str]) -> None:
         """Delete implemented-requirement statements."""
         if implemented_requirement.statements:
             statements = implemented_requirement.statements
             implemented_requirement.statements = []
             for statement in statements:
-                statement.props = self._delete_props(statement.props, rule_id)
+                statement.props = self._delete_props(statement.props, rule_ids)
                 if not len(statement.props):
                     statement.props = None
                 if statement.props:
@@ -546,19 +555,19 @@ class CsvToOscalComponentDefinition(TaskBase):
             if not len(implemented_requirement.statements):
                 implemented_requirement.statements = None
 
-    def _delete_ir_props(self, implemented_requirement: ImplementedRequirement, rule_id: str) -> None:
+    def _delete_ir_props(self, implemented_requirement: ImplementedRequirement, rule_ids: Set[str]) -> None:
         """Delete implemented-requirement props."""
         if implemented_requirement.props:
-            implemented_requirement.props = self._delete_props(implemented_requirement.props, rule_id)
+            implemented_requirement.props = self._delete_props(implemented_requirement.props, rule_ids)
             if not len(implemented_requirement.props):
                 implemented_requirement.props = None
 
-    def _delete_props(self, props: List[Property], rule_id: str) -> List[property]:
+    def _delete_props(self, props: List[Property], rule_ids: Set[str]) -> List[property]:
         """Delete props."""
         rval = []
         if props:
             for prop in props:
-                if prop.name == RULE_ID and prop.value == rule_id:
+                if prop.name == RULE_ID and prop.value in rule_ids:
                     continue
                 rval.append(prop)
         return rval
@@ -571,9 +580,10 @@ class CsvToOscalComponentDefinition(TaskBase):
             component_description = self._csv_mgr.get_value(rule_key, COMPONENT_DESCRIPTION)
             # component
             component = self._cd_mgr.get_component(component_title, component_type, component_description)
-            # props
-            component.props = as_list(component.props)
-            component.props = component.props + self._create_rule_props(rule_key)
+            # props, appended in place since assigning revalidates every prop
+            if component.props is None:
+                component.props = []
+            component.props.extend(self._create_rule_props(rule_key))
             # additional props, when not validation component
             if not self._is_validation(rule_key):
                 # control implementation
@@ -582,9 +592,8 @@ class CsvToOscalComponentDefinition(TaskBase):
                 control_implementation = self._get_control_implementation(component, source, description)
                 # set-parameters
                 set_parameters = self._create_set_parameters(rule_key)
-                if set_parameters:
-                    control_implementation.set_parameters = as_list(control_implementation.set_parameters)
-                    _OscalHelper.add_set_parameters(control_implementation.set_parameters, set_parameters)
+                for set_parameter in set_parameters:
+                    self._add_set_parameter(control_implementation, set_parameter)
                 # control-mappings
                 control_mappings = self._csv_mgr.get_value(rule_key, CONTROL_ID_LIST).split()
                 self._add_rule_prop(control_implementation, control_mappings, rule_key)
@@ -609,7 +618,8 @@ class CsvToOscalComponentDefinition(TaskBase):
             )
             part_id = derive_part_id(control_mapping)
             if part_id is None:
-                implemented_requirement.props = as_list(implemented_requirement.props)
+                if implemented_requirement.props is None:
+                    implemented_requirement.props = []
                 implemented_requirement.props.append(prop)
             else:
                 statement = self._get_statement(implemented_requirement, part_id)
@@ -651,10 +661,11 @@ class CsvToOscalComponentDefinition(TaskBase):
         self, component: DefinedComponent, source: str, description: str
     ) -> ControlImplementation:
         """Find or create control implementation."""
-        component.control_implementations = as_list(component.control_implementations)
-        for control_implementation in component.control_implementations:
-            if control_implementation.source == source and control_implementation.description == description:
-                return control_implementation
+        if component.control_implementations is None:
+            component.control_implementations = []
+        control_implementation = self._cd_mgr.find_item(component, 'control_implementations', (source, description))
+        if control_implementation:
+            return control_implementation
         control_implementation = ControlImplementation(
             uuid=str(uuid.uuid4()), source=source, description=description, implemented_requirements=[]
         )
@@ -707,19 +718,20 @@ class CsvToOscalComponentDefinition(TaskBase):
             if not self._resolved_profile_catalog_helper.validate(control_id):
                 if control_id not in self._unresolved_controls:
                     self._unresolved_controls.append(control_id)
-        for implemented_requirement in control_implementation.implemented_requirements:
-            if implemented_requirement.control_id == control_id:
-                return implemented_requirement
+        implemented_requirement = self._cd_mgr.find_item(control_implementation, 'implemented_requirements', control_id)
+        if implemented_requirement:
+            return implemented_requirement
         implemented_requirement = ImplementedRequirement(uuid=str(uuid.uuid4()), control_id=control_id, description='')
         control_implementation.implemented_requirements.append(implemented_requirement)
         return implemented_requirement
 
     def _get_statement(self, implemented_requirement: ImplementedRequirement, part_id: str) -> Statement:
         """Find or create statement."""
-        implemented_requirement.statements = as_list(implemented_requirement.statements)
-        for statement in implemented_requirement.statements:
-            if statement.statement_id == part_id:
-                return statement
+        if implemented_requirement.statements is None:
+            implemented_requirement.statements = []
+        statement = self._cd_mgr.find_item(implemented_requirement, 'statements', part_id)
+        if statement:
+            return statement
         statement = Statement(uuid=str(uuid.uuid4()), statement_id=part_id, description='', props=[])
         implemented_requirement.statements.append(statement)
         return statement
@@ -733,12 +745,13 @@ class CsvToOscalComponentDefinition(TaskBase):
             # component
             component = self._cd_mgr.get_component(component_title, component_type, component_description)
             # props
-            component.props = self._modify_rule_props(component, rule_key)
+            self._modify_rule_props(component, rule_key)
+        self._cd_mgr.apply_deleted_properties()
 
-    def _modify_rule_props(self, component: DefinedComponent, rule_key: tuple) -> List[Property]:
+    def _modify_rule_props(self, component: DefinedComponent, rule_key: tuple) -> None:
         """Modify rule props."""
         rule_id = self._csv_mgr.get_value(rule_key, RULE_ID)
-        rule_set = _RuleSetHelper.get_rule_set(component.props, rule_id)
+        rule_set = self._cd_mgr.find_rule_set(component, rule_id)
         rule_ns = self._csv_mgr.get_value(rule_key, NAMESPACE)
         column_names = CsvColumn.get_filtered_required_column_names() + CsvColumn.get_filtered_optional_column_names()
         # req'd & optional props
@@ -757,10 +770,11 @@ class CsvToOscalComponentDefinition(TaskBase):
         for column_name in column_names:
             column_value = self._csv_mgr.get_value(rule_key, column_name).strip()
             self._cd_mgr.update_rule_definition(component, rule_set, column_name, column_value, rule_ns, class_)
-        return component.props
 
     def set_params_del(self, del_set_params: List[str]) -> None:
         """Set parameters delete."""
+        # set-parameters are deleted from each control implementation in one pass
+        param_ids_by_control_implementation = {}
         for tokens in del_set_params:
             component_title = tokens[0]
             component_type = tokens[1]
@@ -772,14 +786,11 @@ class CsvToOscalComponentDefinition(TaskBase):
                 component_title, component_type, source, description
             )
             if control_implementation:
-                set_parameters = control_implementation.set_parameters
-                control_implementation.set_parameters = []
-                for set_parameter in self._set_parameter_generator(set_parameters):
-                    if set_parameter.param_id == param_id:
-                        continue
-                    _OscalHelper.add_set_parameter(control_implementation.set_parameters, set_parameter)
-                if control_implementation.set_parameters == []:
-                    control_implementation.set_parameters = None
+                key = id(control_implementation)
+                param_ids_by_control_implementation.setdefault(key, (control_implementation, set()))[1].add(param_id)
+        for control_implementation, param_ids in param_ids_by_control_implementation.values():
+            set_parameters = _OscalHelper.remove_set_parameters(control_implementation.set_parameters, param_ids)
+            control_implementation.set_parameters = set_parameters if set_parameters else None
 
     def set_params_add(self, add_set_params: List[str]) -> None:
         """Set parameters add."""
@@ -794,12 +805,22 @@ class CsvToOscalComponentDefinition(TaskBase):
             control_implementation = self._cd_mgr.find_control_implementation(
                 component_title, component_type, source, description
             )
-            control_implementation.set_parameters = as_list(control_implementation.set_parameters)
             # add
             rule_key = synthesize_rule_key(component_title, component_type, rule_id, None, None)
             values = [self._csv_mgr.get_default_value_by_id(rule_key, param_id)]
             set_parameter = SetParameter(param_id=param_id, values=values)
-            _OscalHelper.add_set_parameter(control_implementation.set_parameters, set_parameter)
+            self._add_set_parameter(control_implementation, set_parameter)
+
+    def _add_set_parameter(self, control_implementation: ControlImplementation, set_parameter: SetParameter) -> None:
+        """Add set parameter, unless already present."""
+        if control_implementation.set_parameters is None:
+            control_implementation.set_parameters = []
+        sp = self._cd_mgr.find_item(control_implementation, 'set_parameters', set_parameter.param_id)
+        if sp is None:
+            control_implementation.set_parameters.append(set_parameter)
+        elif sp.values != set_parameter.values:
+            text = f'set-parameter id={sp.param_id} conflicting values'
+            raise RuntimeError(text)
 
     def set_params_mod(self, mod_set_params: List[str]) -> None:
         """Set parameters modify."""
@@ -842,6 +863,8 @@ class CsvToOscalComponentDefinition(TaskBase):
 
     def control_mappings_del(self, del_control_mappings: List[str]) -> None:
         """Control mappings delete."""
+        # mappings are deleted from each control implementation in one pass, with the rules to delete by control
+        mappings_by_control_implementation = {}
         for tokens in self._control_mappings_generator(del_control_mappings):
             component_title = tokens[0]
             component_type = tokens[1]
@@ -854,14 +877,20 @@ class CsvToOscalComponentDefinition(TaskBase):
             control_implementation = self._cd_mgr.find_control_implementation(
                 component_title, component_type, source, description
             )
+            key = id(control_implementation)
+            mappings = mappings_by_control_implementation.setdefault(key, (control_implementation, {}))[1]
+            mappings.setdefault(control_id, set()).add((rule_id, smt_id))
+        for control_implementation, mappings in mappings_by_control_implementation.values():
             implemented_requirements = control_implementation.implemented_requirements
             control_implementation.implemented_requirements = []
             for implemented_requirement in self._implemented_requirement_generator(implemented_requirements):
-                if implemented_requirement.control_id == control_id:
-                    implemented_requirement.statements = _OscalHelper.remove_rule_statement(
-                        implemented_requirement.statements, rule_id, smt_id
+                rule_smt_ids = mappings.get(implemented_requirement.control_id)
+                if rule_smt_ids:
+                    implemented_requirement.statements = _OscalHelper.remove_rule_statements(
+                        implemented_requirement.statements, rule_smt_ids
                     )
-                    implemented_requirement.props = _OscalHelper.remove_rule(implemented_requirement.props, rule_id)
+                    rule_ids = {rule_id for rule_id, _ in rule_smt_ids}
+                    implemented_requirement.props = _OscalHelper.remove_rules(implemented_requirement.props, rule_ids)
                     if len(as_list(implemented_requirement.props)) or len(as_list(implemented_requirement.statements)):
                         control_implementation.implemented_requirements.append(implemented_requirement)
                 else:
@@ -889,7 +918,8 @@ class CsvToOscalComponentDefinition(TaskBase):
             name = RULE_ID
             prop = Property(name=name, value=rule_id, ns=ns, class_=self.get_class(name))
             if smt_id == control_id:
-                implemented_requirement.props = as_list(implemented_requirement.props)
+                if implemented_requirement.props is None:
+                    implemented_requirement.props = []
                 implemented_requirement.props.append(prop)
             else:
                 statement = self._get_statement(implemented_requirement, smt_id)
@@ -900,66 +930,44 @@ class _OscalHelper:
     """Oscal Helper."""
 
     @staticmethod
-    def add_set_parameters(set_parameter_list: List[SetParameter], set_parameter_list_add: List[SetParameter]) -> None:
-        """Add set parameters."""
-        for set_parameter in set_parameter_list_add:
-            _OscalHelper.add_set_parameter(set_parameter_list, set_parameter)
-
-    @staticmethod
-    def add_set_parameter(set_parameter_list: List[SetParameter], set_parameter: SetParameter) -> None:
-        """Add set parameter."""
-        add = True
-        # don't add duplicate
-        for sp in set_parameter_list:
-            if sp.param_id == set_parameter.param_id:
-                add = False
-                if sp.values != set_parameter.values:
-                    text = f'set-parameter id={sp.param_id} conflicting values'
-                    raise RuntimeError(text)
-                break
-        if add:
-            set_parameter_list.append(set_parameter)
+    def remove_set_parameters(set_parameter_list: List[SetParameter], param_ids: Set[str]) -> List[SetParameter]:
+        """Remove set parameters with the param ids, and duplicates."""
+        set_parameters = {}
+        for set_parameter in as_list(set_parameter_list):
+            if set_parameter.param_id in param_ids:
+                continue
+            sp = set_parameters.setdefault(set_parameter.param_id, set_parameter)
+            if sp.values != set_parameter.values:
+                text = f'set-parameter id={sp.param_id} conflicting values'
+                raise RuntimeError(text)
+        return list(set_parameters.values())
 
     @staticmethod
-    def remove_rule_statement(statements: List[Statement], rule_id: str, smt_id: str) -> List[Statement]:
-        """Remove rule from statements."""
+    def remove_rule_statements(statements: List[Statement], rule_smt_ids: Set[Tuple[str, str]]) -> List[Statement]:
+        """Remove rules from statements, given as pairs of rule id and statement id."""
         rval = statements
         if statements:
             rval = []
             for statement in statements:
-                if statement.statement_id == smt_id:
-                    statement.props = _OscalHelper.remove_rule(statement.props, rule_id)
+                rule_ids = {rule_id for rule_id, smt_id in rule_smt_ids if smt_id == statement.statement_id}
+                if rule_ids:
+                    statement.props = _OscalHelper.remove_rules(statement.props, rule_ids)
                 if statement.props is not None and len(statement.props):
                     rval.append(statement)
         return rval
 
     @staticmethod
-    def remove_rule(props: List[Property], rule_id: str) -> List[Property]:
-        """Remove rule from props."""
+    def remove_rules(props: List[Property], rule_ids: Set[str]) -> List[Property]:
+        """Remove rules from props."""
         rval = props
         if props:
             rval = []
             for prop in props:
-                if prop.name != RULE_ID or prop.value != rule_id:
+                if prop.name != RULE_ID or prop.value not in rule_ids:
                     rval.append(prop)
         return rval
 
 
-class _RuleSetHelper:
-    """RuleSet Helper."""
-
-    @staticmethod
-    def get_rule_set(props: List[Property], rule_id: str) -> str:
-        """Get rule_set for given rule_id."""
-        rule_set = None
-        if props:
-            for prop in props:
-                if prop.name == 'Rule_Id' and prop.value == rule_id:
-                    rule_set = prop.remarks
-                    break
-        return rule_set
-
-
 class _RuleSetIdMgr:
     """RuleSetId Manager."""
 
@@ -1027,7 +1035,7 @@ class _ResolvedProfileCatalogHelper:
         self._profile_list = profile_list
         self._root = root
         self._profile_map = {}
-        self._control_list = []
+        self._control_ids = set()
         self._init = False
 
     def _initialize(self):
@@ -1036,19 +1044,60 @@ class _ResolvedProfileCatalogHelper:
                 catalog = ProfileResolver.get_resolved_profile_catalog(pathlib.Path(self._root), profile)
                 self._profile_map[profile] = catalog
                 controls = CatalogInterface.get_control_ids_from_catalog(catalog)
-                self._control_list += controls
-            logger.debug(f'resolved controls: {self._control_list}')
+                self._control_ids.update(controls)
+            logger.debug(f'resolved controls: {sorted(self._control_ids)}')
             self._init = True
 
     def validate(self, control_id: str) -> bool:
         """Validate control_id."""
         self._initialize()
         rval = True
-        if control_id not in self._control_list:
+        if control_id not in self._control_ids:
             rval = False
         return rval
 
 
+class _ListIndex:
+    """
+    Index of the items of a list by key, keeping the first item for each key.
+
+    Items appended to the list are indexed when next used, and the index is rebuilt if the list is replaced or shrinks.
+    """
+
+    def __init__(self, item_key: Callable[[Any], Any]) -> None:
+        """Initialize."""
+        self._item_key = item_key
+        self._items = None
+        self._count = 0
+        self._map = {}
+
+    def find(self, items: Optional[List[Any]], key: Any) -> Any:
+        """Find the first item with the key, or None."""
+        items = as_list(items)
+        if items is not self._items or len(items) < self._count:
+            self._items = items
+            self._count = 0
+            self._map = {}
+        for item in items[self._count :]:
+            item_key = self._item_key(item)
+            if item_key is not None:
+                self._map.setdefault(item_key, item)
+        self._count = len(items)
+        return self._map.get(key)
+
+
+# the list indexed for each index name, and the key of an item in it or None if the item is not indexed
+_list_indexes = {
+    'components': ('components', lambda component: (component.title, component.type)),
+    'control_implementations': ('control_implementations', lambda ci: (ci.source, ci.description)),
+    'set_parameters': ('set_parameters', lambda set_parameter: set_parameter.param_id),
+    'implemented_requirements': ('implemented_requirements', lambda ir: ir.control_id),
+    'statements': ('statements', lambda statement: statement.statement_id),
+    'rule_props': ('props', lambda prop: (prop.remarks, prop.name)),
+    'rule_ids': ('props', lambda prop: prop.value if prop.name == RULE_ID else None),
+}
+
+
 class _CdMgr:
     """CD Manager."""
 
@@ -1069,6 +1118,8 @@ class _CdMgr:
         self._cd_rules_map = {}
         self._cd_set_params_map = {}
         self._cd_controls_map = {}
+        self._list_index_map = {}
+        self._deleted_props_map = {}
         #
         for component in self._component_definition.components:
             self.accounting(component)
@@ -1076,12 +1127,20 @@ class _CdMgr:
         logger.debug(f'cd params: {len(self._cd_rules_map)}')
         logger.debug(f'cd controls: {len(self._cd_controls_map)}')
 
+    def find_item(self, owner: Any, index_name: str, key: Any) -> Any:
+        """Find the first item with the key in the list of the owner indexed by the named index, or None."""
+        list_name, item_key = _list_indexes[index_name]
+        list_index = self._list_index_map.get((id(owner), index_name))
+        if list_index is None:
+            list_index = _ListIndex(item_key)
+            self._list_index_map[(id(owner), index_name)] = list_index
+        return list_index.find(getattr(owner, list_name), key)
+
     def get_component(self, component_title: str, component_type: str, component_description: str) -> DefinedComponent:
         """Get component."""
-        for component in self._component_definition.components:
-            if component.title == component_title and component.type == component_type:
-                logger.debug(f'located component: title={component.title} type={component.type}')
-                return component
+        component = self.find_component(component_title, component_type)
+        if component:
+            return component
         component = DefinedComponent(
             uuid=str(uuid.uuid4()),
             type=component_type,
@@ -1095,25 +1154,17 @@ class _CdMgr:
 
     def find_component(self, component_title: str, component_type: str) -> DefinedComponent:
         """Find component."""
-        rval = None
-        for component in self._component_definition.components:
-            if component.title == component_title and component.type == component_type:
-                logger.debug(f'located component: title={component.title} type={component.type}')
-                rval = component
-                break
+        rval = self.find_item(self._component_definition, 'components', (component_title, component_type))
+        if rval:
+            logger.debug(f'located component: title={rval.title} type={rval.type}')
         return rval
 
     def find_control_implementation(
         self, component_title: str, component_type: str, source: str, description: str
     ) -> ControlImplementation:
         """Find control-implementation."""
-        rval = None
         component = self.find_component(component_title, component_type)
-        for control_implementation in component.control_implementations:
-            if control_implementation.source == source and control_implementation.description == description:
-                rval = control_implementation
-                break
-        return rval
+        return self.find_item(component, 'control_implementations', (source, description))
 
     def get_component_definition(self) -> ComponentDefinition:
         """Get component definition."""
@@ -1154,9 +1205,10 @@ class _CdMgr:
         self.accounting_rule_definitions(component)
         # set-parameters & control mappings
         if component.control_implementations:
+            rule_id_maps = self._get_rule_id_maps(component)
             for control_implementation in component.control_implementations:
                 # set-parameters
-                self.accounting_set_parameters(component, control_implementation)
+                self.accounting_set_parameters(component, control_implementation, rule_id_maps)
                 # control mappings
                 self.accounting_control_mappings(component, control_implementation)
 
@@ -1174,12 +1226,12 @@ class _CdMgr:
                         self._max_rule_set_number = rule_set_number
 
     def accounting_set_parameters(
-        self, component: DefinedComponent, control_implementation: ControlImplementation
+        self, component: DefinedComponent, control_implementation: ControlImplementation, rule_id_maps: tuple
     ) -> None:
         """Accounting, set-parameters."""
         if control_implementation.set_parameters:
             for set_parameter in control_implementation.set_parameters:
-                rule_id = self._get_rule_id(component, set_parameter.param_id)
+                rule_id = self._get_rule_id(rule_id_maps, set_parameter.param_id)
                 key = (
                     component.title,
                     component.type,
@@ -1244,21 +1296,31 @@ class _CdMgr:
                             )
                             self._cd_controls_map[key] = prop
 
-    def _get_rule_id(self, component: DefinedComponent, param_id: str) -> str:
+    def _get_rule_id_maps(self, component: DefinedComponent) -> tuple:
+        """Get maps of rule_set to rule_id and of param_id to rule_set, the last prop found for each."""
+        map_ = {}
+        rule_sets = {}
+        for prop in as_list(component.props):
+            if prop.name == 'Rule_Id':
+                map_[prop.remarks] = prop.value
+            elif prop.name == 'Parameter_Id':
+                rule_sets[prop.value] = prop.remarks
+        return (map_, rule_sets)
+
+    def _get_rule_id(self, rule_id_maps: tuple, param_id: str) -> str:
         """Get rule_id for given param_id."""
         rule_id = None
-        if component.props:
-            map_ = {}
-            rule_set = None
-            for prop in component.props:
-                if prop.name == 'Rule_Id':
-                    map_[prop.remarks] = prop.value
-                elif prop.name == 'Parameter_Id' and prop.value == param_id:
-                    rule_set = prop.remarks
-            if rule_set:
-                rule_id = map_[rule_set]
+        map_, rule_sets = rule_id_maps
+        rule_set = rule_sets.get(param_id)
+        if rule_set:
+            rule_id = map_[rule_set]
         return rule_id
 
+    def find_rule_set(self, component: DefinedComponent, rule_id: str) -> str:
+        """Find rule_set for given rule_id."""
+        prop = self.find_item(component, 'rule_ids', rule_id)
+        return prop.remarks if prop else None
+
     def update_rule_definition(
         self, component: DefinedComponent, rule_set: str, name: str, value: str, ns: str, class_: str
     ) -> None:
@@ -1279,17 +1341,15 @@ class _CdMgr:
 
     def find_property(self, component: DefinedComponent, rule_set: str, name: str) -> Property:
         """Find property."""
-        rval = None
-        for prop in component.props:
-            if prop.remarks == rule_set and prop.name == name:
-                rval = prop
-                break
-        return rval
+        if (rule_set, name) in self._deleted_props_map.get(id(component), (None, ()))[1]:
+            return None
+        return self.find_item(component, 'rule_props', (rule_set, name))
 
     def add_property(
         self, component: DefinedComponent, rule_set: str, name: str, value: str, ns: str, class_: str
     ) -> None:
         """Add property."""
+        self._apply_deleted_properties(component)
         prop_add = Property(name=name, value=value, ns=ns, class_=class_, remarks=rule_set)
         last = 0
         for index, prop in enumerate(component.props):
@@ -1311,11 +1371,25 @@ class _CdMgr:
         component.props = props
 
     def delete_property(self, component: DefinedComponent, rule_set: str, name: str) -> None:
-        """Delete property."""
+        """Delete property, when deleted properties are applied so the props of the component are replaced once."""
+        if self.find_property(component, rule_set, name) is None:
+            return
+        self._deleted_props_map.setdefault(id(component), (component, set()))[1].add((rule_set, name))
+
+    def apply_deleted_properties(self) -> None:
+        """Apply deleted properties."""
+        for component, _ in list(self._deleted_props_map.values()):
+            self._apply_deleted_properties(component)
+
+    def _apply_deleted_properties(self, component: DefinedComponent) -> None:
+        """Apply deleted properties of component."""
+        _, deleted_props = self._deleted_props_map.pop(id(component), (None, None))
+        if not deleted_props:
+            return
         props = []
         for prop in component.props:
-            if prop.remarks == rule_set and prop.name == name:
-                logger.debug(f'delete-prop: {rule_set} {name} {prop.value}')
+            if (prop.remarks, prop.name) in deleted_props:
+                logger.debug(f'delete-prop: {prop.remarks} {prop.name} {prop.value}')
             else:
                 props.append(prop)
         component.props = props
@@ -1501,6 +1575,7 @@ class _CsvMgr:
                 self._csv.append(row)
         self._undecorate_header()
         self._verify()
+        self._map_columns()
         self._csv_rules_map = {}
         self._csv_set_params_map = {}
         self._csv_controls_map = {}
@@ -1557,21 +1632,11 @@ class _CsvMgr:
 
     def get_parameter_id_column_names(self) -> List[str]:
         """Get parameter_id column_names."""
-        col_names = []
-        for col_name in self._csv[0]:
-            if col_name.startswith(PARAMETER_ID):
-                col_names.append(col_name)
-        return col_names
+        return self._parameter_id_column_names
 
     def get_parameter_column_names(self) -> List[str]:
         """Get parameter column_names."""
-        col_names = []
-        for col_name in self._csv[0]:
-            if col_name.startswith(PARAMETER_VALUE_DEFAULT):
-                continue
-            if col_name.startswith(PARAMETER):
-                col_names.append(col_name)
-        return col_names
+        return self._parameter_column_names
 
     def get_profile_list(self):
         """Get profile list."""
@@ -1631,6 +1696,25 @@ class _CsvMgr:
             heading = heading.title()
             self._csv[0].append(heading)
 
+    def _map_columns(self) -> None:
+        """Map column names to indexes, and find the parameter and user column names, once for all rows."""
+        self._col_index_map = {}
+        for index, heading in enumerate(self._csv[0]):
+            self._col_index_map.setdefault(self._get_normalized_column_name(heading), index)
+        self._parameter_id_column_names = []
+        self._parameter_column_names = []
+        self._user_column_names = []
+        for col_name in self._csv[0]:
+            if col_name.startswith(PARAMETER_ID):
+                self._parameter_id_column_names.append(col_name)
+            if col_name.startswith(PARAMETER) and not col_name.startswith(PARAMETER_VALUE_DEFAULT):
+                self._parameter_column_names.append(col_name)
+            t1 = CsvColumn.is_column_name_required(col_name)
+            t2 = CsvColumn.is_column_name_optional(col_name)
+            t3 = CsvColumn.is_column_name_parameter(col_name)
+            if not (t1 or t2 or t3):
+                self._user_column_names.append(col_name)
+
     def _verify(self) -> None:
         """Verify."""
         required_columns = CsvColumn.get_required_column_names()
@@ -1661,15 +1745,7 @@ class _CsvMgr:
 
     def get_col_index(self, column_name: str) -> int:
         """Get index for column name."""
-        rval = -1
-        head_row = self._csv[0]
-        col_name = self._get_normalized_column_name(column_name)
-        for index, heading in enumerate(head_row):
-            head_name = self._get_normalized_column_name(heading)
-            if head_name == col_name:
-                rval = index
-                break
-        return rval
+        return self._col_index_map.get(self._get_normalized_column_name(column_name), -1)
 
     def get_row(self, rule_key: tuple) -> List:
         """Get row for rule."""
@@ -1706,11 +1782,4 @@ class _CsvMgr:
 
     def get_user_column_names(self) -> List[str]:
         """Get user column names."""
-        user_column_names = []
-        for column_name in self._csv[0]:
-            t1 = CsvColumn.is_column_name_required(column_name)
-            t2 = CsvColumn.is_column_name_optional(column_name)
-            t3 = CsvColumn.is_column_name_parameter(column_name)
-            if not (t1 or t2 or t3):
-                user_column_names.append(column_name)
-        return user_column_names
+        return self._user_column_names
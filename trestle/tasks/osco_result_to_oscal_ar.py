@@ -15,19 +15,27 @@
 """OSCAL transformation tasks."""
 
 import configparser
+import functools
 import logging
 import pathlib
 import traceback
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from trestle.common import const
 from trestle.tasks.base_task import TaskBase
 from trestle.tasks.base_task import TaskOutcome
+from trestle.tasks.results_transform import transform_task_files
 from trestle.transforms.implementations.osco import OscoTransformer
 
 logger = logging.getLogger(__name__)
 
 
+def _make_transformer(modes: Dict[str, Any]) -> OscoTransformer:
+    """Create the transformer for one file, configured as given to the task."""
+    osco_transformer = OscoTransformer()
+    osco_transformer.set_modes(modes)
+    return osco_transformer
+
+
 # deprecated - use XccdfResultToOscalAR instead
 class OscoResultToOscalAR(TaskBase):
     """
@@ -66,6 +74,9 @@ class OscoResultToOscalAR(TaskBase):
             '  output-dir = (required) the path of the output directory comprising synthesized OSCAL .json files.'
         )
         logger.info('  output-overwrite = (optional) true [default] or false; replace existing output when true.')
+        logger.info(
+            '  jobs = (optional) the number of input files to transform in parallel worker processes, default is 1.'
+        )
         logger.info(
             '  quiet = (optional) true or false [default]; display file creations and rules analysis when false.'
         )
@@ -126,6 +137,11 @@ class OscoResultToOscalAR(TaskBase):
         self._overwrite = self._config.getboolean('output-overwrite', True)
         quiet = self._config.get('quiet', False)
         self._verbose = not self._simulate and not quiet
+        # config optional jobs
+        jobs = self._config.getint('jobs', 1)
+        if jobs < 1:
+            logger.warning('config invalid "jobs"')
+            return TaskOutcome(mode + 'failure')
         # config optional timestamp
         timestamp = self._config.get('timestamp')
         if timestamp is not None:
@@ -139,40 +155,16 @@ class OscoResultToOscalAR(TaskBase):
         # insure output dir exists
         opth.mkdir(exist_ok=True, parents=True)
         # process
-        for ifile in sorted(ipth.iterdir()):
-            if ifile.suffix not in ['.json', '.jsn', '.yaml', '.yml', '.xml']:
-                continue
-            blob = self._read_file(ifile)
-            osco_transformer = OscoTransformer()
-            osco_transformer.set_modes(modes)
-            results = osco_transformer.transform(blob)
-            oname = ifile.stem + '.oscal' + '.json'
-            ofile = opth / oname
-            if not self._overwrite and pathlib.Path(ofile).exists():
-                logger.warning(f'output: {ofile} already exists')
-                return TaskOutcome(mode + 'failure')
-            self._write_file(results, ofile)
-            self._show_analysis(osco_transformer)
-        return TaskOutcome(mode + 'success')
-
-    def _read_file(self, ifile: str) -> str:
-        """Read raw input file."""
-        if not self._simulate and self._verbose:
-            logger.info(f'input: {ifile}')
-        with open(ifile, encoding=const.FILE_ENCODING) as fp:
-            blob = fp.read()
-        return blob
-
-    def _write_file(self, result: str, ofile: str) -> None:
-        """Write oscal results file."""
-        if not self._simulate:
-            if self._verbose:
-                logger.info(f'output: {ofile}')
-            result.oscal_write(pathlib.Path(ofile))
-
-    def _show_analysis(self, osco_transformer: OscoTransformer) -> None:
-        """Show analysis."""
-        if not self._simulate and self._verbose:
-            analysis = osco_transformer.analysis
-            for line in analysis:
-                logger.info(line)
+        ifiles = [
+            ifile for ifile in sorted(ipth.iterdir()) if ifile.suffix in ['.json', '.jsn', '.yaml', '.yml', '.xml']
+        ]
+        return transform_task_files(
+            functools.partial(_make_transformer, modes),
+            ifiles,
+            opth,
+            jobs,
+            mode,
+            self._overwrite,
+            self._simulate,
+            self._verbose,
+        )
@@ -0,0 +1,138 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Transformation of many result files to OSCAL assessment results files by a pool of worker processes."""
+
+import logging
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, List, Tuple
+
+from trestle.common import const
+from trestle.tasks.base_task import TaskOutcome
+from trestle.transforms.transformer_factory import ResultsTransformer, TransformerBase
+
+logger = logging.getLogger(__name__)
+
+
+def transform_file(
+    make_transformer: Callable[[], ResultsTransformer],
+    ifile: pathlib.Path,
+    ofile: pathlib.Path,
+    write: bool,
+    streaming: bool = False,
+) -> List[str]:
+    """Transform the input file with a new transformer, write the results if requested and return the analysis."""
+    transformer = make_transformer()
+    if streaming:
+        # the transformer writes the results itself as they are built
+        transformer.transform_file(ifile, ofile if write else None)
+        return transformer.analysis
+    with open(ifile, encoding=const.FILE_ENCODING) as fp:
+        blob = fp.read()
+    results = transformer.transform(blob)
+    if write:
+        results.oscal_write(ofile)
+    return transformer.analysis
+
+
+def _init_worker(timestamp: str) -> None:
+    """Give the worker the timestamp of the parent so all observations share it."""
+    TransformerBase.set_timestamp(timestamp)
+
+
+def transform_files(
+    make_transformer: Callable[[], ResultsTransformer],
+    files: List[Tuple[pathlib.Path, pathlib.Path]],
+    jobs: int,
+    write: bool,
+    streaming: bool = False,
+) -> Iterator[List[str]]:
+    """
+    Transform each input file to its output file with jobs worker processes.
+
+    Args:
+        make_transformer: picklable function creating the configured transformer used for each file
+        files: the input and output file pairs
+        jobs: the number of worker processes, with the files transformed in this process if 1
+        write: whether to write the output files
+        streaming: whether the transformer streams each input file to its output file with its transform_file
+
+    Returns:
+        Iterator over the analysis of each file, in the order of the files
+    """
+    if not files:
+        return
+    if jobs == 1:
+        for ifile, ofile in files:
+            yield transform_file(make_transformer, ifile, ofile, write, streaming)
+        return
+    jobs = min(jobs, len(files))
+    n_files = len(files)
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(TransformerBase.get_timestamp(),)
+    ) as executor:
+        yield from executor.map(
+            transform_file,
+            [make_transformer] * n_files,
+            [ifile for ifile, _ in files],
+            [ofile for _, ofile in files],
+            [write] * n_files,
+            [streaming] * n_files,
+        )
+
+
+def transform_task_files(
+    make_transformer: Callable[[], ResultsTransformer],
+    ifiles: List[pathlib.Path],
+    opth: pathlib.Path,
+    jobs: int,
+    mode: str,
+    overwrite: bool,
+    simulate: bool,
+    verbose: bool,
+    streaming: bool = False,
+) -> TaskOutcome:
+    """
+    Transform the input files of a results task to the output folder with jobs worker processes.
+
+    Args:
+        make_transformer: picklable function creating the configured transformer used for each file
+        ifiles: the input files
+        opth: the output folder, in which each output file is named after its input file
+        jobs: the number of worker processes, with the files transformed in this process if 1
+        mode: the task mode prefixed to the outcome, either 'simulated-' or ''
+        overwrite: whether existing output files may be overwritten
+        simulate: whether to skip writing the output files
+        verbose: whether to log the files and the analysis of each
+        streaming: whether the transformer streams each input file to its output file with its transform_file
+
+    Returns:
+        The outcome of the task, failure if an output file exists and may not be overwritten
+    """
+    files = [(ifile, opth / (ifile.stem + '.oscal' + '.json')) for ifile in ifiles]
+    if not overwrite:
+        for _, ofile in files:
+            if ofile.exists():
+                logger.warning(f'output: {ofile} already exists')
+                return TaskOutcome(mode + 'failure')
+    analyses = transform_files(make_transformer, files, jobs, not simulate, streaming)
+    for (ifile, ofile), analysis in zip(files, analyses, strict=True):
+        if not simulate and verbose:
+            logger.info(f'input: {ifile}')
+            logger.info(f'output: {ofile}')
+            for line in analysis:
+                logger.info(line)
+    return TaskOutcome(mode + 'success')
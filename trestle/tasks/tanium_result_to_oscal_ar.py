@@ -15,19 +15,27 @@
 """OSCAL transformation tasks."""
 
 import configparser
+import functools
 import logging
 import pathlib
 import traceback
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from trestle.common import const
 from trestle.tasks.base_task import TaskBase
 from trestle.tasks.base_task import TaskOutcome
+from trestle.tasks.results_transform import transform_task_files
 from trestle.transforms.implementations.tanium import TaniumTransformer
 
 logger = logging.getLogger(__name__)
 
 
+def _make_transformer(modes: Dict[str, Any]) -> TaniumTransformer:
+    """Create the transformer for one file, configured as given to the task."""
+    tanium_transformer = TaniumTransformer()
+    tanium_transformer.set_modes(modes)
+    return tanium_transformer
+
+
 class TaniumResultToOscalAR(TaskBase):
     """
     Task to convert Tanium result to OSCAL json.
@@ -70,6 +78,13 @@ class TaniumResultToOscalAR(TaskBase):
             '  output-dir = (required) the path of the output directory comprising synthesized OSCAL .json files.'
         )
         logger.info('  output-overwrite = (optional) true [default] or false; replace existing output when true.')
+        logger.info(
+            '  jobs = (optional) the number of input files to transform in parallel worker processes, default is 1.'
+        )
+        logger.info(
+            '  streaming = (optional) true or false [default]; read each json input file incrementally and write '
+            + 'its observations to the output in batches of blocksize when true, bounding memory use.'
+        )
         logger.info(
             '  quiet = (optional) true or false [default]; display file creations and rules analysis when false.'
         )
@@ -130,6 +145,11 @@ class TaniumResultToOscalAR(TaskBase):
         self._overwrite = self._config.getboolean('output-overwrite', True)
         quiet = self._config.get('quiet', False)
         self._verbose = not self._simulate and not quiet
+        # config optional jobs
+        jobs = self._config.getint('jobs', 1)
+        if jobs < 1:
+            logger.warning('config invalid "jobs"')
+            return TaskOutcome(mode + 'failure')
         # config optional timestamp
         timestamp = self._config.get('timestamp')
         if timestamp is not None:
@@ -147,41 +167,19 @@ class TaniumResultToOscalAR(TaskBase):
             'caching': self._config.getboolean('caching', True),
             'checking': self._config.getboolean('checking', False),
         }
+        streaming = self._config.getboolean('streaming', False)
         # insure output dir exists
         opth.mkdir(exist_ok=True, parents=True)
         # process
-        for ifile in sorted(ipth.iterdir()):
-            blob = self._read_file(ifile)
-            tanium_transformer = TaniumTransformer()
-            tanium_transformer.set_modes(modes)
-            results = tanium_transformer.transform(blob)
-            oname = ifile.stem + '.oscal' + '.json'
-            ofile = opth / oname
-            if not self._overwrite and pathlib.Path(ofile).exists():
-                logger.warning(f'output: {ofile} already exists')
-                return TaskOutcome(mode + 'failure')
-            self._write_file(results, ofile)
-            self._show_analysis(tanium_transformer)
-        return TaskOutcome(mode + 'success')
-
-    def _read_file(self, ifile: str) -> str:
-        """Read raw input file."""
-        if not self._simulate and self._verbose:
-            logger.info(f'input: {ifile}')
-        with open(ifile, 'r', encoding=const.FILE_ENCODING) as fp:
-            blob = fp.read()
-        return blob
-
-    def _write_file(self, result: str, ofile: str) -> None:
-        """Write oscal results file."""
-        if not self._simulate:
-            if self._verbose:
-                logger.info(f'output: {ofile}')
-            result.oscal_write(pathlib.Path(ofile))
-
-    def _show_analysis(self, tanium_transformer: TaniumTransformer) -> None:
-        """Show analysis."""
-        if not self._simulate and self._verbose:
-            analysis = tanium_transformer.analysis
-            for line in analysis:
-                logger.info(line)
+        ifiles = sorted(ipth.iterdir())
+        return transform_task_files(
+            functools.partial(_make_transformer, modes),
+            ifiles,
+            opth,
+            jobs,
+            mode,
+            self._overwrite,
+            self._simulate,
+            self._verbose,
+            streaming,
+        )
@@ -15,14 +15,15 @@
 """OSCAL transformation tasks."""
 
 import configparser
+import functools
 import logging
 import pathlib
 import traceback
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
-from trestle.common import const
 from trestle.tasks.base_task import TaskBase
 from trestle.tasks.base_task import TaskOutcome
+from trestle.tasks.results_transform import transform_task_files
 from trestle.transforms.implementations.xccdf import XccdfTransformer
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,19 @@ default_title = 'XCCDF'
 default_description = 'XCCDF Scan Results'
 
 
+def _make_transformer(
+    title: str, description: str, type_: str, modes: Dict[str, Any], tags: Dict[str, str]
+) -> XccdfTransformer:
+    """Create the transformer for one file, configured as given to the task."""
+    xccdf_transformer = XccdfTransformer()
+    xccdf_transformer.set_title(title)
+    xccdf_transformer.set_description(description)
+    xccdf_transformer.set_type(type_)
+    xccdf_transformer.set_modes(modes)
+    xccdf_transformer.set_tags(tags)
+    return xccdf_transformer
+
+
 class XccdfResultToOscalAR(TaskBase):
     """
     Task to convert Xccdf result to OSCAL json.
@@ -76,6 +90,9 @@ class XccdfResultToOscalAR(TaskBase):
         t1 = f'  output-overwrite       = {opt} '
         t2 = 'true [default] or false; replace existing output when true.'
         logger.info(f'{t1}{t2}')
+        t1 = f'  jobs                   = {opt} '
+        t2 = 'the number of input files to transform in parallel worker processes, default is 1.'
+        logger.info(f'{t1}{t2}')
         t1 = f'  quiet                  = {opt} '
         t2 = 'true or false [default]; display file creations and rules analysis when false.'
         logger.info(f'{t1}{t2}')
@@ -150,6 +167,11 @@ class XccdfResultToOscalAR(TaskBase):
         self._overwrite = self._config.getboolean('output-overwrite', True)
         quiet = self._config.get('quiet', False)
         self._verbose = not self._simulate and not quiet
+        # config optional jobs
+        jobs = self._config.getint('jobs', 1)
+        if jobs < 1:
+            logger.warning('config invalid "jobs"')
+            return TaskOutcome(mode + 'failure')
         # title, description, type
         title = self._config.get('title', default_title)
         description = self._config.get('description', default_description)
@@ -169,25 +191,19 @@ class XccdfResultToOscalAR(TaskBase):
         # insure output dir exists
         opth.mkdir(exist_ok=True, parents=True)
         # process
-        for ifile in sorted(ipth.iterdir()):
-            if ifile.suffix not in ['.json', '.jsn', '.yaml', '.yml', '.xml']:
-                continue
-            blob = self._read_file(ifile)
-            xccdf_transformer = XccdfTransformer()
-            xccdf_transformer.set_title(title)
-            xccdf_transformer.set_description(description)
-            xccdf_transformer.set_type(type_)
-            xccdf_transformer.set_modes(modes)
-            xccdf_transformer.set_tags(tags)
-            results = xccdf_transformer.transform(blob)
-            oname = ifile.stem + '.oscal' + '.json'
-            ofile = opth / oname
-            if not self._overwrite and pathlib.Path(ofile).exists():
-                logger.warning(f'output: {ofile} already exists')
-                return TaskOutcome(mode + 'failure')
-            self._write_file(results, ofile)
-            self._show_analysis(xccdf_transformer)
-        return TaskOutcome(mode + 'success')
+        ifiles = [
+            ifile for ifile in sorted(ipth.iterdir()) if ifile.suffix in ['.json', '.jsn', '.yaml', '.yml', '.xml']
+        ]
+        return transform_task_files(
+            functools.partial(_make_transformer, title, description, type_, modes, tags),
+            ifiles,
+            opth,
+            jobs,
+            mode,
+            self._overwrite,
+            self._simulate,
+            self._verbose,
+        )
 
     def _get_tags(self) -> Dict:
         """Get property name to class tags, if any."""
@@ -202,25 +218,3 @@ class XccdfResultToOscalAR(TaskBase):
                     value = parts[1]
                     tags[name] = value
         return tags
-
-    def _read_file(self, ifile: str) -> str:
-        """Read raw input file."""
-        if not self._simulate and self._verbose:
-            logger.info(f'input: {ifile}')
-        with open(ifile, encoding=const.FILE_ENCODING) as fp:
-            blob = fp.read()
-        return blob
-
-    def _write_file(self, result: str, ofile: str) -> None:
-        """Write oscal results file."""
-        if not self._simulate:
-            if self._verbose:
-                logger.info(f'output: {ofile}')
-            result.oscal_write(pathlib.Path(ofile))
-
-    def _show_analysis(self, xccdf_transformer: XccdfTransformer) -> None:
-        """Show analysis."""
-        if not self._simulate and self._verbose:
-            analysis = xccdf_transformer.analysis
-            for line in analysis:
-                logger.info(line)
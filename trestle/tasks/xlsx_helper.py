@@ -18,11 +18,15 @@
 import logging
 import pathlib
 import string
-from typing import Any, Dict, Iterator, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
+from defusedxml import ElementTree
 from openpyxl import load_workbook
-from openpyxl.cell.cell import MergedCell
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.xml.constants import SHEET_MAIN_NS
 
 from trestle import __version__
 from trestle.common.err import TrestleError
@@ -33,12 +37,73 @@ from trestle.tasks.base_task import TaskBase
 
 logger = logging.getLogger(__name__)
 
+_MERGE_CELL_TAG = f'{{{SHEET_MAIN_NS}}}mergeCell'
+
 
 def get_trestle_version() -> str:
     """Get trestle version wrapper."""
     return __version__
 
 
+def _read_merged_ranges(work_sheet: ReadOnlyWorksheet) -> List[CellRange]:
+    """Read the merged cell ranges of a read-only work sheet, which openpyxl does not load in read-only mode."""
+    merged_ranges = []
+    with work_sheet._get_source() as source:
+        for _, element in ElementTree.iterparse(source):
+            if element.tag == _MERGE_CELL_TAG:
+                merged_ranges.append(CellRange(element.get('ref')))
+            element.clear()
+    return merged_ranges
+
+
+class SheetValues:
+    """
+    Values of the cells of a work sheet, read once into an array of rows.
+
+    A work sheet of a work book loaded read-only is streamed rather than creating an object for every cell, so work
+    books should be loaded read-only, and only the values are kept, each row as a tuple as long as its last cell.
+    """
+
+    def __init__(self, work_sheet: Union[ReadOnlyWorksheet, Worksheet]) -> None:
+        """Initialize from a sheet of a work book, preferably loaded read-only."""
+        self._rows: List[Tuple[Any, ...]] = []
+        if not isinstance(work_sheet, ReadOnlyWorksheet):
+            self._rows = list(work_sheet.iter_rows(values_only=True))
+            self._merged_ranges = list(work_sheet.merged_cells.ranges)
+        else:
+            # the dimensions recorded in the sheet may be stale, so read every row and cell present instead
+            work_sheet.reset_dimensions()
+            # rows without cells are filled in by openpyxl up to the last row, which may be the last row of the sheet,
+            # so keep them only if a row with cells follows, as a fully loaded sheet would
+            empty_rows = 0
+            for values in work_sheet.iter_rows(values_only=True):
+                if not values:
+                    empty_rows += 1
+                    continue
+                self._rows.extend([()] * empty_rows)
+                empty_rows = 0
+                self._rows.append(values)
+            self._merged_ranges = _read_merged_ranges(work_sheet)
+        self.max_row = len(self._rows)
+        self.max_column = max((len(values) for values in self._rows), default=0)
+
+    def value(self, row: int, col: int) -> Any:
+        """Get value for cell, by row and column counted from 1."""
+        if row > self.max_row:
+            return None
+        values = self._rows[row - 1]
+        if col > len(values):
+            return None
+        return values[col - 1]
+
+    def merged_value(self, row: int, col: int) -> Any:
+        """Get value for cell, adjusting for merged cells."""
+        for mc_range in self._merged_ranges:
+            if mc_range.min_row <= row <= mc_range.max_row and mc_range.min_col <= col <= mc_range.max_col:
+                return self.value(mc_range.min_row, mc_range.min_col)
+        return self.value(row, col)
+
+
 class Column:
     """Spread sheet columns."""
 
@@ -210,9 +275,11 @@ class XlsxHelper:
         """Load."""
         self._spread_sheet = spread_sheet
         self._sheet_name = sheet_name
-        self._wb = load_workbook(self._spread_sheet)
-        self._work_sheet = self._wb[self._sheet_name]
-        self._map_name_to_letters = {}
+        wb = load_workbook(self._spread_sheet, read_only=True)
+        try:
+            self._work_sheet = SheetValues(wb[self._sheet_name])
+        finally:
+            wb.close()
         # accumulators
         self.rows_missing_control_id = []
         self.rows_missing_goal_name_id = []
@@ -258,8 +325,8 @@ class XlsxHelper:
         """Return True if row is to be skipped."""
         if self._column.filter_column is None:
             return False
-        col = self._get_column_letter(self._column.filter_column)
-        value = self._work_sheet[col + str(row)].value
+        col = self._get_column(self._column.filter_column)
+        value = self._work_sheet.value(row, col)
         if value is None:
             return False
         if value.lower() != 'yes':
@@ -269,8 +336,8 @@ class XlsxHelper:
 
     def get_goal_name_id(self, row: int, strict: bool = True) -> str:
         """Get goal_name_id from work_sheet."""
-        col = self._get_column_letter(self._column.goal_name_id)
-        value = self._work_sheet[col + str(row)].value
+        col = self._get_column(self._column.goal_name_id)
+        value = self._work_sheet.value(row, col)
         if value is None:
             self._add_row(row, self.rows_missing_goal_name_id)
         else:
@@ -288,8 +355,8 @@ class XlsxHelper:
 
     def get_rule_name_id(self, row: int, strict: bool = False) -> str:
         """Get rule_name_id from work_sheet."""
-        col = self._get_column_letter(self._column.rule_name_id)
-        value = self._work_sheet[col + str(row)].value
+        col = self._get_column(self._column.rule_name_id)
+        value = self._work_sheet.value(row, col)
         if value is None:
             self._add_row(row, self.rows_missing_rule_name_id)
         else:
@@ -307,16 +374,16 @@ class XlsxHelper:
 
     def get_parameter_value_default(self, row: int) -> str:
         """Get parameter_value_default from work_sheet."""
-        col = self._get_column_letter(self._column.rename_values_alternatives)
-        value = self._work_sheet[col + str(row)].value
+        col = self._get_column(self._column.rename_values_alternatives)
+        value = self._work_sheet.value(row, col)
         if value is not None:
             value = str(value).split(',')[0].strip()
         return value
 
     def get_parameter_values(self, row: int) -> str:
         """Get parameter_values from work_sheet."""
-        col = self._get_column_letter(self._column.rename_values_alternatives)
-        value = self._work_sheet[col + str(row)].value
+        col = self._get_column(self._column.rename_values_alternatives)
+        value = self._work_sheet.value(row, col)
         if value is None and self.get_parameter_name(row) is not None:
             self._add_row(row, self.rows_missing_parameters_values)
         # massage into comma separated list of values
@@ -330,8 +397,8 @@ class XlsxHelper:
 
     def _get_goal_text(self, row: int) -> str:
         """Get goal_text from work_sheet."""
-        col = self._get_column_letter(self._column.control_text)
-        goal_text = self._work_sheet[col + str(row)].value
+        col = self._get_column(self._column.control_text)
+        goal_text = self._work_sheet.value(row, col)
         # normalize & tokenize
         value = goal_text.replace('\t', ' ')
         return value
@@ -361,8 +428,8 @@ class XlsxHelper:
         Example: {'au-2': ['(a)', '(d)'], 'au-12': [], 'si-4': ['(a)', '(b)', '(c)']}
         """
         value = {}
-        for col in self._get_column_letter(self._column.nist_mappings):
-            control = self._work_sheet[col + str(row)].value
+        for col in self._get_column(self._column.nist_mappings):
+            control = self._work_sheet.value(row, col)
             if control is None:
                 continue
             # remove blanks
@@ -386,10 +453,10 @@ class XlsxHelper:
 
     def get_component_name(self, row: int) -> str:
         """Get component_name from work_sheet."""
-        col = self._get_column_letter(self._column.resource_title)
-        value = self._work_sheet[col + str(row)].value
+        col = self._get_column(self._column.resource_title)
+        value = self._work_sheet.value(row, col)
         if value is None:
-            raise RuntimeError(f'row {row} col {col} missing component name')
+            raise RuntimeError(f'row {row} col {get_column_letter(col)} missing component name')
         return value.strip()
 
     def get_parameter_name(self, row: int) -> Tuple[str, str]:
@@ -400,8 +467,8 @@ class XlsxHelper:
         """Get parameter_name and description from work_sheet."""
         name = None
         description = None
-        col = self._get_column_letter(self._column.rename_parameter_opt_parm)
-        combined_values = self._work_sheet[col + str(row)].value
+        col = self._get_column(self._column.rename_parameter_opt_parm)
+        combined_values = self._work_sheet.value(row, col)
         if combined_values is not None:
             if '\n' in combined_values:
                 parameter_parts = combined_values.split('\n')
@@ -417,7 +484,7 @@ class XlsxHelper:
                 if name != sname:
                     self._add_row(row, self.rows_invalid_parameter_name)
             else:
-                logger.info(f'row {row} col {col} invalid value')
+                logger.info(f'row {row} col {get_column_letter(col)} invalid value')
         if name is None and self.get_parameter_value_default(row) is not None:
             self._add_row(row, self.rows_missing_parameters)
         value = name, description
@@ -425,23 +492,23 @@ class XlsxHelper:
 
     def _get_control_id(self, row: int) -> int:
         """Get control_id from work_sheet."""
-        col = self._get_column_letter(self._column.control_id)
-        value = self._work_sheet[col + str(row)].value
+        col = self._get_column(self._column.control_id)
+        value = self._work_sheet.value(row, col)
         return value
 
-    def _get_column_letter(self, name: str) -> str:
-        """Get column letter."""
-        value = self.map_name_to_letters[name]
+    def _get_column(self, name: str) -> Union[int, List[int]]:
+        """Get column number, or numbers if the name has several columns."""
+        value = self._map_name_to_columns[name]
         if len(value) == 1:
             value = value[0]
         return value
 
     def _map_columns(self) -> None:
         """Map columns."""
-        self.map_name_to_letters = {}
+        self._map_name_to_columns: Dict[str, List[int]] = {}
         columns = self._work_sheet.max_column
         for column in range(1, columns + 1):
-            cell_value = self._cell_value(1, column)
+            cell_value = self._work_sheet.merged_value(1, column)
             if cell_value is None:
                 continue
             cell_tokens = cell_value.split()
@@ -485,28 +552,16 @@ class XlsxHelper:
             self._column.rename_parameter_opt_parm,
             self._column.rename_values_alternatives,
         ]:
-            if name not in self.map_name_to_letters.keys():
+            if name not in self._map_name_to_columns.keys():
                 raise RuntimeError(f'missing column {name}')
 
     def _add_column(self, name: str, column: int, limit: int) -> None:
         """Add column."""
-        if name not in self.map_name_to_letters:
-            self.map_name_to_letters[name] = []
-        if limit > 0 and len(self.map_name_to_letters[name]) == limit:
+        if name not in self._map_name_to_columns:
+            self._map_name_to_columns[name] = []
+        if limit > 0 and len(self._map_name_to_columns[name]) == limit:
             raise RuntimeError(f'duplicate column {name} {get_column_letter(column)}')
-        self.map_name_to_letters[name].append(get_column_letter(column))
-
-    def _cell_value(self, row: int, col: int) -> Any:
-        """Get value for cell, adjusting for merged cells."""
-        cell = self._work_sheet.cell(row, col)
-        retval = cell.value
-        if isinstance(cell, MergedCell):
-            # cell is merged
-            for mc_range in self._work_sheet.merged_cells.ranges:
-                coord = get_column_letter(col) + str(row)
-                if coord in mc_range:
-                    retval = mc_range.start_cell.value
-        return retval
+        self._map_name_to_columns[name].append(column)
 
     def _normalize_control(self, control: str) -> Tuple[str, List[str]]:
         """Remove parenthesized characters from controls."""
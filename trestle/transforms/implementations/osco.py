@@ -21,9 +21,6 @@ import json
 import logging
 import uuid
 from typing import Any, Dict, Iterator, List, Tuple, ValuesView
-from xml.etree.ElementTree import Element  # noqa: S405 - used for typing only
-
-from defusedxml import ElementTree
 
 from ruamel.yaml import YAML
 
@@ -42,6 +39,7 @@ from trestle.oscal.profile import Profile
 from trestle.transforms.results import Results
 from trestle.transforms.transformer_factory import FromOscalTransformer, ResultsTransformer
 from trestle.transforms.transformer_helper import TransformerHelper
+from trestle.transforms.xccdf_parser import iter_rule_results
 
 logger = logging.getLogger(__name__)
 
@@ -184,151 +182,10 @@ class _ComplianceOperatorResult:
         """Initialize given specified args."""
         self.osco_xml = osco_xml
 
-    def _get_version(self, root: Element) -> str:
-        """Extract version from the XML."""
-        value = None
-        for key, val in root.attrib.items():
-            if key == 'version':
-                value = val
-                break
-        return value
-
-    def _get_id(self, root: Element) -> str:
-        """Extract id from the XML."""
-        value = None
-        for key, val in root.attrib.items():
-            if key == 'id':
-                value = val
-                break
-        return value
-
-    def _get_target(self, root: Element) -> str:
-        """Extract target from the XML."""
-        value = None
-        for lev1 in root:
-            tag = _remove_namespace(lev1.tag)
-            if tag == 'target':
-                value = root.find(lev1.tag).text
-                break
-        return value
-
-    def _get_target_type(self, root: Element) -> str:
-        """Extract target_type from the XML."""
-        value = None
-        benchmark_href = self._get_benchmark_href(root)
-        if benchmark_href is not None and '-' in benchmark_href:
-            value = benchmark_href.split('-')[1]
-        return value
-
-    def _get_benchmark(self, root: Element, kw) -> str:
-        """Extract benchmark from the XML."""
-        value = None
-        for lev1 in root:
-            tag = _remove_namespace(lev1.tag)
-            if tag == 'benchmark':
-                value = lev1.get(kw)
-                break
-        return value
-
-    def _get_benchmark_href(self, root: Element) -> str:
-        """Extract benchmark.href from the XML."""
-        return self._get_benchmark(root, 'href')
-
-    def _get_benchmark_id(self, root: Element) -> str:
-        """Extract benchmark.id from the XML."""
-        return self._get_benchmark(root, 'id')
-
-    def _get_fact(self, lev1: Element, kw: str) -> str:
-        """Extract fact from the XML."""
-        value = None
-        for lev2 in lev1:
-            tag = _remove_namespace(lev2.tag)
-            if tag == 'fact':
-                name = lev2.get('name')
-                if name == kw:
-                    value = lev2.text
-                    break
-        return value
-
-    def _get_scanner_name(self, root: Element) -> str:
-        """Extract scanner:name from the XML."""
-        value = None
-        for lev1 in root:
-            tag = _remove_namespace(lev1.tag)
-            if tag == 'target-facts':
-                value = self._get_fact(lev1, 'urn:xccdf:fact:scanner:name')
-                break
-        return value
-
-    def _get_scanner_version(self, root: Element) -> str:
-        """Extract scanner:version from the XML."""
-        value = None
-        for lev1 in root:
-            tag = _remove_namespace(lev1.tag)
-            if tag == 'target-facts':
-                value = self._get_fact(lev1, 'urn:xccdf:fact:scanner:version')
-                break
-        return value
-
-    def _get_host_name(self, root: Element) -> str:
-        """Extract asset:identifier:host_name from the XML."""
-        value = None
-        for lev1 in root:
-            tag = _remove_namespace(lev1.tag)
-            if tag == 'target-facts':
-                value = self._get_fact(lev1, 'urn:xccdf:fact:asset:identifier:host_name')
-                break
-        return value
-
-    def _get_result(self, lev1: Element) -> str:
-        """Extract result from the XML."""
-        value = None
-        for lev2 in lev1:
-            tag = _remove_namespace(lev2.tag)
-            if tag == 'result':
-                value = lev1.find(lev2.tag).text
-                break
-        return value
-
     def _parse_xml(self) -> Iterator[RuleUse]:
-        """Parse the stringified XML."""
-        results = self.osco_xml
-        root = ElementTree.fromstring(results, forbid_dtd=True)
-        version = self._get_version(root)
-        id_ = self._get_id(root)
-        target = self._get_target(root)
-        target_type = self._get_target_type(root)
-        host_name = self._get_host_name(root)
-        benchmark_href = self._get_benchmark_href(root)
-        benchmark_id = self._get_benchmark_id(root)
-        scanner_name = self._get_scanner_name(root)
-        scanner_version = self._get_scanner_version(root)
-        for lev1 in root:
-            tag = _remove_namespace(lev1.tag)
-            if tag == 'rule-result':
-                idref = lev1.get('idref')
-                time = lev1.get('time')
-                severity = lev1.get('severity')
-                weight = lev1.get('weight')
-                result = self._get_result(lev1)
-                args = {
-                    'id_': id_,
-                    'target': target,
-                    'target_type': target_type,
-                    'host_name': host_name,
-                    'benchmark_href': benchmark_href,
-                    'benchmark_id': benchmark_id,
-                    'scanner_name': scanner_name,
-                    'scanner_version': scanner_version,
-                    'idref': idref,
-                    'version': version,
-                    'time': time,
-                    'result': result,
-                    'severity': severity,
-                    'weight': weight,
-                }
-                rule_use = RuleUse(args)
-                yield rule_use
+        """Parse the stringified XML in a single streaming pass."""
+        for args in iter_rule_results(self.osco_xml, find_test_result=False):
+            yield RuleUse(args)
 
     def rule_use_generator(self) -> Iterator[RuleUse]:
         """Generate RuleUses by way of parsing the embedded XML."""
@@ -574,11 +431,6 @@ class _OscalResultsFactory:
         self._process(co_result)
 
 
-def _remove_namespace(subject: str) -> str:
-    """If a namespace is present in the subject string, remove it."""
-    return subject.rsplit('}').pop()
-
-
 class OscalProfileToOscoProfileTransformer(FromOscalTransformer):
     """Interface for Oscal Profile to Osco Profile transformer."""
 
@@ -15,16 +15,23 @@
 """Facilitate Tanium result to NIST OSCAL transformation."""
 
 # mypy: ignore-errors  # noqa E800
+import collections
 import datetime
+import itertools
 import json
 import logging
-import multiprocessing
 import os
+import pathlib
+import struct
+import tempfile
 import traceback
 import uuid
-from typing import Any, Dict, List, Optional, ValuesView
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, ValuesView
 
-from trestle.common.list_utils import join_key_to_list_dicts
+import orjson
+
+from trestle.common import const
 from trestle.oscal.assessment_results import LocalDefinitions1
 from trestle.oscal.assessment_results import Observation
 from trestle.oscal.assessment_results import Result
@@ -96,12 +103,28 @@ class TaniumResultToOscalARTransformer(ResultsTransformer):
     def transform(self, blob: str) -> Results:
         """Transform the blob into a Results."""
         ts0 = datetime.datetime.now()
-        results = Results()
         ru_factory = RuleUseFactory(self.get_timestamp())
         ru_list = ru_factory.make_list(blob)
-        tanium_oscal_factory = TaniumOscalFactory(
+        return self._transform(ru_list, ts0)
+
+    def transform_file(self, path: pathlib.Path, ofile: Optional[pathlib.Path] = None) -> None:
+        """
+        Transform the file of tanium json into results written to the output file if given, streaming both.
+
+        The file is parsed incrementally, so neither its content nor the full RuleUse list is held in memory.  The
+        observations are built in batches of blocksize and spilled to a temporary file, from which they are read back
+        as the results are written, so peak memory does not depend on the number of RuleUses.
+        """
+        ts0 = datetime.datetime.now()
+        tanium_oscal_factory = self._make_factory(RuleUseStream(path, self.get_timestamp()))
+        tanium_oscal_factory.write_results(ofile)
+        self._set_analysis(tanium_oscal_factory, ts0)
+
+    def _make_factory(self, rule_uses: Iterable['RuleUse']) -> 'TaniumOscalFactory':
+        """Make the factory of the OSCAL entities for the RuleUses, configured by the modes."""
+        return TaniumOscalFactory(
             self.get_timestamp(),
-            ru_list,
+            rule_uses,
             self.blocksize,
             self.cpus_max,
             self.cpus_min,
@@ -109,10 +132,19 @@ class TaniumResultToOscalARTransformer(ResultsTransformer):
             self.caching,
             self.aggregate,
         )
-        results.__root__ = tanium_oscal_factory.results
+
+    def _set_analysis(self, tanium_oscal_factory: 'TaniumOscalFactory', ts0: datetime.datetime) -> None:
+        """Keep the analysis of the factory with the time taken."""
         ts1 = datetime.datetime.now()
         self._analysis = tanium_oscal_factory.analysis
         self._analysis.append(f'transform time: {ts1 - ts0}')
+
+    def _transform(self, rule_uses: Iterable['RuleUse'], ts0: datetime.datetime) -> Results:
+        """Transform the RuleUses into a Results."""
+        results = Results()
+        tanium_oscal_factory = self._make_factory(rule_uses)
+        results.__root__ = tanium_oscal_factory.results
+        self._set_analysis(tanium_oscal_factory, ts0)
         return results
 
 
@@ -191,10 +223,8 @@ class RuleUseFactory:
             retval.append(rule_use)
         return retval
 
-    def make_list(self, blob: str) -> List[RuleUse]:
-        """Build RuleUse list from input data."""
-        retval = []
-        lines = blob.splitlines()
+    def iter_rule_uses(self, lines: Iterable[str]) -> Iterator[RuleUse]:
+        """Build RuleUses from input data, one line at a time."""
         for line in lines:
             line = line.strip()
             if line:
@@ -203,16 +233,91 @@ class RuleUseFactory:
                     for item in jdata:
                         if debuggable:
                             logger.debug(f'item: {item}')
-                        retval += self._make_sublist(item)
+                        yield from self._make_sublist(item)
                 else:
                     if debuggable:
                         logger.debug(f'jdata: {jdata}')
-                    retval += self._make_sublist(jdata)
+                    yield from self._make_sublist(jdata)
+
+    def iter_file_rule_uses(self, fp: IO[str]) -> Iterator[RuleUse]:
+        """Build RuleUses from input data read incrementally from the stream, one row at a time."""
+        for row in _iter_json_rows(fp):
+            yield from self._make_sublist(row)
+
+    def make_list(self, blob: str) -> List[RuleUse]:
+        """Build RuleUse list from input data."""
+        retval = list(self.iter_rule_uses(blob.splitlines()))
         if debuggable:
             logger.debug(f'ru_list: {len(retval)}')
         return retval
 
 
+def _iter_json_rows(fp: IO[str], chunk_size: int = 1 << 16) -> Iterator[Dict[str, Any]]:
+    """
+    Parse the rows of tanium data from the stream incrementally, holding only the text of about one row at a time.
+
+    The stream holds json values one after another, such as one per line, each being a row or a list of rows, so a
+    whole export as one json list is parsed a row at a time too.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    in_list = False
+    eof = False
+    while True:
+        pos = json.decoder.WHITESPACE.match(buffer, pos).end()
+        if pos == len(buffer):
+            if eof:
+                if in_list:
+                    raise json.JSONDecodeError('Unterminated list of rows', buffer, pos)
+                return
+            buffer = fp.read(chunk_size)
+            pos = 0
+            eof = not buffer
+            continue
+        char = buffer[pos]
+        if in_list and char in ',]':
+            in_list = char == ','
+            pos += 1
+            continue
+        if char == '[':
+            in_list = True
+            pos += 1
+            continue
+        try:
+            row, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            # the row continues beyond the buffer, so read at least as much again to parse it in few attempts
+            more = fp.read(max(chunk_size, len(buffer) - pos))
+            buffer = buffer[pos:] + more
+            pos = 0
+            eof = not more
+            continue
+        if debuggable:
+            logger.debug(f'row: {row}')
+        yield row
+
+
+class RuleUseStream:
+    """
+    RuleUses read from a file of tanium json, afresh each time they are iterated.
+
+    Only about one row of the file and the RuleUses made from it are held in memory at a time.
+    """
+
+    def __init__(self, path: pathlib.Path, timestamp: str) -> None:
+        """Initialize given specified args."""
+        self._path = path
+        self._rule_use_factory = RuleUseFactory(timestamp)
+
+    def __iter__(self) -> Iterator[RuleUse]:
+        """Read the RuleUses from the file."""
+        with open(self._path, 'r', encoding=const.FILE_ENCODING) as fp:
+            yield from self._rule_use_factory.iter_file_rule_uses(fp)
+
+
 def _uuid() -> str:
     """Create uuid."""
     return str(uuid.uuid4())
@@ -238,13 +343,164 @@ def _uuid_result() -> str:
     return _uuid()
 
 
+def _observation_property_values(rule_use: RuleUse) -> List[Tuple[str, str, Optional[str]]]:
+    """Get the name, value and class of each observation property of the rule use."""
+    return [
+        ('Check_ID', rule_use.check_id, None),
+        ('Check_ID_Benchmark', rule_use.check_id_benchmark, 'scc_predefined_profile'),
+        ('Check_ID_Version', rule_use.check_id_version, 'scc_predefined_profile_version'),
+        ('Check_ID_Level', rule_use.check_id_level, None),
+        ('Rule_ID', rule_use.rule_id, 'scc_goal_description'),
+        ('Rule_ID', rule_use.rule_id, 'scc_check_name_id'),
+        ('State', rule_use.state, 'scc_result'),
+        ('Timestamp', rule_use.timestamp, 'scc_timestamp'),
+    ]
+
+
+class _ObservationBatch(NamedTuple):
+    """Observations built from a chunk of the RuleUse list, with the property cache accounting of building them."""
+
+    observations: List[Observation]
+    requests: int
+    hits: int
+
+
+class _ObservationBuilder:
+    """
+    Build observations from RuleUses.
+
+    The builder holds only the lookups needed to build observations, so it can be sent once to each worker process
+    and then be given just the RuleUses of each chunk.
+    """
+
+    def __init__(
+        self,
+        ns: str,
+        component_refs: Dict[Tuple[str, str], str],
+        inventory_refs: Dict[str, str],
+        common_properties: Set[Tuple[str, str, str, Optional[str]]],
+        property_manager: PropertyManager,
+    ) -> None:
+        """Initialize given specified args."""
+        self._ns = ns
+        self._component_refs = component_refs
+        self._inventory_refs = inventory_refs
+        self._common_properties = common_properties
+        self._property_manager = property_manager
+
+    def build(self, rule_uses: List[RuleUse]) -> _ObservationBatch:
+        """Build the observation of each RuleUse, in order."""
+        requests = self._property_manager.requests
+        hits = self._property_manager.hits
+        observations = []
+        for rule_use in rule_uses:
+            observation = Observation(
+                uuid=_uuid_observation(),
+                description=rule_use.rule_id,
+                methods=['TEST-AUTOMATED'],
+                collected=rule_use.collected,
+            )
+            subject_uuid = self._inventory_refs[rule_use.tanium_client_ip_address]
+            observation.subjects = [SubjectReference(subject_uuid=subject_uuid, type='inventory-item')]
+            # properties common to the component are aggregated in its result instead
+            group = self._component_refs.get((rule_use.component_type, rule_use.component))
+            observation.props = [
+                self._property_manager.materialize(name=name, value=value, ns=self._ns, class_=class_)
+                for name, value, class_ in _observation_property_values(rule_use)
+                if (group, name, value, class_) not in self._common_properties
+            ]
+            observations.append(observation)
+        return _ObservationBatch(
+            observations, self._property_manager.requests - requests, self._property_manager.hits - hits
+        )
+
+
+# the observation builder of a worker process, sent once when the process starts
+_worker_builder: Optional[_ObservationBuilder] = None
+
+
+def _init_observation_worker(builder: _ObservationBuilder) -> None:
+    """Keep the observation builder in the worker process."""
+    global _worker_builder
+    _worker_builder = builder
+
+
+def _build_observations(rule_uses: List[RuleUse]) -> _ObservationBatch:
+    """Build the observations of a chunk of RuleUses in the worker process."""
+    return _worker_builder.build(rule_uses)
+
+
+def _map_bounded(executor: Executor, fn: Callable[[Any], Any], iterable: Iterable[Any], window: int) -> Iterator[Any]:
+    """Map the function over the iterable in the executor, in order, consuming the iterable only window ahead."""
+    futures = collections.deque()
+    for item in iterable:
+        if len(futures) >= window:
+            yield futures.popleft().result()
+        futures.append(executor.submit(fn, item))
+    while futures:
+        yield futures.popleft().result()
+
+
+class _ObservationSpill:
+    """
+    Observations spilled to a temporary file as they are built, to be read back a subject at a time.
+
+    The observations of each batch are written as a segment per subject, linked from the previous segment of the
+    subject, so only the offsets of the first and last segment of each subject are held in memory.
+    """
+
+    # the offset of the next segment of the subject, 0 if none since no segment follows at 0, and the payload length
+    _header = struct.Struct('<QQ')
+    _link = struct.Struct('<Q')
+
+    def __init__(self, fp: IO[bytes]) -> None:
+        """Initialize given specified args."""
+        self._fp = fp
+        self._first: Dict[str, int] = {}
+        self._last: Dict[str, int] = {}
+
+    def write(self, observations: List[Observation]) -> None:
+        """Write the batch of observations, as one line of json each, grouped by subject."""
+        segments: Dict[str, List[bytes]] = {}
+        for observation in observations:
+            json_bytes = observation.oscal_serialize_json_bytes(wrapped=False)
+            segments.setdefault(observation.subjects[0].subject_uuid, []).append(json_bytes)
+        links = []
+        self._fp.seek(0, os.SEEK_END)
+        for subject, lines in segments.items():
+            payload = b'\n'.join(lines)
+            offset = self._fp.tell()
+            self._fp.write(self._header.pack(0, len(payload)))
+            self._fp.write(payload)
+            if subject in self._last:
+                links.append((self._last[subject], offset))
+            else:
+                self._first[subject] = offset
+            self._last[subject] = offset
+        for at, offset in links:
+            self._fp.seek(at)
+            self._fp.write(self._link.pack(offset))
+
+    def read(self, subjects: List[str]) -> Iterator[Dict[str, Any]]:
+        """Read back the observations of the subjects in order, holding one segment at a time."""
+        for subject in subjects:
+            offset = self._first.get(subject)
+            while offset is not None:
+                self._fp.seek(offset)
+                next_offset, length = self._header.unpack(self._fp.read(self._header.size))
+                payload = self._fp.read(length)
+                for line in payload.split(b'\n'):
+                    yield orjson.loads(line)
+                offset = next_offset or None
+
+
 class TaniumOscalFactory:
     """Build Tanium OSCAL entities."""
 
     def __init__(
         self,
         timestamp: str,
-        rule_use_list: List[RuleUse],
+        rule_use_list: Iterable[RuleUse],
         blocksize: int = 11000,
         cpus_max: int = 1,
         cpus_min: int = 1,
@@ -256,8 +512,15 @@ class TaniumOscalFactory:
         self._rule_use_list = rule_use_list
         self._timestamp = timestamp
         self._component_map: Dict[str, SystemComponent] = {}
+        self._component_refs: Dict[Tuple[str, str], str] = {}
         self._inventory_map: Dict[str, InventoryItem] = {}
-        self._observation_list: List[Observation] = []
+        self._observation_map: Dict[str, List[Observation]] = {}
+        self._observation_count = 0
+        self._observation_spill: Optional[_ObservationSpill] = None
+        self._rule_use_count = 0
+        self._common_properties: Set[Tuple[str, str, str, Optional[str]]] = set()
+        self._worker_requests = 0
+        self._worker_hits = 0
         self._ns = 'https://oscal-compass.github.io/compliance-trestle/schemas/oscal/ar/tanium'
         self._cpus = None
         self._checking = checking
@@ -280,28 +543,41 @@ class TaniumOscalFactory:
         self._property_accounting = PropertyAccounting()
         self._property_manager = PropertyManager(caching=caching, checking=checking)
 
-    def _is_duplicate_component(self, rule_use: RuleUse) -> bool:
-        """Check for duplicate component."""
-        retval = False
-        component_type = rule_use.component_type
-        component_title = rule_use.component
-        for component in self._component_map.values():
-            if component.type != component_type:
-                continue
-            if component.title != component_title:
-                continue
-            retval = True
-            break
-        return retval
+    def _derive_local_definitions(self) -> None:
+        """
+        Derive the components, inventory and common properties from the RuleUse list in one pass over it.
+
+        Only the first RuleUse of each component and of each inventory item, and the property accounting of each
+        component, are kept during the pass.  The uuids are created after it, components first, as when each was
+        derived in a pass of its own.
+        """
+        component_rule_uses: Dict[Tuple[str, str], RuleUse] = {}
+        inventory_rule_uses: Dict[str, RuleUse] = {}
+        count = 0
+        for rule_use in self._rule_use_list:
+            count += 1
+            component_key = (rule_use.component_type, rule_use.component)
+            component_rule_uses.setdefault(component_key, rule_use)
+            inventory_rule_uses.setdefault(rule_use.tanium_client_ip_address, rule_use)
+            if self._aggregate:
+                # the component uuids are not known yet, so the accounting is by the component key instead
+                group = str(component_key)
+                self._property_accounting.count_group(group=group)
+                for name, value, class_ in _observation_property_values(rule_use):
+                    self._property_accounting.count_property(
+                        group=group, name=name, value=value, ns=self._ns, class_=class_
+                    )
+        self._rule_use_count = count
+        self._derive_components(component_rule_uses)
+        self._derive_inventory(inventory_rule_uses)
+        if self._aggregate:
+            self._derive_common_properties(component_rule_uses)
 
-    def _derive_components(self) -> None:
-        """Derive components from RuleUse list."""
+    def _derive_components(self, component_rule_uses: Dict[Tuple[str, str], RuleUse]) -> None:
+        """Derive components from the first RuleUse of each."""
         self._component_map: Dict[str, SystemComponent] = {}
-        for rule_use in self._rule_use_list:
-            if self._is_duplicate_component(rule_use):
-                continue
-            component_type = rule_use.component_type
-            component_title = rule_use.component
+        self._component_refs: Dict[Tuple[str, str], str] = {}
+        for (component_type, component_title), rule_use in component_rule_uses.items():
             # See Note in _get_component_ref.
             component_description = rule_use.component
             component_ref = _uuid_component()
@@ -314,27 +590,18 @@ class TaniumOscalFactory:
                 status=status,
             )
             self._component_map[component_ref] = component
+            self._component_refs[(component_type, component_title)] = component_ref
 
     def _get_component_ref(self, rule_use: RuleUse) -> Optional[str]:
         """Get component reference for specified rule use."""
-        uuid = None
-        for component_ref, component in self._component_map.items():
-            if component.type != rule_use.component_type:
-                continue
-            if component.title != rule_use.component:
-                continue
-            # Note: currently title and description are the same,
-            # therefore checking description is not necessary.
-            uuid = component_ref
-            break
-        return uuid
-
-    def _derive_inventory(self) -> None:
-        """Derive inventory from RuleUse list."""
+        # Note: currently title and description are the same,
+        # therefore checking description is not necessary.
+        return self._component_refs.get((rule_use.component_type, rule_use.component))
+
+    def _derive_inventory(self, inventory_rule_uses: Dict[str, RuleUse]) -> None:
+        """Derive inventory from the first RuleUse of each item."""
         self._inventory_map: Dict[str, InventoryItem] = {}
-        for rule_use in self._rule_use_list:
-            if rule_use.tanium_client_ip_address in self._inventory_map:
-                continue
+        for tanium_client_ip_address, rule_use in inventory_rule_uses.items():
             inventory = InventoryItem(uuid=_uuid_inventory(), description='inventory')
             inventory.props = [
                 self._property_manager.materialize(name='Computer_Name', value=rule_use.computer_name, ns=self._ns),
@@ -350,136 +617,31 @@ class TaniumOscalFactory:
             component_uuid = self._get_component_ref(rule_use)
             if component_uuid is not None:
                 inventory.implemented_components = [ImplementedComponent(component_uuid=component_uuid)]
-            self._inventory_map[rule_use.tanium_client_ip_address] = inventory
+            self._inventory_map[tanium_client_ip_address] = inventory
 
     def _get_inventory_ref(self, rule_use: RuleUse) -> str:
         """Get inventory reference for specified rule use."""
         return self._inventory_map[rule_use.tanium_client_ip_address].uuid
 
-    def _conditional_include(
-        self,
-        props: List[Property],
-        group: str = None,
-        name: str = None,
-        value: str = None,
-        ns: str = None,
-        class_: str = None,
-    ) -> None:
-        """Add non-aggregated property or remember common property."""
-        if self._aggregate:
-            if self._property_accounting.is_common_property(group=group, name=name, value=value, ns=ns, class_=class_):
-                # common property
-                self._property_manager.put_common_property(group=group, name=name, value=value, ns=ns, class_=class_)
-                return
-        # non-aggregated property
-        props.append(self._property_manager.materialize(name=name, value=value, ns=ns, class_=class_))
-
-    def _get_observtion_properties(self, rule_use: RuleUse) -> List[Property]:
-        """Get observation properties."""
-        props = []
-        group = self._get_component_ref(rule_use)
-        self._conditional_include(props=props, group=group, name='Check_ID', value=rule_use.check_id, ns=self._ns)
-        self._conditional_include(
-            props=props,
-            group=group,
-            name='Check_ID_Benchmark',
-            value=rule_use.check_id_benchmark,
-            ns=self._ns,
-            class_='scc_predefined_profile',
-        )
-        self._conditional_include(
-            props=props,
-            group=group,
-            name='Check_ID_Version',
-            value=rule_use.check_id_version,
-            ns=self._ns,
-            class_='scc_predefined_profile_version',
-        )
-        self._conditional_include(
-            props=props, group=group, name='Check_ID_Level', value=rule_use.check_id_level, ns=self._ns
-        )
-        self._conditional_include(
-            props=props, group=group, name='Rule_ID', value=rule_use.rule_id, ns=self._ns, class_='scc_goal_description'
-        )
-        self._conditional_include(
-            props=props, group=group, name='Rule_ID', value=rule_use.rule_id, ns=self._ns, class_='scc_check_name_id'
-        )
-        self._conditional_include(
-            props=props, group=group, name='State', value=rule_use.state, ns=self._ns, class_='scc_result'
-        )
-        self._conditional_include(
-            props=props, group=group, name='Timestamp', value=rule_use.timestamp, ns=self._ns, class_='scc_timestamp'
-        )
-        return props
-
-    def _derive_common_property_accounting(self) -> None:
-        """Derive common properties accounting from RuleUse list."""
-        for rule_use in self._rule_use_list:
-            group = self._get_component_ref(rule_use)
-            self._property_accounting.count_group(group=group)
-            self._property_accounting.count_property(group=group, name='Check_ID', value=rule_use.check_id, ns=self._ns)
-            self._property_accounting.count_property(
-                group=group,
-                name='Check_ID_Benchmark',
-                value=rule_use.check_id_benchmark,
-                ns=self._ns,
-                class_='scc_predefined_profile',
-            )
-            self._property_accounting.count_property(
-                group=group,
-                name='Check_ID_Version',
-                value=rule_use.check_id_version,
-                ns=self._ns,
-                class_='scc_predefined_profile_version',
-            )
-            self._property_accounting.count_property(
-                group=group, name='Check_ID_Level', value=rule_use.check_id_level, ns=self._ns
-            )
-            self._property_accounting.count_property(
-                group=group, name='Rule_ID', value=rule_use.rule_id, ns=self._ns, class_='scc_goal_description'
-            )
-            self._property_accounting.count_property(
-                group=group, name='Rule_ID', value=rule_use.rule_id, ns=self._ns, class_='scc_check_name_id'
-            )
-            self._property_accounting.count_property(
-                group=group, name='State', value=rule_use.state, ns=self._ns, class_='scc_result'
-            )
-            self._property_accounting.count_property(
-                group=group, name='Timestamp', value=rule_use.timestamp, ns=self._ns, class_='scc_timestamp'
-            )
-
-    # parallel process to process one chuck of entire data set
-    def _batch_observations(self, index: int) -> Dict[str, List[Observation]]:
-        """Derive batch of observations from RuleUse list."""
-        observation_partial_map: Dict[str, List[Observation]] = {}
-        # determine which chunk to process
-        batch_size = (len(self._rule_use_list) // self._batch_workers) + 1
-        start = index * batch_size
-        end = (index + 1) * batch_size
-        end = min(end, len(self._rule_use_list))
-        if debuggable:
-            logger.debug(f'start: {start} end: {end - 1}')
-        # process just the one chunk
-        for i in range(start, end):
-            rule_use = self._rule_use_list[i]
-            observation = Observation(
-                uuid=_uuid_observation(),
-                description=rule_use.rule_id,
-                methods=['TEST-AUTOMATED'],
-                collected=rule_use.collected,
-            )
-            subject_uuid = self._get_inventory_ref(rule_use)
-            subject_reference = SubjectReference(subject_uuid=subject_uuid, type='inventory-item')
-            observation.subjects = [subject_reference]
-            observation.props = self._get_observtion_properties(rule_use)
-            observation_partial_map[subject_uuid] = observation_partial_map.get(subject_uuid, []) + [observation]
-        return observation_partial_map
+    def _derive_common_properties(self, component_rule_uses: Dict[Tuple[str, str], RuleUse]) -> None:
+        """Derive the properties common to all RuleUses of each component from the accounting."""
+        # a common property is a property of every RuleUse of the group, so the first RuleUse has them all
+        for component_key, rule_use in component_rule_uses.items():
+            group = self._component_refs[component_key]
+            for name, value, class_ in _observation_property_values(rule_use):
+                if self._property_accounting.is_common_property(
+                    group=str(component_key), name=name, value=value, ns=self._ns, class_=class_
+                ):
+                    self._property_manager.put_common_property(
+                        group=group, name=name, value=value, ns=self._ns, class_=class_
+                    )
+                    self._common_properties.add((group, name, value, class_))
 
     @property
     def _batch_workers(self) -> int:
         """Calculate number of parallel processes to employ."""
         if self._cpus is None:
-            cpus_estimate = len(self._rule_use_list) // self._blocksize
+            cpus_estimate = self._rule_use_count // self._blocksize
             self._cpus = max(min(cpus_estimate, self._cpus_max), self._cpus_min)
             if debuggable:
                 logger.debug(f'CPUs estimate: {cpus_estimate} available: {os.cpu_count()} selection: {self._cpus}')
@@ -487,17 +649,48 @@ class TaniumOscalFactory:
 
     def _derive_observations(self) -> None:
         """Derive observations from RuleUse list."""
+        builder = _ObservationBuilder(
+            self._ns,
+            self._component_refs,
+            {ip_address: inventory.uuid for ip_address, inventory in self._inventory_map.items()},
+            self._common_properties,
+            self._property_manager,
+        )
         self._observation_map = {}
+        self._observation_count = 0
         if self._batch_workers == 1:
             # no need for multiprocessing
-            self._observation_map = self._batch_observations(0)
+            for chunk in self._rule_use_chunks():
+                self._gather_observations(builder.build(chunk))
         else:
-            # use multiprocessing to perform observations creation in parallel
-            pool = multiprocessing.Pool(processes=self._batch_workers)
-            rval_list = pool.map(self._batch_observations, range(self._batch_workers))
-            # gather observations from the sundry batch workers
-            for partial_observation_map in rval_list:
-                self._observation_map = join_key_to_list_dicts(self._observation_map, partial_observation_map)
+            # use multiprocessing to perform observations creation in parallel, sending each worker only the
+            # builder once and then just the RuleUses of each chunk, with a bounded number of chunks in flight
+            with ProcessPoolExecutor(
+                max_workers=self._batch_workers, initializer=_init_observation_worker, initargs=(builder,)
+            ) as executor:
+                window = 2 * self._batch_workers
+                for batch in _map_bounded(executor, _build_observations, self._rule_use_chunks(), window):
+                    self._gather_observations(batch)
+                    # the cache of each worker is its own
+                    self._worker_requests += batch.requests
+                    self._worker_hits += batch.hits
+
+    def _rule_use_chunks(self) -> Iterator[List[RuleUse]]:
+        """Split the RuleUses into chunks of blocksize, taking each from the RuleUse list only when it is needed."""
+        rule_uses = iter(self._rule_use_list)
+        chunk = list(itertools.islice(rule_uses, self._blocksize))
+        while chunk:
+            yield chunk
+            chunk = list(itertools.islice(rule_uses, self._blocksize))
+
+    def _gather_observations(self, batch: _ObservationBatch) -> None:
+        """Gather observations from the sundry batches, partitioned by subject in the order of the RuleUses."""
+        self._observation_count += len(batch.observations)
+        if self._observation_spill is not None:
+            self._observation_spill.write(batch.observations)
+            return
+        for observation in batch.observations:
+            self._observation_map.setdefault(observation.subjects[0].subject_uuid, []).append(observation)
 
     @property
     def components(self) -> List[SystemComponent]:
@@ -539,8 +732,10 @@ class TaniumOscalFactory:
         analysis = []
         analysis.append(f'components: {len(self.components)}')
         analysis.append(f'inventory: {len(self.inventory)}')
-        analysis.append(f'observations: {len(self.observations)}')
-        analysis.append(f'cache: requests={self._property_manager.requests} hits={self._property_manager.hits}')
+        analysis.append(f'observations: {self._observation_count}')
+        requests = self._property_manager.requests + self._worker_requests
+        hits = self._property_manager.hits + self._worker_hits
+        analysis.append(f'cache: requests={requests} hits={hits}')
         return analysis
 
     def _get_local_definitions(self, system_component: SystemComponent) -> LocalDefinitions1:
@@ -592,15 +787,36 @@ class TaniumOscalFactory:
     def results(self) -> List[Result]:
         """OSCAL result."""
         if self._result is None:
-            self._derive_components()
-            self._derive_inventory()
-            if self._aggregate:
-                self._derive_common_property_accounting()
+            self._derive_local_definitions()
             self._derive_observations()
+        return self._make_results()
+
+    def write_results(self, ofile: Optional[pathlib.Path]) -> None:
+        """
+        Derive the results and write them to the output file if given, holding one batch of observations at a time.
+
+        The observations are spilled to a temporary file as they are built, and read back from it by each result as
+        it is written.
+        """
+        with tempfile.TemporaryFile() as fp:
+            self._observation_spill = _ObservationSpill(fp)
+            try:
+                self._derive_local_definitions()
+                self._derive_observations()
+                results = Results()
+                results.__root__ = self._make_results()
+                if ofile is not None:
+                    results.oscal_write(ofile)
+            finally:
+                self._observation_spill = None
+
+    def _make_results(self) -> List[Result]:
+        """Make the result of each component, with observations read back only as written if they were spilled."""
         results = []
         for component in self.components:
             local_definitions = self._get_local_definitions(component)
-            observations = self._get_observations(local_definitions)
+            spill = self._observation_spill
+            observations = self._get_observations(local_definitions) if spill is None else None
             result = Result(
                 uuid=_uuid_result(),
                 title='Tanium',
@@ -613,5 +829,8 @@ class TaniumOscalFactory:
             )
             component_ref = component.uuid
             result.props = self._get_properties(component_ref)
+            if spill is not None:
+                subjects = self._get_local_definitions_uuids(local_definitions)
+                result = result.copy(update={'observations': spill.read(subjects)})
             results.append(result)
         return results
@@ -0,0 +1,150 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2026 The OSCAL Compass Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming parser of the rule results in the TestResult of XCCDF scan results."""
+
+from typing import Dict, Iterator, List, Optional, Union
+from xml.etree.ElementTree import Element  # noqa: S405 - used for typing only
+
+from defusedxml import ElementTree
+
+XCCDF_12_TEST_RESULT = '{http://checklists.nist.gov/xccdf/1.2}TestResult'  # NOSONAR
+
+FACT_SCANNER_NAME = 'urn:xccdf:fact:scanner:name'
+FACT_SCANNER_VERSION = 'urn:xccdf:fact:scanner:version'
+FACT_HOST_NAME = 'urn:xccdf:fact:asset:identifier:host_name'
+
+
+class _XmlSource:
+    """File-like reader of xml already held in memory, handing it to the parser in slices without copying it all."""
+
+    def __init__(self, xml: Union[str, bytes]) -> None:
+        self._xml = xml
+        self._pos = 0
+
+    def read(self, size: int = -1) -> Union[str, bytes]:
+        start = self._pos
+        self._pos = len(self._xml) if size < 0 else min(len(self._xml), start + size)
+        return self._xml[start : self._pos]
+
+
+def _remove_namespace(subject: str) -> str:
+    """If a namespace is present in the subject string, remove it."""
+    return subject.rsplit('}').pop()
+
+
+def _get_target_type(benchmark_href: Optional[str]) -> Optional[str]:
+    """Get the target type from the benchmark href."""
+    if benchmark_href is not None and '-' in benchmark_href:
+        return benchmark_href.split('-')[1]
+    return None
+
+
+def _get_result(rule_result: Element) -> Optional[str]:
+    """Get the text of the first result in a rule-result."""
+    for child in rule_result:
+        if _remove_namespace(child.tag) == 'result':
+            return child.text
+    return None
+
+
+def _get_facts(target_facts: Element) -> Dict[str, Optional[str]]:
+    """Get the text of the first fact for each name in target-facts."""
+    facts: Dict[str, Optional[str]] = {}
+    for child in target_facts:
+        if _remove_namespace(child.tag) == 'fact':
+            facts.setdefault(child.get('name'), child.text)
+    return facts
+
+
+def iter_rule_results(
+    xml: Union[str, bytes], find_test_result: bool = True, default_version: Optional[str] = None
+) -> Iterator[Dict[str, Optional[str]]]:
+    """
+    Parse the xml in a single streaming pass, yielding the arguments of each rule-result in the TestResult.
+
+    Args:
+        xml: the scan results, as a TestResult document or, if find_test_result, any document containing one
+        find_test_result: if the root is not a TestResult use the first XCCDF 1.2 TestResult in the document,
+            otherwise the root is treated as the TestResult whatever its tag
+        default_version: the version if the root of the document has none
+
+    Returns:
+        Iterator over the dict of the RuleUse arguments for each rule-result of the first TestResult
+
+    Notes:
+        Elements are discarded as soon as they are processed, so the memory used does not grow with the document.
+        The target, benchmark and target-facts of the TestResult are taken from its first child of each kind,
+        and XCCDF places them before the rule-results, so each rule-result is yielded once it is parsed.
+        DTDs and entities are forbidden, as when the whole document is parsed with defusedxml.
+    """
+    events = ElementTree.iterparse(_XmlSource(xml), events=('start', 'end'), forbid_dtd=True)
+    open_elements: List[Element] = []
+    test_result: Optional[Element] = None
+    version = default_version
+    header: Dict[str, Optional[str]] = {}
+    facts: Optional[Dict[str, Optional[str]]] = None
+    for event, elem in events:
+        if event == 'start':
+            if not open_elements:
+                version = elem.get('version', default_version)
+                if not find_test_result or _remove_namespace(elem.tag) == 'TestResult':
+                    test_result = elem
+                    header['id_'] = elem.get('id')
+            elif test_result is None and elem.tag == XCCDF_12_TEST_RESULT:
+                test_result = elem
+                header['id_'] = elem.get('id')
+            open_elements.append(elem)
+            continue
+
+        open_elements.pop()
+        if elem is test_result:
+            # only the first TestResult is used
+            return
+        parent = open_elements[-1] if open_elements else None
+        if test_result is not None and parent is not test_result:
+            # part of a child of the TestResult still being parsed
+            continue
+        if parent is test_result:
+            tag = _remove_namespace(elem.tag)
+            if tag == 'target' and 'target' not in header:
+                header['target'] = elem.text
+            elif tag == 'benchmark' and 'benchmark_href' not in header:
+                header['benchmark_href'] = elem.get('href')
+                header['benchmark_id'] = elem.get('id')
+            elif tag == 'target-facts' and facts is None:
+                facts = _get_facts(elem)
+            elif tag == 'rule-result':
+                facts = facts if facts is not None else {}
+                benchmark_href = header.get('benchmark_href')
+                yield {
+                    'id_': header.get('id_'),
+                    'target': header.get('target'),
+                    'target_type': _get_target_type(benchmark_href),
+                    'host_name': facts.get(FACT_HOST_NAME),
+                    'benchmark_href': benchmark_href,
+                    'benchmark_id': header.get('benchmark_id'),
+                    'scanner_name': facts.get(FACT_SCANNER_NAME),
+                    'scanner_version': facts.get(FACT_SCANNER_VERSION),
+                    'idref': elem.get('idref'),
+                    'version': version,
+                    'time': elem.get('time'),
+                    'result': _get_result(elem),
+                    'severity': elem.get('severity'),
+                    'weight': elem.get('weight'),
+                }
+        if parent is not None:
+            # the earlier siblings were already removed, so this is the only child left
+            parent.remove(elem)